@@ -0,0 +1,132 @@
+"""add_asset_latest_price
+
+Revision ID: c4a7e2d91b10
+Revises: b29565f1f5cc
+Create Date: 2026-10-17 10:00:00.000000
+
+자산별 최신 가격 프로젝션 테이블 (asset_latest_price)
+- 원천 6개 테이블(realtime_quotes, realtime_quotes_time_bar, realtime_quotes_time_delay,
+  ohlcv_intraday_data, ohlcv_day_data, world_assets_ranking)에 문장 단위 트리거를 걸어
+  쓰기 시점에 우선순위를 비교해 갱신 (COPY/MERGE 배치도 문장당 UPSERT 한 번)
+- 우선순위: timestamp_utc 최신 -> source_rank -> provider_rank (기존 /latest-prices/batch 정렬과 동일)
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4a7e2d91b10'
+down_revision: Union[str, None] = 'b29565f1f5cc'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+PROVIDER_RANK_SQL = """
+    CASE {col}
+        WHEN 'polygon' THEN 1
+        WHEN 'twelvedata' THEN 2
+        WHEN 'alpaca' THEN 3
+        ELSE 4
+    END
+"""
+
+# (원천 테이블, source_table, source_rank, 가격 컬럼, 시각 식, data_source 식, 추가 조건)
+SOURCES = [
+    ("realtime_quotes", "realtime", 1, "price", "timestamp_utc", "data_source", ""),
+    ("realtime_quotes_time_bar", "realtime_bar", 2, "close_price", "timestamp_utc", "data_source", ""),
+    ("realtime_quotes_time_delay", "realtime_delay", 3, "price", "timestamp_utc", "data_source", ""),
+    ("ohlcv_intraday_data", "intraday", 4, "close_price", "timestamp_utc", "NULL::varchar", ""),
+    ("ohlcv_day_data", "daily", 9, "close_price", "timestamp_utc", "NULL::varchar",
+     "AND (data_interval = '1d' OR data_interval = '1day' OR data_interval IS NULL)"),
+    ("world_assets_ranking", "ranking", 9, "price_usd", "CAST(ranking_date AS TIMESTAMP)", "'ranking'::varchar", ""),
+]
+
+
+def _candidates_sql(relation, source_table, source_rank, price_col, ts_expr, ds_expr, where):
+    """원천 행 -> 자산별 최상위 후보 1개 (같은 문장 안의 중복 asset_id 제거)"""
+    return f"""
+        SELECT DISTINCT ON (asset_id)
+            asset_id,
+            {price_col} AS price,
+            {ts_expr} AS timestamp_utc,
+            '{source_table}' AS source_table,
+            {source_rank} AS source_rank,
+            {ds_expr} AS data_source,
+            {PROVIDER_RANK_SQL.format(col=ds_expr)} AS provider_rank
+        FROM {relation}
+        WHERE asset_id IS NOT NULL AND {price_col} IS NOT NULL {where}
+        ORDER BY asset_id, {ts_expr} DESC, {PROVIDER_RANK_SQL.format(col=ds_expr)} ASC
+    """
+
+
+UPSERT_SQL = """
+    INSERT INTO asset_latest_price AS p
+        (asset_id, price, timestamp_utc, source_table, source_rank, data_source, provider_rank, updated_at)
+    SELECT asset_id, price, timestamp_utc, source_table, source_rank, data_source, provider_rank, now()
+    FROM ({candidates}) c
+    ON CONFLICT (asset_id) DO UPDATE SET
+        price = EXCLUDED.price,
+        timestamp_utc = EXCLUDED.timestamp_utc,
+        source_table = EXCLUDED.source_table,
+        source_rank = EXCLUDED.source_rank,
+        data_source = EXCLUDED.data_source,
+        provider_rank = EXCLUDED.provider_rank,
+        updated_at = now()
+    -- 더 최신이거나, 같은 시각이면 우선순위가 같거나 높은 원천일 때만 교체
+    WHERE (EXCLUDED.timestamp_utc, p.source_rank, p.provider_rank)
+       >= (p.timestamp_utc, EXCLUDED.source_rank, EXCLUDED.provider_rank)
+"""
+
+
+def _trigger_function(table):
+    return f"asset_latest_price_from_{table}"
+
+
+def upgrade() -> None:
+    op.create_table(
+        'asset_latest_price',
+        sa.Column('asset_id', sa.Integer(), sa.ForeignKey('assets.asset_id', ondelete='CASCADE'), primary_key=True),
+        sa.Column('price', sa.DECIMAL(24, 10), nullable=False),
+        sa.Column('timestamp_utc', sa.DateTime(), nullable=False),
+        sa.Column('source_table', sa.String(20), nullable=False),
+        sa.Column('source_rank', sa.Integer(), nullable=False),
+        sa.Column('data_source', sa.String(100), nullable=True),
+        sa.Column('provider_rank', sa.Integer(), nullable=False),
+        sa.Column('updated_at', sa.TIMESTAMP(), server_default=sa.text('now()'), nullable=True),
+    )
+
+    for table, source_table, source_rank, price_col, ts_expr, ds_expr, where in SOURCES:
+        function = _trigger_function(table)
+        candidates = _candidates_sql("new_rows", source_table, source_rank, price_col, ts_expr, ds_expr, where)
+        op.execute(f"""
+        CREATE OR REPLACE FUNCTION {function}()
+        RETURNS trigger AS $$
+        BEGIN
+            {UPSERT_SQL.format(candidates=candidates)};
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+        """)
+        # 전이 테이블은 이벤트 하나에만 지정 가능하므로 INSERT / UPDATE 트리거를 따로 생성
+        for event in ("INSERT", "UPDATE"):
+            op.execute(f"""
+            CREATE TRIGGER trg_{table}_latest_price_{event.lower()}
+            AFTER {event} ON {table}
+            REFERENCING NEW TABLE AS new_rows
+            FOR EACH STATEMENT EXECUTE FUNCTION {function}();
+            """)
+
+    # 기존 데이터 백필 (원천별로 자산당 최신 1행만 비교)
+    for table, source_table, source_rank, price_col, ts_expr, ds_expr, where in SOURCES:
+        candidates = _candidates_sql(table, source_table, source_rank, price_col, ts_expr, ds_expr, where)
+        op.execute(UPSERT_SQL.format(candidates=candidates))
+
+
+def downgrade() -> None:
+    for table, *_ in SOURCES:
+        for event in ("insert", "update"):
+            op.execute(f"DROP TRIGGER IF EXISTS trg_{table}_latest_price_{event} ON {table}")
+        op.execute(f"DROP FUNCTION IF EXISTS {_trigger_function(table)}()")
+    op.drop_table('asset_latest_price')
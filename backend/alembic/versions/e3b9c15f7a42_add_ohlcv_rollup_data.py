@@ -0,0 +1,44 @@
+"""add_ohlcv_rollup_data
+
+Revision ID: e3b9c15f7a42
+Revises: c4a7e2d91b10
+Create Date: 2026-10-17 12:00:00.000000
+
+일봉 주/월 롤업 테이블 (ohlcv_rollup_data)
+- 1W / 1M 차트가 ohlcv_day_data 전체를 읽어 매번 집계하지 않도록 기간별 봉을 저장
+- 채우기: scripts/backfill_ohlcv_rollups.py (이후에는 DataRepository.save_ohlcv_data가 영향 기간만 갱신)
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e3b9c15f7a42'
+down_revision: Union[str, None] = 'c4a7e2d91b10'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'ohlcv_rollup_data',
+        sa.Column('asset_id', sa.Integer(), sa.ForeignKey('assets.asset_id', ondelete='CASCADE'), nullable=False),
+        sa.Column('period', sa.String(4), nullable=False),
+        sa.Column('period_start', sa.DateTime(), nullable=False),
+        sa.Column('timestamp_utc', sa.DateTime(), nullable=False),
+        sa.Column('open_price', sa.DECIMAL(24, 10), nullable=True),
+        sa.Column('high_price', sa.DECIMAL(24, 10), nullable=True),
+        sa.Column('low_price', sa.DECIMAL(24, 10), nullable=True),
+        sa.Column('close_price', sa.DECIMAL(24, 10), nullable=True),
+        sa.Column('volume', sa.DECIMAL(30, 10), nullable=False, server_default='0'),
+        sa.Column('bar_count', sa.Integer(), nullable=False),
+        sa.Column('updated_at', sa.TIMESTAMP(), server_default=sa.text('now()'), nullable=True),
+        # (asset_id, period, period_start DESC) 조회가 PK 인덱스로 처리됨
+        sa.PrimaryKeyConstraint('asset_id', 'period', 'period_start'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('ohlcv_rollup_data')
@@ -0,0 +1,40 @@
+"""add_rolling_correlation_snapshot
+
+Revision ID: f6c2d8a41b93
+Revises: e3b9c15f7a42
+Create Date: 2026-10-17 15:00:00.000000
+
+상위 N개 자산 이동 상관계수/베타 사전 계산 결과 (rolling_correlation_snapshot)
+- SchedulerService 일일 잡이 유니버스당 한 행을 UPSERT (app/services/rolling_correlation.py)
+- calculate_correlation_matrix 가 30/90/365일 요청을 이 결과의 부분 행렬로 응답
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f6c2d8a41b93'
+down_revision: Union[str, None] = 'e3b9c15f7a42'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'rolling_correlation_snapshot',
+        sa.Column('universe', sa.String(50), nullable=False),
+        sa.Column('as_of_date', sa.Date(), nullable=False),
+        sa.Column('rebuilt_on', sa.Date(), nullable=False),
+        sa.Column('windows', sa.JSON(), nullable=False),
+        sa.Column('assets', sa.JSON(), nullable=False),
+        sa.Column('result', sa.LargeBinary(), nullable=False),
+        sa.Column('state', sa.LargeBinary(), nullable=False),
+        sa.Column('updated_at', sa.TIMESTAMP(), server_default=sa.text('now()'), nullable=True),
+        sa.PrimaryKeyConstraint('universe'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('rolling_correlation_snapshot')
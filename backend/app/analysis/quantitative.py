@@ -1,11 +1,13 @@
 
-import pandas as pd
 import numpy as np
 from fastapi import HTTPException
 import logging
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from sqlalchemy.orm import Session
-from app.crud.asset import crud_asset, crud_ohlcv
+from app.services.cross_asset_analytics import (
+    analytics_cache, correlation_snapshot, load_price_matrix, rolling_zscore, ticker_set_key
+)
+from app.services.rolling_correlation import load_rolling_matrices
 from datetime import datetime, timedelta
 
 logger = logging.getLogger(__name__)
@@ -13,105 +15,80 @@ logger = logging.getLogger(__name__)
 def calculate_correlation_matrix(db: Session, tickers: List[str], days: int = 90) -> Dict[str, Any]:
     """
     Calculate correlation matrix for given tickers over the last N days.
+    Results are cached per (ticker set, days, as-of date).
+    Requests inside the precomputed top-asset universe read prices from the
+    rolling correlation snapshot instead of the database.
     """
-    data = {}
-    
     end_date = datetime.utcnow().date()
-    start_date = end_date - timedelta(days=days + 30) 
+    start_date = end_date - timedelta(days=days + 30)
+    requested = list(dict.fromkeys(tickers))
 
-    excluded = []
-    asset_info = {}
-    
     try:
-        valid_tickers = []
-
-        for ticker in tickers:
-            asset = crud_asset.get_by_ticker(db, ticker)
-            if not asset:
-                excluded.append({"ticker": ticker, "reason": "not_found", "available": 0})
-                continue
-            
-            ohlcvs = crud_ohlcv.get_ohlcv_data(
-                db, 
-                asset_id=asset.asset_id, 
-                start_date=start_date,
-                limit=days + 20
-            )
-            
-            if not ohlcvs or len(ohlcvs) < days * 0.6:
-                 excluded.append({
-                     "ticker": ticker, 
-                     "reason": "insufficient_data", 
-                     "available": len(ohlcvs) if ohlcvs else 0
-                 })
-                 continue
-
-            ohlcvs_sorted = sorted(ohlcvs, key=lambda x: x.timestamp_utc)
-            dates = [x.timestamp_utc.date() for x in ohlcvs_sorted]
-            closes = [float(x.close_price) for x in ohlcvs_sorted]
-            
-            series = pd.Series(data=closes, index=dates, name=ticker)
-            series = series[~series.index.duplicated(keep='last')]
-            
-            data[ticker] = series
-            # Store asset info for frontend (exclude same group logic)
-            # Ensure asset.asset_type is loaded
-            asset_type_name = asset.asset_type.type_name if asset.asset_type else "Unknown"
-
-            asset_info[ticker] = {
-                "name": asset.name,
-                "type": asset_type_name
-            }
-            valid_tickers.append(ticker)
-
-        if len(valid_tickers) < 2:
-            return {
-                "error": "Not enough valid assets", 
-                "matrix": [], 
-                "heatmap_data": [], 
-                "excluded": excluded,
-                "asset_info": {}
-            }
+        key = ("correlation", ticker_set_key(requested), days, end_date)
+        snapshot = analytics_cache.get(key)
+        if snapshot is None:
+            snapshot = _precomputed_snapshot(db, sorted(requested), start_date, days, end_date)
+            if snapshot is None:
+                snapshot = _correlation_snapshot(db, sorted(requested), start_date, days)
+            analytics_cache.set(key, snapshot)
+        return _correlation_response(snapshot, requested)
+    except Exception as e:
+        logger.error(f"Error calculating correlation matrix: {e}", exc_info=True)
+        # Fallback empty
+        return {"error": str(e), "matrix": [], "heatmap_data": []}
+
 
-        df = pd.DataFrame(data)
-        df = df.dropna()
-
-        if df.empty:
-             return {
-                 "error": "No overlapping data", 
-                 "matrix": [], 
-                 "heatmap_data": [], 
-                 "excluded": excluded,
-                 "asset_info": {}
-             }
-        
-        pct_change = df.pct_change().dropna()
-        correlation_matrix = pct_change.corr(method='pearson')
-        
-        matrix_dict = correlation_matrix.to_dict()
-        
-        heatmap_data = []
-        for y in valid_tickers:
-            if y not in matrix_dict: continue
-            row = {"id": y, "data": []}
-            for x in valid_tickers:
-                if x not in matrix_dict[y]: continue
-                val = matrix_dict.get(y, {}).get(x, 0)
-                if pd.isna(val): val = 0
-                row["data"].append({"x": x, "y": val})
-            heatmap_data.append(row)
+def _correlation_snapshot(db: Session, tickers: List[str], start_date, days: int) -> Dict[str, Any]:
+    """Order-independent correlation result for a ticker set (cached)."""
+    prices = load_price_matrix(db, tickers, start_date, limit=days + 20)
+    return correlation_snapshot(prices, days)
 
+
+def _precomputed_snapshot(db: Session, tickers: List[str], start_date, days: int, end_date) -> Optional[Dict[str, Any]]:
+    """
+    Same result as _correlation_snapshot, built from the daily closes stored with the
+    rolling correlation snapshot when it covers every requested ticker and the start date.
+    Bars after the snapshot date (through end_date) are read for the requested tickers only,
+    so the range matches the on-demand query; stock/crypto mixes use the same common-date returns.
+    """
+    matrices = load_rolling_matrices(db, end_date)
+    if matrices is None or not matrices.prices_cover(tickers, start_date):
+        return None
+    prices = matrices.price_matrix_through(db, tickers, start_date, end_date, limit=days + 20)
+    return correlation_snapshot(prices, days)
+
+
+def _correlation_response(snapshot: Dict[str, Any], requested: List[str]) -> Dict[str, Any]:
+    """Lay out a cached snapshot in the caller's ticker order."""
+    excluded = [snapshot["excluded"][t] for t in requested if t in snapshot["excluded"]]
+    if snapshot["error"]:
         return {
-            "tickers": valid_tickers,
-            "matrix": matrix_dict,
-            "heatmap_data": heatmap_data,
+            "error": snapshot["error"],
+            "matrix": [],
+            "heatmap_data": [],
             "excluded": excluded,
-            "asset_info": asset_info
+            "asset_info": {}
         }
-    except Exception as e:
-        logger.error(f"Error calculating correlation matrix: {e}", exc_info=True)
-        # Fallback empty
-        return {"error": str(e), "matrix": [], "heatmap_data": []}
+
+    valid_tickers = [t for t in requested if t in snapshot["tickers"]]
+    index = [snapshot["tickers"].index(t) for t in valid_tickers]
+    corr = snapshot["corr"][np.ix_(index, index)]
+    values = [[None if np.isnan(v) else v for v in row] for row in corr.tolist()]
+
+    matrix_dict = {x: {y: values[i][j] for i, y in enumerate(valid_tickers)} for j, x in enumerate(valid_tickers)}
+    heatmap_data = [
+        {"id": y, "data": [{"x": x, "y": values[i][j] if values[i][j] is not None else 0}
+                           for j, x in enumerate(valid_tickers)]}
+        for i, y in enumerate(valid_tickers)
+    ]
+
+    return {
+        "tickers": valid_tickers,
+        "matrix": matrix_dict,
+        "heatmap_data": heatmap_data,
+        "excluded": excluded,
+        "asset_info": {t: snapshot["asset_info"][t] for t in valid_tickers}
+    }
 
 def calculate_spread_analysis(db: Session, ticker_a: str, ticker_b: str, days: int = 90) -> Dict[str, Any]:
     """
@@ -122,63 +99,55 @@ def calculate_spread_analysis(db: Session, ticker_a: str, ticker_b: str, days: i
     start_date = end_date - timedelta(days=days + 60) # Buffer for rolling calculations
 
     try:
-        # Fetch Data
-        assets = []
+        # Fetch Data (both assets in one query)
+        prices = load_price_matrix(
+            db, [ticker_a, ticker_b], start_date,
+            limit=days + 365 # Ensure we get full history (default is 1000)
+        )
         for t in [ticker_a, ticker_b]:
-            asset = crud_asset.get_by_ticker(db, t)
-            if not asset:
+            if t in prices.missing:
                 raise HTTPException(status_code=404, detail=f"Asset not found: {t}")
-            
-            ohlcvs = crud_ohlcv.get_ohlcv_data(
-                db, 
-                asset_id=asset.asset_id, 
-                start_date=start_date,
-                limit=days + 365 # Ensure we get full history (default is 1000)
-            )
-            if not ohlcvs or len(ohlcvs) < 30: # Minimal check for rolling window
-                 raise HTTPException(status_code=400, detail=f"Insufficient data for {t} (Need at least 30 days)")
-                 
-            # Create Series
-            # Helper to convert to series
-            df_t = pd.DataFrame([{
-                "date": x.timestamp_utc.date(), 
-                "close": float(x.close_price)
-            } for x in ohlcvs])
-            df_t.set_index("date", inplace=True)
-            df_t = df_t[~df_t.index.duplicated(keep='last')]
-            assets.append(df_t["close"])
-            
-        data = pd.concat(assets, axis=1).dropna()
-        data.columns = [ticker_a, ticker_b]
-        
-        if data.empty:
+            if prices.row_counts[t] < 30: # Minimal check for rolling window
+                raise HTTPException(status_code=400, detail=f"Insufficient data for {t} (Need at least 30 days)")
+
+        closes = np.column_stack([prices.column(ticker_a), prices.column(ticker_b)])
+        keep = ~np.isnan(closes).any(axis=1)
+        closes, dates = closes[keep], prices.dates[keep]
+
+        if not len(dates):
             raise HTTPException(status_code=400, detail="No overlapping data found")
-            
+
         # Calculate Log Ratio Spread
         # spread = log(PriceA) - log(PriceB)
-        data["log_spread"] = np.log(data[ticker_a]) - np.log(data[ticker_b])
-        
+        with np.errstate(invalid="ignore", divide="ignore"):
+            log_spread = np.log(closes[:, 0]) - np.log(closes[:, 1])
+
         # Calculate Z-Score (Rolling 30-day window)
         window = 30
-        data["mean"] = data["log_spread"].rolling(window=window).mean()
-        data["std"] = data["log_spread"].rolling(window=window).std()
-        data["z_score"] = (data["log_spread"] - data["mean"]) / data["std"]
-        
+        mean, std, z_score = rolling_zscore(log_spread, window)
+
         # Drop initial NaN for rolling
-        data = data.dropna()
-        
+        valid = ~(np.isnan(log_spread) | np.isnan(mean) | np.isnan(std) | np.isnan(z_score))
+
         # Format for Linear Chart
         # data points: {date, z_score, spread, price_a, price_b}
-        chart_data = []
-        for date, row in data.iterrows():
-            chart_data.append({
-                "date": date.strftime("%Y-%m-%d"),
-                "z_score": row["z_score"] if not pd.isna(row["z_score"]) else 0,
-                "spread": row["log_spread"],
-                "price_a": row[ticker_a],
-                "price_b": row[ticker_b]
-            })
-            
+        chart_data = [
+            {
+                "date": d,
+                "z_score": z,
+                "spread": sp,
+                "price_a": pa,
+                "price_b": pb
+            }
+            for d, z, sp, pa, pb in zip(
+                np.datetime_as_string(dates[valid], unit="D").tolist(),
+                z_score[valid].tolist(),
+                log_spread[valid].tolist(),
+                closes[valid, 0].tolist(),
+                closes[valid, 1].tolist(),
+            )
+        ]
+
         return {
             "ticker_a": ticker_a,
             "ticker_b": ticker_b,
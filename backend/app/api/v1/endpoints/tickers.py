@@ -8,6 +8,7 @@ import logging
 from datetime import datetime
 
 from ....core.database import get_postgres_db
+from ....core.subscription_resolver import subscription_resolver
 from ....schemas.common import CollectionStatusResponse, CollectionSettingsResponse, LastCollectionsResponse, ReloadResponse
 from pydantic import BaseModel
 from typing import List, Dict, Any
@@ -155,6 +156,8 @@ async def update_ticker_collection_settings(
 
         db.commit()
         db.refresh(asset)
+        # 자산 변경 -> WebSocket 구독 심볼 인덱스 즉시 갱신
+        subscription_resolver.invalidate()
         
         return {
             "asset_id": asset_id,
@@ -219,6 +222,8 @@ async def bulk_update_ticker_collection_settings(
         # 모든 업데이트를 한 번에 커밋
         db.commit()
         logger.info(f"Successfully committed {len(updated_assets)} updates")
+        if updated_assets:
+            subscription_resolver.invalidate()
         
         # 응답 생성 (새로고침 없이 직접 데이터 사용)
         return [
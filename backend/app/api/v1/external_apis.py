@@ -17,6 +17,8 @@ from ...external_apis import (
 from ...external_apis.implementations.edgar_client import EdgarClient
 from ...external_apis.implementations.macrotrends_client import MacrotrendsClient
 from ...services.ingest.macrotrends_ingest import ingest_stock_financials
+from ...services.provider_health import provider_health
+from ...services.rate_limiter import rate_limiter
 from ...core.database import get_postgres_db
 from sqlalchemy.orm import Session
 from ...schemas.common import MarketDataResponse, ExternalAPITestResponse
@@ -84,6 +86,21 @@ async def test_external_api_connections():
         raise HTTPException(status_code=500, detail=f"Connection test failed: {str(e)}")
 
 
+@router.get("/rate-limits/usage")
+async def get_rate_limit_usage():
+    """Provider token-bucket usage (shared buckets in Redis) and this process's wait/reject counters"""
+    try:
+        return {"timestamp": datetime.now().isoformat(), "gates": await rate_limiter.utilization()}
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Rate limit usage failed: {str(e)}")
+
+
+@router.get("/providers/health")
+async def get_provider_health():
+    """Per-provider OHLCV latency/health and collection latency percentiles per fallback policy (this process)"""
+    return {"timestamp": datetime.now().isoformat(), **provider_health.snapshot()}
+
+
 @router.get("/stock/{ticker}", response_model=StockDataResponse)
 async def get_stock_data(ticker: str):
     """Get stock data from external APIs"""
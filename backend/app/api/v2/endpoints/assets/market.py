@@ -8,9 +8,9 @@ from fastapi import APIRouter, Depends, HTTPException, Query, Path
 from sqlalchemy.orm import Session
 from sqlalchemy import text
 from typing import Optional, List, Dict, Any
-from datetime import date, datetime, timedelta, time
-from collections import defaultdict
+from datetime import date, datetime, timedelta
 import logging
+import numpy as np
 import pytz
 
 from app.core.database import get_postgres_db
@@ -20,6 +20,12 @@ from app.models import (
 from .shared.resolvers import resolve_asset_identifier
 from .shared.validators import validate_data_interval
 from fastapi_cache.decorator import cache
+from app.services.latest_price_cache import latest_price_cache
+from app.services.ohlcv_chart_merge import MergeSource, change_percent, merge_sources, to_chart_dicts
+from app.services.ohlcv_resampler import (
+    OHLCVColumns, aggregate_dicts, resample_candles, resample_dicts, zero_as_nan
+)
+from app.services.ohlcv_rollup import rollup_chart_data
 
 logger = logging.getLogger(__name__)
 
@@ -287,74 +293,98 @@ def db_get_delay_data(
         ))
     return result_objects
 
-def db_get_realtime_bar_data(
+# 차트 원천 조회 (분봉/시간봉): 원천별 SELECT를 UNION ALL로 묶어 한 번의 왕복으로 가져옴
+CHART_PROVIDER_ORDER_SQL = """
+    CASE
+        WHEN data_source = 'polygon' THEN 1
+        WHEN data_source = 'twelvedata' THEN 2
+        WHEN data_source = 'alpaca' THEN 3
+        ELSE 4
+    END ASC
+"""
+
+CHART_SOURCE_SQL = {
+    # ohlcv_intraday_data: start_date가 없으면 최신 limit개 (db_get_intraday_data와 동일)
+    'intraday': """
+        (SELECT {k} AS src, timestamp_utc, open_price, high_price, low_price, close_price, volume
+         FROM ohlcv_intraday_data
+         WHERE asset_id = :asset_id AND data_interval = :interval_{k} {range_filter}
+         ORDER BY timestamp_utc {direction}
+         LIMIT :limit_{k})
+    """,
+    'realtime_bar': """
+        (SELECT DISTINCT ON (timestamp_utc)
+                {k} AS src, timestamp_utc, open_price, high_price, low_price, close_price, volume
+         FROM realtime_quotes_time_bar
+         WHERE asset_id = :asset_id AND data_interval = :interval_{k} {range_filter}
+         ORDER BY timestamp_utc ASC, {provider_order}
+         LIMIT :limit_{k})
+    """,
+    # 지연 시세는 가격 하나를 OHLC 모두에 사용 (틱성 봉)
+    'delay': """
+        (SELECT DISTINCT ON (timestamp_utc)
+                {k} AS src, timestamp_utc, price AS open_price, price AS high_price,
+                price AS low_price, price AS close_price, volume
+         FROM realtime_quotes_time_delay
+         WHERE asset_id = :asset_id AND data_interval = :interval_{k} {range_filter}
+         ORDER BY timestamp_utc ASC, {provider_order}
+         LIMIT :limit_{k})
+    """,
+}
+
+
+def db_get_chart_sources(
     db: Session,
     asset_id: int,
     start_date: Optional[date],
     end_date: Optional[date],
-    data_interval: str,
-    limit: int = 5000
-) -> List[RealtimeQuotesTimeBar]:
-    """Realtime bar (봉) 데이터 조회 - realtime_quotes_time_bar 테이블 사용"""
-    start_time_str = start_date.isoformat() if start_date else 'NULL'
-    end_time_str = end_date.isoformat() if end_date else 'NULL'
-
-    query_str = f"""
-        SELECT DISTINCT ON (timestamp_utc)
-            asset_id,
-            data_interval,
-            open_price,
-            high_price,
-            low_price,
-            close_price,
-            volume,
-            change_amount,
-            change_percent,
-            timestamp_utc,
-            data_source
-        FROM realtime_quotes_time_bar
-        WHERE asset_id = :asset_id
-          AND data_interval = :data_interval
-          {f"AND timestamp_utc >= :start_date" if start_date else ""}
-          {f"AND timestamp_utc <= :end_date" if end_date else ""}
-        ORDER BY timestamp_utc ASC,
-                 CASE
-                    WHEN data_source = 'polygon' THEN 1
-                    WHEN data_source = 'twelvedata' THEN 2
-                    WHEN data_source = 'alpaca' THEN 3
-                    ELSE 4
-                 END ASC
-        LIMIT :limit
+    specs: List[tuple]
+) -> List[OHLCVColumns]:
     """
-    params = {
-        "asset_id": asset_id,
-        "data_interval": data_interval,
-        "limit": limit
-    }
+    차트 원천 여러 개를 한 번의 쿼리로 조회해 원천별 시간순 컬럼으로 반환.
+    specs: [(kind, data_interval, limit)] - kind는 'intraday' / 'realtime_bar' / 'delay'
+    값 규칙은 기존 _format_ohlcv_rows와 동일 (봉 원천의 0 가격은 결측, 거래량 결측은 0)
+    """
+    range_filter = ""
+    if start_date:
+        range_filter += " AND timestamp_utc >= :start_date"
+    if end_date:
+        range_filter += " AND timestamp_utc <= :end_date"
+
+    params: Dict[str, Any] = {"asset_id": asset_id}
     if start_date:
         params["start_date"] = start_date
     if end_date:
         params["end_date"] = end_date
 
-    rows = db.execute(text(query_str), params).fetchall()
-
-    # Convert raw rows to RealtimeQuotesTimeBar objects for compatibility with _format_ohlcv_rows
-    result_objects = []
-    for row in rows:
-        result_objects.append(RealtimeQuotesTimeBar(
-            asset_id=row.asset_id,
-            data_interval=row.data_interval,
-            open_price=row.open_price,
-            high_price=row.high_price,
-            low_price=row.low_price,
-            close_price=row.close_price,
-            volume=row.volume,
-            change_amount=row.change_amount,
-            change_percent=row.change_percent,
-            timestamp_utc=row.timestamp_utc,
-            data_source=row.data_source
+    selects = []
+    for k, (kind, interval, limit) in enumerate(specs):
+        selects.append(CHART_SOURCE_SQL[kind].format(
+            k=k,
+            range_filter=range_filter,
+            direction="ASC" if start_date else "DESC",
+            provider_order=CHART_PROVIDER_ORDER_SQL,
         ))
-    return result_objects
+        params[f"interval_{k}"] = interval
+        params[f"limit_{k}"] = limit
+
+    rows = db.execute(text(" UNION ALL ".join(selects)), params).fetchall()
+    if not rows:
+        return [OHLCVColumns.empty() for _ in specs]
+
+    src = np.fromiter((row[0] for row in rows), dtype=np.int64, count=len(rows))
+    cols = OHLCVColumns.from_arrays(*zip(*(row[1:] for row in rows)), sort=False)
+
+    sources = []
+    for k, (kind, _, _) in enumerate(specs):
+        part = cols.take(np.flatnonzero(src == k))
+        part = part.take(np.argsort(part.ts, kind="stable"))
+        if kind != 'delay':
+            part = OHLCVColumns(part.ts, *(zero_as_nan(a) for a in (part.open, part.high, part.low, part.close)), part.volume)
+        part.volume = np.nan_to_num(part.volume, nan=0.0)
+        sources.append(part)
+    return sources
+
 
 def _recalculate_change_percent(data_list: List[Dict]) -> List[Dict]:
     """리스트 내의 Dict 데이터의 change_percent를 이전 종가(prev_close)를 기준으로 강제 재계산함 (DB 값 무시)"""
@@ -487,78 +517,21 @@ def get_daily_data_combined(db, asset_id, start_date, end_date, limit):
 
 
 def aggregate_to_weekly_v2(daily_data: List[Dict]) -> List[Dict]:
-    """일봉 데이터(Dict)를 주봉으로 집계"""
-    buckets = defaultdict(list)
-    for r in daily_data:
-        iso = r['timestamp_utc'].isocalendar()
-        key = (iso[0], iso[1])  # (ISO year, ISO week)
-        buckets[key].append(r)
-
-    aggregated = []
-    for key in sorted(buckets.keys()):
-        rows = sorted(buckets[key], key=lambda x: x['timestamp_utc'])
-        if not rows:
-            continue
-
-        first = rows[0]
-        last = rows[-1]
-
-        candle = {
-            'timestamp_utc': last['timestamp_utc'],
-            'open_price': float(first['open_price']) if first['open_price'] else None,
-            'high_price': max((float(x['high_price']) for x in rows if x['high_price']), default=None),
-            'low_price': min((float(x['low_price']) for x in rows if x['low_price']), default=None),
-            'close_price': float(last['close_price']) if last['close_price'] else None,
-            'volume': sum(float(x['volume']) for x in rows if x['volume']),
-            'change_percent': None,
-            'data_interval': '1W'
-        }
-        aggregated.append(candle)
-
-    prev_close = None
-    for candle in aggregated:
-        if prev_close and candle['close_price'] and prev_close > 0:
-            candle['change_percent'] = round(((candle['close_price'] - prev_close) / prev_close) * 100, 4)
-        prev_close = candle['close_price']
-
-    return aggregated
+    """일봉 데이터(Dict)를 주봉으로 집계 (ISO 주)"""
+    return aggregate_dicts(daily_data, '1W')
 
 
 def aggregate_to_monthly_v2(daily_data: List[Dict]) -> List[Dict]:
     """일봉 데이터(Dict)를 월봉으로 집계"""
-    buckets = defaultdict(list)
-    for r in daily_data:
-        ym = (r['timestamp_utc'].year, r['timestamp_utc'].month)
-        buckets[ym].append(r)
-
-    aggregated = []
-    for (y, m) in sorted(buckets.keys()):
-        rows = sorted(buckets[(y, m)], key=lambda x: x['timestamp_utc'])
-        if not rows:
-            continue
+    return aggregate_dicts(daily_data, '1M')
 
-        first = rows[0]
-        last = rows[-1]
-
-        candle = {
-            'timestamp_utc': last['timestamp_utc'],
-            'open_price': float(first['open_price']) if first['open_price'] else None,
-            'high_price': max((float(x['high_price']) for x in rows if x['high_price']), default=None),
-            'low_price': min((float(x['low_price']) for x in rows if x['low_price']), default=None),
-            'close_price': float(last['close_price']) if last['close_price'] else None,
-            'volume': sum(float(x['volume']) for x in rows if x['volume']),
-            'change_percent': None,
-            'data_interval': '1M'
-        }
-        aggregated.append(candle)
-
-    prev_close = None
-    for candle in aggregated:
-        if prev_close and candle['close_price'] and prev_close > 0:
-            candle['change_percent'] = round(((candle['close_price'] - prev_close) / prev_close) * 100, 4)
-        prev_close = candle['close_price']
 
-    return aggregated
+def get_rollup_chart_data(db, asset_id, rule, start_date, end_date, limit) -> Optional[List[Dict]]:
+    """주봉/월봉 롤업 차트 (롤업이 없으면 None). 최근 기간은 get_daily_data_combined의 최근 일봉으로 다시 집계"""
+    return rollup_chart_data(
+        db, asset_id, rule, start_date, end_date, limit,
+        lambda n: get_daily_data_combined(db, asset_id, None, end_date, n),
+    )
 
 
 def resample_intraday_data(rows: List[Dict], interval_minutes: int, label: str = None) -> List[Dict]:
@@ -567,64 +540,25 @@ def resample_intraday_data(rows: List[Dict], interval_minutes: int, label: str =
         return []
 
     label = label or f'{interval_minutes}m'
-    aggregated = []
-    bucket_start_time = None
-    bucket_rows = []
-
-    # Sort
-    rows = sorted(rows, key=lambda x: x['timestamp_utc'])
-
-    for r in rows:
-        ts = r['timestamp_utc']
-
-        if interval_minutes >= 1440:
-            # 1d or more: floor to day
-            current_bucket_time = ts.replace(hour=0, minute=0, second=0, microsecond=0)
-        elif interval_minutes >= 60:
-            # Multi-hour: floor to hour + interval hours
-            hours_floor = (ts.hour // (interval_minutes // 60)) * (interval_minutes // 60)
-            current_bucket_time = ts.replace(hour=hours_floor, minute=0, second=0, microsecond=0)
-        else:
-            # Sub-hour: floor to minutes
-            minute_floor = (ts.minute // interval_minutes) * interval_minutes
-            current_bucket_time = ts.replace(minute=minute_floor, second=0, microsecond=0)
-
-        if bucket_start_time is None:
-            bucket_start_time = current_bucket_time
-            bucket_rows.append(r)
-        elif current_bucket_time == bucket_start_time:
-            bucket_rows.append(r)
-        else:
-            if bucket_rows:
-                aggregated.append(_make_candle(bucket_rows, bucket_start_time, label))
-            bucket_start_time = current_bucket_time
-            bucket_rows = [r]
-
-    if bucket_rows:
-        aggregated.append(_make_candle(bucket_rows, bucket_start_time, label))
-
-    return aggregated
-
-def _make_candle(rows, timestamp, interval_str):
-    """Dict 형태의 rows로부터 캔들 생성"""
-    first = rows[0]
-    last = rows[-1]
-
-    high = max((float(x['high_price']) for x in rows if x['high_price'] is not None), default=0.0)
-    low = min((float(x['low_price']) for x in rows if x['low_price'] is not None), default=0.0)
-    vol = sum((float(x['volume']) for x in rows if x['volume'] is not None))
-
-    candle = {
-        'timestamp_utc': timestamp,
-        'open_price': float(first['open_price']) if first['open_price'] else None,
-        'high_price': high,
-        'low_price': low,
-        'close_price': float(last['close_price']) if last['close_price'] else None,
-        'volume': vol,
-        'change_percent': None,
-        'data_interval': interval_str
-    }
-    return candle
+    return resample_dicts(rows, interval_minutes, label)
+
+
+# 차트 병합 원천 순위 (높을수록 같은 시각의 완전한 봉을 덮어씀)
+CHART_SOURCE_RANKS = {
+    'intraday': 0,
+    'resampled': 1,
+    'delay': 2,
+    'realtime_bar': 3,
+}
+
+
+def _merged_chart_data(merged: OHLCVColumns, interval: str, limit: Optional[int]) -> List[Dict]:
+    """병합 컬럼 -> 응답 dict (change_percent는 전체 구간 기준으로 계산한 뒤 limit 적용)"""
+    change = change_percent(merged.open, merged.close)
+    if limit and len(merged) > limit:
+        merged = merged.take(slice(-limit, None))
+        change = change[-limit:]
+    return to_chart_dicts(merged, interval, change)
 
 
 # ============================================================================
@@ -670,11 +604,15 @@ def get_ohlcv_data_v2(
             if data_interval == '1m':
                 pass # Continue to intraday logic
             else:
-                daily_data = get_daily_data_combined(db, asset_id, start_date, end_date, 20000)
-                if data_interval.upper() == '1W':
-                    aggregated = aggregate_to_weekly_v2(daily_data)
-                else:
-                    aggregated = aggregate_to_monthly_v2(daily_data)
+                rule = '1W' if data_interval.upper() == '1W' else '1M'
+                aggregated = get_rollup_chart_data(db, asset_id, rule, start_date, end_date, limit)
+                if aggregated is None:
+                    # 롤업이 아직 없는 자산 (백필 전): 일봉 전체를 읽어 집계
+                    daily_data = get_daily_data_combined(db, asset_id, start_date, end_date, 20000)
+                    if rule == '1W':
+                        aggregated = aggregate_to_weekly_v2(daily_data)
+                    else:
+                        aggregated = aggregate_to_monthly_v2(daily_data)
                 if limit:
                     aggregated = aggregated[-limit:]
                 return {
@@ -701,80 +639,54 @@ def get_ohlcv_data_v2(
             interval_map = {'5M': 5, '15M': 15, '30M': 30, '1H': 60, '4H': 240}
             target_min = interval_map[interval_upper]
 
-            # 먼저 네이티브 해당 인터벌 데이터를 로드
-            native_rows = db_get_intraday_data(db, asset_id, start_date, end_date, data_interval, limit)
-            native_data = _format_ohlcv_rows(native_rows)
-
             # 누락 방지를 위해 하위 분봉 로드 (5M~30M은 5M에서, 1H 이상은 5M/1H에서 유동적으로)
             # 중요: 과거 테이블과 실시간 테이블 양쪽에서 소스 데이터를 가져와야 오늘자 리샘플링이 가능함
             if target_min <= 5:
                 source_int = '1m'
             else:
                 source_int = '5m'
-            
-            raw_hist = db_get_intraday_data(db, asset_id, start_date, end_date, source_int, limit * (target_min // 5 if source_int == '5m' else target_min))
-            raw_rt = db_get_realtime_bar_data(db, asset_id, start_date, end_date, source_int, limit * (target_min // 5 if source_int == '5m' else target_min))
-
-            raw_data = _format_ohlcv_rows(raw_hist + raw_rt)
-
-            unique_sources = {}
-            for d in raw_data:
-                ts = d['timestamp_utc']
-                # 단순 틱 데이터(H=L)가 아닌 유의미한 봉 데이터를 우선시함
-                if ts not in unique_sources or d.get('high_price') != d.get('low_price'):
-                    unique_sources[ts] = d
-
-            synth_data = resample_intraday_data(list(unique_sources.values()), target_min, data_interval)
-
-            # 실시간/지연 데이터(리얼타임 테이블)도 해당 인터벌로 가져와 함께 병합
-            rt_bar_rows = db_get_realtime_bar_data(db, asset_id, start_date, end_date, data_interval, limit)
-            delay_rows = db_get_delay_data(db, asset_id, start_date, end_date, data_interval, limit)
-            rt_data = _format_ohlcv_rows(rt_bar_rows)
-            dy_data = _format_ohlcv_rows(delay_rows)
-
-            unique_final = {d['timestamp_utc']: d for d in native_data}
-            for ds in [synth_data, dy_data, rt_data]:
-                for d in ds:
-                    ts = d['timestamp_utc']
-                    if ts not in unique_final or d.get('high_price') != d.get('low_price'):
-                        unique_final[ts] = d
-
-            data = sorted(unique_final.values(), key=lambda x: x['timestamp_utc'])
-            data = _recalculate_change_percent(data)
+            source_limit = limit * (target_min // 5 if source_int == '5m' else target_min)
+
+            # 네이티브 / 하위 분봉(과거+실시간) / 실시간 봉 / 지연 시세를 한 번에 조회
+            native, raw_hist, raw_rt, rt_bar, delay = db_get_chart_sources(db, asset_id, start_date, end_date, [
+                ('intraday', data_interval, limit),
+                ('intraday', source_int, source_limit),
+                ('realtime_bar', source_int, source_limit),
+                ('realtime_bar', data_interval, limit),
+                ('delay', data_interval, limit),
+            ])
+
+            # 하위 분봉: 과거 테이블 우선, 실시간 봉은 빈 시각만 채움 -> 목표 간격으로 리샘플
+            raw, _ = merge_sources([
+                MergeSource('intraday', raw_hist, CHART_SOURCE_RANKS['intraday'], overrides=False),
+                MergeSource('realtime_bar', raw_rt, CHART_SOURCE_RANKS['realtime_bar'], overrides=False),
+            ])
+            synth = resample_candles(raw, target_min).to_columns()
+
+            merged, _ = merge_sources([
+                MergeSource('intraday', native, CHART_SOURCE_RANKS['intraday'], overrides=False),
+                MergeSource('resampled', synth, CHART_SOURCE_RANKS['resampled']),
+                MergeSource('delay', delay, CHART_SOURCE_RANKS['delay']),
+                MergeSource('realtime_bar', rt_bar, CHART_SOURCE_RANKS['realtime_bar']),
+            ])
+            data = _merged_chart_data(merged, data_interval, limit)
 
         # 4. 그 외 (1m 등 주요 라이브 차트 데이터)
         else:
-            # 1) 인트라데이 (과거 분봉)
-            intraday_rows = db_get_intraday_data(db, asset_id, start_date, end_date, data_interval, limit)
-            hist_data = _format_ohlcv_rows(intraday_rows)
-
-            # 2) 실시간 집계 봉 (최신 7일분)
-            realtime_bar_rows = db_get_realtime_bar_data(db, asset_id, start_date, end_date, data_interval, limit)
-            realtime_bar_hist = _format_ohlcv_rows(realtime_bar_rows)
-
-            # 3) 지연 시세 (백업용)
-            delay_rows = db_get_delay_data(db, asset_id, start_date, end_date, data_interval, limit)
-            delay_hist = _format_ohlcv_rows(delay_rows)
-
-            # 병합 (최신 데이터가 이전 데이터를 덮어씀, 소스 우선순위와 함께 유니크 보장)
-            unique_final = {}
-            # 우선순위가 낮은 소스부터 채워서 최종적으로 높은 우선순위가 덮어쓰도록 유도하거나, 
-            # 혹은 timestamp별로 소스 순위를 따져서 하나만 선택
-            
-            # 1) 히스토리 데이터 먼저 로드
-            for d in hist_data:
-                unique_final[d['timestamp_utc']] = d
-            for d in delay_hist:
-                ts = d['timestamp_utc']
-                if ts not in unique_final or d.get('high_price') != d.get('low_price'):
-                    unique_final[ts] = d
-            for d in realtime_bar_hist:
-                ts = d['timestamp_utc']
-                if ts not in unique_final or d.get('high_price') != d.get('low_price'):
-                    unique_final[ts] = d
-
-            data = sorted(unique_final.values(), key=lambda x: x['timestamp_utc'])
-            data = _recalculate_change_percent(data)
+            # 인트라데이(과거 분봉) / 실시간 집계 봉(최신 7일분) / 지연 시세(백업용)를 한 번에 조회
+            hist, rt_bar, delay = db_get_chart_sources(db, asset_id, start_date, end_date, [
+                ('intraday', data_interval, limit),
+                ('realtime_bar', data_interval, limit),
+                ('delay', data_interval, limit),
+            ])
+
+            # 히스토리가 바탕, 지연 시세 -> 실시간 봉 순으로 완전한 봉이 덮어씀 (틱성 봉은 빈 시각만 채움)
+            merged, _ = merge_sources([
+                MergeSource('intraday', hist, CHART_SOURCE_RANKS['intraday'], overrides=False),
+                MergeSource('delay', delay, CHART_SOURCE_RANKS['delay']),
+                MergeSource('realtime_bar', rt_bar, CHART_SOURCE_RANKS['realtime_bar']),
+            ])
+            data = _merged_chart_data(merged, data_interval, limit)
 
         if limit and len(data) > limit:
             data = data[-limit:]
@@ -961,136 +873,21 @@ def get_batch_latest_prices_v2(
         if not tickers:
             return {"data": []}
 
-        ticker_list = [t.strip().upper() for t in tickers.split(',') if t.strip()]
-
-        # 1. Get Asset IDs
-        assets = db.query(Asset.asset_id, Asset.ticker).filter(
-            Asset.ticker.in_(ticker_list)
-        ).all()
+        # 중복 티커는 한 번만 조회/응답 (요청 순서 유지)
+        ticker_list = list(dict.fromkeys(t.strip().upper() for t in tickers.split(',') if t.strip()))
 
-        logger.info(f"[BatchPrice] Found {len(assets)} assets for tickers: {[a.ticker for a in assets]}")
-
-        if not assets:
-            return {"data": []}
+        # asset_latest_price 프로젝션(쓰기 시점에 원천 우선순위 반영)을 read-through 캐시로 조회
+        prices = latest_price_cache.get_many(db, ticker_list)
 
-        asset_map = {a.asset_id: a.ticker for a in assets}
-        asset_ids = list(asset_map.keys())
-
-        # 2. Get Max Date per Asset (optimized UNION ALL)
-        # Check Realtime (delay), Intraday, and Daily tables
-        # Priority: Timestamp DESC
-
-        stmt = text("""
-            WITH latest_prices AS (
-                -- 0. Realtime Quotes (Live)
-                SELECT
-                    asset_id,
-                    price as close_price,
-                    timestamp_utc,
-                    'realtime' as source_table,
-                    data_source
-                FROM realtime_quotes
-                WHERE asset_id = ANY(:asset_ids)
-
-                UNION ALL
-
-                -- 1. Realtime Quotes (15m delay)
-                SELECT
-                    asset_id,
-                    price as close_price,
-                    timestamp_utc,
-                    'realtime_delay' as source_table,
-                    data_source
-                FROM realtime_quotes_time_delay
-                WHERE asset_id = ANY(:asset_ids)
-
-                UNION ALL
-
-                -- 1.1 Realtime Bar Data
-                SELECT
-                    asset_id,
-                    close_price,
-                    timestamp_utc,
-                    'realtime_bar' as source_table,
-                    data_source
-                FROM realtime_quotes_time_bar
-                WHERE asset_id = ANY(:asset_ids)
-
-                UNION ALL
-
-                -- 2. Intraday Data
-                SELECT
-                    asset_id,
-                    close_price,
-                    timestamp_utc,
-                    'intraday' as source_table,
-                    NULL as data_source
-                FROM ohlcv_intraday_data
-                WHERE asset_id = ANY(:asset_ids)
-                  AND timestamp_utc > (now() AT TIME ZONE 'UTC' - INTERVAL '7 days')
-                
-                UNION ALL
-                
-                -- 3. Daily Data
-                SELECT 
-                    asset_id, 
-                    close_price, 
-                    timestamp_utc,
-                    'daily' as source_table,
-                    NULL as data_source
-                FROM ohlcv_day_data 
-                WHERE asset_id = ANY(:asset_ids) 
-                AND (data_interval = '1d' OR data_interval = '1day' OR data_interval IS NULL)
-
-                UNION ALL
-                
-                -- 4. World Assets Ranking (Daily Snapshot)
-                SELECT 
-                    asset_id, 
-                    price_usd as close_price, 
-                    CAST(ranking_date AS TIMESTAMP) as timestamp_utc,
-                    'ranking' as source_table,
-                    'ranking' as data_source
-                FROM world_assets_ranking 
-                WHERE asset_id = ANY(:asset_ids)
-            )
-            SELECT DISTINCT ON (asset_id) 
-                asset_id, 
-                close_price, 
-                timestamp_utc,
-                data_source
-            FROM latest_prices
-            ORDER BY asset_id, 
-                     timestamp_utc DESC,
-                     CASE source_table
-                        WHEN 'realtime' THEN 1
-                        WHEN 'realtime_bar' THEN 2
-                        WHEN 'realtime_delay' THEN 3
-                        WHEN 'intraday' THEN 4
-                        ELSE 9
-                     END ASC,
-                     CASE 
-                        WHEN data_source = 'polygon' THEN 1
-                        WHEN data_source = 'twelvedata' THEN 2
-                        WHEN data_source = 'alpaca' THEN 3
-                        ELSE 4
-                     END ASC
-        """)
-        
-        rows = db.execute(stmt, {"asset_ids": asset_ids}).fetchall()
-        
-        logger.info(f"[BatchPrice] DB Query Result: {len(rows)} rows fetched")
-        
         data = []
-        for row in rows:
-            mapped = dict(row._mapping)
-            t_ticker = asset_map.get(mapped['asset_id'])
-            if t_ticker:
-                logger.debug(f"[BatchPrice] {t_ticker} -> {mapped['close_price']} at {mapped['timestamp_utc']}")
+        for t_ticker in ticker_list:
+            for item in prices.get(t_ticker, []):
+                if item['price'] is None:
+                    continue
                 data.append({
-                    "ticker": t_ticker,
-                    "price": float(mapped['close_price']) if mapped['close_price'] else None,
-                    "last_updated": mapped['timestamp_utc']
+                    "ticker": item['ticker'],
+                    "price": item['price'],
+                    "last_updated": item['last_updated']
                 })
                 
         logger.info(f"[BatchPrice] Returning {len(data)} items: {[d['ticker'] for d in data]}")
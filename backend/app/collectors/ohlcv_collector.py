@@ -5,8 +5,8 @@ relying on dependency injection for all external interactions.
 """
 import logging
 import asyncio
-import json
-from typing import List, Dict, Any
+import os
+from typing import List, Dict, Any, Optional
 
 from sqlalchemy.orm import Session, joinedload
 from sqlalchemy import or_
@@ -15,11 +15,14 @@ from .base_collector import BaseCollector
 from app.models.asset import Asset, AssetType
 from app.core.config_manager import ConfigManager
 from app.services.api_strategy_manager import ApiStrategyManager
+from app.services.ohlcv_fetch_planner import FetchPlan, plan_fetches
 from app.utils.redis_queue_manager import RedisQueueManager
-from app.external_apis.base.schemas import OhlcvDataPoint # 표준 스키마 임포트
 
 logger = logging.getLogger(__name__)
 
+# 배치 큐 OHLCV 페이로드 형식: "columns" (열 배열 한 번 직렬화, 기본) | "items" (기존 봉별 dict, 구버전 DataProcessor 호환)
+OHLCV_QUEUE_PAYLOAD = os.getenv("OHLCV_QUEUE_PAYLOAD", "columns").lower()
+
 
 class OHLCVCollector(BaseCollector):
     """
@@ -140,10 +143,21 @@ class OHLCVCollector(BaseCollector):
     async def _collect_for_interval(self, asset_ids: List[int], interval: str) -> Dict[str, int]:
         """Handles the collection logic for a single interval."""
         self.logging_helper.log_info(f"Processing interval '{interval}' for {len(asset_ids)} assets.")
-        
+
+        # 전체 자산의 수집 구간을 한 번에 계획 (실패 시 자산별 계산 경로로)
+        plans: Optional[Dict[int, FetchPlan]] = None
+        try:
+            plans = plan_fetches(self.db, asset_ids, interval)
+        except Exception as e:
+            self.db.rollback()
+            self.logging_helper.log_error(f"Failed to plan OHLCV fetches for interval '{interval}', falling back to per-asset planning: {e}")
+
+        if plans is not None:
+            asset_ids = [asset_id for asset_id in asset_ids if asset_id in plans and plans[asset_id].window]
+
         tasks = [
             self.process_with_semaphore(
-                self._fetch_and_enqueue_for_asset(asset_id, interval)
+                self._fetch_and_enqueue_for_asset(asset_id, interval, plans.get(asset_id) if plans else None)
             )
             for asset_id in asset_ids
         ]
@@ -155,54 +169,52 @@ class OHLCVCollector(BaseCollector):
         self.logging_helper.log_info(f"Interval '{interval}' complete. Processed: {processed_count}, Enqueued: {enqueued_count}")
         return {"processed_assets": processed_count, "enqueued_records": enqueued_count}
 
-    async def _fetch_and_enqueue_for_asset(self, asset_id: int, interval: str) -> Dict[str, Any]:
+    async def _fetch_and_enqueue_for_asset(self, asset_id: int, interval: str, plan: Optional[FetchPlan] = None) -> Dict[str, Any]:
         """
         Fetches data for a single asset and enqueues it.
         This is the core unit of work.
         """
         try:
             # 3. 데이터 가져오라고 시키기 (ApiStrategyManager 사용)
-            # ApiStrategyManager는 내부적으로 백필 여부, API fallback 등을 모두 처리합니다.
-            ohlcv_data: List[OhlcvDataPoint] = await self.api_manager.get_ohlcv_data(
+            # 수집 구간은 plan(실행 단위 일괄 계획)을 그대로 쓰고, API fallback은 ApiStrategyManager가 처리합니다.
+            batch = await self.api_manager.get_ohlcv_batch(
                 asset_id=asset_id,
-                interval=interval
+                interval=interval,
+                plan=plan
             )
-            
-            # 백필 여부 확인 (ApiStrategyManager에서 가져온 정보 사용)
-            is_backfill = getattr(self.api_manager, '_last_fetch_was_backfill', False)
 
-            if not ohlcv_data:
+            if batch is None or not len(batch):
                 self.logging_helper.log_debug(f"No new OHLCV data returned for asset_id {asset_id}, interval {interval}.")
                 return {"success": True, "enqueued_count": 0}
 
+            # 백필 여부는 이 호출의 수집 구간에서 가져옴 (일괄 계획 실패 시 자산별로 계산한 값, 다른 자산 태스크와 공유하지 않음)
+            is_backfill = batch.is_backfill
+
             # 4. 작업 큐에 넘겨주기 (RedisQueueManager 사용)
-            if ohlcv_data:
-                # 표준 큐 페이로드 형식: {"items": [...], "metadata": {...}}로 통일
-                # JSON 직렬화를 위해 model_dump_json을 사용하거나, 직접 변환
-                items = [
-                    json.loads(item.model_dump_json()) for item in ohlcv_data
+            # 표준 큐 페이로드 형식: {"columns": {...}, "metadata": {...}} (봉별 모델/JSON 변환 없이 열 배열을 한 번만 직렬화)
+            payload: Dict[str, Any] = {
+                "metadata": {
+                    "asset_id": asset_id,
+                    "interval": interval,
+                    "data_type": "ohlcv",
+                    "is_backfill": is_backfill
+                }
+            }
+            if OHLCV_QUEUE_PAYLOAD == "items":
+                payload["items"] = [
+                    {**row, "timestamp_utc": row["timestamp_utc"].isoformat()}
+                    for row in batch.to_rows(None, interval)
                 ]
+            else:
+                payload["columns"] = batch.to_payload()
 
-                # interval에 따라 적절한 태스크 타입 선택
-                # 1m은 분 단위이므로 intraday_data로 분류 (1mo, 1month는 월 단위이므로 day_data)
-                task_type = "ohlcv_day_data" if interval in ["1d", "daily", "1w", "1mo", "1month"] else "ohlcv_intraday_data"
-                
-                await self.redis_queue_manager.push_batch_task(
-                    task_type,
-                    {
-                        "items": items,
-                        "metadata": {
-                            "asset_id": asset_id,
-                            "interval": interval,
-                            "data_type": "ohlcv",
-                            "is_backfill": is_backfill
-                        }
-                    }
-                )
-                self.logging_helper.log_debug(f"Successfully enqueued {len(ohlcv_data)} OHLCV records for asset_id {asset_id}.")
-                return {"success": True, "enqueued_count": len(ohlcv_data)}
+            # interval에 따라 적절한 태스크 타입 선택
+            # 1m은 분 단위이므로 intraday_data로 분류 (1mo, 1month는 월 단위이므로 day_data)
+            task_type = "ohlcv_day_data" if interval in ["1d", "daily", "1w", "1mo", "1month"] else "ohlcv_intraday_data"
             
-            return {"success": True, "enqueued_count": 0}
+            await self.redis_queue_manager.push_batch_task(task_type, payload)
+            self.logging_helper.log_debug(f"Successfully enqueued {len(batch)} OHLCV records for asset_id {asset_id}.")
+            return {"success": True, "enqueued_count": len(batch)}
 
         except Exception as e:
             self.logging_helper.log_asset_error(asset_id, e)
@@ -0,0 +1,231 @@
+"""
+Quote Broadcast Engine - 실시간 시세 배치의 방(room) 단위 묶음 전송
+- 같은 (asset_id, ticker) 시세는 전송 주기 안에서 최신 값 하나로 합침 (심볼별 최대 전송 빈도 제한)
+- prices_{ticker} / prices_{asset_id} 두 방에 모두 있는 클라이언트도 시세당 한 번만 받음
+- 클라이언트마다 구독한 심볼 시세 목록을 담은 'realtime_quotes' 이벤트 1개를 전송.
+  구독 조합이 같은 클라이언트는 같은 페이로드로 묶어 sio.emit(to=[sid, ...]) 한 번으로 보냄
+  (콜백 없는 emit은 python-socketio가 패킷을 한 번만 인코딩해서 수신자 전원에게 공유)
+- Redis 매니저(멀티 워커) 사용 시 수신 배치를 채널로 한 번만 중계하고 각 워커는 로컬 클라이언트에만 전송
+  (emit(ignore_queue=True): 매니저 큐를 다시 거치지 않음)
+- 호환성: 합쳐진 시세는 'realtime_quotes'(목록)로만 전송됨. 단건 'realtime_quote' 이벤트만 듣는
+  클라이언트(웹 프론트엔드 외 스크립트/봇 등)는 더 이상 시세를 받지 못하므로 'realtime_quotes'를 구독해야 함
+"""
+import asyncio
+import json
+import logging
+import os
+import time
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import socketio
+
+logger = logging.getLogger(__name__)
+
+QUOTE_EVENT = "realtime_quotes"
+RELAY_CHANNEL = "ws:realtime_quotes"
+DEFAULT_MAX_RATE_HZ = float(os.getenv("WS_QUOTE_MAX_RATE_HZ", "5"))
+STATS_INTERVAL_SECONDS = 60
+
+
+def quote_key(quote: Dict[str, Any]) -> Tuple[Any, Any]:
+    return quote.get("asset_id"), quote.get("ticker")
+
+
+def quote_rooms(quote: Dict[str, Any]) -> List[str]:
+    """시세가 전달될 방 목록 (티커와 ID 둘 다 지원하여 프론트엔드 호환성 확보)"""
+    asset_id = quote.get("asset_id")
+    ticker = quote.get("ticker") or f"ASSET_{asset_id}"
+    rooms = [f"prices_{ticker}"]
+    if asset_id:
+        rooms.append(f"prices_{asset_id}")
+    return rooms
+
+
+JSON_SCALARS = (str, int, float, bool)
+
+
+def compact_quote(quote: Dict[str, Any]) -> Dict[str, Any]:
+    """None 필드는 전송하지 않음 (datetime/Decimal 등은 중계 경로의 json.dumps(default=str)와 같게 문자열로)"""
+    return {k: v if isinstance(v, JSON_SCALARS) else str(v) for k, v in quote.items() if v is not None}
+
+
+class QuoteBroadcastEngine:
+    """시세 배치를 합치고 클라이언트별 프레임으로 전송"""
+
+    def __init__(
+        self,
+        sio: socketio.AsyncServer,
+        namespace: str = "/",
+        max_rate_hz: float = DEFAULT_MAX_RATE_HZ,
+        relay_url: Optional[str] = None,
+    ):
+        self.sio = sio
+        self.namespace = namespace
+        # 0 이하이면 합치지 않고 수신 즉시 전송
+        self.flush_interval = 1.0 / max_rate_hz if max_rate_hz > 0 else 0.0
+        self.relay_url = relay_url
+        self._pending: Dict[Tuple[Any, Any], Dict[str, Any]] = {}
+        self._wakeup = asyncio.Event()
+        self._flush_task: Optional[asyncio.Task] = None
+        self._relay_task: Optional[asyncio.Task] = None
+        self._relay_client = None
+        self._relay_ready = False
+        self.stats = defaultdict(int)
+        self._stats_started = time.time()
+
+    # ------------------------------------------------------------------
+    # 입력
+    # ------------------------------------------------------------------
+    async def submit(self, quotes: Iterable[Dict[str, Any]]):
+        """Broadcaster 서비스에서 받은 시세 배치 등록 (중계 사용 시 모든 워커로 전달)"""
+        quotes = [q for q in quotes if isinstance(q, dict)]
+        if not quotes:
+            return
+        self.ensure_started()
+        # 중계 채널 구독이 끝나기 전에는 유실되지 않도록 로컬로 바로 전송
+        if self.relay_url and self._relay_ready:
+            try:
+                client = await self._get_relay_client()
+                await client.publish(RELAY_CHANNEL, json.dumps(quotes, default=str))
+                return
+            except Exception as e:
+                logger.warning(f"⚠️ Quote relay publish failed, broadcasting locally: {e}")
+        self.enqueue(quotes)
+
+    def enqueue(self, quotes: Iterable[Dict[str, Any]]):
+        """로컬 전송 대기열에 추가 (같은 심볼은 최신 값으로 덮어씀)"""
+        for quote in quotes:
+            if not quote.get("ticker") and not quote.get("asset_id"):
+                continue
+            key = quote_key(quote)
+            if key in self._pending:
+                self.stats["conflated"] += 1
+            self._pending[key] = quote
+            self.stats["received"] += 1
+        self.ensure_started()
+        self._wakeup.set()
+
+    def ensure_started(self):
+        """이벤트 루프 안에서 처음 호출될 때 전송/중계 수신 태스크 시작"""
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_loop())
+        if self.relay_url and (self._relay_task is None or self._relay_task.done()):
+            self._relay_task = asyncio.create_task(self._relay_loop())
+
+    # ------------------------------------------------------------------
+    # 전송
+    # ------------------------------------------------------------------
+    async def _flush_loop(self):
+        while True:
+            await self._wakeup.wait()
+            self._wakeup.clear()
+            started = time.monotonic()
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.error(f"❌ Quote flush failed: {e}")
+            if self.flush_interval:
+                await asyncio.sleep(max(0.0, self.flush_interval - (time.monotonic() - started)))
+
+    async def flush(self) -> int:
+        """대기 중인 시세를 클라이언트별 'realtime_quotes' 이벤트로 전송. 반환값: 전송한 클라이언트 프레임 수"""
+        if not self._pending:
+            return 0
+        quotes = list(self._pending.values())
+        self._pending = {}
+
+        # 시세 dict는 한 번만 만들고, 구독 조합이 같은 클라이언트 묶음마다 페이로드 1개 + emit 1회
+        compact = [compact_quote(q) for q in quotes]
+        groups = self.group_by_client(quotes)
+        sends = [
+            self.sio.emit(
+                QUOTE_EVENT,
+                [compact[i] for i in indices],
+                to=sids,
+                namespace=self.namespace,
+                ignore_queue=True,
+            )
+            for indices, sids in groups.items()
+        ]
+        frames = sum(len(sids) for sids in groups.values())
+        if sends:
+            results = await asyncio.gather(*sends, return_exceptions=True)
+            for sids, result in zip(groups.values(), results):
+                if isinstance(result, Exception):
+                    self.stats["failed"] += len(sids)
+
+        self.stats["sent"] += len(quotes)
+        self.stats["frames"] += frames
+        self._log_stats()
+        return frames
+
+    def group_by_client(self, quotes: List[Dict[str, Any]]) -> Dict[Tuple[int, ...], List[str]]:
+        """
+        로컬 클라이언트별로 받을 시세 인덱스를 모으고, 같은 인덱스 조합을 가진 클라이언트끼리 묶음.
+        반환값: {(시세 인덱스...): [sid, ...]}
+        """
+        per_client: Dict[str, List[int]] = defaultdict(list)
+        manager = self.sio.manager
+        for index, quote in enumerate(quotes):
+            seen = set()
+            for room in quote_rooms(quote):
+                for sid, _ in manager.get_participants(self.namespace, room):
+                    if sid not in seen:
+                        seen.add(sid)
+                        per_client[sid].append(index)
+
+        groups: Dict[Tuple[int, ...], List[str]] = defaultdict(list)
+        for sid, indices in per_client.items():
+            groups[tuple(indices)].append(sid)
+        return groups
+
+    def _log_stats(self):
+        now = time.time()
+        if now - self._stats_started < STATS_INTERVAL_SECONDS:
+            return
+        s = self.stats
+        print(
+            f"✅ [WebSocket 통계] 지난 {int(now - self._stats_started)}초: 수신 {s['received']}건, "
+            f"병합 {s['conflated']}건, 전송 {s['sent']}건, 클라이언트 프레임 {s['frames']}개, 실패 {s['failed']}개"
+        )
+        self.stats.clear()
+        self._stats_started = now
+
+    # ------------------------------------------------------------------
+    # 멀티 워커 중계
+    # ------------------------------------------------------------------
+    async def _get_relay_client(self):
+        if self._relay_client is None:
+            import redis.asyncio as redis
+            self._relay_client = redis.from_url(self.relay_url)
+        return self._relay_client
+
+    async def _relay_loop(self):
+        """다른 워커(또는 자신)가 중계한 배치를 받아 로컬 대기열에 추가"""
+        while True:
+            pubsub = None
+            try:
+                client = await self._get_relay_client()
+                pubsub = client.pubsub()
+                await pubsub.subscribe(RELAY_CHANNEL)
+                self._relay_ready = True
+                async for message in pubsub.listen():
+                    if message.get("type") != "message":
+                        continue
+                    try:
+                        self.enqueue(json.loads(message["data"]))
+                    except (ValueError, TypeError) as e:
+                        logger.warning(f"⚠️ Invalid relayed quote batch: {e}")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"❌ Quote relay subscription failed, retrying: {e}")
+                await asyncio.sleep(1)
+            finally:
+                self._relay_ready = False
+                if pubsub is not None:
+                    try:
+                        await pubsub.close()
+                    except Exception:
+                        pass
@@ -0,0 +1,164 @@
+"""
+Subscription Resolver - subscribe_prices 심볼을 asset_id 방으로 해석
+- 프로세스 공용 SymbolResolver 인덱스로 요청의 심볼 목록을 한 번에 해석 (이벤트 루프에서 DB 접근 없음)
+- 시작 시 전체 적재(warm), 이후 assets.updated_at 워터마크로 주기적 증분 갱신 (자산 변경/삭제 반영)
+- 자산을 수정하는 경로(tickers 설정 엔드포인트, crud_asset.update_asset_settings)는 invalidate()로 즉시 갱신
+- 인덱스에 없는 심볼만 비동기 세션으로 한 번의 쿼리로 조회하고, 끝내 없는 심볼은 일정 시간 부정 캐시
+"""
+import asyncio
+import logging
+import os
+from typing import Dict, Iterable, List, Optional
+
+from sqlalchemy import text
+
+from app.services.symbol_resolver import SymbolResolver, identifier_candidates, symbol_resolver
+from app.services.ttl_cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+REFRESH_INTERVAL_SECONDS = int(os.getenv("WS_SYMBOL_REFRESH_SECONDS", "60"))
+NEGATIVE_TTL_SECONDS = int(os.getenv("WS_SYMBOL_NEGATIVE_TTL_SECONDS", "300"))
+NEGATIVE_MAX_ENTRIES = int(os.getenv("WS_SYMBOL_NEGATIVE_MAX_ENTRIES", "10000"))
+
+MISS_QUERY = text("""
+    SELECT a.asset_id, a.ticker, at.type_name, a.is_active
+    FROM assets a
+    JOIN asset_types at ON a.asset_type_id = at.asset_type_id
+    WHERE a.ticker = ANY(:tickers)
+""")
+
+
+class SubscriptionResolver:
+    """구독 심볼 -> asset_id 일괄 해석 (인덱스 우선, 미스는 비동기 DB 조회)"""
+
+    def __init__(
+        self,
+        resolver: SymbolResolver = symbol_resolver,
+        refresh_interval: int = REFRESH_INTERVAL_SECONDS,
+        negative_ttl: int = NEGATIVE_TTL_SECONDS,
+    ):
+        self.resolver = resolver
+        self.refresh_interval = refresh_interval
+        self.negative_ttl = negative_ttl
+        # 끝내 해석되지 않은 심볼 (임의 입력이 쌓이지 않도록 개수 상한)
+        self._negative = TTLCache(ttl_seconds=negative_ttl, max_entries=NEGATIVE_MAX_ENTRIES)
+        self._miss_lock: Optional[asyncio.Lock] = None
+        self._refresh_task: Optional[asyncio.Task] = None
+
+    # ------------------------------------------------------------------
+    # 해석
+    # ------------------------------------------------------------------
+    async def resolve_many(self, symbols: Iterable) -> Dict[str, int]:
+        """
+        심볼 목록을 asset_id로 일괄 해석. 숫자 심볼(이미 ID)과 해석 실패 심볼은 결과에서 제외.
+        반환값: {symbol: asset_id}
+        """
+        resolved: Dict[str, int] = {}
+        misses: List[str] = []
+        for symbol in dict.fromkeys(str(s) for s in symbols if s):
+            if symbol.isdigit():
+                continue
+            hit = self.resolver.resolve_identifier(symbol)
+            if hit is not None:
+                resolved[symbol] = hit.asset_id
+            elif symbol not in self._negative:
+                misses.append(symbol)
+
+        if misses:
+            resolved.update(await self._resolve_misses(misses))
+        return resolved
+
+    async def _resolve_misses(self, symbols: List[str]) -> Dict[str, int]:
+        """인덱스 미스를 한 번의 비동기 쿼리로 조회해 인덱스에 반영"""
+        if self._miss_lock is None:
+            self._miss_lock = asyncio.Lock()
+        async with self._miss_lock:
+            # 대기하는 동안 다른 요청이 이미 적재했을 수 있음
+            resolved: Dict[str, int] = {}
+            pending = []
+            for symbol in symbols:
+                hit = self.resolver.resolve_identifier(symbol)
+                if hit is not None:
+                    resolved[symbol] = hit.asset_id
+                else:
+                    pending.append(symbol)
+            if not pending:
+                return resolved
+
+            tickers = sorted({c for s in pending for c in identifier_candidates(s) + identifier_candidates(s.upper())})
+            try:
+                rows = await self._fetch_rows(tickers)
+            except Exception as e:
+                logger.warning(f"⚠️ Subscription symbol lookup failed: {e}")
+                return resolved
+            if rows:
+                self.resolver.load_rows(rows, replace=False)
+
+            unresolved = {}
+            for symbol in pending:
+                hit = self.resolver.resolve_identifier(symbol)
+                if hit is not None:
+                    resolved[symbol] = hit.asset_id
+                else:
+                    unresolved[symbol] = True
+            self._negative.set_many(unresolved)
+            return resolved
+
+    async def _fetch_rows(self, tickers: List[str]) -> List[tuple]:
+        from app.core.database import get_async_session_local
+
+        session_local = get_async_session_local()
+        async with session_local() as session:
+            result = await session.execute(MISS_QUERY, {"tickers": tickers})
+            return [tuple(row) for row in result.fetchall()]
+
+    # ------------------------------------------------------------------
+    # 적재 / 갱신
+    # ------------------------------------------------------------------
+    def ensure_started(self):
+        """이벤트 루프 안에서 처음 호출될 때 워밍 + 주기 갱신 태스크 시작"""
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self._refresh_loop())
+
+    async def refresh(self, full: bool = False) -> int:
+        """인덱스 갱신 (동기 DB 작업은 스레드에서 실행). 반환값: 반영된 자산 수"""
+        updated = await asyncio.to_thread(self._refresh_sync, full)
+        if updated:
+            # 새로 생기거나 바뀐 자산이 있으면 부정 캐시는 다시 확인하도록 비움
+            self._negative.invalidate()
+        return updated
+
+    def _refresh_sync(self, full: bool) -> int:
+        from app.core.database import SessionLocal
+
+        db = SessionLocal()
+        try:
+            return self.resolver.refresh(db, full=full)
+        finally:
+            db.close()
+
+    def invalidate(self):
+        """자산 변경 직후 호출: 부정 캐시를 비우고 다음 주기를 기다리지 않고 증분 갱신"""
+        self._negative.invalidate()
+        try:
+            asyncio.get_running_loop().create_task(self.refresh())
+        except RuntimeError:
+            # 이벤트 루프 밖(동기 엔드포인트 등)에서는 다음 주기 갱신에 맡김
+            pass
+
+    async def _refresh_loop(self):
+        while True:
+            try:
+                updated = await self.refresh()
+                if updated:
+                    print(f"🔎 [Subscription] 심볼 인덱스 갱신: {updated}개 자산 ({self.resolver.stats()['index_size']} entries)")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"❌ Subscription symbol index refresh failed: {e}")
+            await asyncio.sleep(self.refresh_interval)
+
+
+# 프로세스 공용 인스턴스
+subscription_resolver = SubscriptionResolver()
@@ -8,7 +8,8 @@ from datetime import datetime, timezone
 from app.core.config import GLOBAL_APP_CONFIGS
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.jobstores.memory import MemoryJobStore
-from collections import defaultdict
+from app.core.quote_broadcast import QuoteBroadcastEngine
+from app.core.subscription_resolver import subscription_resolver
 
 # DataProcessor를 모듈 레벨에서 한 번만 임포트하여 재사용합니다.
 try:
@@ -49,6 +50,8 @@ sio = socketio.AsyncServer(
 async def connect(sid, environ):
     """클라이언트 연결 시 호출"""
     print(f"🔗 Client connected: {sid}")
+    quote_engine.ensure_started()
+    subscription_resolver.ensure_started()
     print(f"🔍 연결 정보: {environ.get('REMOTE_ADDR', 'unknown')}")
     
     # 현재 연결된 클라이언트 수 확인
@@ -71,9 +74,11 @@ async def disconnect(sid):
     print(f"👥 남은 연결된 클라이언트 수: {connected_clients}")
 
 # (신규) Broadcaster 서비스로부터 이벤트를 받아 처리
-# 통계 집계용 변수
-broadcast_stats = defaultdict(lambda: 0)
-last_stat_log_time = time.time()
+# 시세는 QuoteBroadcastEngine이 심볼별로 합친 뒤 클라이언트별 'realtime_quotes' 프레임으로 전송
+quote_engine = QuoteBroadcastEngine(
+    sio,
+    relay_url=redis_url if os.getenv("WS_QUOTE_RELAY", "true").lower() == "true" else None,
+)
 
 @sio.event
 async def broadcast_quote(sid, data):
@@ -87,10 +92,7 @@ async def broadcast_quotes_batch(sid, data_list):
         return
     
     # print(f"📦 [BACKEND←BROADCASTER] 배치 수신: {len(data_list)}건")
-    # 병렬 브로드캐스트 (속도 최적화)
-    tasks = [broadcast_realtime_quote(item) for item in data_list]
-    if tasks:
-        await asyncio.gather(*tasks)
+    await quote_engine.submit(data_list)
 
 # 실시간 가격 데이터 구독 이벤트
 @sio.event
@@ -99,36 +101,21 @@ async def subscribe_prices(sid, data):
     symbols = data.get('symbols', [])
     print(f"📡 Client {sid} subscribing to prices: {symbols}")
     
-    # 각 심볼에 대해 룸에 추가
-    for symbol in symbols:
-        # 1. 기본 티커명/ID명 룸 입장
-        await sio.enter_room(sid, f"prices_{symbol}")
-        print(f"🏠 Added client {sid} to room: prices_{symbol}")
-        
-        # 2. [추가] 심볼을 asset_id로 해석하여 ID 기반 룸에도 자동 입장
-        # 이렇게 하면 티커명 불일치(BTC vs BTCUSDT) 문제를 원천 차단 가능함
-        if symbol and not str(symbol).isdigit():
-            try:
-                from app.core.database import SessionLocal
-                from app.api.v2.endpoints.assets.shared.resolvers import resolve_asset_identifier
-                
-                db = SessionLocal()
-                try:
-                    asset_id = resolve_asset_identifier(db, str(symbol))
-                    if asset_id:
-                        await sio.enter_room(sid, f"prices_{asset_id}")
-                        print(f"🏠 [Smart-Route] Also added client {sid} to room: prices_{asset_id}")
-                except Exception:
-                    # 해석 실패 시 시도 중단 (로그는 생략하여 노이즈 방지)
-                    pass
-                finally:
-                    db.close()
-            except ImportError:
-                # 초기화 중이거나 모듈 로드 실패 시 무시
-                pass
-            except Exception as e:
-                print(f"⚠️ Smart-Route resolution failed: {e}")
-    
+    # 1. 기본 티커명/ID명 룸 입장
+    # 2. 심볼을 asset_id로 해석하여 ID 기반 룸에도 자동 입장 (티커명 불일치 BTC vs BTCUSDT 대응)
+    #    인덱스로 일괄 해석하며, 인덱스에 없는 심볼만 비동기 DB 조회
+    try:
+        resolved = await subscription_resolver.resolve_many(symbols)
+    except Exception as e:
+        resolved = {}
+        print(f"⚠️ Smart-Route resolution failed: {e}")
+
+    rooms = {f"prices_{symbol}" for symbol in symbols}
+    rooms.update(f"prices_{asset_id}" for asset_id in resolved.values())
+    for room in rooms:
+        await sio.enter_room(sid, room)
+    print(f"🏠 Added client {sid} to {len(rooms)} rooms ({len(resolved)} resolved to asset_id)")
+
     await sio.emit('subscription_confirmed', {
         'message': f'Subscribed to {len(symbols)} symbols',
         'symbols': symbols
@@ -209,43 +196,15 @@ async def broadcast_sparkline_update(symbol, interval, sparkline_data):
         print(f"Failed to broadcast sparkline update for {symbol}: {e}")
 
 async def broadcast_realtime_quote(quote_data):
-    """실시간 인용 데이터를 모든 연결된 클라이언트에게 브로드캐스트"""
+    """
+    실시간 인용 데이터를 구독 중인 클라이언트에게 브로드캐스트 (배치 엔진 경유)
+    단건 'realtime_quote' 이벤트가 아니라 합쳐진 'realtime_quotes' 목록으로 전송됨
+    """
     try:
-        asset_id = quote_data.get('asset_id')
-        price = quote_data.get('price')
-        ticker = quote_data.get('ticker', f'ASSET_{asset_id}')
-        change_percent = quote_data.get('change_percent', 0)
-        
-        if not ticker:
+        if not isinstance(quote_data, dict) or not (quote_data.get('ticker') or quote_data.get('asset_id')):
             print(f"⚠️ 브로드캐스트 건너뜀: ticker 정보가 없습니다. data={quote_data}")
             return
-
-        # 로그 출력 시 None 값 안전하게 처리
-        change_percent_str = f"{change_percent:+.2f}%" if change_percent is not None else "N/A"
-
-        # 방송할 룸 목록 (티커와 ID 둘 다 지원하여 프론트엔드 호환성 확보)
-        rooms = [f"prices_{ticker}"]
-        if asset_id:
-            rooms.append(f"prices_{asset_id}")
-        
-        # 각 룸으로 이벤트 전송
-        for room in rooms:
-            await sio.emit('realtime_quote', quote_data, room=room)
-        
-        # print(f"✅ Broadcasted {ticker} to rooms: {rooms}")
-        
-        # 통계 집계
-        global last_stat_log_time
-        asset_type = quote_data.get('asset_type', 'Unknown')
-        broadcast_stats[asset_type] += 1
-        
-        current_time = time.time()
-        if current_time - last_stat_log_time >= 60:
-            stats_str = ", ".join([f"{k}: {v}개 성공" for k, v in broadcast_stats.items()])
-            print(f"✅ [WebSocket 통계] 지난 1분간 방송 성공: {stats_str}")
-            broadcast_stats.clear()
-            last_stat_log_time = current_time
-        
+        await quote_engine.submit([quote_data])
     except Exception as e:
         print(f"❌ Failed to broadcast realtime quote: {e}")
         import traceback
@@ -76,6 +76,9 @@ class CRUDAsset(CRUDBase[Asset]):
                     setattr(asset, key, value)
             
             db.commit()
+            # 티커/활성 상태가 바뀔 수 있으므로 WebSocket 구독 심볼 인덱스 갱신
+            from app.core.subscription_resolver import subscription_resolver
+            subscription_resolver.invalidate()
             return True
         except Exception as e:
             logger.error(f"Asset settings update failed: {e}")
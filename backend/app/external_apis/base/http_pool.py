@@ -0,0 +1,84 @@
+"""
+이벤트 루프별 공유 httpx 클라이언트 풀
+- 클라이언트 구현은 호출마다 `async with httpx.AsyncClient(...)` 로 새 커넥션 풀을 열고 닫아, 호출마다
+  TCP/TLS 핸드셰이크가 발생했음
+- pooled_client(**kwargs): enable_shared_pool()을 호출한 루프(스케줄러 상시 루프)에서는 같은 설정(kwargs)의
+  keep-alive 클라이언트를 돌려주고 닫지 않음. 그 외 루프에서는 기존처럼 호출마다 새 클라이언트
+- 커넥션 풀은 루프에 묶이므로 루프마다 따로 두고, 루프 종료 전에 close_shared_pool()로 닫음
+"""
+import asyncio
+import os
+import threading
+from contextlib import asynccontextmanager
+from typing import Any, Dict, Tuple
+
+import httpx
+
+HTTP_POOL_MAX_CONNECTIONS = int(os.getenv("HTTP_POOL_MAX_CONNECTIONS", "100"))
+HTTP_POOL_MAX_KEEPALIVE = int(os.getenv("HTTP_POOL_MAX_KEEPALIVE", "20"))
+HTTP_POOL_KEEPALIVE_EXPIRY = float(os.getenv("HTTP_POOL_KEEPALIVE_EXPIRY", "90"))
+
+_pools: Dict[asyncio.AbstractEventLoop, Dict[Tuple, httpx.AsyncClient]] = {}
+_stats: Dict[asyncio.AbstractEventLoop, Dict[str, int]] = {}
+_lock = threading.Lock()
+
+
+def _pool_key(kwargs: Dict[str, Any]) -> Tuple:
+    return tuple(sorted((k, repr(v)) for k, v in kwargs.items()))
+
+
+def enable_shared_pool() -> None:
+    """현재 실행 중인 루프에서 pooled_client가 공유 클라이언트를 쓰도록 등록"""
+    loop = asyncio.get_running_loop()
+    with _lock:
+        _pools.setdefault(loop, {})
+        _stats.setdefault(loop, {"clients": 0, "requests": 0})
+
+
+async def close_shared_pool() -> None:
+    """현재 루프의 공유 클라이언트를 모두 닫고 등록 해제"""
+    loop = asyncio.get_running_loop()
+    with _lock:
+        clients = list(_pools.pop(loop, {}).values())
+        _stats.pop(loop, None)
+    for client in clients:
+        try:
+            await client.aclose()
+        except Exception:
+            pass
+
+
+def pool_stats() -> Dict[str, int]:
+    """현재 루프의 공유 클라이언트 수 / 공유 클라이언트로 처리한 호출 수"""
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return {"clients": 0, "requests": 0}
+    return dict(_stats.get(loop) or {"clients": 0, "requests": 0})
+
+
+@asynccontextmanager
+async def pooled_client(**kwargs):
+    """httpx.AsyncClient(**kwargs) 대체. 공유 풀이 켜진 루프에서는 재사용 (종료 시 닫지 않음)"""
+    loop = asyncio.get_running_loop()
+    pool = _pools.get(loop)
+    if pool is None:
+        async with httpx.AsyncClient(**kwargs) as client:
+            yield client
+        return
+
+    key = _pool_key(kwargs)
+    client = pool.get(key)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=HTTP_POOL_MAX_CONNECTIONS,
+                max_keepalive_connections=HTTP_POOL_MAX_KEEPALIVE,
+                keepalive_expiry=HTTP_POOL_KEEPALIVE_EXPIRY,
+            ),
+            **kwargs,
+        )
+        pool[key] = client
+        _stats[loop]["clients"] += 1
+    _stats[loop]["requests"] += 1
+    yield client
@@ -8,6 +8,7 @@ from datetime import datetime
 import httpx
 
 from app.external_apis.base.tradfi_client import TradFiAPIClient
+from app.external_apis.base.http_pool import pooled_client
 from app.external_apis.base.schemas import (
     OhlcvDataPoint, RealtimeQuoteData, CompanyProfileData,
     StockFinancialsData, StockAnalystEstimatesData,
@@ -51,7 +52,7 @@ class AlphaVantageClient(TradFiAPIClient):
             return False
         
         try:
-            async with httpx.AsyncClient() as client:
+            async with pooled_client() as client:
                 url = f"{self.base_url}?function=TIME_SERIES_INTRADAY&symbol=AAPL&interval=1min&apikey={self.api_keys[0]}"
                 data = await self._fetch_async(client, url, "Alpha Vantage", "AAPL")
                 return "Time Series (1min)" in data or "Note" in data
@@ -96,7 +97,7 @@ class AlphaVantageClient(TradFiAPIClient):
         
         for api_key in self.api_keys:
             try:
-                async with httpx.AsyncClient() as client:
+                async with pooled_client() as client:
                     # 4h 인터벌의 경우 TIME_SERIES_INTRADAY 사용
                     if interval == "4h":
                         url = f"{self.base_url}?function=TIME_SERIES_INTRADAY&symbol={symbol}&interval=60min&apikey={api_key}&outputsize=full"
@@ -190,7 +191,7 @@ class AlphaVantageClient(TradFiAPIClient):
         
         for api_key in self.api_keys:
             try:
-                async with httpx.AsyncClient() as client:
+                async with pooled_client() as client:
                     url = f"{self.base_url}?function=OVERVIEW&symbol={symbol}&apikey={api_key}"
                     data = await self._fetch_async(client, url, "Alpha Vantage Overview", symbol)
                     
@@ -275,7 +276,7 @@ class AlphaVantageClient(TradFiAPIClient):
                 raise ValueError("No Alpha Vantage API keys configured")
             for api_key in self.api_keys:
                 try:
-                    async with httpx.AsyncClient() as client:
+                    async with pooled_client() as client:
                         url = f"{self.base_url}?function=OVERVIEW&symbol={symbol}&apikey={api_key}"
                         data = await self._fetch_async(client, url, "Alpha Vantage Overview", symbol)
 
@@ -348,7 +349,7 @@ class AlphaVantageClient(TradFiAPIClient):
                         "apikey": api_key
                     }
                     
-                    async with httpx.AsyncClient() as client:
+                    async with pooled_client() as client:
                         response = await client.get(url, params=params, timeout=self.api_timeout)
                         if response.status_code == 200:
                             data = response.json()
@@ -8,6 +8,7 @@ from datetime import datetime
 import httpx
 
 from app.external_apis.base.crypto_client import CryptoAPIClient
+from app.external_apis.base.http_pool import pooled_client
 from app.external_apis.base.schemas import CryptoData
 from app.external_apis.utils.helpers import safe_float, safe_timestamp_parse
 
@@ -103,7 +104,7 @@ class BinanceClient(CryptoAPIClient):
     async def test_connection(self) -> bool:
         """Test Binance API connection"""
         try:
-            async with httpx.AsyncClient() as client:
+            async with pooled_client() as client:
                 url = f"{self.base_url}/ping"
                 response = await client.get(url, timeout=self.api_timeout)
                 return response.status_code == 200
@@ -141,7 +142,7 @@ class BinanceClient(CryptoAPIClient):
             # 심볼 정규화
             normalized_symbol = self._normalize_symbol_for_binance(symbol)
             
-            async with httpx.AsyncClient() as client:
+            async with pooled_client() as client:
                 # Build query parameters
                 query = f"symbol={normalized_symbol}&interval={interval}"
                 
@@ -195,7 +196,7 @@ class BinanceClient(CryptoAPIClient):
             # 심볼 정규화
             normalized_symbol = self._normalize_symbol_for_binance(symbol)
             
-            async with httpx.AsyncClient() as client:
+            async with pooled_client() as client:
                 url = f"{self.base_url}/ticker/24hr?symbol={normalized_symbol}"
                 data = await self._fetch_async(client, url, "Binance 24hr Ticker", normalized_symbol)
                 
@@ -216,7 +217,7 @@ class BinanceClient(CryptoAPIClient):
     async def get_exchange_info(self) -> Optional[Dict[str, Any]]:
         """Get exchange information"""
         try:
-            async with httpx.AsyncClient() as client:
+            async with pooled_client() as client:
                 url = f"{self.base_url}/exchangeInfo"
                 data = await self._fetch_async(client, url, "Binance Exchange Info")
                 
@@ -248,7 +249,7 @@ class BinanceClient(CryptoAPIClient):
             # 심볼 정규화
             normalized_symbol = self._normalize_symbol_for_binance(symbol)
             
-            async with httpx.AsyncClient() as client:
+            async with pooled_client() as client:
                 # Get 24hr ticker data
                 url = f"{self.base_url}/ticker/24hr?symbol={normalized_symbol}"
                 data = await self._fetch_async(client, url, "Binance 24hr Ticker", normalized_symbol)
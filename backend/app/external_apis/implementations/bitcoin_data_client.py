@@ -9,6 +9,7 @@ import httpx
 import pandas as pd
 
 from app.external_apis.base.onchain_client import OnChainAPIClient
+from app.external_apis.base.http_pool import pooled_client
 from app.external_apis.base.schemas import CryptoData, OnChainMetricData, CryptoMetricsData
 from app.external_apis.utils.helpers import safe_float, safe_date_parse
 
@@ -71,7 +72,7 @@ class BitcoinDataClient(OnChainAPIClient):
     async def test_connection(self) -> bool:
         """Test Bitcoin Data API connection"""
         try:
-            async with httpx.AsyncClient() as client:
+            async with pooled_client() as client:
                 # Test with a lightweight endpoint
                 url = f"{self.base_url}/btc-price?size=1"
                 params = {}
@@ -278,7 +279,7 @@ class BitcoinDataClient(OnChainAPIClient):
                 size = days if days else 1
                 query_params['size'] = size
 
-            async with httpx.AsyncClient() as client:
+            async with pooled_client() as client:
                 data = await self._fetch_standard(client, endpoint, query_params)
                 
                 if not data:
@@ -8,6 +8,7 @@ from datetime import datetime, timedelta, timezone
 import httpx
 
 from app.external_apis.base.crypto_client import CryptoAPIClient
+from app.external_apis.base.http_pool import pooled_client
 from app.external_apis.base.schemas import OhlcvDataPoint, RealtimeQuoteData, CryptoData
 from app.external_apis.utils.helpers import safe_float, safe_date_parse
 
@@ -111,7 +112,7 @@ class CoinbaseClient(CryptoAPIClient):
     async def test_connection(self) -> bool:
         """Test Coinbase API connection"""
         try:
-            async with httpx.AsyncClient() as client:
+            async with pooled_client() as client:
                 url = f"{self.base_url}/time"
                 response = await client.get(url, timeout=self.api_timeout)
                 return response.status_code == 200
@@ -146,7 +147,7 @@ class CoinbaseClient(CryptoAPIClient):
                 logger.warning(f"Coinbase does not support symbol: {symbol}")
                 return []
             
-            async with httpx.AsyncClient() as client:
+            async with pooled_client() as client:
                 # Coinbase는 granularity를 초 단위로 받음 (86400 = 1일)
                 granularity_val = int(86400)
                 if interval == "1m":
@@ -248,7 +249,7 @@ class CoinbaseClient(CryptoAPIClient):
             # Coinbase API용 심볼 변환
             coinbase_symbol = self._convert_symbol_for_coinbase(symbol)
             
-            async with httpx.AsyncClient() as client:
+            async with pooled_client() as client:
                 url = f"{self.base_url}/products/{coinbase_symbol}/ticker"
                 data = await self._fetch_async(client, url, "Coinbase Ticker", symbol)
                 
@@ -268,7 +269,7 @@ class CoinbaseClient(CryptoAPIClient):
     async def get_exchange_info(self) -> Optional[Dict[str, Any]]:
         """Get exchange information from Coinbase"""
         try:
-            async with httpx.AsyncClient() as client:
+            async with pooled_client() as client:
                 url = f"{self.base_url}/products"
                 data = await self._fetch_async(client, url, "Coinbase Products")
                 
@@ -305,7 +306,7 @@ class CoinbaseClient(CryptoAPIClient):
                 logger.warning(f"Coinbase does not support symbol: {symbol}")
                 return None
             
-            async with httpx.AsyncClient() as client:
+            async with pooled_client() as client:
                 # Get product stats
                 url = f"{self.base_url}/products/{coinbase_symbol}/stats"
                 data = await self._fetch_async(client, url, "Coinbase Stats", symbol)
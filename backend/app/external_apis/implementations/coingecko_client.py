@@ -9,6 +9,7 @@ from datetime import datetime
 import httpx
 
 from app.external_apis.base.crypto_client import CryptoAPIClient
+from app.external_apis.base.http_pool import pooled_client
 from app.external_apis.base.schemas import OhlcvDataPoint, RealtimeQuoteData, CryptoData
 from app.external_apis.utils.helpers import safe_float, safe_date_parse
 
@@ -58,7 +59,7 @@ class CoinGeckoClient(CryptoAPIClient):
     async def test_connection(self) -> bool:
         """Test CoinGecko API connection"""
         try:
-            async with httpx.AsyncClient() as client:
+            async with pooled_client() as client:
                 url = f"{self.base_url}/ping"
                 response = await client.get(url, timeout=self.api_timeout)
                 return response.status_code == 200
@@ -92,7 +93,7 @@ class CoinGeckoClient(CryptoAPIClient):
             # Enforce rate limiting
             await self._enforce_rate_limit()
             
-            async with httpx.AsyncClient() as client:
+            async with pooled_client() as client:
                 # CoinGecko는 일간 데이터를 기본으로 제공
                 if interval != "1d":
                     logger.warning(f"CoinGecko only supports daily data, requested interval: {interval}")
@@ -181,7 +182,7 @@ class CoinGeckoClient(CryptoAPIClient):
     async def get_realtime_quote(self, symbol: str) -> Optional[RealtimeQuoteData]:
         """Get real-time quote from CoinGecko"""
         try:
-            async with httpx.AsyncClient() as client:
+            async with pooled_client() as client:
                 # CoinGecko는 coin ID를 사용
                 coin_id = self._normalize_symbol_for_coingecko(symbol)
                 url = f"{self.base_url}/simple/price?ids={coin_id}&vs_currencies=usd&include_24hr_change=true"
@@ -205,7 +206,7 @@ class CoinGeckoClient(CryptoAPIClient):
     async def get_exchange_info(self) -> Optional[Dict[str, Any]]:
         """Get exchange information from CoinGecko"""
         try:
-            async with httpx.AsyncClient() as client:
+            async with pooled_client() as client:
                 url = f"{self.base_url}/exchanges"
                 data = await self._fetch_async(client, url, "CoinGecko Exchanges")
                 
@@ -231,7 +232,7 @@ class CoinGeckoClient(CryptoAPIClient):
     async def get_global_metrics(self) -> Optional[Dict[str, Any]]:
         """Get global cryptocurrency market metrics from CoinGecko"""
         try:
-            async with httpx.AsyncClient() as client:
+            async with pooled_client() as client:
                 url = f"{self.base_url}/global"
                 data = await self._fetch_async(client, url, "CoinGecko Global")
                 
@@ -348,7 +349,7 @@ class CoinGeckoClient(CryptoAPIClient):
             # Enforce rate limiting
             await self._enforce_rate_limit()
             
-            async with httpx.AsyncClient() as client:
+            async with pooled_client() as client:
                 # CoinGecko는 coin ID를 사용
                 coin_id = self._normalize_symbol_for_coingecko(symbol)
                 url = f"{self.base_url}/coins/{coin_id}?localization=false&tickers=false&market_data=true&community_data=false&developer_data=false&sparkline=false"
@@ -10,6 +10,7 @@ from datetime import datetime
 import httpx
 
 from app.external_apis.base.crypto_client import CryptoAPIClient
+from app.external_apis.base.http_pool import pooled_client
 from app.external_apis.base.schemas import OhlcvDataPoint, RealtimeQuoteData, CryptoData
 from app.core.config import COINMARKETCAP_API_KEY
 from app.external_apis.utils.helpers import safe_float, safe_date_parse
@@ -70,7 +71,7 @@ class CoinMarketCapClient(CryptoAPIClient):
             return False
         
         try:
-            async with httpx.AsyncClient() as client:
+            async with pooled_client() as client:
                 url = f"{self.base_url}/cryptocurrency/map?limit=1"
                 response = await client.get(url, headers=self.headers, timeout=self.api_timeout)
                 return response.status_code == 200
@@ -147,7 +148,7 @@ class CoinMarketCapClient(CryptoAPIClient):
     async def get_realtime_quote(self, symbol: str) -> Optional[RealtimeQuoteData]:
         """Get real-time quote from CoinMarketCap"""
         try:
-            async with httpx.AsyncClient() as client:
+            async with pooled_client() as client:
                 url = f"{self.base_url}/cryptocurrency/quotes/latest?symbol={symbol}&convert=USD"
                 data = await self._fetch_async_with_headers(client, url, "CoinMarketCap Quotes", symbol)
                 
@@ -179,7 +180,7 @@ class CoinMarketCapClient(CryptoAPIClient):
             normalized_symbol = self._normalize_symbol_for_coinmarketcap(symbol)
             if not normalized_symbol:
                 normalized_symbol = (symbol or "").strip().upper()
-            async with httpx.AsyncClient() as client:
+            async with pooled_client() as client:
                 url = f"{self.base_url}/cryptocurrency/quotes/latest?symbol={normalized_symbol}&convert=USD"
                 data = await self._fetch_async_with_headers(client, url, "CoinMarketCap Quotes", normalized_symbol)
 
@@ -217,7 +218,7 @@ class CoinMarketCapClient(CryptoAPIClient):
             normalized_symbol = self._normalize_symbol_for_coinmarketcap(symbol)
             if not normalized_symbol:
                 normalized_symbol = (symbol or "").strip().upper()
-            async with httpx.AsyncClient() as client:
+            async with pooled_client() as client:
                 url = f"{self.base_url}/cryptocurrency/info?symbol={normalized_symbol}"
                 data = await self._fetch_async_with_headers(client, url, "CoinMarketCap Info", normalized_symbol)
                 if isinstance(data, dict) and "data" in data and normalized_symbol in data["data"]:
@@ -246,7 +247,7 @@ class CoinMarketCapClient(CryptoAPIClient):
                     # quotes로 id/slug 확보 후 id로 조회 시도
                     details = await self.get_quote_details(symbol)
                     if details and isinstance(details, dict):
-                        async with httpx.AsyncClient() as client2:
+                        async with pooled_client() as client2:
                             coin_id = None
                             try:
                                 # quotes를 다시 호출하여 id 포함 응답 받기
@@ -285,7 +286,7 @@ class CoinMarketCapClient(CryptoAPIClient):
     async def get_exchange_info(self) -> Optional[Dict[str, Any]]:
         """Get exchange information from CoinMarketCap"""
         try:
-            async with httpx.AsyncClient() as client:
+            async with pooled_client() as client:
                 url = f"{self.base_url}/exchange/map?limit=10"
                 data = await self._fetch_async_with_headers(client, url, "CoinMarketCap Exchanges")
                 
@@ -312,7 +313,7 @@ class CoinMarketCapClient(CryptoAPIClient):
     async def get_global_metrics(self) -> Optional[Dict[str, Any]]:
         """Get global cryptocurrency market metrics from CoinMarketCap"""
         try:
-            async with httpx.AsyncClient() as client:
+            async with pooled_client() as client:
                 url = f"{self.base_url}/global-metrics/quotes/latest?convert=USD"
                 data = await self._fetch_async_with_headers(client, url, "CoinMarketCap Global Metrics")
                 
@@ -346,7 +347,7 @@ class CoinMarketCapClient(CryptoAPIClient):
             normalized_symbol = self._normalize_symbol_for_coinmarketcap(symbol)
             logger.info(f"[{symbol}] CoinMarketCap API 호출 시도 (정규화: {normalized_symbol}): {self.base_url}/cryptocurrency/quotes/latest?symbol={normalized_symbol}&convert=USD")
             
-            async with httpx.AsyncClient() as client:
+            async with pooled_client() as client:
                 url = f"{self.base_url}/cryptocurrency/quotes/latest?symbol={normalized_symbol}&convert=USD"
                 data = await self._fetch_async_with_headers(client, url, "CoinMarketCap Quotes", normalized_symbol)
                 
@@ -9,6 +9,7 @@ import httpx
 import json
 
 from ..base.tradfi_client import TradFiAPIClient
+from ..base.http_pool import pooled_client
 import os
 
 # ... (imports)
@@ -49,7 +50,7 @@ class EdgarClient(TradFiAPIClient):
     async def test_connection(self) -> bool:
         """Test connection to SEC EDGAR API"""
         try:
-            async with httpx.AsyncClient(timeout=10) as client:
+            async with pooled_client(timeout=10) as client:
                 # Test with a simple company facts request
                 test_url = f"{self.CIK_LOOKUP_URL}0000320193.json"  # Apple's CIK
                 response = await client.get(test_url, headers=self.headers)
@@ -105,7 +106,7 @@ class EdgarClient(TradFiAPIClient):
         
         log.debug(f"Fetching EDGAR data from: {url}")
         
-        async with httpx.AsyncClient(timeout=10) as client:
+        async with pooled_client(timeout=10) as client:
             response = await client.get(url, headers=self.headers)
             response.raise_for_status()
             
@@ -9,6 +9,7 @@ import pytz
 import httpx
 
 from app.external_apis.base.tradfi_client import TradFiAPIClient
+from app.external_apis.base.http_pool import pooled_client
 from app.external_apis.base.schemas import (
     OhlcvDataPoint,
     CompanyProfileData,
@@ -43,7 +44,7 @@ class FMPClient(TradFiAPIClient):
             return False
         
         try:
-            async with httpx.AsyncClient() as client:
+            async with pooled_client() as client:
                 url = f"{self.base_url}/quote?symbol=AAPL&apikey={self.api_key}"
                 data = await self._fetch_async(client, url, "FMP", "AAPL")
                 return isinstance(data, list) and len(data) > 0
@@ -93,7 +94,7 @@ class FMPClient(TradFiAPIClient):
                     logger.info(f"FMP: {format_trading_status_message(end_date_obj)} - 데이터 요청 스킵")
                     return []
             
-            async with httpx.AsyncClient() as client:
+            async with pooled_client() as client:
                 # interval에 따라 다른 엔드포인트 사용
                 if interval in ["4h", "1h", "30m", "15m", "5m", "1m"]:
                     # 인트라데이 데이터용 엔드포인트
@@ -173,7 +174,7 @@ class FMPClient(TradFiAPIClient):
             raise ValueError("No FMP API key configured")
         
         try:
-            async with httpx.AsyncClient() as client:
+            async with pooled_client() as client:
                 url = f"{self.base_url}/profile?symbol={symbol}&apikey={self.api_key}"
                 
                 try:
@@ -245,7 +246,7 @@ class FMPClient(TradFiAPIClient):
             raise ValueError("No FMP API key configured")
         
         try:
-            async with httpx.AsyncClient() as client:
+            async with pooled_client() as client:
                 url = f"{self.base_url}/quote?symbol={symbol}&apikey={self.api_key}"
                 data = await self._fetch_async(client, url, "FMP Quote", symbol)
                 
@@ -276,7 +277,7 @@ class FMPClient(TradFiAPIClient):
             raise ValueError("No FMP API key configured")
         
         try:
-            async with httpx.AsyncClient() as client:
+            async with pooled_client() as client:
                 # stable API에서는 기술 지표를 개별적으로 가져와야 함 (EMA 200 기본값 시도)
                 url = f"{self.base_url}/technical-indicators/ema?symbol={symbol}&period=200&apikey={self.api_key}"
 
@@ -319,7 +320,7 @@ class FMPClient(TradFiAPIClient):
             raise ValueError("No FMP API key configured")
 
         try:
-            async with httpx.AsyncClient() as client:
+            async with pooled_client() as client:
                 # Profile API에서 기본 재무 데이터 가져오기
                 profile_url = f"{self.base_url}/profile?symbol={symbol}&apikey={self.api_key}"
                 
@@ -411,7 +412,7 @@ class FMPClient(TradFiAPIClient):
             raise ValueError("No FMP API key configured")
 
         try:
-            async with httpx.AsyncClient() as client:
+            async with pooled_client() as client:
                 # Use the stable analyst-estimates endpoint per FMP docs
                 url = f"https://financialmodelingprep.com/stable/analyst-estimates?symbol={symbol}&period=annual&limit=10&apikey={self.api_key}"
                 
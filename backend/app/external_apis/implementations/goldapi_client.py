@@ -10,6 +10,7 @@ from decimal import Decimal
 import httpx
 
 from app.external_apis.base.schemas import OhlcvDataPoint, RealtimeQuoteData
+from app.external_apis.base.http_pool import pooled_client
 from app.external_apis.utils.helpers import safe_float
 
 logger = logging.getLogger(__name__)
@@ -62,7 +63,7 @@ class GoldAPIClient:
     async def test_connection(self) -> bool:
         """API 연결 테스트"""
         try:
-            async with httpx.AsyncClient(timeout=self.api_timeout) as client:
+            async with pooled_client(timeout=self.api_timeout) as client:
                 url = f"{self.base_url}/XAU/USD"
                 response = await client.get(url, headers=self._get_headers())
                 return response.status_code == 200
@@ -102,7 +103,7 @@ class GoldAPIClient:
                 logger.warning(f"Unsupported metal symbol: {symbol} -> {metal_symbol}")
                 return None
             
-            async with httpx.AsyncClient(timeout=self.api_timeout) as client:
+            async with pooled_client(timeout=self.api_timeout) as client:
                 url = f"{self.base_url}/{metal_symbol}/{currency}"
                 logger.info(f"GoldAPI request: {url}")
                 
@@ -171,7 +172,7 @@ class GoldAPIClient:
                 logger.warning(f"Unsupported metal symbol: {symbol}")
                 return None
             
-            async with httpx.AsyncClient(timeout=self.api_timeout) as client:
+            async with pooled_client(timeout=self.api_timeout) as client:
                 url = f"{self.base_url}/{metal_symbol}/{currency}/{date}"
                 logger.info(f"GoldAPI historical request: {url}")
                 
@@ -305,7 +306,7 @@ class GoldAPIClient:
     async def get_gold_silver_ratio(self) -> Optional[Dict[str, Any]]:
         """금/은 비율 조회 (XAU/XAG)"""
         try:
-            async with httpx.AsyncClient(timeout=self.api_timeout) as client:
+            async with pooled_client(timeout=self.api_timeout) as client:
                 url = f"{self.base_url}/XAU/XAG"
                 response = await client.get(url, headers=self._get_headers())
                 response.raise_for_status()
@@ -11,6 +11,7 @@ import asyncio
 from datetime import datetime, timedelta
 
 from app.external_apis.base.tradfi_client import TradFiAPIClient
+from app.external_apis.base.http_pool import pooled_client
 from app.external_apis.base.schemas import (
     OhlcvDataPoint, RealtimeQuoteData, CompanyProfileData,
     StockFinancialsData, TechnicalIndicatorsData,
@@ -65,7 +66,7 @@ class KisClient(TradFiAPIClient):
         }
         
         try:
-            async with httpx.AsyncClient() as client:
+            async with pooled_client() as client:
                 resp = await client.post(url, headers=headers, json=body, timeout=10.0)
                 resp.raise_for_status()
                 data = resp.json()
@@ -135,7 +136,7 @@ class KisClient(TradFiAPIClient):
             default_headers.update(headers)
             
         try:
-            async with httpx.AsyncClient() as client:
+            async with pooled_client() as client:
                 if method.upper() == "GET":
                     resp = await client.get(url, headers=default_headers, params=params, timeout=self.api_timeout)
                 elif method.upper() == "POST":
@@ -16,6 +16,7 @@ import httpx
 from bs4 import BeautifulSoup
 
 from ..base.tradfi_client import TradFiAPIClient
+from ..base.http_pool import pooled_client
 
 
 logger = logging.getLogger(__name__)
@@ -39,7 +40,7 @@ class MacrotrendsClient(TradFiAPIClient):
 
     async def test_connection(self) -> bool:
         try:
-            async with httpx.AsyncClient(timeout=self.api_timeout, follow_redirects=True, headers=self.headers) as client:
+            async with pooled_client(timeout=self.api_timeout, follow_redirects=True, headers=self.headers) as client:
                 resp = await client.get(self.BASE.format(symbol="AAPL", slug="apple", page="income-statement"))
                 return resp.status_code == 200
         except Exception as e:
@@ -72,7 +73,7 @@ class MacrotrendsClient(TradFiAPIClient):
     async def _fetch_table(self, symbol: str, slug: str, page: str) -> Optional[List[Dict[str, Any]]]:
         url = self.BASE.format(symbol=symbol.upper(), slug=slug, page=page)
         try:
-            async with httpx.AsyncClient(timeout=self.api_timeout, follow_redirects=True, headers=self.headers) as client:
+            async with pooled_client(timeout=self.api_timeout, follow_redirects=True, headers=self.headers) as client:
                 resp = await client.get(url)
                 resp.raise_for_status()
                 soup = BeautifulSoup(resp.content, "html.parser")
@@ -11,6 +11,7 @@ from decimal import Decimal
 import httpx
 
 from app.external_apis.base.schemas import OhlcvDataPoint, RealtimeQuoteData
+from app.external_apis.base.http_pool import pooled_client
 from app.external_apis.utils.helpers import safe_float
 
 logger = logging.getLogger(__name__)
@@ -64,7 +65,7 @@ class MarketDataClient:
     async def test_connection(self) -> bool:
         """API 연결 테스트 (AAPL은 인증 없이 테스트 가능)"""
         try:
-            async with httpx.AsyncClient(timeout=self.api_timeout) as client:
+            async with pooled_client(timeout=self.api_timeout) as client:
                 url = f"{self.base_url}/stocks/quotes/AAPL/"
                 response = await client.get(url, headers=self._get_headers())
                 return response.status_code == 200
@@ -100,7 +101,7 @@ class MarketDataClient:
         try:
             endpoint = self.supported_endpoints.get(asset_type, '/stocks')
             
-            async with httpx.AsyncClient(timeout=self.api_timeout) as client:
+            async with pooled_client(timeout=self.api_timeout) as client:
                 url = f"{self.base_url}{endpoint}/quotes/{symbol}/"
                 logger.info(f"MarketData request: {url}")
                 
@@ -166,7 +167,7 @@ class MarketDataClient:
         try:
             endpoint = self.supported_endpoints.get(asset_type, '/stocks')
             
-            async with httpx.AsyncClient(timeout=self.api_timeout) as client:
+            async with pooled_client(timeout=self.api_timeout) as client:
                 url = f"{self.base_url}{endpoint}/candles/{resolution}/{symbol}/"
                 params = {}
                 
@@ -291,7 +292,7 @@ class MarketDataClient:
             endpoint = self.supported_endpoints.get(asset_type, '/stocks')
             symbols_str = ','.join(symbols)
             
-            async with httpx.AsyncClient(timeout=self.api_timeout) as client:
+            async with pooled_client(timeout=self.api_timeout) as client:
                 url = f"{self.base_url}{endpoint}/bulkquotes/"
                 params = {'symbols': symbols_str}
                 
@@ -346,7 +347,7 @@ class MarketDataClient:
             실적 데이터
         """
         try:
-            async with httpx.AsyncClient(timeout=self.api_timeout) as client:
+            async with pooled_client(timeout=self.api_timeout) as client:
                 url = f"{self.base_url}/stocks/earnings/{symbol}/"
                 params = {}
                 
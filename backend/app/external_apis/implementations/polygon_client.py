@@ -9,6 +9,7 @@ import asyncio
 from datetime import datetime, timedelta, timezone
 
 from app.external_apis.base.tradfi_client import TradFiAPIClient
+from app.external_apis.base.http_pool import pooled_client
 from app.external_apis.base.schemas import (
     OhlcvDataPoint, RealtimeQuoteData, CompanyProfileData,
     StockFinancialsData, StockAnalystEstimatesData, TechnicalIndicatorsData
@@ -86,7 +87,7 @@ class PolygonClient(TradFiAPIClient):
         url = f"{self.base_url}{path}"
         
         try:
-            async with httpx.AsyncClient() as client:
+            async with pooled_client() as client:
                 resp = await client.get(url, params=params, timeout=self.api_timeout)
                 
                 # 404 에러 처리: 지원하지 않는 심볼
@@ -9,6 +9,7 @@ import pandas as pd
 from datetime import datetime, timedelta
 
 from app.external_apis.base.tradfi_client import TradFiAPIClient
+from app.external_apis.base.http_pool import pooled_client
 from app.external_apis.base.schemas import (
     OhlcvDataPoint, RealtimeQuoteData, CompanyProfileData,
     StockFinancialsData, TechnicalIndicatorsData,
@@ -108,7 +109,7 @@ class TiingoClient(TradFiAPIClient):
             url = f"{self.base_url}{normalized_path}"
             
             try:
-                async with httpx.AsyncClient() as client:
+                async with pooled_client() as client:
                     resp = await client.get(url, params=params, timeout=self.api_timeout)
                     
                     # 404 에러 처리: 지원하지 않는 심볼
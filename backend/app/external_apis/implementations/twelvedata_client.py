@@ -10,6 +10,7 @@ from collections import deque
 from datetime import datetime, timedelta
 
 from app.external_apis.base.tradfi_client import TradFiAPIClient
+from app.external_apis.base.http_pool import pooled_client
 from app.external_apis.base.schemas import (
     OhlcvDataPoint, RealtimeQuoteData, CompanyProfileData,
     StockFinancialsData, TechnicalIndicatorsData
@@ -67,7 +68,7 @@ class TwelveDataClient(TradFiAPIClient):
         url = f"{self.base_url}{path}"
         await self._rate_limit()
         try:
-            async with httpx.AsyncClient() as client:
+            async with pooled_client() as client:
                 resp = await client.get(url, params=query, timeout=self.api_timeout)
                 resp.raise_for_status()
                 data = resp.json()
@@ -89,7 +90,7 @@ class TwelveDataClient(TradFiAPIClient):
         try:
             # Rate limiting 적용
             await self._rate_limit()
-            async with httpx.AsyncClient() as client:
+            async with pooled_client() as client:
                 resp = await client.get(f"{self.base_url}/time_series", params={"symbol": "AAPL", "interval": "1min", "outputsize": 1, "apikey": self.api_key}, timeout=self.api_timeout)
                 return resp.status_code == 200
         except Exception as e:
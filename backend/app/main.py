@@ -17,6 +17,7 @@ from app.core.database import engine
 from app.models.user import User
 from app.models.session import UserSession, TokenBlacklist, AuditLog
 from app.core.websocket import sio
+from app.core.subscription_resolver import subscription_resolver
 from app.core.config import GLOBAL_APP_CONFIGS, load_and_set_global_configs, initialize_bitcoin_asset_id
 from app.core.cache import setup_cache  # Import setup_cache
 from app.services.session_cleanup_scheduler import session_cleanup_scheduler
@@ -52,6 +53,8 @@ app = FastAPI(
 @app.on_event("startup")
 async def startup_event():
     await setup_cache()
+    # 구독 심볼 인덱스 워밍 + 주기 갱신
+    subscription_resolver.ensure_started()
 
 # CORS 설정
 origins = [
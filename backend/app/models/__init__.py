@@ -41,6 +41,9 @@ from .asset import (
     BondMarketData,
     ScrapingLogs,
     RealtimeQuotesTimeBar,
+    AssetLatestPrice,
+    OHLCVRollupData,
+    RollingCorrelationSnapshot,
 )
 
 # Financial models
@@ -135,6 +138,9 @@ __all__ = [
     "BondMarketData",
     "ScrapingLogs",
     "RealtimeQuotesTimeBar",
+    "AssetLatestPrice",
+    "OHLCVRollupData",
+    "RollingCorrelationSnapshot",
     
     # Financial models
     "FinancialStatement",
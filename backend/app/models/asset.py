@@ -1,6 +1,7 @@
 # backend_temp/app/models/asset.py
 from sqlalchemy import (BIGINT, BigInteger, DECIMAL, TIMESTAMP, Boolean, Column, Date,
-                        DateTime, ForeignKey, Integer, String, Text, func, JSON, Float, UniqueConstraint, Index)
+                        DateTime, ForeignKey, Integer, String, Text, func, JSON, Float, UniqueConstraint, Index,
+                        LargeBinary)
 from sqlalchemy.orm import relationship
 
 from ..core.database import Base
@@ -867,3 +868,60 @@ class RealtimeQuotesTimeBar(Base):
         Index('idx_rt_bar_lookup', 'asset_id', 'timestamp_utc'),
     )
 
+
+
+class AssetLatestPrice(Base):
+    """
+    자산별 최신 가격 프로젝션 (원천 테이블 트리거로 쓰기 시점에 갱신)
+    - 우선순위: timestamp_utc 최신 -> source_rank(realtime 1, realtime_bar 2, realtime_delay 3, intraday 4, 나머지 9)
+      -> provider_rank(polygon 1, twelvedata 2, alpaca 3, 나머지 4)
+    """
+    __tablename__ = 'asset_latest_price'
+
+    asset_id = Column(Integer, ForeignKey('assets.asset_id', ondelete="CASCADE"), primary_key=True)
+    price = Column(DECIMAL(24, 10), nullable=False)
+    timestamp_utc = Column(DateTime, nullable=False)
+    source_table = Column(String(20), nullable=False)
+    source_rank = Column(Integer, nullable=False)
+    data_source = Column(String(100))
+    provider_rank = Column(Integer, nullable=False)
+    updated_at = Column(TIMESTAMP, server_default=func.now(), onupdate=func.now())
+
+
+class OHLCVRollupData(Base):
+    """
+    일봉 주/월 롤업 (1W: ISO 주, 1M: 달력 월)
+    - ohlcv_day_data 저장 시 영향받은 기간만 재계산 (app/services/ohlcv_rollup.py)
+    - timestamp_utc는 기간 내 마지막 일봉 날짜 (기존 aggregate_to_weekly_v2/monthly_v2 라벨과 동일)
+    """
+    __tablename__ = 'ohlcv_rollup_data'
+
+    asset_id = Column(Integer, ForeignKey('assets.asset_id', ondelete="CASCADE"), primary_key=True)
+    period = Column(String(4), primary_key=True)
+    period_start = Column(DateTime, primary_key=True)
+    timestamp_utc = Column(DateTime, nullable=False)
+    open_price = Column(DECIMAL(24, 10))
+    high_price = Column(DECIMAL(24, 10))
+    low_price = Column(DECIMAL(24, 10))
+    close_price = Column(DECIMAL(24, 10))
+    volume = Column(DECIMAL(30, 10), nullable=False, default=0)
+    bar_count = Column(Integer, nullable=False)
+    updated_at = Column(TIMESTAMP, server_default=func.now(), onupdate=func.now())
+
+
+class RollingCorrelationSnapshot(Base):
+    """
+    상위 N개 자산 유니버스의 상관계수 계산용 일봉 종가 사전 적재 결과 (유니버스당 한 행)
+    - result: 날짜 순서로 정렬한 최근 종가 매트릭스 (np.savez_compressed)
+    - state: 증분 갱신용 종가 링 버퍼 (app/services/rolling_correlation.py)
+    """
+    __tablename__ = 'rolling_correlation_snapshot'
+
+    universe = Column(String(50), primary_key=True)
+    as_of_date = Column(Date, nullable=False)
+    rebuilt_on = Column(Date, nullable=False)
+    windows = Column(JSON, nullable=False)
+    assets = Column(JSON, nullable=False)
+    result = Column(LargeBinary, nullable=False)
+    state = Column(LargeBinary, nullable=False)
+    updated_at = Column(TIMESTAMP, server_default=func.now(), onupdate=func.now())
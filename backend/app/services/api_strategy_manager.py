@@ -21,7 +21,10 @@ from app.external_apis.implementations import (
 )
 from app.external_apis.implementations.goldapi_client import GoldAPIClient
 from app.external_apis.implementations.macrotrends_client import MacrotrendsClient
-from app.crud.asset import crud_ohlcv
+from app.services.ohlcv_batch import OHLCVBatch, price_columns, price_quality
+from app.services.ohlcv_fetch_planner import FetchPlan, plan_fetches
+from app.services.provider_health import provider_health, run_hedged
+from app.services.rate_limiter import rate_limiter
 from app.utils.logging_helper import ApiLoggingHelper as LoggingHelper
 from app.external_apis.base.schemas import EtfInfoData
 
@@ -144,9 +147,6 @@ class ApiStrategyManager:
         self.api_failure_counts = {}
         self.max_failures_before_disable = 5  # 5회 연속 실패 시 비활성화
         
-        # API별 Rate Limiting (동적으로 클라이언트에서 가져옴)
-        self.api_rate_limits = {}  # 클라이언트별로 동적 생성
-        
         # 자산 타입 캐시 (성능 최적화)
         self._asset_type_cache = {}
         self._cache_ttl = self._get_config_value("ASSET_TYPE_CACHE_TTL_SECONDS", 3600, int)  # 1시간 캐시
@@ -289,44 +289,17 @@ class ApiStrategyManager:
                 out_of_order = (~data['timestamp_utc'].is_monotonic_increasing).sum()
                 self.logger.warning(f"[{api_name} {ticker}] timestamps not monotonic increasing (out_of_order approx)={out_of_order}")
 
-            # 가격 컬럼 수집
-            price_candidates = ['open_price','open','Open','high_price','high','High','low_price','low','Low','close_price','close','Close']
-            price_cols = [c for c in price_candidates if c in data.columns]
-
-            # 가격 0/NULL 비율
-            if price_cols:
-                col_stats = []
-                total_rows = len(data)
-                total_zero_or_null = 0
-                for c in price_cols:
-                    series = pd.to_numeric(data[c], errors='coerce')
-                    null_cnt = series.isna().sum()
-                    zero_cnt = (series == 0).sum()
-                    total_zero_or_null += (null_cnt + zero_cnt)
-                    col_stats.append((c, int(null_cnt), int(zero_cnt)))
-                ratio = total_zero_or_null / (total_rows * len(price_cols)) if total_rows > 0 else 1.0
-                self.logger.info(f"[{api_name} {ticker}] price null/zero ratio={ratio:.3%} per col stats={col_stats}")
+            # 가격 0/NULL 비율 + OHLC 논리 검사 (열 배열 마스크, 행 단위 반복 없음)
+            prices = price_columns(data)
+            if prices:
+                quality = price_quality(prices)
+                ratio = quality["zero_null_ratio"]
+                self.logger.info(f"[{api_name} {ticker}] price null/zero ratio={ratio:.3%} cols={list(prices)}")
                 if ratio > 0.05:
                     self.logger.warning(f"[{api_name} {ticker}] reject: too many zero/null prices ratio={ratio:.3%} > 5%")
                     return None
-
-                # OHLC 논리 검사 (가능한 컬럼 맵핑)
-                def pick(*names):
-                    for n in names:
-                        if n in data.columns:
-                            return pd.to_numeric(data[n], errors='coerce')
-                    return None
-                s_open = pick('open_price','open','Open')
-                s_high = pick('high_price','high','High')
-                s_low  = pick('low_price','low','Low')
-                s_close= pick('close_price','close','Close')
-                if s_high is not None and s_low is not None:
-                    max_ocl = pd.concat([s_open, s_close, s_low], axis=1).max(axis=1, skipna=True)
-                    min_ocl = pd.concat([s_open, s_close, s_high], axis=1).min(axis=1, skipna=True)
-                    high_viol = (s_high < max_ocl).sum(skipna=True)
-                    low_viol  = (s_low  > min_ocl).sum(skipna=True)
-                    if high_viol or low_viol:
-                        self.logger.warning(f"[{api_name} {ticker}] OHLC logical anomalies: high<max(open,close,low)={int(high_viol)}, low>min(open,close,high)={int(low_viol)}")
+                if quality["high_violations"] or quality["low_violations"]:
+                    self.logger.warning(f"[{api_name} {ticker}] OHLC logical anomalies: high<max(open,close,low)={quality['high_violations']}, low>min(open,close,high)={quality['low_violations']}")
 
             # 인덱스 설정하지 않고 컬럼으로 유지 (DataProcessor에서 처리)
             self.logger.info(f"[{api_name} {ticker}] final frame shape={data.shape}")
@@ -412,72 +385,6 @@ class ApiStrategyManager:
         else:
             return class_name.lower()
     
-    async def _check_rate_limit(self, api_name: str, client=None) -> bool:
-        """
-        API별 rate limit을 확인하고 필요시 대기합니다.
-        클라이언트의 get_rate_limit_info()를 동적으로 사용합니다.
-        
-        Args:
-            api_name: API 이름
-            client: API 클라이언트 객체 (rate limit 정보 가져오기용)
-            
-        Returns:
-            True if rate limit allows, False if exceeded
-        """
-        # 클라이언트가 제공되지 않으면 rate limit 체크 건너뛰기
-        if not client or not hasattr(client, 'get_rate_limit_info'):
-            return True
-        
-        # 클라이언트에서 rate limit 정보 가져오기
-        try:
-            rate_limit_info = client.get_rate_limit_info()
-            calls_per_minute = rate_limit_info.get('free_tier', {}).get('calls_per_minute', 1000)
-        except Exception as e:
-            self.logger.warning(f"Failed to get rate limit info for {api_name}: {e}")
-            return True  # 실패 시 rate limit 체크 건너뛰기
-        
-        # API별 호출 기록 초기화 (필요시)
-        if api_name not in self.api_rate_limits:
-            self.api_rate_limits[api_name] = {'last_calls': []}
-        
-        rate_limit = self.api_rate_limits[api_name]
-        current_time = time.time()
-        
-        
-        
-        # 1분 이전의 호출 기록 제거
-        rate_limit['last_calls'] = [
-            call_time for call_time in rate_limit['last_calls'] 
-            if current_time - call_time < 60
-        ]
-        
-        # Rate limit 확인
-        if len(rate_limit['last_calls']) >= calls_per_minute:
-            self.logger.warning(f"Rate limit exceeded for {api_name} ({calls_per_minute}/min). Waiting...")
-            return False
-        
-        # 호출 기록 추가
-        rate_limit['last_calls'].append(current_time)
-        return True
-    
-    async def _wait_for_rate_limit(self, api_name: str):
-        """
-        Rate limit이 초과된 경우 대기합니다.
-        """
-        if api_name not in self.api_rate_limits:
-            return
-        
-        rate_limit = self.api_rate_limits[api_name]
-        current_time = time.time()
-        
-        # 가장 오래된 호출이 1분이 지날 때까지 대기
-        if rate_limit['last_calls']:
-            oldest_call = min(rate_limit['last_calls'])
-            wait_time = 60 - (current_time - oldest_call)
-            if wait_time > 0:
-                self.logger.info(f"Waiting {wait_time:.1f}s for {api_name} rate limit reset")
-                await asyncio.sleep(wait_time)
-
     async def _get_asset_info(self, asset_id: int) -> Tuple[Optional[str], Optional[str], Optional[str]]:
         """자산 ID로 티커, 타입, 공급처 조회"""
         from app.models.asset import Asset
@@ -508,17 +415,61 @@ class ApiStrategyManager:
         preferred_data_source: Optional[str] = None,
         limit: Optional[int] = None,
         start_date: Optional[str] = None,
-        end_date: Optional[str] = None
+        end_date: Optional[str] = None,
+        plan: Optional[FetchPlan] = None
     ) -> List[OhlcvDataPoint]:
         """
-        특정 자산의 지정된 간격 OHLCV 데이터를 최신 위주로 가져와 검증 후 데이터프레임으로 반환
-        성공 시 반환되는 데이터는 PostgreSQL DB에 자동으로 배치를 통해 비동기 저장이 예약됩니다.
+        특정 자산의 지정된 간격 OHLCV 데이터를 최신 위주로 가져와 검증 후 OhlcvDataPoint 목록으로 반환
+        (큐 적재 경로는 봉별 모델 변환이 없는 get_ohlcv_batch 사용)
         """
-        # 자산 정보 조회
-        ticker, asset_type, db_data_source = await self._get_asset_info(asset_id)
+        batch = await self.get_ohlcv_batch(
+            asset_id, interval, preferred_data_source=preferred_data_source,
+            limit=limit, start_date=start_date, end_date=end_date, plan=plan
+        )
+        if batch is None or not len(batch):
+            return []
+
+        from app.external_apis.base.schemas import OhlcvDataPoint
+        return [
+            OhlcvDataPoint(
+                timestamp_utc=row['timestamp_utc'],
+                open_price=row['open_price'],
+                high_price=row['high_price'],
+                low_price=row['low_price'],
+                close_price=row['close_price'],
+                volume=row['volume'],
+                change_percent=row['change_percent'],
+                data_interval=interval
+            )
+            for row in batch.to_rows(asset_id, interval)
+        ]
+
+    async def get_ohlcv_batch(
+        self, 
+        asset_id: int, 
+        interval: str = "1d", 
+        preferred_data_source: Optional[str] = None,
+        limit: Optional[int] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        plan: Optional[FetchPlan] = None
+    ) -> Optional[OHLCVBatch]:
+        """
+        특정 자산의 지정된 간격 OHLCV 데이터를 가져와 컬럼형 배치(OHLCVBatch)로 반환 (수집할 것이 없으면 None)
+        batch.is_backfill: 이번 수집 구간이 백필인지 (plan, 없으면 자산별로 계산한 수집 매개변수 기준)
+        검증된 DataFrame을 NumPy 마스크로 한 번에 정규화하므로 봉마다 Python 객체를 만들지 않음.
+        plan (ohlcv_fetch_planner.plan_fetches 결과)이 있으면 자산 정보/수집 구간 조회 없이 계획을 그대로 사용합니다.
+        """
+        if plan is not None:
+            if not plan.window:
+                return None
+            ticker, asset_type, db_data_source = plan.ticker, plan.asset_type, plan.data_source
+        else:
+            # 자산 정보 조회
+            ticker, asset_type, db_data_source = await self._get_asset_info(asset_id)
         if not ticker:
             self.logger.error(f"Asset ID {asset_id}에 해당하는 자산을 찾을 수 없습니다.")
-            return []
+            return None
         
         self.logger.info(f"get_ohlcv_data called for {ticker} (asset_id: {asset_id}, interval: {interval}, preferred: {preferred_data_source})")
         
@@ -526,14 +477,20 @@ class ApiStrategyManager:
         source_to_use = preferred_data_source or db_data_source
         
         # 수집 매개변수 계산 (오버라이드가 없는 경우에만 실행)
-        if start_date or end_date or limit:
+        if plan is not None:
+            params = plan.params()
+        elif start_date or end_date or limit:
             params = {
                 "start_date": start_date,
                 "end_date": end_date,
-                "limit": limit
+                "limit": limit,
+                "is_backfill": True  # 수동 호출은 보통 백필로 간주 (get_ohlcv와 동일)
             }
         else:
             params = await self._get_fetch_parameters(asset_id, interval, ticker, asset_type)
+            if not params:
+                self.logger.info(f"No data fetching needed for asset {asset_id} ({ticker}) at this time.")
+                return None
         
         # 기존 get_ohlcv 메서드 호출
         df = await self.get_ohlcv(
@@ -544,44 +501,18 @@ class ApiStrategyManager:
             asset_id, 
             preferred_data_source=source_to_use, 
             start_date=params.get("start_date"), 
-            end_date=params.get("end_date")
+            end_date=params.get("end_date"),
+            plan=plan
         )
 
         if df is None or df.empty:
-            return []
-        
-        # DataFrame을 Pydantic 모델 리스트로 변환
-        from app.external_apis.base.schemas import OhlcvDataPoint
-        
-        result = []
-        # Reset index to make 'timestamp_utc' a column
-        df_reset = df.reset_index()
-        
-        for _, row in df_reset.iterrows():
-            try:
-                # 컬럼명을 안전하게 확인하고 변환
-                def get_val(r, keys):
-                    for k in keys:
-                        if k in r and pd.notna(r[k]):
-                            return r[k]
-                    return None
-                
-                data_point = OhlcvDataPoint(
-                    timestamp_utc=get_val(row, ['timestamp_utc', 'timestamp']),
-                    open_price=float(get_val(row, ['open_price', 'open'])),
-                    high_price=float(get_val(row, ['high_price', 'high'])),
-                    low_price=float(get_val(row, ['low_price', 'low'])),
-                    close_price=float(get_val(row, ['close_price', 'close'])),
-                    volume=float(get_val(row, ['volume'])),
-                    change_percent=float(get_val(row, ['change_percent', 'change'])) if get_val(row, ['change_percent', 'change']) is not None else None,
-                    data_interval=interval
-                )
-                result.append(data_point)
-            except Exception as e:
-                self.logger.warning(f"Failed to convert row to OhlcvDataPoint: {e}")
-                continue
-        
-        return result
+            return None
+
+        batch = OHLCVBatch.from_frame(df.reset_index())
+        batch.is_backfill = bool(params.get("is_backfill", False))
+        if batch.dropped:
+            self.logger.warning(f"{ticker}: {batch.dropped} OHLCV rows dropped (missing timestamp/OHLC or duplicate timestamp)")
+        return batch
 
     async def get_ohlcv(
         self, 
@@ -592,11 +523,14 @@ class ApiStrategyManager:
         asset_id: Optional[int] = None, 
         preferred_data_source: Optional[str] = None,
         start_date: Optional[str] = None,
-        end_date: Optional[str] = None
+        end_date: Optional[str] = None,
+        plan: Optional[FetchPlan] = None
     ) -> Optional[pd.DataFrame]:
         """
         [IMPROVED] OHLCV 데이터를 여러 API에서 순서대로 시도하여 가져옵니다.
         이제 DB 상태를 확인하여 최적의 파라미터를 자동으로 결정합니다.
+        OHLCV_FALLBACK_POLICY=hedged(기본)이면 앞 공급자가 자신의 최근 p95 지연 안에 답하지 않을 때 다음 공급자를
+        헤지로 동시에 시작하고 먼저 유효한 데이터를 준 쪽을 사용합니다 (sequential: 기존 순차 폴백).
         
         Args:
             ticker: 주식/암호화폐 티커
@@ -604,28 +538,39 @@ class ApiStrategyManager:
             limit: 가져올 데이터 개수 (기본값, asset_id가 있으면 무시됨)
             asset_type: 자산 타입 (crypto, stock, commodity 등)
             asset_id: 자산 ID (DB 상태 확인용, 있으면 최적 파라미터 자동 계산)
+            plan: 수집 계획 (있으면 DB 조회 없이 계획의 구간/백필 여부 사용)
             
         Returns:
             DataFrame 또는 None (모든 API 실패 시)
         """
-        # historical_days를 먼저 가져오기
-        from app.models import AppConfiguration
-        from app.core.database import get_postgres_db
-        
-        db = next(get_postgres_db())
-        try:
-            historical_days_config = db.query(AppConfiguration).filter(
-                AppConfiguration.config_key == "HISTORICAL_DATA_DAYS_PER_RUN"
-            ).first()
-            historical_days = int(historical_days_config.config_value) if historical_days_config else 165
-        finally:
-            db.close()
+        # historical_days를 먼저 가져오기 (계획이 있으면 계획 시점 값 사용)
+        if plan is not None:
+            historical_days = plan.historical_days
+        else:
+            from app.models import AppConfiguration
+            from app.core.database import get_postgres_db
+            
+            db = next(get_postgres_db())
+            try:
+                historical_days_config = db.query(AppConfiguration).filter(
+                    AppConfiguration.config_key == "HISTORICAL_DATA_DAYS_PER_RUN"
+                ).first()
+                historical_days = int(historical_days_config.config_value) if historical_days_config else 165
+            finally:
+                db.close()
         
         # 파라미터 결정 (매개변수로 전달된 것이 있으면 우선적으로 사용)
         is_backfill = False
         
+        if plan is not None and plan.window:
+            params = plan.params()
+            start_date = params["start_date"]
+            end_date = params["end_date"]
+            adjusted_limit = params["limit"]
+            is_backfill = params["is_backfill"]
+            self.logger.info(f"Using planned parameters for asset {plan.asset_id}: {start_date} to {end_date}, limit={adjusted_limit}, backfill={is_backfill}")
         # 외부 전달 파라미터가 모두 있는 경우 그것을 사용
-        if start_date or end_date or limit > 100: # 100은 기본값이므로 100보다 크면 사용자로 간주하거나 그냥 인자 우선
+        elif start_date or end_date or limit > 100: # 100은 기본값이므로 100보다 크면 사용자로 간주하거나 그냥 인자 우선
              adjusted_limit = limit
              # start_date, end_date는 이미 인자로 받음
              is_backfill = True # 수동 호출은 보통 백필로 간주
@@ -641,8 +586,6 @@ class ApiStrategyManager:
             end_date = params["end_date"]
             adjusted_limit = params["limit"]
             is_backfill = params.get("is_backfill", False)
-            # 백필 플래그를 인스턴스 변수에 저장 (수집기에서 참조용)
-            self._last_fetch_was_backfill = is_backfill
             self.logger.info(f"Using optimized parameters for asset {asset_id}: {start_date} to {end_date}, limit={adjusted_limit}, backfill={is_backfill}")
         else:
             # 기존 로직 유지 (하위 호환성)
@@ -658,8 +601,6 @@ class ApiStrategyManager:
                 self.logger.info(f"{interval} interval requested for {ticker}. Using adjusted limit: {adjusted_limit} (base: {historical_days})")
         
         yahoo_period = self._calculate_yahoo_period(adjusted_limit)
-        last_exception = None
-        failure_reasons = []  # Track all failure reasons for better error reporting
         
         # preferred_data_source 초기화
         preferred_data_source_lower = preferred_data_source.lower() if preferred_data_source else None
@@ -791,248 +732,274 @@ class ApiStrategyManager:
             else:
                 self.logger.warning(f"Interval priority for {interval} specified but no matching clients found. Using default clients.")
         
-        for i, client in enumerate(clients_to_use):
-            try:
-                # API 호출 시작 로깅
-                api_name = self._get_api_name(client)
+        policy = self._get_config_value("OHLCV_FALLBACK_POLICY", "hedged", str).lower()
+        max_parallel = max(1, self._get_config_value("OHLCV_HEDGE_MAX_PARALLEL", 2, int)) if policy == "hedged" else 1
+        total = len(clients_to_use)
 
-                # 클라이언트별 심볼 제외 가드
-                if api_name == 'twelvedata' and ticker in self._twelvedata_symbol_denylist:
-                    self.logger.info(f"Skip {api_name} for unsupported symbol {ticker}")
-                    continue
-                
-                # Rate limit 확인 및 대기
-                if not await self._check_rate_limit(api_name, client):
-                    await self._wait_for_rate_limit(api_name)
-                    await self._check_rate_limit(api_name, client)  # 다시 확인
-                
-                self.logging_helper.log_api_call_start(api_name, ticker)
-                
-                self.logger.info(f"Attempting to fetch OHLCV for {ticker} using {client.__class__.__name__} (attempt {i+1}/{len(clients_to_use)})")
-                
-                # 각 클라이언트의 메서드명이 다를 수 있으므로 적응적으로 호출
-                if hasattr(client, 'get_ohlcv_data'):
-                    # FMP, Alpha Vantage, Binance, Coinbase 클라이언트 (Tiingo 제외)
-                    if hasattr(client, '__class__') and 'FMPClient' in str(client.__class__):
-                        # FMP 클라이언트의 경우 limit 파라미터 전달
-                        # 날짜 범위가 있으면 전달 (from/to)
-                        if start_date and end_date:
-                            data = await client.get_ohlcv_data(ticker, start_date=start_date, end_date=end_date, limit=adjusted_limit)
-                        else:
-                            data = await client.get_ohlcv_data(ticker, limit=adjusted_limit)
-                    elif hasattr(client, '__class__') and 'BinanceClient' in str(client.__class__):
-                        # Binance는 start_date, end_date 파라미터 지원
-                        data = await client.get_ohlcv_data(ticker, interval=interval, start_date=start_date, end_date=end_date, limit=adjusted_limit)
-                    elif hasattr(client, '__class__') and 'CoinbaseClient' in str(client.__class__):
-                        # Coinbase는 start_date, end_date 파라미터 지원
-                        data = await client.get_ohlcv_data(ticker, interval=interval, start_date=start_date, end_date=end_date, limit=adjusted_limit)
-                    elif hasattr(client, '__class__') and 'AlphaVantageClient' in str(client.__class__):
-                        # Alpha Vantage는 interval 파라미터 지원
-                        data = await client.get_ohlcv_data(ticker, interval=interval, limit=adjusted_limit)
-                    elif hasattr(client, '__class__') and 'TwelveDataClient' in str(client.__class__):
-                        # TwelveData는 interval, start_date, end_date, limit 파라미터 지원
-                        data = await client.get_ohlcv_data(ticker, interval=interval, start_date=start_date, end_date=end_date, limit=adjusted_limit)
-                    elif hasattr(client, '__class__') and ('TiingoClient' in str(client.__class__) or 'PolygonClient' in str(client.__class__)):
-                        # Tiingo/Polygon은 interval, start_date, end_date, limit 파라미터 지원
-                        data = await client.get_ohlcv_data(ticker, interval=interval, start_date=start_date, end_date=end_date, limit=adjusted_limit)
+        async def attempt(client, hedged: bool):
+            label = f"attempt {clients_to_use.index(client) + 1}/{total}" + (", hedge" if hedged else "")
+            return await self._attempt_ohlcv(
+                client, hedged, ticker, interval, start_date, end_date, adjusted_limit, yahoo_period, label
+            )
+
+        async def can_hedge(client) -> bool:
+            # 헤지는 기다리지 않고 rate limit 토큰을 얻을 수 있을 때만 (안 되면 순차 폴백)
+            return await rate_limiter.try_acquire(self._get_api_name(client), client)
+
+        started = time.monotonic()
+        outcome = await run_hedged(
+            clients_to_use,
+            attempt,
+            hedge_delay=lambda client: provider_health.hedge_delay(self._get_api_name(client)),
+            can_hedge=can_hedge,
+            max_parallel=max_parallel,
+            on_event=lambda client, event: provider_health.record(self._get_api_name(client), event),
+        )
+        collections = provider_health.observe_collection(policy, time.monotonic() - started, outcome.result is not None)
+        if collections % 100 == 0:
+            self.logger.info(f"📈 OHLCV 수집 지연 {provider_health.collection_summary(policy)}")
+        if outcome.result is not None:
+            if outcome.hedges:
+                self.logger.info(f"🏁 {ticker}: {outcome.winner.__class__.__name__} won after {outcome.hedges} hedge(s)")
+            return outcome.result
+
+        failure_reasons = outcome.failures
+        last_exception = Exception(failure_reasons[-1]) if failure_reasons else None
+
+        # Build comprehensive error message
+        if failure_reasons:
+            error_summary = "; ".join(failure_reasons[:5])  # Show first 5 reasons
+            if len(failure_reasons) > 5:
+                error_summary += f" (and {len(failure_reasons) - 5} more failures)"
+            self.logger.error(f"All API clients failed to fetch OHLCV for {ticker}. Failures: {error_summary}. Last error: {last_exception}")
+        else:
+            self.logger.error(f"All API clients failed to fetch OHLCV for {ticker}. No specific error information available. Last error: {last_exception}")
+        return None
+    
+    async def _attempt_ohlcv(
+        self,
+        client,
+        hedged: bool,
+        ticker: str,
+        interval: str,
+        start_date: Optional[str],
+        end_date: Optional[str],
+        adjusted_limit: int,
+        yahoo_period: str,
+        attempt_label: str,
+    ) -> Tuple[Optional[pd.DataFrame], Optional[str]]:
+        """
+        심볼 제외/rate limit 확인 후 조회, 공급자 지연·성공 여부를 provider_health에 기록 (hedged면 토큰은 이미 확보됨)
+        실패(타임아웃 포함)와 취소된 시도는 경과 시간을 중도 절단 지연 표본으로 기록
+        """
+        api_name = self._get_api_name(client)
+
+        # 클라이언트별 심볼 제외 가드
+        if api_name == 'twelvedata' and ticker in self._twelvedata_symbol_denylist:
+            self.logger.info(f"Skip {api_name} for unsupported symbol {ticker}")
+            return None, f"{api_name} skipped for unsupported symbol {ticker}"
+
+        # Rate limit 토큰 확보 (대기가 너무 길면 다음 공급자로)
+        if not hedged and not await rate_limiter.acquire(api_name, client):
+            reason = f"{client.__class__.__name__} rate limited"
+            self.logger.warning(f"{reason} for {ticker}, trying next provider")
+            return None, reason
+
+        started = time.monotonic()
+        try:
+            data, reason = await self._fetch_ohlcv_from_client(
+                client, api_name, ticker, interval, start_date, end_date, adjusted_limit, yahoo_period, attempt_label
+            )
+        except asyncio.CancelledError:
+            # 헤지에 져서 취소된 시도도 경과 시간은 지연 통계에 남김 (느린 공급자가 표본에서 빠지지 않도록)
+            provider_health.observe_cancelled(api_name, time.monotonic() - started)
+            raise
+        provider_health.observe(api_name, time.monotonic() - started, data is not None)
+        return data, reason
+
+    async def _fetch_ohlcv_from_client(
+        self,
+        client,
+        api_name: str,
+        ticker: str,
+        interval: str,
+        start_date: Optional[str],
+        end_date: Optional[str],
+        adjusted_limit: int,
+        yahoo_period: str,
+        attempt_label: str,
+    ) -> Tuple[Optional[pd.DataFrame], Optional[str]]:
+        """
+        공급자 하나로 OHLCV 조회 + 검증
+        Returns: (검증된 DataFrame, None) 또는 (None, 실패 사유)
+        """
+        try:
+            self.logging_helper.log_api_call_start(api_name, ticker)
+            
+            self.logger.info(f"Attempting to fetch OHLCV for {ticker} using {client.__class__.__name__} ({attempt_label})")
+            
+            # 각 클라이언트의 메서드명이 다를 수 있으므로 적응적으로 호출
+            if hasattr(client, 'get_ohlcv_data'):
+                # FMP, Alpha Vantage, Binance, Coinbase 클라이언트 (Tiingo 제외)
+                if hasattr(client, '__class__') and 'FMPClient' in str(client.__class__):
+                    # FMP 클라이언트의 경우 limit 파라미터 전달
+                    # 날짜 범위가 있으면 전달 (from/to)
+                    if start_date and end_date:
+                        data = await client.get_ohlcv_data(ticker, start_date=start_date, end_date=end_date, limit=adjusted_limit)
                     else:
-                        # 다른 클라이언트들은 기존 방식 유지
-                        data = await client.get_ohlcv_data(ticker)
-                    
-                    # List[OhlcvDataPoint]를 DataFrame으로 변환
-                    # List[OhlcvDataPoint] 또는 None을 DataFrame으로 변환
-                    if data is None:
-                        reason = f"{client.__class__.__name__} returned None"
+                        data = await client.get_ohlcv_data(ticker, limit=adjusted_limit)
+                elif hasattr(client, '__class__') and 'BinanceClient' in str(client.__class__):
+                    # Binance는 start_date, end_date 파라미터 지원
+                    data = await client.get_ohlcv_data(ticker, interval=interval, start_date=start_date, end_date=end_date, limit=adjusted_limit)
+                elif hasattr(client, '__class__') and 'CoinbaseClient' in str(client.__class__):
+                    # Coinbase는 start_date, end_date 파라미터 지원
+                    data = await client.get_ohlcv_data(ticker, interval=interval, start_date=start_date, end_date=end_date, limit=adjusted_limit)
+                elif hasattr(client, '__class__') and 'AlphaVantageClient' in str(client.__class__):
+                    # Alpha Vantage는 interval 파라미터 지원
+                    data = await client.get_ohlcv_data(ticker, interval=interval, limit=adjusted_limit)
+                elif hasattr(client, '__class__') and 'TwelveDataClient' in str(client.__class__):
+                    # TwelveData는 interval, start_date, end_date, limit 파라미터 지원
+                    data = await client.get_ohlcv_data(ticker, interval=interval, start_date=start_date, end_date=end_date, limit=adjusted_limit)
+                elif hasattr(client, '__class__') and ('TiingoClient' in str(client.__class__) or 'PolygonClient' in str(client.__class__)):
+                    # Tiingo/Polygon은 interval, start_date, end_date, limit 파라미터 지원
+                    data = await client.get_ohlcv_data(ticker, interval=interval, start_date=start_date, end_date=end_date, limit=adjusted_limit)
+                else:
+                    # 다른 클라이언트들은 기존 방식 유지
+                    data = await client.get_ohlcv_data(ticker)
+                
+                # List[OhlcvDataPoint]를 DataFrame으로 변환
+                # List[OhlcvDataPoint] 또는 None을 DataFrame으로 변환
+                if data is None:
+                    reason = f"{client.__class__.__name__} returned None"
+                    self.logger.warning(f"{reason} for {ticker}")
+                    return None, reason
+                elif isinstance(data, list):
+                    if not data:  # 빈 리스트
+                        reason = f"{client.__class__.__name__} returned empty list"
                         self.logger.warning(f"{reason} for {ticker}")
-                        failure_reasons.append(reason)
-                        last_exception = Exception(reason)
-                        continue
-                    elif isinstance(data, list):
-                        if not data:  # 빈 리스트
-                            reason = f"{client.__class__.__name__} returned empty list"
-                            self.logger.warning(f"{reason} for {ticker}")
-                            failure_reasons.append(reason)
-                            last_exception = Exception(reason)
-                            continue
-                        # Pydantic 모델 리스트를 DataFrame으로 변환
-                        df_data = []
-                        for item in data:
-                            if hasattr(item, 'model_dump'):
-                                item_dict = item.model_dump()
-                            elif hasattr(item, 'dict'):
-                                item_dict = item.dict()
-                            else:
-                                item_dict = item.__dict__
-                            
-                            # 디버깅: 첫 번째 아이템의 구조 확인
-                            if len(df_data) == 0:
-                                self.logger.debug(f"First item structure: {item_dict}")
-                            
-                            df_data.append(item_dict)
-                        
-                        data = pd.DataFrame(df_data)
-                        self.logger.info(f"{client.__class__.__name__} raw frame shape={data.shape}, columns={list(data.columns)}")
+                        return None, reason
+                    # Pydantic 모델 리스트를 DataFrame으로 변환
+                    df_data = []
+                    for item in data:
+                        if hasattr(item, 'model_dump'):
+                            item_dict = item.model_dump()
+                        elif hasattr(item, 'dict'):
+                            item_dict = item.dict()
+                        else:
+                            item_dict = item.__dict__
                         
-                        # 디버깅: DataFrame의 첫 번째 행 확인
-                        if not data.empty:
-                            self.logger.debug(f"First row data: {data.iloc[0].to_dict()}")
+                        # 디버깅: 첫 번째 아이템의 구조 확인
+                        if len(df_data) == 0:
+                            self.logger.debug(f"First item structure: {item_dict}")
                         
-                        data = self._validate_ohlcv_dataframe(data, api_name, ticker)
-                        if data is None:
-                            reason = f"{client.__class__.__name__} data validation failed (missing timestamp, too many nulls, or empty after cleaning)"
-                            self.logger.warning(f"{reason} for {ticker}")
-                            failure_reasons.append(reason)
-                            last_exception = Exception(reason)
-                            continue
-                elif hasattr(client, 'get_historical_prices'):
-                    # TwelveData, Polygon 클라이언트
-                    if hasattr(client, '__class__') and 'PolygonClient' in str(client.__class__):
-                        # Polygon - start_date, end_date, interval 순서
-                        data = await client.get_historical_prices(ticker, start_date, end_date, interval)
-                    else:
-                        # TwelveData - 날짜 범위 사용
-                        data = await client.get_historical_prices(ticker, interval, start_date=start_date, end_date=end_date)
-                    if data is not None and not data.empty:
-                        data = pd.DataFrame(data)
-                        self.logger.info(f"{client.__class__.__name__} raw frame shape={data.shape}, columns={list(data.columns)}")
-                        data = self._validate_ohlcv_dataframe(data, api_name, ticker)
-                        if data is None:
-                            reason = f"{client.__class__.__name__} data validation failed (missing timestamp, too many nulls, or empty after cleaning)"
-                            self.logger.warning(f"{reason} for {ticker}")
-                            failure_reasons.append(reason)
-                            last_exception = Exception(reason)
-                            continue
-                    else:
-                        reason = f"{client.__class__.__name__}.get_historical_prices returned None or empty data"
+                        df_data.append(item_dict)
+                    
+                    data = pd.DataFrame(df_data)
+                    self.logger.info(f"{client.__class__.__name__} raw frame shape={data.shape}, columns={list(data.columns)}")
+                    
+                    # 디버깅: DataFrame의 첫 번째 행 확인
+                    if not data.empty:
+                        self.logger.debug(f"First row data: {data.iloc[0].to_dict()}")
+                    
+                    data = self._validate_ohlcv_dataframe(data, api_name, ticker)
+                    if data is None:
+                        reason = f"{client.__class__.__name__} data validation failed (missing timestamp, too many nulls, or empty after cleaning)"
                         self.logger.warning(f"{reason} for {ticker}")
-                        failure_reasons.append(reason)
-                        last_exception = Exception(reason)
-                        continue
-                elif hasattr(client, 'get_historical_data'):
-                    # Yahoo Finance 클라이언트 - period 사용
-                    data = await client.get_historical_data(ticker, period=yahoo_period, interval=interval)
-                    if data is not None and not data.empty:
-                        # List[Dict]를 DataFrame으로 변환
-                        data = pd.DataFrame(data)
-                    else:
-                        reason = f"{client.__class__.__name__}.get_historical_data returned None or empty data"
+                        return None, reason
+            elif hasattr(client, 'get_historical_prices'):
+                # TwelveData, Polygon 클라이언트
+                if hasattr(client, '__class__') and 'PolygonClient' in str(client.__class__):
+                    # Polygon - start_date, end_date, interval 순서
+                    data = await client.get_historical_prices(ticker, start_date, end_date, interval)
+                else:
+                    # TwelveData - 날짜 범위 사용
+                    data = await client.get_historical_prices(ticker, interval, start_date=start_date, end_date=end_date)
+                if data is not None and not data.empty:
+                    data = pd.DataFrame(data)
+                    self.logger.info(f"{client.__class__.__name__} raw frame shape={data.shape}, columns={list(data.columns)}")
+                    data = self._validate_ohlcv_dataframe(data, api_name, ticker)
+                    if data is None:
+                        reason = f"{client.__class__.__name__} data validation failed (missing timestamp, too many nulls, or empty after cleaning)"
                         self.logger.warning(f"{reason} for {ticker}")
-                        failure_reasons.append(reason)
-                        last_exception = Exception(reason)
-                        continue
+                        return None, reason
                 else:
-                    reason = f"{client.__class__.__name__} has no known OHLCV data fetching method"
-                    self.logger.warning(f"{reason}")
-                    failure_reasons.append(reason)
-                    last_exception = Exception(reason)
-                    continue
-                
+                    reason = f"{client.__class__.__name__}.get_historical_prices returned None or empty data"
+                    self.logger.warning(f"{reason} for {ticker}")
+                    return None, reason
+            elif hasattr(client, 'get_historical_data'):
+                # Yahoo Finance 클라이언트 - period 사용
+                data = await client.get_historical_data(ticker, period=yahoo_period, interval=interval)
                 if data is not None and not data.empty:
-                    # 데이터 검증: 모든 가격 컬럼의 0값 확인
-                    price_columns = []
-                    for col_name in ['open_price', 'open', 'Open', 'high_price', 'high', 'High', 'low_price', 'low', 'Low', 'close_price', 'close', 'Close']:
-                        if col_name in data.columns:
-                            price_columns.append(col_name)
-                    
-                    if price_columns:
-                        # 모든 가격 컬럼에서 0값 확인
-                        total_zero_count = 0
-                        total_valid_count = 0
-                        
-                        for col in price_columns:
-                            zero_count = (data[col] == 0).sum()
-                            null_count = data[col].isna().sum()
-                            total_zero_count += zero_count + null_count
-                            total_valid_count += len(data)
-                        
-                        zero_ratio = total_zero_count / total_valid_count if total_valid_count > 0 else 0
-                        
-                        if zero_ratio > 0.05:  # 5% 이상이 0이면 문제로 간주 (더 엄격하게)
-                            msg = f"{client.__class__.__name__} returned data with {zero_ratio:.1%} zero/null prices for {ticker}"
-                            self.logging_helper.log_api_call_failure(api_name, ticker, Exception(msg))
-                            self.logger.warning(f"{msg}. Skipping this data.")
-                            failure_reasons.append(msg)
-                            last_exception = Exception(msg)
-                            continue
-                        
-                        # 개별 행에서 모든 가격이 0인 경우 제거
-                        valid_rows = 0
-                        for _, row in data.iterrows():
-                            has_valid_price = False
-                            for col in price_columns:
-                                if pd.notna(row[col]) and row[col] > 0:
-                                    has_valid_price = True
-                                    break
-                            if has_valid_price:
-                                valid_rows += 1
-                        
-                        if valid_rows == 0:
-                            msg = f"{client.__class__.__name__} returned data with no valid prices for {ticker}"
-                            self.logging_helper.log_api_call_failure(api_name, ticker, Exception(msg))
-                            self.logger.warning(f"{msg}. Skipping this data.")
-                            failure_reasons.append(msg)
-                            last_exception = Exception(msg)
-                            continue
-                        
-                        self.logger.info(f"{client.__class__.__name__} data validation passed for {ticker}: {valid_rows}/{len(data)} valid rows")
-                    
-                    # API 호출 성공 로깅
-                    self.logging_helper.log_api_call_success(api_name, ticker, len(data))
-                    
-                    self.logger.info(f"Successfully fetched OHLCV for {ticker} from {client.__class__.__name__} ({len(data)} records)")
-                    return data
+                    # List[Dict]를 DataFrame으로 변환
+                    data = pd.DataFrame(data)
                 else:
-                    # API 호출은 성공했지만 데이터가 없는 경우 로깅
-                    reason = f"{client.__class__.__name__} returned empty data"
-                    self.logging_helper.log_api_call_failure(api_name, ticker, Exception("No data returned"))
+                    reason = f"{client.__class__.__name__}.get_historical_data returned None or empty data"
                     self.logger.warning(f"{reason} for {ticker}")
-                    failure_reasons.append(reason)
-                    last_exception = Exception(reason)
+                    return None, reason
+            else:
+                reason = f"{client.__class__.__name__} has no known OHLCV data fetching method"
+                self.logger.warning(f"{reason}")
+                return None, reason
+            
+            if data is not None and not data.empty:
+                # 데이터 검증: 가격 컬럼의 0/NULL 비율과 유효 가격이 있는 행 수
+                prices = price_columns(data)
+                if prices:
+                    quality = price_quality(prices)
+                    zero_ratio = quality["zero_null_ratio"]
+                    if zero_ratio > 0.05:  # 5% 이상이 0이면 문제로 간주 (더 엄격하게)
+                        msg = f"{client.__class__.__name__} returned data with {zero_ratio:.1%} zero/null prices for {ticker}"
+                        self.logging_helper.log_api_call_failure(api_name, ticker, Exception(msg))
+                        self.logger.warning(f"{msg}. Skipping this data.")
+                        return None, msg
+
+                    valid_rows = quality["valid_rows"]
+                    if valid_rows == 0:
+                        msg = f"{client.__class__.__name__} returned data with no valid prices for {ticker}"
+                        self.logging_helper.log_api_call_failure(api_name, ticker, Exception(msg))
+                        self.logger.warning(f"{msg}. Skipping this data.")
+                        return None, msg
                     
-            except Exception as e:
-                # API 호출 실패 로깅
-                self.logging_helper.log_api_call_failure(api_name, ticker, e)
+                    self.logger.info(f"{client.__class__.__name__} data validation passed for {ticker}: {valid_rows}/{len(data)} valid rows")
                 
-                error_str = str(e)
+                # API 호출 성공 로깅
+                self.logging_helper.log_api_call_success(api_name, ticker, len(data))
                 
-                # 404 에러는 정상적인 실패로 간주하고 다음 API로 넘어감
-                if "404" in error_str or "Not Found" in error_str:
-                    reason = f"{client.__class__.__name__} returned 404"
-                    self.logger.warning(f"{reason} for {ticker}. Trying next client.")
-                    failure_reasons.append(reason)
-                    last_exception = e
-                    continue
-                # 429 (Rate Limit) 에러는 다음 클라이언트로 넘어감
-                elif "429" in error_str or "Too Many Requests" in error_str or "rate limit" in error_str.lower():
-                    reason = f"{client.__class__.__name__} returned 429 (rate limit exceeded)"
-                    self.logger.warning(f"{reason} for {ticker}. Trying next client.")
-                    failure_reasons.append(reason)
-                    last_exception = e
-                    continue
-                # 컬럼 관련 오류는 다음 클라이언트로 시도
-                elif "timestamp" in error_str.lower() or "datetime" in error_str.lower() or "columns" in error_str.lower():
-                    reason = f"{client.__class__.__name__} has column/timestamp issue: {e}"
-                    self.logger.warning(f"{reason} for {ticker}. Trying next client.")
-                    failure_reasons.append(reason)
-                    last_exception = e
-                    continue
-                else:
-                    reason = f"{client.__class__.__name__} failed: {e}"
-                    self.logger.warning(f"{reason} for {ticker}. Trying next client.")
-                    failure_reasons.append(reason)
-                    last_exception = e
-                    continue
-        
-        # Build comprehensive error message
-        if failure_reasons:
-            error_summary = "; ".join(failure_reasons[:5])  # Show first 5 reasons
-            if len(failure_reasons) > 5:
-                error_summary += f" (and {len(failure_reasons) - 5} more failures)"
-            self.logger.error(f"All API clients failed to fetch OHLCV for {ticker}. Failures: {error_summary}. Last error: {last_exception}")
-        else:
-            self.logger.error(f"All API clients failed to fetch OHLCV for {ticker}. No specific error information available. Last error: {last_exception}")
-        return None
-    
+                self.logger.info(f"Successfully fetched OHLCV for {ticker} from {client.__class__.__name__} ({len(data)} records)")
+                return data, None
+            else:
+                # API 호출은 성공했지만 데이터가 없는 경우 로깅
+                reason = f"{client.__class__.__name__} returned empty data"
+                self.logging_helper.log_api_call_failure(api_name, ticker, Exception("No data returned"))
+                self.logger.warning(f"{reason} for {ticker}")
+                return None, reason
+                
+        except Exception as e:
+            # API 호출 실패 로깅
+            self.logging_helper.log_api_call_failure(api_name, ticker, e)
+            
+            error_str = str(e)
+            
+            # 404 에러는 정상적인 실패로 간주하고 다음 API로 넘어감
+            if "404" in error_str or "Not Found" in error_str:
+                reason = f"{client.__class__.__name__} returned 404"
+                self.logger.warning(f"{reason} for {ticker}. Trying next client.")
+                return None, reason
+            # 429 (Rate Limit) 에러는 다음 클라이언트로 넘어감
+            elif "429" in error_str or "Too Many Requests" in error_str or "rate limit" in error_str.lower():
+                reason = f"{client.__class__.__name__} returned 429 (rate limit exceeded)"
+                self.logger.warning(f"{reason} for {ticker}. Trying next client.")
+                return None, reason
+            # 컬럼 관련 오류는 다음 클라이언트로 시도
+            elif "timestamp" in error_str.lower() or "datetime" in error_str.lower() or "columns" in error_str.lower():
+                reason = f"{client.__class__.__name__} has column/timestamp issue: {e}"
+                self.logger.warning(f"{reason} for {ticker}. Trying next client.")
+                return None, reason
+            else:
+                reason = f"{client.__class__.__name__} failed: {e}"
+                self.logger.warning(f"{reason} for {ticker}. Trying next client.")
+                return None, reason
+
     async def get_commodity_ohlcv(self, ticker: str, interval: str = "1d", limit: int = 100, asset_id: int = None) -> Optional[pd.DataFrame]:
         """
         [IMPROVED] 커머디티 OHLCV 데이터를 FMP 우선순위로 가져옵니다.
@@ -1090,9 +1057,8 @@ class ApiStrategyManager:
                 except Exception:
                     client_name = "unknown"
                 # Only gate Polygon explicitly; others proceed as-is
-                if "polygon" in client_name:
-                    while not await self._check_rate_limit('polygon', client):
-                        await asyncio.sleep(1)
+                if "polygon" in client_name and not await rate_limiter.acquire('polygon', client):
+                    return None
 
                 if hasattr(client, 'get_company_profile'):
                     data = await client.get_company_profile(ticker)
@@ -1592,285 +1558,14 @@ class ApiStrategyManager:
 
     def _get_fetch_parameters_impl(self, db, asset_id: int, interval: str) -> Optional[Dict[str, Any]]:
         """
-        [ADVANCED LOGIC] Determines optimal fetch parameters based on DB state and settings.
-        Prioritizes recency, then progressively deepens historical data.
+        DB 상태와 설정으로 자산 하나의 수집 구간 결정 (규칙은 ohlcv_fetch_planner.plan_window).
+        수집기는 실행마다 plan_fetches로 전체 자산을 한 번에 계획하고, 이 경로는 단건 호출용.
         """
-        from app.models import AppConfiguration, Asset, AssetType
-        # db is passed as argument
-        
-        # No try block here needed for indentation, relying on original indentation (8 spaces)
-        # But wait, original code had `db = ...` then `try:` (which I added in Step 192).
-        # I need to match the indentation of the following lines.
-        # The following lines start with `try:` (added in Step 192) or `asset_type...` (indented in Step 192).
-        # Wait, I reverted Step 192? No I didn't revert it yet.
-        # So currently lines 1492+ are indented 12 spaces (because of `try:` I added).
-        # I need to FIX that indentation too.
-        # Or I can just keep `try/finally` around the body in `_impl` using `pass` in finally?
-        # No, simpler to just replace the top block.
-        
-        # Current state of file at 1490:
-        # try:
-        #    asset_type ... (12 spaces)
-        
-        # I want:
-        # asset_type ... (8 spaces?)
-        
-        # If I can't reindent easily, I can keep the `try` block in `_impl` but make it a dummy try?
-        # try:
-        #    ...
-        # except: raise
-        
-        # This preserves indentation.
         try:
-            # 자산 타입 확인 (캐시 사용)
-            asset_type, is_crypto = self._get_asset_type_cached(db, asset_id)
-            
-            # Load settings from DB
-            backfill_conf = db.query(AppConfiguration).filter_by(config_key="ENABLE_HISTORICAL_BACKFILL").first()
-            historical_days_conf = db.query(AppConfiguration).filter_by(config_key="HISTORICAL_DATA_DAYS_PER_RUN").first()
-            max_days_conf = db.query(AppConfiguration).filter_by(config_key="MAX_HISTORICAL_DAYS").first()
-
-            enable_backfill = backfill_conf.config_value.lower() == 'true' if backfill_conf else True
-            historical_days = int(historical_days_conf.config_value) if historical_days_conf else 165
-            max_historical_days = int(max_days_conf.config_value) if max_days_conf else 10950 # Default to ~30 years
-            
-            # 1m, 5m 간격은 최대 백필 기간을 10년(3650일)로 변경
-            if interval in ['1m', '5m']:
-                max_historical_days = min(max_historical_days, 3650)  # 최대 10년
-                self.logger.debug(f"Interval {interval}: Limiting max historical days to 3650 (10 years) for backfill")
-
-            # Get both the newest and oldest timestamps
-            # interval에 따라 올바른 테이블에서 데이터 조회
-            # "1m"은 1분(1 minute)이므로 제외, 1개월은 "1mo" 또는 "1M" 사용
-            is_daily_interval = interval in ["1d", "daily", "1w", "1mo", "1M", "1month"] or interval is None
-            
-            # 휴일 감지 및 날짜 범위 최적화
-            from ..utils.trading_calendar import is_trading_day, get_last_trading_day, format_trading_status_message
-            if is_daily_interval:
-                oldest_ts, newest_ts = crud_ohlcv.get_date_range(db, asset_id, interval)
-            else:
-                # 인트라데이 데이터의 경우 OHLCVIntradayData 모델 사용
-                from app.models.asset import OHLCVIntradayData
-                from sqlalchemy import and_, desc
-                
-                # 가장 오래된 데이터 조회
-                oldest_record = (
-                    db.query(OHLCVIntradayData.timestamp_utc)
-                    .filter(
-                        and_(
-                            OHLCVIntradayData.asset_id == asset_id,
-                            OHLCVIntradayData.data_interval == interval
-                        )
-                    )
-                    .order_by(OHLCVIntradayData.timestamp_utc)
-                    .first()
-                )
-                
-                # 가장 최신 데이터 조회
-                newest_record = (
-                    db.query(OHLCVIntradayData.timestamp_utc)
-                    .filter(
-                        and_(
-                            OHLCVIntradayData.asset_id == asset_id,
-                            OHLCVIntradayData.data_interval == interval
-                        )
-                    )
-                    .order_by(desc(OHLCVIntradayData.timestamp_utc))
-                    .first()
-                )
-                
-                oldest_ts = oldest_record[0] if oldest_record else None
-                newest_ts = newest_record[0] if newest_record else None
-            
-            today = datetime.now().date()
-            
-            # 간격별 limit 계산 (1m, 5m은 고정값 사용)
-            def _get_interval_limit(interval: str, days: int) -> int:
-                if interval == '1m':
-                    return 1000  # Binance limit (was 4320)
-                elif interval == '5m':
-                    return 1000  # Aligning with 1m for safety (was 8640)
-                elif interval == '15m':
-                    return 2016  # 3주 
-                elif interval == '30m':
-                    return 1440  # 30일
-                elif interval == '1h':
-                    return 720   # 30일
-                elif interval == '4h':
-                    return 500   # 80일
-                elif interval == '1d':
-                    return 365   # 1년
-                return 500
-            
-            # Case 1: No data at all. Perform initial backfill.
-            if not newest_ts:
-                if enable_backfill:
-                    # 1m, 5m 간격은 최대 백필 기간을 2년(730일)로 제한
-                    backfill_days = historical_days
-                    if interval in ['1m', '5m']:
-                        backfill_days = min(backfill_days, 730)
-                        self.logger.debug(f"Interval {interval}: Limiting initial backfill to {backfill_days} days (2 years)")
-                    elif interval == '1d':
-                        # OOM 방지를 위해 1일 간격 초기 백필은 30일로 제한 (안정화 후 늘릴 수 있음)
-                        backfill_days = min(backfill_days, 30)
-                        self.logger.debug(f"Interval {interval}: Limiting initial backfill to {backfill_days} days to prevent OOM")
-                    
-                    self.logger.info(f"Asset {asset_id}: No data found. Performing initial backfill for {backfill_days} days.")
-                    end_date = today
-                    start_date = today - timedelta(days=backfill_days)
-                    limit = _get_interval_limit(interval, backfill_days)
-                    return {"start_date": start_date.strftime('%Y-%m-%d'), "end_date": end_date.strftime('%Y-%m-%d'), "limit": limit, "is_backfill": True}
-                else:
-                    self.logger.info(f"Asset {asset_id}: No data and backfill is disabled. Fetching recent data only.")
-                    end_date = today
-                    start_date = today - timedelta(days=5)
-                    limit = _get_interval_limit(interval, 5)
-                    return {"start_date": start_date.strftime('%Y-%m-%d'), "end_date": end_date.strftime('%Y-%m-%d'), "limit": limit, "is_backfill": False}
-
-            # Case 2: Data exists. Check for gaps and historical depth.
-            # newest_ts가 datetime 또는 date일 수 있음
-            if hasattr(newest_ts, 'date'):
-                latest_date = newest_ts.date()
-            else:
-                latest_date = newest_ts
-            days_diff = (today - latest_date).days
-
-            # Subcase 2.1: Prioritize filling recent gaps and collecting latest data.
-            # 최신 데이터가 1일 이상 차이나면 갭을 채우고, 1일 이내여도 최신 데이터를 수집
-            if days_diff >= 1:
-                # 갭이 있거나 최신 데이터가 어제인 경우 최신 데이터 수집
-                self.logger.info(f"Asset {asset_id}: {'Gap of ' + str(days_diff) + ' days detected. Filling recent data.' if days_diff > 1 else 'Collecting latest data (1 day old or less).'}")
-                start_date = latest_date + timedelta(days=1) if days_diff > 1 else latest_date
-                # 최신 데이터 수집을 위해 최소 1일치 데이터 요청
-                days_to_fetch = max(days_diff, 1)
-                limit = _get_interval_limit(interval, days_to_fetch)
-                return {"start_date": start_date.strftime('%Y-%m-%d'), "end_date": today.strftime('%Y-%m-%d'), "limit": limit, "is_backfill": days_diff > 1}
-
-            # Subcase 2.2: Data is up-to-date (days_diff == 0). Still collect latest data to ensure freshness.
-            if days_diff == 0 and not enable_backfill:
-                # 오늘 데이터가 이미 있어도 최신 데이터를 계속 수집 (실시간 업데이트)
-                self.logger.info(f"Asset {asset_id}: Data is up-to-date. Collecting latest data to ensure freshness.")
-                # 최근 1일치 데이터 수집 (최신 데이터 확보)
-                limit = _get_interval_limit(interval, 1)
-                return {"start_date": latest_date.strftime('%Y-%m-%d'), "end_date": today.strftime('%Y-%m-%d'), "limit": limit, "is_backfill": False}
-            
-            # Subcase 2.3: Data is up-to-date. Check if historical deepening is needed.
-            if enable_backfill:
-                oldest_date = oldest_ts.date() if hasattr(oldest_ts, 'date') else oldest_ts
-                current_depth = (today - oldest_date).days
-                
-                # 암호화폐가 아닌 경우 (주식, ETF, 지수) 특별한 백필 조건 적용
-                if not is_crypto:
-                    # 설정에서 최소 히스토리 날짜 가져오기 (기본값: 1999.11.01)
-                    min_history_date_conf = db.query(AppConfiguration).filter_by(config_key="MIN_HISTORICAL_DATE").first()
-                    min_required_date_str = min_history_date_conf.config_value if min_history_date_conf else "1999-11-01"
-                    try:
-                        min_required_date = datetime.strptime(min_required_date_str, "%Y-%m-%d").date()
-                    except ValueError:
-                        min_required_date = datetime(1999, 11, 1).date()
-                        self.logger.warning(f"Invalid MIN_HISTORICAL_DATE format: {min_required_date_str}. Using default: 1999-11-01")
-                    
-                    # 1m, 5m 간격은 최대 백필 기간을 2년(730일)로 제한
-                    if interval in ['1m', '5m']:
-                        min_required_date = max(min_required_date, today - timedelta(days=730))
-                        self.logger.debug(f"Interval {interval}: Limiting min_required_date to 2 years ago ({min_required_date})")
-                    
-                    max_required_date = today - timedelta(days=historical_days)
-                    
-                    # 최신 데이터가 충분히 있는지 확인 (현재날짜 - historical_days 이후)
-                    if newest_ts.date() < max_required_date:
-                        # 최신 데이터 백필 필요
-                        gap_days = (max_required_date - newest_ts.date()).days
-                        self.logger.info(f"Asset {asset_id} ({asset_type}): Backfilling recent data from {newest_ts.date() + timedelta(days=1)} to {max_required_date}")
-                        limit = _get_interval_limit(interval, gap_days)
-                        return {
-                            "start_date": (newest_ts.date() + timedelta(days=1)).strftime('%Y-%m-%d'),
-                            "end_date": max_required_date.strftime('%Y-%m-%d'),
-                            "limit": limit,
-                            "is_backfill": True
-                        }
-                    
-                    # 과거 데이터가 충분히 있는지 확인 (MIN_HISTORICAL_DATE부터)
-                    if oldest_date > min_required_date:
-                        # 과거 데이터 백필 필요
-                        gap_days = (oldest_date - min_required_date).days
-                        self.logger.info(f"Asset {asset_id} ({asset_type}): Backfilling historical data from {min_required_date} to {oldest_date - timedelta(days=1)}")
-                        limit = _get_interval_limit(interval, gap_days)
-                        return {
-                            "start_date": min_required_date.strftime('%Y-%m-%d'),
-                            "end_date": (oldest_date - timedelta(days=1)).strftime('%Y-%m-%d'),
-                            "limit": limit,
-                            "is_backfill": True
-                        }
-                    
-                    # 중간 갭 확인 및 처리
-                    gap_info = self._check_data_gaps(db, asset_id, interval, min_required_date, max_required_date)
-                    if gap_info:
-                        self.logger.info(f"Asset {asset_id} ({asset_type}): Found data gap from {gap_info['start_date']} to {gap_info['end_date']}")
-                        limit = _get_interval_limit(interval, gap_info['days'])
-                        return {
-                            "start_date": gap_info['start_date'],
-                            "end_date": gap_info['end_date'],
-                            "limit": limit,
-                            "is_backfill": True
-                        }
-                    
-                    # 모든 조건 만족 - 백필 불필요
-                    self.logger.info(f"Asset {asset_id} ({asset_type}): Data fully populated from {min_required_date} to {max_required_date}. No backfill needed.")
-                    return None
-                else:
-                    # 암호화폐의 경우 주식과 동일한 체계적인 백필 로직 적용
-                    # 암호화폐는 2010년부터 데이터가 있으므로 2010-01-01을 최소 히스토리 날짜로 설정
-                    min_required_date = datetime(2010, 1, 1).date()
-                    
-                    # 1m, 5m 간격은 최대 백필 기간을 10년(3650일)로 변경
-                    if interval in ['1m', '5m']:
-                        min_required_date = max(min_required_date, today - timedelta(days=3650))
-                        self.logger.debug(f"Interval {interval} (crypto): Limiting min_required_date to 10 years ago ({min_required_date})")
-                    
-                    max_required_date = today - timedelta(days=historical_days)
-                    
-                    # 최신 데이터가 충분히 있는지 확인 (현재날짜 - historical_days 이후)
-                    if newest_ts.date() < max_required_date:
-                        # 최신 데이터 백필 필요
-                        self.logger.info(f"Asset {asset_id} (crypto): Backfilling recent data from {newest_ts.date() + timedelta(days=1)} to {max_required_date}")
-                        return {
-                            "start_date": (newest_ts.date() + timedelta(days=1)).strftime('%Y-%m-%d'),
-                            "end_date": max_required_date.strftime('%Y-%m-%d'),
-                            "limit": max(1, (max_required_date - newest_ts.date()).days + 5),
-                            "is_backfill": True
-                        }
-                    
-                    # 과거 데이터가 충분히 있는지 확인 (2010-01-01부터)
-                    if oldest_date > min_required_date:
-                        # 과거 데이터 백필 필요
-                        self.logger.info(f"Asset {asset_id} (crypto): Backfilling historical data from {min_required_date} to {oldest_date - timedelta(days=1)}")
-                        return {
-                            "start_date": min_required_date.strftime('%Y-%m-%d'),
-                            "end_date": (oldest_date - timedelta(days=1)).strftime('%Y-%m-%d'),
-                            "limit": max(1, (oldest_date - min_required_date).days + 5),
-                            "is_backfill": True
-                        }
-                    
-                    # 중간 갭 확인 및 처리
-                    gap_info = self._check_data_gaps(db, asset_id, interval, min_required_date, max_required_date)
-                    if gap_info:
-                        self.logger.info(f"Asset {asset_id} (crypto): Found data gap from {gap_info['start_date']} to {gap_info['end_date']}")
-                        return {
-                            "start_date": gap_info['start_date'],
-                            "end_date": gap_info['end_date'],
-                            "limit": max(1, gap_info['days'] + 5),
-                            "is_backfill": True
-                        }
-                    
-                    # 모든 조건 만족 - 백필 불필요
-                    self.logger.info(f"Asset {asset_id} (crypto): Data fully populated from {min_required_date} to {max_required_date}. No backfill needed.")
-                    return None
-
-            # Subcase 2.3: Data is up-to-date and backfill is disabled.
-            self.logger.info(f"Asset {asset_id}: Data is up-to-date and backfill is disabled.")
-            return None # No action needed
-
+            plan = plan_fetches(db, [asset_id], interval).get(asset_id)
+            if plan and plan.window:
+                self.logger.info(f"Asset {asset_id}: fetch plan {plan.params()}")
+            return plan.params() if plan else None
         except Exception as e:
             self.logger.error(f"Error getting fetch parameters for asset {asset_id}: {e}")
             # Fallback to a safe default (fetch last 7 days) in case of any error
@@ -1883,84 +1578,6 @@ class ApiStrategyManager:
         finally:
             db.close()
     
-    def _check_data_gaps(self, db, asset_id: int, interval: str, min_date: datetime.date, max_date: datetime.date) -> Optional[Dict[str, Any]]:
-        """
-        지정된 날짜 범위 내에서 데이터 갭을 확인합니다.
-        간단한 방식으로 변경하여 MySQL 재귀 쿼리 제한을 회피합니다.
-        """
-        try:
-            from sqlalchemy import text
-            
-            # interval에 따라 올바른 테이블 사용
-            # "1m"은 1분(1 minute)이므로 제외, 1개월은 "1mo" 또는 "1M" 사용
-            is_daily_interval = interval in ["1d", "daily", "1w", "1mo", "1M", "1month"] or interval is None
-            table_name = "ohlcv_day_data" if is_daily_interval else "ohlcv_intraday_data"
-            
-            # 간단한 방식: 최근 데이터와 최초 데이터만 확인
-            query = text(f"""
-                SELECT 
-                    MIN(timestamp_utc) as earliest_date,
-                    MAX(timestamp_utc) as latest_date,
-                    COUNT(*) as total_records
-                FROM {table_name}
-                WHERE asset_id = :asset_id 
-                AND data_interval = :interval
-                AND timestamp_utc >= CAST(:min_date AS DATE)
-                AND timestamp_utc <= CAST(:max_date AS DATE)
-            """)
-            
-            result = db.execute(query, {
-                'asset_id': asset_id,
-                'interval': interval,
-                'min_date': min_date.strftime('%Y-%m-%d'),
-                'max_date': max_date.strftime('%Y-%m-%d')
-            }).fetchone()
-            
-            if not result or result[2] == 0:
-                return {
-                    'has_gaps': True,
-                    'gap_start': min_date,
-                    'gap_end': max_date,
-                    'gap_days': (max_date - min_date).days
-                }
-            
-            earliest_date = result[0].date() if result[0] else None
-            latest_date = result[1].date() if result[1] else None
-            total_records = result[2]
-            
-            # 간단한 갭 체크: 최초/최근 날짜와 요청 범위 비교
-            gaps = []
-            
-            if earliest_date and earliest_date > min_date:
-                gaps.append({
-                    'start': min_date,
-                    'end': earliest_date,
-                    'days': (earliest_date - min_date).days
-                })
-            
-            if latest_date and latest_date < max_date:
-                gaps.append({
-                    'start': latest_date,
-                    'end': max_date,
-                    'days': (max_date - latest_date).days
-                })
-            
-            if gaps:
-                # 가장 큰 갭 반환
-                largest_gap = max(gaps, key=lambda x: x['days'])
-                return {
-                    'has_gaps': True,
-                    'gap_start': largest_gap['start'],
-                    'gap_end': largest_gap['end'],
-                    'gap_days': largest_gap['days']
-                }
-            
-            return None
-            
-        except Exception as e:
-            logger.error(f"Error checking data gaps for asset {asset_id}: {e}")
-            return None
-    
     def _get_asset_type_cached(self, db, asset_id: int) -> Tuple[str, bool]:
         """
         자산 타입을 캐시에서 가져오거나 DB에서 조회하여 캐시에 저장합니다.
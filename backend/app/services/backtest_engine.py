@@ -0,0 +1,238 @@
+"""
+Vectorized Backtest Engine
+- 진입/청산 조건을 월/요일/시간/RSI에 대한 NumPy boolean mask로 계산
+- 포지션 상태는 거래 단위 상태 기계(searchsorted로 다음 진입/청산 지점 탐색)로 결정하고
+  보유 구간의 평가금액은 구간 단위 벡터 연산으로 채움
+- 기존 /api/v2/backtest 의 iterrows 루프와 동일한 통계/곡선을 반환 (Numba 없이 순수 NumPy)
+"""
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+MONTH_NAMES = ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
+DAY_NAMES = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
+TIMEZONE_OFFSETS = {"KST": 9}
+MAX_CURVE_POINTS = 500
+
+
+@dataclass
+class CalendarFeatures:
+    """타임스탬프별 달력 특성 (시간대 보정 적용 후)"""
+    month: np.ndarray    # 1-12
+    weekday: np.ndarray  # 0=Mon ... 6=Sun
+    hour: np.ndarray     # 0-23
+
+
+@dataclass
+class SimulationResult:
+    equity: np.ndarray
+    max_drawdown: float
+    total_trades: int
+    winning_trades: int
+    liquidation_index: Optional[int] = None
+    trades: List[Dict[str, Any]] = field(default_factory=list)
+
+
+def calendar_features(timestamps: np.ndarray, tz_offset_hours: int = 0) -> CalendarFeatures:
+    """datetime64 배열에서 월/요일/시간을 정수 연산으로 계산"""
+    ts = np.asarray(timestamps, dtype="datetime64[s]")
+    if tz_offset_hours:
+        ts = ts + np.timedelta64(tz_offset_hours, "h")
+    seconds = ts.astype(np.int64)
+    days = np.floor_divide(seconds, 86400)
+    month = ts.astype("datetime64[M]").astype(np.int64) % 12 + 1
+    # 1970-01-01은 목요일(=3)
+    weekday = (days + 3) % 7
+    hour = (seconds - days * 86400) // 3600
+    return CalendarFeatures(month=month, weekday=weekday, hour=hour)
+
+
+def _month_mask(features: CalendarFeatures, months: List[str]) -> np.ndarray:
+    wanted = [MONTH_NAMES.index(m) + 1 for m in months or [] if m in MONTH_NAMES]
+    return np.isin(features.month, wanted)
+
+
+def entry_mask(features: CalendarFeatures, rsi: np.ndarray, entry_rules: Dict[str, Any], side: str = "long") -> np.ndarray:
+    """진입 조건 mask (월 ∧ 요일 ∧ 시간 ∧ RSI)"""
+    mask = _month_mask(features, entry_rules.get("months", []))
+
+    day = entry_rules.get("day")
+    if day != "Any":
+        mask &= features.weekday == DAY_NAMES.index(day) if day in DAY_NAMES else False
+
+    hour = entry_rules.get("hour")
+    if isinstance(hour, (int, float)):
+        mask &= features.hour == hour
+    else:
+        mask[:] = False
+
+    rsi_rule = entry_rules.get("rsi", {})
+    if rsi_rule.get("enabled"):
+        rsi_val = rsi_rule.get("value", 40)
+        operator = rsi_rule.get("operator", "<")
+        if side == "long":
+            mask &= (rsi < rsi_val) if operator == "<" else (rsi > rsi_val)
+        else:
+            mask &= (rsi > rsi_val) if operator == ">" else (rsi < rsi_val)
+    return mask
+
+
+def exit_mask(features: CalendarFeatures, rsi: np.ndarray, exit_rules: Dict[str, Any], side: str = "long") -> np.ndarray:
+    """청산 조건 mask (월 ∨ RSI)"""
+    mask = _month_mask(features, exit_rules.get("months", []))
+    rsi_rule = exit_rules.get("rsi", {})
+    if rsi_rule.get("enabled"):
+        rsi_val = rsi_rule.get("value", 70)
+        mask |= (rsi > rsi_val) if side == "long" else (rsi < rsi_val)
+    return mask
+
+
+def simulate(
+    close: np.ndarray,
+    entries: np.ndarray,
+    exits: np.ndarray,
+    initial_capital: float = 1000.0,
+    leverage: float = 1.0,
+    side: str = "long",
+) -> SimulationResult:
+    """
+    포지션 상태 기계 실행.
+    미보유 상태에서는 진입 mask, 보유 상태에서는 청산 mask만 평가하며 (같은 봉에서 재진입 없음)
+    보유 중 평가금액이 0 이하가 되면 청산 신호보다 먼저 강제 청산(liquidation) 처리.
+    """
+    n = len(close)
+    equity = np.empty(n, dtype=np.float64)
+    entry_idx = np.flatnonzero(entries)
+    exit_idx = np.flatnonzero(exits)
+    is_long = side == "long"
+
+    balance = initial_capital
+    total_trades = 0
+    winning_trades = 0
+    liquidation_index = None
+    trades: List[Dict[str, Any]] = []
+
+    pos = 0  # 미보유 구간 시작 인덱스
+    while pos < n:
+        k = np.searchsorted(entry_idx, pos)
+        if k >= len(entry_idx):
+            equity[pos:] = balance
+            break
+        start = int(entry_idx[k])
+        equity[pos:start] = balance
+
+        entry_price = close[start]
+        position_size = (balance * leverage) / entry_price
+        trades.append({"type": "entry", "side": side, "index": start, "price": float(entry_price)})
+
+        # 진입 다음 봉부터 청산 신호 탐색
+        j = np.searchsorted(exit_idx, start + 1)
+        end = int(exit_idx[j]) if j < len(exit_idx) else n - 1
+        has_exit = j < len(exit_idx)
+
+        window = close[start:end + 1]
+        pnl = (window - entry_price) * position_size if is_long else (entry_price - window) * position_size
+        held_equity = balance + pnl
+
+        # 강제 청산 확인 (진입 봉 제외)
+        liquidated = np.flatnonzero(held_equity[1:] <= 0)
+        if len(liquidated):
+            liquidation_index = start + 1 + int(liquidated[0])
+            equity[start:liquidation_index] = held_equity[:liquidation_index - start]
+            equity[liquidation_index:] = 0.0
+            trades.append({"type": "liquidation", "index": liquidation_index, "price": float(close[liquidation_index])})
+            break
+
+        if not has_exit:
+            equity[start:] = held_equity
+            break
+
+        equity[start:end] = held_equity[:-1]
+        profit_loss = pnl[-1]
+        balance += profit_loss
+        equity[end] = balance
+        total_trades += 1
+        if profit_loss > 0:
+            winning_trades += 1
+        trades.append({"type": "exit", "side": side, "index": end, "price": float(close[end])})
+        pos = end + 1
+
+    # MDD: 강제 청산 이전 구간만 반영 (기존 루프와 동일)
+    tracked = equity if liquidation_index is None else equity[:liquidation_index]
+    max_dd = 0.0
+    if len(tracked):
+        peak = np.maximum.accumulate(np.maximum(tracked, initial_capital))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            dd = np.where(peak > 0, (peak - tracked) / peak * 100, 0.0)
+        max_dd = max(0.0, float(dd.max()))
+
+    return SimulationResult(
+        equity=equity,
+        max_drawdown=max_dd,
+        total_trades=total_trades,
+        winning_trades=winning_trades,
+        liquidation_index=liquidation_index,
+        trades=trades,
+    )
+
+
+def _curve(ts_ms: np.ndarray, values: np.ndarray, step: int) -> List[List[float]]:
+    """샘플링 후 [timestamp_ms, value] 목록 생성 (반올림은 기존과 같은 Python round)"""
+    return [[int(t), round(float(v), 2)] for t, v in zip(ts_ms[::step].tolist(), values[::step].tolist())]
+
+
+def run_backtest(
+    df: pd.DataFrame,
+    entry_rules: Dict[str, Any],
+    exit_rules: Dict[str, Any],
+    initial_capital: float = 1000.0,
+    leverage: float = 1.0,
+    side: str = "long",
+    max_points: int = MAX_CURVE_POINTS,
+) -> Dict[str, Any]:
+    """
+    close_price, rsi 컬럼과 DatetimeIndex를 가진 DataFrame으로 백테스트 실행.
+    반환값은 /api/v2/backtest POST 응답의 liquidated/liquidation_time/stats/graph 부분.
+    """
+    timestamps = df.index.values.astype("datetime64[ns]")
+    close = df["close_price"].to_numpy(dtype=np.float64)
+    rsi = df["rsi"].to_numpy(dtype=np.float64)
+
+    features = calendar_features(timestamps, TIMEZONE_OFFSETS.get(entry_rules.get("timezone"), 0))
+    entries = entry_mask(features, rsi, entry_rules, side)
+    exits = exit_mask(features, rsi, exit_rules, side)
+    result = simulate(close, entries, exits, initial_capital, leverage, side)
+
+    final_value = round(float(result.equity[-1]), 2)
+    total_roi = ((final_value / initial_capital) - 1) * 100 if initial_capital > 0 else 0
+    win_rate = (result.winning_trades / result.total_trades * 100) if result.total_trades > 0 else 0
+
+    ts_ms = timestamps.astype("datetime64[ms]").astype(np.int64)
+    benchmark = initial_capital * (close / close[0])
+    step = len(close) // max_points if len(close) > max_points else 1
+
+    liquidation_time = None
+    if result.liquidation_index is not None:
+        liquidation_time = df.index[result.liquidation_index]
+
+    return {
+        "liquidated": result.liquidation_index is not None,
+        "liquidation_time": liquidation_time,
+        "stats": {
+            "initial_capital": initial_capital,
+            "final_value": round(final_value, 2),
+            "total_roi": round(total_roi, 2),
+            "max_drawdown": round(result.max_drawdown, 2),
+            "win_rate": round(win_rate, 2),
+            "total_trades": result.total_trades,
+        },
+        "graph": {
+            "strategy": _curve(ts_ms, result.equity, step),
+            "benchmark": _curve(ts_ms, benchmark, step),
+        },
+    }
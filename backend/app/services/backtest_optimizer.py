@@ -0,0 +1,562 @@
+"""
+Backtest Parameter Optimizer
+- 시간/요일/RSI 파라미터 그리드를 조합 단위 벡터화 배치로 평가 (scripts/optimize_btcusdt.py의 조합별 iterrows 루프 대체)
+- 가격/RSI/달력 특성 배열과 청산 인덱스는 한 번만 계산해 shared memory로 워커 프로세스(ProcessPoolExecutor)에 공유
+- 조합별 수익률 상한(청산 구간마다 가장 유리한 진입 1건씩의 수익 곱)이 현재 Top-N에 못 미치면 평가 전에 제외
+- 배치가 끝날 때마다 기간별 Top-N을 갱신해 콜백으로 전달 (스트리밍)
+
+시뮬레이션 규칙은 기존 optimize_btcusdt.run_simulation과 동일:
+롱 전용 / 레버리지 1 / 진입 봉에서는 청산하지 않음 / 기간 종료 시 마지막 종가로 평가
+"""
+import heapq
+import itertools
+import json
+import logging
+import multiprocessing
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from multiprocessing import shared_memory
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .backtest_engine import DAY_NAMES, MONTH_NAMES, calendar_features
+from .indicator_store import indicator_store
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_HOURS: Tuple[Optional[int], ...] = (None, 0, 4, 8, 12, 16, 20)
+DEFAULT_DAYS: Tuple[str, ...] = ("Any", "Mon", "Wed", "Fri", "Sun")
+DEFAULT_RSI_VALUES: Tuple[Optional[float], ...] = (30, 40, 50, 60)
+DEFAULT_PERIODS: Dict[str, int] = {"1 Month": 30, "3 Months": 90, "6 Months": 180, "1 Year": 365}
+
+SEASONAL_PERIOD = "Sell in May"
+SEASONAL_ENTRY_MONTHS = ("Nov", "Dec", "Jan", "Feb", "Mar", "Apr")
+SEASONAL_EXIT_MONTHS = ("May",)
+
+MIN_PERIOD_BARS = 50
+DEFAULT_BATCH_SIZE = 32
+DEFAULT_TOP_N = 5
+# 이보다 작은 그리드는 워커 생성 비용이 평가 시간보다 커서 현재 프로세스에서 평가
+PARALLEL_MIN_COMBINATIONS = 2000
+# ROI는 소수 둘째 자리에서 반올림되므로 상한이 임계값보다 이만큼 낮을 때만 제외
+PRUNE_TOLERANCE = 0.01
+
+DEFAULT_RESULTS_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+    "scripts",
+    "btcusdt_optimization_results.json",
+)
+
+# 조합 인코딩 컬럼: [기간 시작 인덱스, 시간(-1=Any), 요일(-1=Any, -2=없음), RSI 임계값(NaN=미사용)]
+ANY = -1
+NEVER = -2
+
+
+@dataclass(frozen=True)
+class GridSpec:
+    """탐색할 파라미터 그리드와 고정 규칙"""
+    hours: Tuple[Optional[int], ...] = DEFAULT_HOURS
+    days: Tuple[str, ...] = DEFAULT_DAYS
+    rsi_values: Tuple[Optional[float], ...] = DEFAULT_RSI_VALUES
+    rsi_operator: str = "<"
+    entry_months: Tuple[str, ...] = ()  # 비어 있으면 모든 월
+    exit_months: Tuple[str, ...] = ()
+    exit_rsi: Optional[float] = 70.0
+    initial_capital: float = 1000.0
+
+    def combinations(self) -> List[Tuple[Optional[int], str, Optional[float]]]:
+        return list(itertools.product(self.hours, self.days, self.rsi_values))
+
+
+@dataclass
+class PeriodResult:
+    period: str
+    start_date: datetime
+    bars: int
+    top: List[Dict[str, Any]] = field(default_factory=list)
+    evaluated: int = 0
+    cached: int = 0
+    pruned: int = 0
+
+    @property
+    def best(self) -> Optional[Dict[str, Any]]:
+        return self.top[0] if self.top else None
+
+
+# ----------------------------------------------------------------------
+# 특성 배열
+# ----------------------------------------------------------------------
+def build_feature_arrays(df: pd.DataFrame, grid: GridSpec) -> Dict[str, np.ndarray]:
+    """
+    close_price, rsi 컬럼과 DatetimeIndex(UTC)를 가진 DataFrame에서 그리드 평가용 배열 생성.
+    exit_after[j] = j 이상에서 처음 나오는 청산 신호 인덱스 (없으면 n), 길이 n+1
+    """
+    close = df["close_price"].to_numpy(dtype=np.float64)
+    rsi = df["rsi"].to_numpy(dtype=np.float64)
+    features = calendar_features(df.index.values.astype("datetime64[ns]"))
+    n = len(close)
+
+    entry_ok = np.ones(n, dtype=bool)
+    if grid.entry_months:
+        entry_ok = np.isin(features.month, [MONTH_NAMES.index(m) + 1 for m in grid.entry_months if m in MONTH_NAMES])
+
+    exits = np.isin(features.month, [MONTH_NAMES.index(m) + 1 for m in grid.exit_months if m in MONTH_NAMES])
+    if grid.exit_rsi is not None:
+        exits |= rsi > grid.exit_rsi
+    exit_after = np.full(n + 1, n, dtype=np.int64)
+    exit_after[:n] = np.where(exits, np.arange(n), n)
+    exit_after = np.minimum.accumulate(exit_after[::-1])[::-1].copy()
+
+    return {
+        "close": close,
+        "rsi": rsi,
+        "hour": features.hour.astype(np.int8),
+        "weekday": features.weekday.astype(np.int8),
+        "entry_ok": entry_ok,
+        "exit_after": exit_after,
+    }
+
+
+def encode_combinations(start: int, combos: Sequence[Tuple[Optional[int], str, Optional[float]]]) -> np.ndarray:
+    """(hour, day, rsi) 조합을 평가용 float64 행렬로 변환"""
+    encoded = np.empty((len(combos), 4), dtype=np.float64)
+    for row, (hour, day, rsi_value) in enumerate(combos):
+        if day == "Any":
+            weekday = ANY
+        else:
+            weekday = DAY_NAMES.index(day) if day in DAY_NAMES else NEVER
+        encoded[row] = (
+            start,
+            ANY if hour is None else hour,
+            weekday,
+            np.nan if rsi_value is None else rsi_value,
+        )
+    return encoded
+
+
+def entry_matrix(arrays: Dict[str, np.ndarray], encoded: np.ndarray, rsi_operator: str = "<") -> np.ndarray:
+    """조합 x 봉 진입 mask (기간 시작 이후 ∧ 월 ∧ 시간 ∧ 요일 ∧ RSI)"""
+    n = len(arrays["close"])
+    starts = encoded[:, 0:1].astype(np.int64)
+    hours = encoded[:, 1:2]
+    weekdays = encoded[:, 2:3]
+    thresholds = encoded[:, 3:4]
+
+    mask = arrays["entry_ok"][None, :] & (np.arange(n)[None, :] >= starts)
+    mask &= (hours == ANY) | (arrays["hour"][None, :] == hours)
+    mask &= (weekdays == ANY) | (arrays["weekday"][None, :] == weekdays)
+    rsi = arrays["rsi"][None, :]
+    with np.errstate(invalid="ignore"):
+        rsi_cond = (rsi < thresholds) if rsi_operator == "<" else (rsi > thresholds)
+    mask &= np.isnan(thresholds) | rsi_cond
+    return mask
+
+
+def roi_upper_bound(arrays: Dict[str, np.ndarray], masks: np.ndarray) -> np.ndarray:
+    """
+    조합별 ROI(%) 상한.
+    진입 봉 i의 청산 지점은 exit_after[i+1]로 고정되고, 실제 거래들은 서로 다른 청산 지점을 가지므로
+    청산 지점이 같은 진입 후보 중 가장 유리한 1건의 수익(손실이면 0)만 곱한 값이 도달 가능한 최대 자산.
+    """
+    close = arrays["close"]
+    n = len(close)
+    exit_of = arrays["exit_after"][1:]
+    exit_price = close[np.minimum(exit_of, n - 1)]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        gain = np.nan_to_num(np.log(exit_price / close), nan=np.inf, posinf=np.inf)
+    gain = np.maximum(gain, 0.0)
+    group_starts = np.flatnonzero(np.r_[True, exit_of[1:] != exit_of[:-1]])
+    best = np.maximum.reduceat(np.where(masks, gain[None, :], 0.0), group_starts, axis=1)
+    with np.errstate(over="ignore"):
+        return (np.exp(best.sum(axis=1)) - 1) * 100
+
+
+def simulate_batch(
+    arrays: Dict[str, np.ndarray],
+    masks: np.ndarray,
+    starts: np.ndarray,
+    initial_capital: float = 1000.0,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    여러 조합의 거래 상태 기계를 동시에 진행 (반복 1회 = 조합별 거래 1건).
+    반환값: (반올림 전 ROI %, 완료된 거래 수)
+    """
+    close = arrays["close"]
+    exit_after = arrays["exit_after"]
+    k, n = masks.shape
+
+    # next_entry[c, j] = j 이상에서 처음 나오는 진입 인덱스 (없으면 n)
+    next_entry = np.full((k, n + 1), n, dtype=np.int64)
+    next_entry[:, :n] = np.where(masks, np.arange(n)[None, :], n)
+    next_entry = np.minimum.accumulate(next_entry[:, ::-1], axis=1)[:, ::-1]
+
+    pos = np.asarray(starts, dtype=np.int64).copy()
+    balance = np.full(k, initial_capital, dtype=np.float64)
+    trades = np.zeros(k, dtype=np.int64)
+    rows = np.arange(k)
+
+    while len(rows):
+        start = next_entry[rows, pos[rows]]
+        entered = start < n
+        rows, start = rows[entered], start[entered]
+        if not len(rows):
+            break
+
+        end = exit_after[start + 1]
+        closed = end < n
+        entry_price = close[start]
+        exit_price = close[np.minimum(end, n - 1)]
+        # 기존 루프와 같은 연산 순서 (position = balance / price, balance += pnl)
+        position_size = balance[rows] / entry_price
+        balance[rows] = balance[rows] + (exit_price - entry_price) * position_size
+        trades[rows[closed]] += 1
+
+        pos[rows] = end + 1
+        rows = rows[closed]
+
+    return ((balance / initial_capital) - 1) * 100, trades
+
+
+def evaluate_combinations(
+    arrays: Dict[str, np.ndarray],
+    encoded: np.ndarray,
+    rsi_operator: str = "<",
+    initial_capital: float = 1000.0,
+) -> Tuple[List[float], List[int]]:
+    """인코딩된 조합 배치를 평가해 (ROI 목록, 거래 수 목록) 반환"""
+    masks = entry_matrix(arrays, encoded, rsi_operator)
+    roi, trades = simulate_batch(arrays, masks, encoded[:, 0], initial_capital)
+    return [round(float(v), 2) for v in roi], trades.tolist()
+
+
+# ----------------------------------------------------------------------
+# Shared memory
+# ----------------------------------------------------------------------
+class SharedFeatureArrays:
+    """특성 배열을 shared memory 블록에 복사하고 워커가 이름으로 붙을 수 있는 spec 제공"""
+
+    def __init__(self, arrays: Dict[str, np.ndarray]):
+        self._segments: List[shared_memory.SharedMemory] = []
+        self.spec: Dict[str, Tuple[str, str, Tuple[int, ...]]] = {}
+        try:
+            for name, array in arrays.items():
+                segment = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+                self._segments.append(segment)
+                np.ndarray(array.shape, dtype=array.dtype, buffer=segment.buf)[...] = array
+                self.spec[name] = (segment.name, array.dtype.str, array.shape)
+        except Exception:
+            self.close()
+            raise
+
+    def close(self):
+        for segment in self._segments:
+            try:
+                segment.close()
+                segment.unlink()
+            except FileNotFoundError:
+                pass
+        self._segments = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+_worker_arrays: Dict[str, np.ndarray] = {}
+_worker_segments: List[shared_memory.SharedMemory] = []
+
+
+def _attach_worker(spec: Dict[str, Tuple[str, str, Tuple[int, ...]]]):
+    """워커 초기화: shared memory 블록을 복사 없이 ndarray로 연결"""
+    for name, (segment_name, dtype, shape) in spec.items():
+        segment = shared_memory.SharedMemory(name=segment_name)
+        _worker_segments.append(segment)
+        _worker_arrays[name] = np.ndarray(shape, dtype=np.dtype(dtype), buffer=segment.buf)
+
+
+def _evaluate_in_worker(encoded: np.ndarray, rsi_operator: str, initial_capital: float):
+    return evaluate_combinations(_worker_arrays, encoded, rsi_operator, initial_capital)
+
+
+# ----------------------------------------------------------------------
+# 그리드 탐색
+# ----------------------------------------------------------------------
+def cache_key(start_date: datetime, latest_date: datetime, combo: Tuple[Optional[int], str, Optional[float]]) -> str:
+    """기존 결과 파일과 같은 캐시 키: {start}_{end}_{hour}_{day}_{rsi}"""
+    hour, day, rsi_value = combo
+    return f"{start_date.date()}_{latest_date.date()}_{hour}_{day}_{rsi_value}"
+
+
+def _naive_utc(value: datetime) -> np.datetime64:
+    ts = pd.Timestamp(value)
+    if ts.tzinfo is not None:
+        ts = ts.tz_convert("UTC").tz_localize(None)
+    return ts.to_datetime64().astype("datetime64[ns]")
+
+
+class _TopN:
+    """ROI 내림차순, 동률이면 그리드 순서가 앞선 조합 우선 (기존 '첫 최댓값' 선택과 동일)"""
+
+    def __init__(self, size: int):
+        self.size = size
+        self._heap: List[Tuple[float, int, Dict[str, Any]]] = []
+
+    def push(self, order: int, entry: Dict[str, Any]):
+        item = (entry["roi"], -order, entry)
+        if len(self._heap) < self.size:
+            heapq.heappush(self._heap, item)
+        elif item[:2] > self._heap[0][:2]:
+            heapq.heapreplace(self._heap, item)
+
+    @property
+    def threshold(self) -> float:
+        return self._heap[0][0] if len(self._heap) >= self.size else -np.inf
+
+    def items(self) -> List[Dict[str, Any]]:
+        return [entry for _, _, entry in sorted(self._heap, key=lambda item: item[:2], reverse=True)]
+
+
+def optimize_grid(
+    df: pd.DataFrame,
+    grid: GridSpec = GridSpec(),
+    periods: Optional[Dict[str, int]] = None,
+    latest_date: Optional[datetime] = None,
+    cache: Optional[Dict[str, float]] = None,
+    top_n: int = DEFAULT_TOP_N,
+    workers: Optional[int] = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    prune: bool = True,
+    on_update: Optional[Callable[[PeriodResult], None]] = None,
+) -> Dict[str, PeriodResult]:
+    """
+    기간별로 그리드를 평가해 Top-N 반환.
+    - cache: {cache_key: roi} — 적중한 조합은 재평가하지 않고, 새로 평가한 결과는 같은 dict에 추가됨
+    - workers: 워커 프로세스 수 (None이면 그리드 크기에 따라 CPU 수 또는 1, 1 이하이면 현재 프로세스에서 평가)
+    - on_update: 배치 결과가 반영될 때마다 해당 기간의 PeriodResult로 호출
+    """
+    periods = periods or DEFAULT_PERIODS
+    latest_date = latest_date or df.index[-1].to_pydatetime()
+    cache = cache if cache is not None else {}
+    combos = grid.combinations()
+    arrays = build_feature_arrays(df, grid)
+    timestamps = df.index.values.astype("datetime64[ns]")
+
+    results: Dict[str, PeriodResult] = {}
+    tops: Dict[str, _TopN] = {}
+    pending: List[Tuple[float, str, int, int]] = []  # (-상한, 기간, 조합 순서, 시작 인덱스)
+
+    for period, days in periods.items():
+        start_date = latest_date - timedelta(days=days)
+        start = int(np.searchsorted(timestamps, _naive_utc(start_date)))
+        bars = len(timestamps) - start
+        if bars < MIN_PERIOD_BARS:
+            logger.warning(f"⚠️ Not enough data for {period} ({bars} bars)")
+            continue
+
+        result = results[period] = PeriodResult(period=period, start_date=start_date, bars=bars)
+        top = tops[period] = _TopN(top_n)
+        missing = []
+        for order, combo in enumerate(combos):
+            key = cache_key(start_date, latest_date, combo)
+            if key in cache:
+                top.push(order, {"roi": cache[key], "params": list(combo), "cached": True})
+                result.cached += 1
+            else:
+                missing.append(order)
+
+        if not missing:
+            continue
+        encoded = encode_combinations(start, [combos[i] for i in missing])
+        if prune:
+            bounds = np.concatenate([
+                roi_upper_bound(arrays, entry_matrix(arrays, encoded[i:i + batch_size], grid.rsi_operator))
+                for i in range(0, len(encoded), batch_size)
+            ])
+        else:
+            bounds = np.full(len(missing), np.inf)
+        pending.extend((-float(bound), period, order, start) for bound, order in zip(bounds, missing))
+
+    # 상한이 높은 조합부터 평가해야 임계값이 빨리 올라가 더 많이 제외됨
+    pending.sort(key=lambda item: (item[0], item[2]))
+    queue = list(reversed(pending))
+
+    def next_batch() -> Optional[Tuple[List[Tuple[str, int]], np.ndarray]]:
+        """제외되지 않은 조합으로 다음 배치 구성"""
+        batch: List[Tuple[str, int]] = []
+        starts: List[int] = []
+        while queue and len(batch) < batch_size:
+            neg_bound, period, order, start = queue.pop()
+            if prune and -neg_bound < tops[period].threshold - PRUNE_TOLERANCE:
+                results[period].pruned += 1
+                continue
+            batch.append((period, order))
+            starts.append(start)
+        if not batch:
+            return None
+        encoded = np.vstack([encode_combinations(s, [combos[o]]) for s, (_, o) in zip(starts, batch)])
+        return batch, encoded
+
+    def collect(batch: List[Tuple[str, int]], outcome: Tuple[List[float], List[int]]):
+        touched = set()
+        for (period, order), roi, trades in zip(batch, *outcome):
+            result = results[period]
+            cache[cache_key(result.start_date, latest_date, combos[order])] = roi
+            tops[period].push(order, {"roi": roi, "params": list(combos[order]), "trades": trades})
+            result.evaluated += 1
+            touched.add(period)
+        for period in touched:
+            results[period].top = tops[period].items()
+            if on_update:
+                on_update(results[period])
+
+    if workers is None:
+        workers = (os.cpu_count() or 1) if len(pending) >= PARALLEL_MIN_COMBINATIONS else 1
+    started = time.perf_counter()
+    if workers <= 1:
+        while True:
+            item = next_batch()
+            if item is None:
+                break
+            batch, encoded = item
+            collect(batch, evaluate_combinations(arrays, encoded, grid.rsi_operator, grid.initial_capital))
+    else:
+        # spawn: 스레드가 있는 서버 프로세스에서도 안전하게 워커 생성 (배열은 shared memory로 전달)
+        with SharedFeatureArrays(arrays) as shared, ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_attach_worker,
+            initargs=(shared.spec,),
+        ) as executor:
+            in_flight = {}
+            while True:
+                while len(in_flight) < workers * 2:
+                    item = next_batch()
+                    if item is None:
+                        break
+                    batch, encoded = item
+                    in_flight[executor.submit(_evaluate_in_worker, encoded, grid.rsi_operator, grid.initial_capital)] = batch
+                if not in_flight:
+                    break
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    collect(in_flight.pop(future), future.result())
+
+    for period, result in results.items():
+        result.top = tops[period].items()
+        logger.info(
+            f"📈 {period}: evaluated={result.evaluated} cached={result.cached} pruned={result.pruned} "
+            f"best={result.best}"
+        )
+    logger.info(f"✅ Grid optimization finished in {time.perf_counter() - started:.2f}s (workers={workers})")
+    return results
+
+
+def seasonal_roi(df: pd.DataFrame, initial_capital: float = 1000.0) -> float:
+    """Sell in May 전략 (11~4월 보유, 5월 청산) ROI"""
+    grid = GridSpec(
+        hours=(None,), days=("Any",), rsi_values=(None,),
+        entry_months=SEASONAL_ENTRY_MONTHS, exit_months=SEASONAL_EXIT_MONTHS,
+        exit_rsi=None, initial_capital=initial_capital,
+    )
+    arrays = build_feature_arrays(df, grid)
+    roi, _ = evaluate_combinations(arrays, encode_combinations(0, grid.combinations()), grid.rsi_operator, initial_capital)
+    return roi[0]
+
+
+# ----------------------------------------------------------------------
+# DB 적재 / 결과 파일
+# ----------------------------------------------------------------------
+def load_price_frame(db, ticker: str = "BTCUSDT", days: int = 365) -> Tuple[Optional[Any], Optional[pd.DataFrame], Optional[datetime]]:
+    """
+    최근 days일의 1시간봉(없으면 일봉) 종가와 RSI를 indicator_store에서 DataFrame으로 적재.
+    반환값: (asset, df, latest_date) — 데이터가 없으면 df는 None
+    """
+    from ..models.asset import Asset
+
+    asset = db.query(Asset).filter(Asset.ticker == ticker).first()
+    if not asset and ticker.endswith("USDT"):
+        asset = db.query(Asset).filter(Asset.ticker == ticker[:-4]).first()
+    if not asset:
+        return None, None, None
+
+    for interval in ("1h", "1d"):
+        timestamps, _ = indicator_store.series(db, asset.asset_id, interval)
+        if len(timestamps):
+            break
+    else:
+        return asset, None, None
+
+    latest_date = pd.Timestamp(timestamps[-1]).to_pydatetime()
+    df = indicator_store.frame(
+        db, asset.asset_id, interval, {"rsi": ("rsi", 14)}, start=latest_date - timedelta(days=days)
+    )
+    return asset, df, latest_date
+
+
+def load_results(path: str = DEFAULT_RESULTS_PATH) -> Optional[Dict[str, Any]]:
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, "r") as f:
+            return json.load(f)
+    except Exception as e:
+        logger.warning(f"⚠️ Failed to read optimization results {path}: {e}")
+        return None
+
+
+def run_optimization(
+    db,
+    ticker: str = "BTCUSDT",
+    grid: GridSpec = GridSpec(),
+    top_n: int = DEFAULT_TOP_N,
+    workers: Optional[int] = None,
+    results_path: Optional[str] = DEFAULT_RESULTS_PATH,
+    use_cache: bool = True,
+    on_update: Optional[Callable[[PeriodResult], None]] = None,
+) -> Optional[Dict[str, Any]]:
+    """
+    DB에서 가격을 적재해 기간별 최적 파라미터와 Sell in May 결과를 계산하고 결과 파일을 갱신.
+    반환 형식은 기존 btcusdt_optimization_results.json 과 동일하며 기간별 top_results가 추가됨.
+    """
+    asset, df, latest_date = load_price_frame(db, ticker, days=max(DEFAULT_PERIODS.values()))
+    if df is None or df.empty:
+        logger.warning(f"⚠️ No price data for optimization: {ticker}")
+        return None
+
+    previous = load_results(results_path) if results_path and use_cache else None
+    cache = dict(previous.get("cache", {})) if previous else {}
+
+    results = optimize_grid(
+        df, grid, latest_date=latest_date, cache=cache, top_n=top_n, workers=workers, on_update=on_update,
+    )
+
+    best_results: Dict[str, Any] = {}
+    top_results: Dict[str, Any] = {}
+    for period, result in results.items():
+        if result.best:
+            best_results[period] = {"roi": result.best["roi"], "params": result.best["params"]}
+            top_results[period] = result.top
+
+    seasonal_key = f"seasonal_{df.index[0].date()}_{latest_date.date()}"
+    if seasonal_key not in cache:
+        cache[seasonal_key] = seasonal_roi(df, grid.initial_capital)
+    best_results[SEASONAL_PERIOD] = {"roi": cache[seasonal_key], "params": "Nov-Apr Hold"}
+
+    data = {
+        "ticker": asset.ticker,
+        "latest_analysis_date": latest_date.isoformat() if hasattr(latest_date, 'isoformat') else str(latest_date),
+        "best_results": best_results,
+        "top_results": top_results,
+        "cache": cache,
+    }
+    if results_path:
+        with open(results_path, "w") as f:
+            json.dump(data, f, indent=2)
+    return data
@@ -0,0 +1,204 @@
+"""
+Cross-Asset Analytics - 상관관계 매트릭스 / 스프레드 분석용 가격 매트릭스
+- load_price_matrix: 요청 티커의 자산 정보와 일봉 종가를 LATERAL 쿼리 한 번으로 조회해
+  (날짜 x 자산) float64 2-D 배열로 적재 (결측은 NaN, 같은 날짜는 가장 늦은 행)
+- correlation_matrix: 공통 날짜의 수익률로 NumPy 피어슨 상관계수 계산
+- correlation_snapshot: 가격 매트릭스 -> 상관관계 결과 (데이터 부족 제외, 공통 날짜). DB 조회 경로와
+  rolling_correlation 저장 종가 슬라이스 경로가 같은 함수를 사용하므로 두 경로 결과가 동일
+- rolling_zscore: 스프레드의 이동 평균/표준편차(ddof=1) Z-Score
+- analytics_cache: (티커 집합 해시, days, 기준일) 단위 TTL/LRU 결과 캐시
+- app/analysis/quantitative.py 의 calculate_correlation_matrix / calculate_spread_analysis 가 사용
+"""
+import hashlib
+import os
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Any, Dict, Iterable, List, Tuple
+
+import numpy as np
+from sqlalchemy import text
+
+from app.services.ohlcv_resampler import to_epoch_us
+from app.services.ttl_cache import TTLCache
+
+DEFAULT_TTL_SECONDS = float(os.getenv("ANALYTICS_CACHE_TTL_SECONDS", "900"))
+DEFAULT_MAX_ENTRIES = int(os.getenv("ANALYTICS_CACHE_MAX_ENTRIES", "256"))
+
+PRICE_MATRIX_QUERY = text("""
+    WITH requested AS (
+        SELECT ticker, ord FROM unnest(CAST(:tickers AS varchar[])) WITH ORDINALITY AS t(ticker, ord)
+    ),
+    matched AS (
+        SELECT DISTINCT ON (r.ord) r.ord, a.asset_id, a.ticker, a.name, at.type_name
+        FROM requested r
+        JOIN assets a ON a.ticker = r.ticker
+        LEFT JOIN asset_types at ON at.asset_type_id = a.asset_type_id
+        ORDER BY r.ord, a.asset_id
+    )
+    SELECT m.ord, m.asset_id, m.name, m.type_name, p.timestamp_utc, p.close_price
+    FROM matched m
+    LEFT JOIN LATERAL (
+        SELECT d.timestamp_utc, d.close_price
+        FROM ohlcv_day_data d
+        WHERE d.asset_id = m.asset_id
+          AND d.data_interval = :data_interval
+          AND d.timestamp_utc >= :start_date
+        ORDER BY d.timestamp_utc DESC
+        LIMIT :limit
+    ) p ON true
+    ORDER BY m.ord
+""")
+
+
+@dataclass
+class PriceMatrix:
+    """
+    tickers: 조회된 티커(요청 순서), closes: (날짜 x 티커) 종가, dates: datetime64[D]
+    row_counts: 티커별 원본 행 수(중복 날짜 포함), missing: 자산을 찾지 못한 티커
+    """
+    tickers: List[str]
+    dates: np.ndarray
+    closes: np.ndarray
+    row_counts: Dict[str, int]
+    asset_info: Dict[str, Dict[str, Any]]
+    missing: List[str] = field(default_factory=list)
+
+    def column(self, ticker: str) -> np.ndarray:
+        return self.closes[:, self.tickers.index(ticker)]
+
+    def select(self, tickers: List[str]) -> "PriceMatrix":
+        """일부 티커 열만 (순서 유지)"""
+        index = [self.tickers.index(t) for t in tickers]
+        return PriceMatrix(
+            tickers=list(tickers),
+            dates=self.dates,
+            closes=self.closes[:, index],
+            row_counts={t: self.row_counts[t] for t in tickers},
+            asset_info={t: self.asset_info[t] for t in tickers if t in self.asset_info},
+        )
+
+    def complete_rows(self) -> "PriceMatrix":
+        """모든 티커에 종가가 있는 날짜만 (pandas dropna와 동일)"""
+        keep = ~np.isnan(self.closes).any(axis=1)
+        return PriceMatrix(self.tickers, self.dates[keep], self.closes[keep], self.row_counts, self.asset_info)
+
+
+def load_price_matrix(
+    db,
+    tickers: Iterable[str],
+    start_date: date,
+    limit: int,
+    data_interval: str = '1d',
+) -> PriceMatrix:
+    """요청 티커(중복 제거, 순서 유지)의 자산당 최신 limit개 일봉 종가를 한 번의 쿼리로 적재"""
+    tickers = list(dict.fromkeys(tickers))
+    rows = db.execute(PRICE_MATRIX_QUERY, {
+        "tickers": tickers,
+        "data_interval": data_interval,
+        "start_date": start_date,
+        "limit": limit,
+    }).fetchall()
+
+    found: Dict[int, str] = {}
+    asset_info: Dict[str, Dict[str, Any]] = {}
+    for row in rows:
+        if row.ord not in found:
+            ticker = tickers[row.ord - 1]
+            found[row.ord] = ticker
+            asset_info[ticker] = {"name": row.name, "type": row.type_name or "Unknown"}
+    present = [tickers[ord_ - 1] for ord_ in sorted(found)]
+    missing = [t for t in tickers if t not in asset_info]
+    column_of = {ord_: i for i, ord_ in enumerate(sorted(found))}
+
+    priced = [row for row in rows if row.timestamp_utc is not None]
+    row_counts = {t: 0 for t in present}
+    if not priced:
+        return PriceMatrix(present, np.empty(0, dtype="datetime64[D]"), np.empty((0, len(present))),
+                           row_counts, asset_info, missing)
+
+    cols = np.fromiter((column_of[row.ord] for row in priced), dtype=np.int64, count=len(priced))
+    ts = to_epoch_us([row.timestamp_utc for row in priced])
+    values = np.asarray([row.close_price for row in priced], dtype=np.float64)
+    days = ts.astype("datetime64[us]").astype("datetime64[D]")
+    for i, count in zip(*np.unique(cols, return_counts=True)):
+        row_counts[present[i]] = int(count)
+
+    dates, date_index = np.unique(days, return_inverse=True)
+    closes = np.full((len(dates), len(present)), np.nan)
+    # 같은 (날짜, 티커)는 가장 늦은 시각의 행을 사용
+    cell = date_index * len(present) + cols
+    order = np.lexsort((ts, cell))
+    last = np.append(cell[order][1:] != cell[order][:-1], True)
+    chosen = order[last]
+    closes[date_index[chosen], cols[chosen]] = values[chosen]
+    return PriceMatrix(present, dates, closes, row_counts, asset_info, missing)
+
+
+def correlation_matrix(closes: np.ndarray) -> np.ndarray:
+    """(날짜 x 자산) 종가 -> 단순 수익률의 피어슨 상관계수 (계산 불가 칸은 NaN)"""
+    n = closes.shape[1]
+    if closes.shape[0] < 3:
+        return np.full((n, n), np.nan)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        returns = closes[1:] / closes[:-1] - 1.0
+        return np.corrcoef(returns, rowvar=False).reshape(n, n)
+
+
+def correlation_snapshot(prices: PriceMatrix, days: int) -> Dict[str, Any]:
+    """
+    calculate_correlation_matrix 캐시용 결과 (요청 순서와 무관).
+    티커별 행 수가 days의 60% 미만이면 제외, 남은 티커의 공통 날짜 수익률로 상관계수
+    """
+    excluded = {t: {"ticker": t, "reason": "not_found", "available": 0} for t in prices.missing}
+    valid = []
+    for ticker in prices.tickers:
+        available = prices.row_counts[ticker]
+        if available < days * 0.6:
+            excluded[ticker] = {"ticker": ticker, "reason": "insufficient_data", "available": available}
+        else:
+            valid.append(ticker)
+
+    snapshot = {"excluded": excluded, "tickers": valid, "asset_info": {}, "corr": None, "error": None}
+    if len(valid) < 2:
+        snapshot["error"] = "Not enough valid assets"
+        return snapshot
+
+    overlap = prices.select(valid).complete_rows()
+    if not len(overlap.dates):
+        snapshot["error"] = "No overlapping data"
+        return snapshot
+
+    snapshot["asset_info"] = overlap.asset_info
+    snapshot["corr"] = correlation_matrix(overlap.closes)
+    return snapshot
+
+
+def rolling_zscore(values: np.ndarray, window: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """이동 평균/표준편차(ddof=1)와 Z-Score (앞쪽 window-1개는 NaN)"""
+    n = len(values)
+    mean = np.full(n, np.nan)
+    std = np.full(n, np.nan)
+    if n >= window:
+        windows = np.lib.stride_tricks.sliding_window_view(values, window)
+        mean[window - 1:] = windows.mean(axis=1)
+        std[window - 1:] = windows.std(axis=1, ddof=1)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        z = (values - mean) / std
+    return mean, std, z
+
+
+def ticker_set_key(tickers: Iterable[str]) -> str:
+    """순서와 무관한 티커 집합 해시"""
+    joined = "\x1f".join(sorted(set(tickers)))
+    return hashlib.sha1(joined.encode()).hexdigest()
+
+
+class AnalyticsCache(TTLCache):
+    """분석 결과 TTL/LRU 캐시 (키는 호출자가 기준일을 포함해 구성)"""
+
+    def __init__(self, ttl_seconds: float = DEFAULT_TTL_SECONDS, max_entries: int = DEFAULT_MAX_ENTRIES):
+        super().__init__(ttl_seconds=ttl_seconds, max_entries=max_entries)
+
+
+# 프로세스 공용 인스턴스
+analytics_cache = AnalyticsCache()
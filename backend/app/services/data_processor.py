@@ -6,6 +6,7 @@ Refactored to use Validator, Adapter, Repository, and Consumer components.
 import asyncio
 import json
 import logging
+import os
 import time
 import datetime
 from typing import Dict, List, Any, Optional
@@ -25,6 +26,10 @@ from .processor.adapters import AdapterFactory
 from .processor.repository import DataRepository
 from .processor.consumer import StreamConsumer
 from .processor.redis_bucket_manager import RedisBucketManager
+from .processor.ohlcv_backfill_loader import OHLCVBackfillLoader
+from .processor.batch_coalescer import BatchCoalescer, COALESCE_MAX_TASKS, COALESCE_WINDOW_MS, task_items
+from .ohlcv_batch import task_batch
+from .symbol_resolver import symbol_resolver, ANY_PROVIDER
 
 class DataProcessor:
     """
@@ -58,14 +63,23 @@ class DataProcessor:
         
         # Redis Bucket Manager
         self.bucket_manager = RedisBucketManager(self.redis_url)
+
+        # 백필 OHLCV는 Redis 바구니 대신 COPY + MERGE로 직접 적재
+        self.backfill_bulk_load = os.getenv("OHLCV_BACKFILL_BULK_LOAD", "true").lower() == "true"
+        self.backfill_loader = OHLCVBackfillLoader(self.repository.async_writer)
+
+        # 같은 타입의 배치 태스크는 모아서 한 번에 저장 (RedisQueueManager 경로)
+        self.batch_coalescer = BatchCoalescer(self.repository)
         
-        # StreamConsumer 초기화
+        # StreamConsumer 초기화 (심볼 인덱스는 Broadcaster와 같은 SymbolResolver 사용)
+        self.symbol_resolver = symbol_resolver
         self.stream_consumer = StreamConsumer(
             redis_url=self.redis_url,
             adapter_factory=self.adapter_factory,
             repository=self.repository,
             bucket_manager=self.bucket_manager,
-            batch_size=GLOBAL_APP_CONFIGS.get("BATCH_SIZE", 100)
+            batch_size=GLOBAL_APP_CONFIGS.get("BATCH_SIZE", 100),
+            symbol_resolver=self.symbol_resolver
         )
         
         self.redis_client = None # 직접 사용 최소화, Consumer가 관리
@@ -83,6 +97,8 @@ class DataProcessor:
         }
         
         self.last_cleanup_time = time.time()
+        self.last_asset_refresh_time = 0
+        self.asset_refresh_interval = 60
         
         # Failover 관련 (기존 로직 유지)
         self.backup_sources = ["api_fallback"]
@@ -114,8 +130,8 @@ class DataProcessor:
         # StreamConsumer 연결
         await self.stream_consumer.connect()
         
-        # 자산 맵 로드 및 주입
-        await self._refresh_asset_map()
+        # 자산 심볼 인덱스 전체 적재
+        await self._refresh_asset_map(full=True)
 
         # 스트림 처리를 별도 task로 실행 (배치 처리와 병렬 동작)
         stream_task = asyncio.create_task(self._stream_processing_loop())
@@ -142,7 +158,15 @@ class DataProcessor:
                 if loop_count % 20 == 0:
                     elapsed = time.time() - self.stats["start_time"]
                     logger.info(f"📊 처리 통계: 총 {self.stats['processed_count']}개 처리, 에러 {self.stats['errors']}개, 실행 시간 {elapsed:.0f}초")
+                    if self.backfill_loader.stats["rows"]:
+                        logger.info(f"📥 백필 적재 통계: {self.backfill_loader.stats['rows']:,} rows, {self.backfill_loader.throughput():,.0f} rows/s")
+                    if self.batch_coalescer.stats["writes"]:
+                        logger.info(f"🧺 배치 쓰기 통계: {self.batch_coalescer.summary()}")
                 
+                # 자산 심볼 인덱스 증분 갱신 (변경된 자산만 조회)
+                if time.time() - self.last_asset_refresh_time > self.asset_refresh_interval:
+                    await self._refresh_asset_map()
+
                 # 주기적으로 오래된 실시간 데이터 정리 (1시간마다)
                 if time.time() - self.last_cleanup_time > 3600:
                     await self.repository.cleanup_old_realtime_bars(days=7)
@@ -199,9 +223,15 @@ class DataProcessor:
             try:
                 # 1. 분봉 및 시간봉 처리 (Realtime Bars)
                 # 이 데이터들은 RealtimeQuotesTimeBar(실시간용)와 OHLCVIntradayData(과거용) 양쪽에 저장
+                # 마감된 봉(수집기 스냅샷은 바로)을 청크 단위로 claim(원자적 RENAME)해 가져오며, 저장 성공 후 ack
+                # (늦게 도착한 틱 조각은 claim 시 저장된 봉과 합쳐진 전체 봉으로 다시 저장됨)
                 for interval in ["1m", "5m", "15m", "30m", "1h", "4h"]:
-                    bars = await self.bucket_manager.get_completed_bars(interval)
-                    if bars:
+                    while True:
+                        batch = await self.bucket_manager.get_completed_bars(interval)
+                        if not batch:
+                            break
+                        bars = batch.as_dicts()
+
                         # Realtime 테이블 저장
                         success_rt = await self.repository.save_realtime_bars_batch(bars)
                         
@@ -220,21 +250,21 @@ class DataProcessor:
                             })
                         success_hist = await self.repository.save_ohlcv_data(formatted_intraday)
                         
-                        if success_rt and success_hist:
-                            # 성공 시 Redis에서 해당 키 삭제
-                            for bar in bars:
-                                ts_str = bar['timestamp_utc'].strftime("%Y%m%d%H%M")
-                                key = f"realtime:bars:{interval}:{bar['asset_id']}:{ts_str}"
-                                await self.bucket_manager.delete_bar_key(key)
-                            logger.info(f"💾 Flush: Redis Bucket -> DB ({interval}, {len(bars)}건)")
+                        if not (success_rt and success_hist):
+                            # 실패 시 키를 남겨 다음 주기에 재시도
+                            break
+                        await self.bucket_manager.ack_completed_bars(batch)
+                        logger.info(f"💾 Flush: Redis Bucket -> DB ({interval}, {len(batch)}건)")
                 
                 # 2. [Optimization Task 3] 1일봉(Daily), 주봉(Weekly), 월봉(Monthly) 처리
                 # 이 데이터들은 OHLCVData(일봉용) 테이블에 저장
                 for interval in ["1d", "1w", "1M"]:
-                    bars = await self.bucket_manager.get_completed_bars(interval)
-                    if bars:
+                    while True:
+                        batch = await self.bucket_manager.get_completed_bars(interval)
+                        if not batch:
+                            break
                         formatted_items = []
-                        for b in bars:
+                        for b in batch.as_dicts():
                             formatted_items.append({
                                 'asset_id': b['asset_id'],
                                 'timestamp_utc': b['timestamp_utc'],
@@ -246,14 +276,10 @@ class DataProcessor:
                                 'interval': interval
                             })
                         success = await self.repository.save_ohlcv_data(formatted_items)
-                        if success:
-                            logger.info(f"💾 Flush: Redis Bucket -> DB ({interval}, {len(formatted_items)}건)")
-                            for b in bars:
-                                # 일봉 이상의 데이터는 날짜 기반 키를 가질 수 있으므로 적절히 삭제
-                                # (add_bars_batch에서 생성한 키 형식과 일치해야 함)
-                                ts_str = b['timestamp_utc'].strftime("%Y%m%d%H%M")
-                                key = f"realtime:bars:{interval}:{b['asset_id']}:{ts_str}"
-                                await self.bucket_manager.delete_bar_key(key)
+                        if not success:
+                            break
+                        await self.bucket_manager.ack_completed_bars(batch)
+                        logger.info(f"💾 Flush: Redis Bucket -> DB ({interval}, {len(formatted_items)}건)")
 
                 # 처리 주기를 조절 (10초마다 확인)
                 await asyncio.sleep(10)
@@ -271,69 +297,57 @@ class DataProcessor:
         if self.redis_client:
             await self.redis_client.close()
 
-    async def _refresh_asset_map(self):
-        """자산 ID 매핑 갱신"""
+    async def _refresh_asset_map(self, full: bool = False):
+        """자산 심볼 인덱스 갱신 (최초 전체 적재, 이후 updated_at 기준 증분)"""
         try:
             pg_db = next(get_postgres_db())
             try:
-                # AssetType과 조인하여 type_name을 가져옴
-                assets = pg_db.query(Asset.ticker, Asset.asset_id, AssetType.type_name)\
-                    .join(AssetType, Asset.asset_type_id == AssetType.asset_type_id).all()
-                asset_map = {ticker: {'id': asset_id, 'type': type_name} for ticker, asset_id, type_name in assets}
-                
+                updated = self.symbol_resolver.refresh(pg_db, full=full)
+                if not updated:
+                    return
+
                 # Verify specific mappings for debugging
-                check_tickers = ['BIDU', 'WMT', 'NFLX', 'AAPL', 'NVDA', 'GOOG']
-                for t in check_tickers:
-                    if t in asset_map:
-                        logger.info(f"📍 [MAP-VERIFY] {t} -> {asset_map[t]}")
-                    else:
-                        logger.warning(f"📍 [MAP-VERIFY] {t} is MISSING in map!")
-                
-                self.stream_consumer.set_asset_map(asset_map)
-                logger.info(f"자산 맵 갱신 완료: {len(asset_map)}개")
+                if full or self.last_asset_refresh_time == 0:
+                    check_tickers = ['BIDU', 'WMT', 'NFLX', 'AAPL', 'NVDA', 'GOOG']
+                    for t in check_tickers:
+                        resolved = self.symbol_resolver.resolve(ANY_PROVIDER, t)
+                        if resolved:
+                            logger.info(f"📍 [MAP-VERIFY] {t} -> {resolved.asset_id} ({resolved.asset_type})")
+                        else:
+                            logger.warning(f"📍 [MAP-VERIFY] {t} is MISSING in map!")
+
+                logger.info(f"자산 맵 갱신 완료: {updated}개 반영 ({self.symbol_resolver.stats()})")
             finally:
                 pg_db.close()
+                self.last_asset_refresh_time = time.time()
         except Exception as e:
             logger.error(f"자산 맵 갱신 실패: {e}")
 
     async def _process_batch_queue(self) -> int:
         """배치 큐 데이터 처리"""
+        if self.queue_manager:
+            return await self._process_queued_tasks()
+
         processed_count = 0
         try:
             # 큐에서 데이터 가져오기 (최대 100개씩)
             for i in range(100):
                 task_wrapper = None
-                if self.queue_manager:
-                    task_wrapper = await self.queue_manager.pop_batch_task(timeout_seconds=0.1)
-                    if task_wrapper:
-                        logger.debug(f"🔍 Popped task from queue_manager: {str(task_wrapper)[:200]}...")
-                elif self.redis_client:
-                    result = await self.redis_client.blpop(self.batch_queue, timeout=0.1)
-                    if result:
-                        _, task_data = result
-                        try:
-                            task_wrapper = json.loads(task_data)
-                            logger.debug(f"🔍 Popped task from redis_client: {str(task_wrapper)[:200]}...")
-                        except json.JSONDecodeError:
-                            pass
+                result = await self.redis_client.blpop(self.batch_queue, timeout=0.1)
+                if result:
+                    _, task_data = result
+                    try:
+                        task_wrapper = json.loads(task_data)
+                        logger.debug(f"🔍 Popped task from redis_client: {str(task_wrapper)[:200]}...")
+                    except json.JSONDecodeError:
+                        pass
 
                 if not task_wrapper:
                     # logger.debug("Queue empty")
                     break
                 
-                # 태스크 처리
-                task_type = task_wrapper.get('type', 'unknown')
-                success = await self._process_batch_task(task_wrapper)
-                if success:
+                if await self._run_batch_task(task_wrapper):
                     processed_count += 1
-                    # 배치 태스크 성공 로그 (OHLCV, macrotrends 등 주요 타입만)
-                    if task_type in ('ohlcv_day_data', 'ohlcv_intraday_data', 'macrotrends_financials'):
-                        payload = task_wrapper.get('payload', {})
-                        items_count = len(payload.get('items', [])) if isinstance(payload, dict) else 0
-                        logger.info(f"✅ 배치 태스크 처리 성공: {task_type} ({items_count}건)")
-                else:
-                    # 실패 시 DLQ 등 처리 (여기서는 로그만)
-                    logger.warning(f"배치 태스크 처리 실패: {task_type}")
                 
                 # CPU 부하 완화: 10개 처리마다 짧은 대기
                 if (i + 1) % 10 == 0:
@@ -345,6 +359,76 @@ class DataProcessor:
             
         return processed_count
 
+    async def _read_queued_tasks(self) -> list:
+        """
+        최대 COALESCE_MAX_TASKS개 또는 첫 태스크 이후 COALESCE_WINDOW_MS까지 큐에서 읽음
+        (첫 읽기가 비어 있으면 창을 기다리지 않으므로 추가 지연은 태스크가 있을 때 최대 창 크기만큼)
+        """
+        queued_tasks = await self.queue_manager.read_batch_tasks(count=COALESCE_MAX_TASKS, block_ms=100)
+        deadline = time.monotonic() + COALESCE_WINDOW_MS / 1000
+        while queued_tasks and len(queued_tasks) < COALESCE_MAX_TASKS:
+            remaining_ms = int((deadline - time.monotonic()) * 1000)
+            if remaining_ms <= 0:
+                break
+            more = await self.queue_manager.read_batch_tasks(count=COALESCE_MAX_TASKS - len(queued_tasks), block_ms=remaining_ms)
+            if not more:
+                break
+            queued_tasks.extend(more)
+        return queued_tasks
+
+    async def _process_queued_tasks(self) -> int:
+        """
+        RedisQueueManager에서 읽은 태스크를 BatchCoalescer로 처리 (같은 타입은 한 번의 UPSERT로 병합).
+        병합 쓰기 1회 또는 단일 태스크 1개가 끝날 때마다 성공한 태스크는 ACK, 실패한 태스크는 DLQ로 옮긴 뒤 ACK
+        (배치 전체를 기다리지 않으므로 ACK가 CLAIM_IDLE_MS 안에 이루어지고, 도중에 예외가 나도 저장된 태스크는 ACK됨).
+        처리 도중 프로세스가 죽으면 ACK되지 않은 태스크는 다른 워커(또는 재시작한 워커)가 다시 가져감.
+        """
+        processed_count = 0
+        try:
+            queued_tasks = await self._read_queued_tasks()
+            if not queued_tasks:
+                return 0
+
+            async def settle(indexes: List[int], results: List[bool]) -> None:
+                nonlocal processed_count
+                done = []
+                for i, success in zip(indexes, results):
+                    queued = queued_tasks[i]
+                    if success:
+                        processed_count += 1
+                        done.append(queued)
+                    else:
+                        task_type = queued.task.get('type', 'unknown') if queued.task else 'unknown'
+                        await self.queue_manager.fail_batch_task(queued, f"batch task failed: {task_type}")
+                await self.queue_manager.ack_batch_tasks(done)
+                # CPU 부하 완화: 태스크(병합 쓰기)마다 짧은 대기
+                await asyncio.sleep(0.001)
+
+            await self.batch_coalescer.process([queued.task for queued in queued_tasks], self._run_batch_task, on_done=settle)
+        except Exception as e:
+            logger.error(f"배치 큐 처리 중 오류: {e}")
+            self.stats["errors"] += 1
+
+        return processed_count
+
+    async def _run_batch_task(self, task_wrapper: Dict[str, Any]) -> bool:
+        """태스크 하나 처리 + 결과 로그"""
+        task_type = task_wrapper.get('type', 'unknown')
+        success = await self._process_batch_task(task_wrapper)
+        if success:
+            # 배치 태스크 성공 로그 (OHLCV, macrotrends 등 주요 타입만)
+            if task_type in ('ohlcv_day_data', 'ohlcv_intraday_data', 'macrotrends_financials'):
+                payload = task_wrapper.get('payload', {})
+                items_count = 0
+                if isinstance(payload, dict):
+                    columns = payload.get('columns')
+                    items_count = columns.get('rows', 0) if isinstance(columns, dict) else len(payload.get('items', []))
+                logger.info(f"✅ 배치 태스크 처리 성공: {task_type} ({items_count}건)")
+        else:
+            # DLQ 이동은 호출자 담당 (RedisQueueManager 경로)
+            logger.warning(f"배치 태스크 처리 실패: {task_type}")
+        return success
+
     async def _process_batch_task(self, task: Dict[str, Any]) -> bool:
         """배치 태스크 처리"""
         try:
@@ -354,16 +438,12 @@ class DataProcessor:
             if not task_type or not payload:
                 return False
             
-            items = payload.get("items") if isinstance(payload, dict) else None
-            if items is None:
-                items = payload if isinstance(payload, list) else [payload]
-            items_count = len(items) if isinstance(items, list) else 0
+            # 컬럼형 OHLCV 페이로드는 항목 목록으로 풀지 않고 배열 그대로 사용
+            batch = task_batch(task) if task_type in ("ohlcv_data", "ohlcv_day_data", "ohlcv_intraday_data") else None
+            items = task_items(task) if batch is None else None
+            items_count = len(batch) if batch is not None else (len(items) if isinstance(items, list) else 0)
             
             logger.info(f"🔄 Processing batch task: {task_type} ({items_count} items)")
-                
-            items = payload.get("items") if isinstance(payload, dict) else None
-            if items is None:
-                items = payload if isinstance(payload, list) else [payload]
 
             # Metadata extraction
             meta = {}
@@ -385,6 +465,19 @@ class DataProcessor:
                 return await self.repository.save_crypto_data(items)
             elif task_type in ("ohlcv_data", "ohlcv_day_data", "ohlcv_intraday_data"):
                 # [Optimization Task 3] Redirect to Redis Bucket instead of Direct DB save
+                if meta.get('is_backfill') and self.backfill_bulk_load:
+                    try:
+                        label = f"{task_type} asset={meta.get('asset_id')}"
+                        if batch is not None:
+                            result = await self.backfill_loader.load_batch(batch, meta, label=label)
+                        else:
+                            result = await self.backfill_loader.load(items, meta, label=label)
+                        logger.info(f"📥 Bulk-loaded {result.rows} backfill OHLCV rows ({task_type}, {result.rows_per_second:,.0f} rows/s)")
+                        return True
+                    except Exception as e:
+                        logger.error(f"❌ 백필 대량 적재 실패, Redis 바구니 경로로 재시도: {e}", exc_info=True)
+                if batch is not None:
+                    items = batch.to_rows(meta.get('asset_id'), meta.get('interval'))
                 for it in items:
                     it['asset_id'] = it.get('asset_id') or meta.get('asset_id')
                     it['interval'] = it.get('interval') or it.get('data_interval') or meta.get('interval')
@@ -396,14 +489,8 @@ class DataProcessor:
             elif task_type == "macrotrends_financials":
                 return await self.repository.save_macrotrends_financials(items)
             elif task_type == "onchain_metric":
-                # Payload wrapper handling: extract 'data' list if present
-                onchain_items = []
-                for it in items:
-                    if isinstance(it, dict) and "data" in it and isinstance(it["data"], list):
-                        onchain_items.extend(it["data"])
-                    else:
-                        onchain_items.append(it)
-                return await self.repository.save_onchain_metrics(onchain_items)
+                # 'data' 래퍼는 task_items에서 풀어둠
+                return await self.repository.save_onchain_metrics(items)
             else:
                 logger.warning(f"알 수 없는 태스크 타입: {task_type}")
                 return False
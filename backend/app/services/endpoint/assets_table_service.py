@@ -3,8 +3,9 @@ Assets Table Service - 자산 테이블 데이터 조회 및 병합 로직
 """
 from typing import List, Dict, Optional, Any
 from sqlalchemy.orm import Session
-from sqlalchemy import desc, asc, func, and_, or_
+from sqlalchemy import desc, asc, func, and_, or_, text
 from datetime import datetime, timedelta
+import asyncio
 import json
 import logging
 
@@ -27,6 +28,56 @@ logger = logging.getLogger(__name__)
 twelvedata_client = TwelveDataClient()
 binance_client = BinanceClient()
 coingecko_client = CoinGeckoClient()
+_tiingo_client = None
+_finnhub_client = None
+
+# 외부 실시간 시세 fallback: 공급자별 (페이지당 최대 호출 수, 동시 호출 수)
+# Finnhub은 60 calls/minute 제한이 있어 예산을 작게 유지
+EXTERNAL_QUOTE_BUDGETS = {
+    'twelvedata': (8, 4),
+    'tiingo': (8, 4),
+    'finnhub': (5, 2),
+}
+
+# 공급자별 응답 -> 자산 테이블 필드 변환
+EXTERNAL_QUOTE_PROVIDERS = {
+    'twelvedata': lambda q: {
+        'price': q.get('close'),
+        'change_percent_today': q.get('percent_change'),
+        'volume_today': q.get('volume'),
+        'data_source': 'twelvedata',
+    },
+    'tiingo': lambda q: {
+        'price': q.get('last'),
+        'change_percent_today': q.get('changePercent'),
+        'volume_today': q.get('volume'),
+        'data_source': 'tiingo',
+    },
+    'finnhub': lambda q: {
+        'price': q.price,
+        'change_percent_today': q.change_percent,
+        'volume_today': q.volume,
+        'data_source': 'finnhub',
+    },
+}
+
+
+def _external_quote_fetcher(provider: str):
+    """공급자별 시세 조회 코루틴 함수 (클라이언트는 프로세스당 한 번만 생성)"""
+    global _tiingo_client, _finnhub_client
+    if provider == 'twelvedata':
+        return twelvedata_client.get_quote
+    if provider == 'tiingo':
+        if _tiingo_client is None:
+            from app.external_apis.implementations import TiingoClient
+            _tiingo_client = TiingoClient()
+        return _tiingo_client.get_quote
+    if provider == 'finnhub':
+        if _finnhub_client is None:
+            from app.external_apis.implementations.finnhub_client import FinnhubClient
+            _finnhub_client = FinnhubClient(GLOBAL_APP_CONFIGS.get('FINNHUB_API_KEY'))
+        return _finnhub_client.get_realtime_quote
+    raise ValueError(f"Unsupported quote provider: {provider}")
 
 
 class AssetsTableService:
@@ -493,30 +544,24 @@ class AssetsTableService:
         db: Session,
         assets_data: List[Dict[str, Any]]
     ) -> List[Dict[str, Any]]:
-        """실시간 데이터로 자산 정보 보강 (성능 최적화)"""
+        """
+        실시간 데이터로 자산 정보 보강 (페이지 크기와 무관하게 고정된 수의 쿼리)
+        - 최신 실시간 시세 / 최근 일봉 2개 / 52주 범위 / data_source 를 각각 한 번의 쿼리로 조회
+        - 실시간 시세가 없는 자산만 외부 API를 공급자별 예산·타임아웃 안에서 동시에 조회
+        """
         
         if not assets_data:
             return assets_data
         
-        # 배치로 실시간 데이터 조회
-        tickers = [asset['ticker'] for asset in assets_data]
-        asset_types = [asset['asset_type'] for asset in assets_data]
-        
-        # asset_id로 실시간 데이터 조회 (최신 데이터만 가져오도록 수정)
         asset_ids = [asset['asset_id'] for asset in assets_data]
         
-        # 각 asset_id별로 최신 실시간 데이터만 조회
-        realtime_dict = {}
-        for asset_id in asset_ids:
-            latest_quote = db.query(RealtimeQuote).filter(
-                RealtimeQuote.asset_id == asset_id
-            ).order_by(desc(RealtimeQuote.timestamp_utc)).first()
-            
-            if latest_quote:
-                realtime_dict[asset_id] = latest_quote
+        # 1. 자산별 최신 실시간 시세
+        realtime_dict = AssetsTableService._get_latest_realtime_quotes(db, asset_ids)
         
-        # 배치로 52주 변화율 계산
-        asset_ids = [asset['asset_id'] for asset in assets_data]
+        # 2. 자산별 최근 일봉 2개 (최신가/거래량/전일 대비 변동률 보정용)
+        recent_ohlcv = AssetsTableService._get_recent_daily_ohlcv(db, asset_ids, limit=2)
+        
+        # 3. 배치로 52주 변화율 계산
         ohlcv_data = db.query(
             OHLCVData.asset_id,
             func.max(OHLCVData.close_price).label('latest_price'),
@@ -528,19 +573,35 @@ class AssetsTableService:
         
         ohlcv_dict = {item.asset_id: item for item in ohlcv_data}
         
+        # 4. 실시간 데이터가 없는 자산은 data_source에 따라 외부 API에서 병렬 조회
+        external_quotes: Dict[int, Dict[str, Any]] = {}
+        missing_ids = [asset_id for asset_id in asset_ids if asset_id not in realtime_dict]
+        if missing_ids:
+            data_sources = dict(
+                db.query(Asset.asset_id, Asset.data_source)
+                .filter(Asset.asset_id.in_(missing_ids))
+                .all()
+            )
+            external_quotes = await AssetsTableService._fetch_external_quotes(
+                [asset for asset in assets_data if asset['asset_id'] in data_sources],
+                data_sources
+            )
+        
+        # 실시간 데이터 신선도 체크
+        freshness_threshold = int(GLOBAL_APP_CONFIGS.get("REALTIME_DATA_FRESHNESS_THRESHOLD_SECONDS", 30))
+        current_time = datetime.utcnow()
+        
         enriched_data = []
         for asset_item in assets_data:
             asset_id = asset_item['asset_id']
             ticker = asset_item['ticker']
-            asset_type = asset_item['asset_type']
+            recent = recent_ohlcv.get(asset_id, [])
+            latest_ohlcv = recent[0] if recent else None
             
-            # 1. 실시간 데이터 병합 (새로운 구조에 맞게 수정)
+            # 1. 실시간 데이터 병합
             realtime_quote = realtime_dict.get(asset_id)
             
             if realtime_quote:
-                # 실시간 데이터 신선도 체크
-                freshness_threshold = int(GLOBAL_APP_CONFIGS.get("REALTIME_DATA_FRESHNESS_THRESHOLD_SECONDS", 30))
-                current_time = datetime.utcnow()
                 data_age = (current_time - realtime_quote.timestamp_utc).total_seconds()
                 
                 if data_age <= freshness_threshold:
@@ -560,68 +621,25 @@ class AssetsTableService:
                     asset_item['is_realtime'] = False
                     logger.debug(f"오래된 데이터 무시: {ticker}, 나이: {data_age:.1f}초 (임계값: {freshness_threshold}초)")
             else:
-                # 실시간 데이터가 없는 경우
+                # 실시간 데이터가 없는 경우 외부 API 조회 결과 사용
                 asset_item['is_realtime'] = False
-                # 실시간 데이터가 없으면 data_source에 따라 API에서 직접 조회
-                asset = db.query(Asset).filter(Asset.asset_id == asset_id).first()
-                if asset and asset.data_source:
-                    try:
-                        if asset.data_source == 'twelvedata':
-                            quote_data = await twelvedata_client.get_quote(ticker)
-                            if quote_data:
-                                asset_item['price'] = quote_data.get('close')
-                                asset_item['change_percent_today'] = quote_data.get('percent_change')
-                                asset_item['volume_today'] = quote_data.get('volume')
-                                asset_item['data_source'] = 'twelvedata'
-                                asset_item['last_updated'] = datetime.now()
-                        elif asset.data_source == 'tiingo':
-                            from app.external_apis.implementations import TiingoClient
-                            tiingo_client = TiingoClient()
-                            quote_data = await tiingo_client.get_quote(ticker)
-                            if quote_data:
-                                asset_item['price'] = quote_data.get('last')
-                                asset_item['change_percent_today'] = quote_data.get('changePercent')
-                                asset_item['volume_today'] = quote_data.get('volume')
-                                asset_item['data_source'] = 'tiingo'
-                                asset_item['last_updated'] = datetime.now()
-                        elif asset.data_source == 'finnhub':
-                            # Finnhub API로 직접 조회 (60 calls/minute 제한)
-                            from app.external_apis.implementations.finnhub_client import FinnhubClient
-                            finnhub_client = FinnhubClient(GLOBAL_APP_CONFIGS.get('FINNHUB_API_KEY'))
-                            quote_data = await finnhub_client.get_realtime_quote(ticker)
-                            if quote_data:
-                                asset_item['price'] = quote_data.price
-                                asset_item['change_percent_today'] = quote_data.change_percent
-                                asset_item['volume_today'] = quote_data.volume
-                                asset_item['data_source'] = 'finnhub'
-                                asset_item['last_updated'] = datetime.now()
-                                logger.info(f"Finnhub API로 {ticker} 실시간 데이터 조회 성공: ${quote_data.price}")
-                    except Exception as e:
-                        logger.warning(f"Failed to fetch real-time data for {ticker} from {asset.data_source}: {e}")
+                quote_data = external_quotes.get(asset_id)
+                if quote_data:
+                    asset_item.update(quote_data)
+                    asset_item['last_updated'] = datetime.now()
                 
                 # API 조회가 실패하거나 data_source가 없는 경우 OHLCV 데이터를 기본값으로 사용
-                if asset_item['price'] is None:
-                    # OHLCV에서 최신 가격 조회
-                    latest_ohlcv = db.query(OHLCVData).filter(
-                        OHLCVData.asset_id == asset_id,
-                        OHLCVData.data_interval.is_(None)  # 일봉 데이터는 data_interval이 NULL
-                    ).order_by(desc(OHLCVData.timestamp_utc)).first()
-                    
-                    if latest_ohlcv and latest_ohlcv.close_price:
-                        asset_item['price'] = float(latest_ohlcv.close_price)
-                        asset_item['volume_today'] = float(latest_ohlcv.volume) if latest_ohlcv.volume else None
-                        asset_item['last_updated'] = latest_ohlcv.timestamp_utc
+                if asset_item['price'] is None and latest_ohlcv and latest_ohlcv.close_price:
+                    asset_item['price'] = float(latest_ohlcv.close_price)
+                    asset_item['volume_today'] = float(latest_ohlcv.volume) if latest_ohlcv.volume else None
+                    asset_item['last_updated'] = latest_ohlcv.timestamp_utc
             # 변화율/거래량 보강: OHLCV 기반 보정
             if asset_item.get('change_percent_today') is None:
                 # 최근 2일 종가로 today 변동률 계산
-                last_two = db.query(OHLCVData).filter(
-                    OHLCVData.asset_id == asset_id,
-                    OHLCVData.data_interval.is_(None)  # 일봉 데이터는 data_interval이 NULL
-                ).order_by(desc(OHLCVData.timestamp_utc)).limit(2).all()
-                if len(last_two) >= 2 and last_two[0].close_price and last_two[1].close_price:
+                if len(recent) >= 2 and recent[0].close_price and recent[1].close_price:
                     try:
-                        latest_cp = float(last_two[0].close_price)
-                        prev_cp = float(last_two[1].close_price)
+                        latest_cp = float(recent[0].close_price)
+                        prev_cp = float(recent[1].close_price)
                         if prev_cp != 0:
                             cpct = ((latest_cp - prev_cp) / prev_cp) * 100.0
                             asset_item['change_percent_today'] = round(cpct, 4)
@@ -629,13 +647,9 @@ class AssetsTableService:
                         pass
             if asset_item.get('volume_today') is None:
                 # 최신 OHLCV의 거래량 사용
-                latest_ohlcv_v = db.query(OHLCVData).filter(
-                    OHLCVData.asset_id == asset_id,
-                    OHLCVData.data_interval.is_(None)  # 일봉 데이터는 data_interval이 NULL
-                ).order_by(desc(OHLCVData.timestamp_utc)).first()
-                if latest_ohlcv_v and latest_ohlcv_v.volume is not None:
+                if latest_ohlcv and latest_ohlcv.volume is not None:
                     try:
-                        asset_item['volume_today'] = float(latest_ohlcv_v.volume)
+                        asset_item['volume_today'] = float(latest_ohlcv.volume)
                     except Exception:
                         pass
             # 통화 기본값 보강
@@ -657,6 +671,93 @@ class AssetsTableService:
         
         return enriched_data
     
+    @staticmethod
+    def _get_latest_realtime_quotes(db: Session, asset_ids: List[int]) -> Dict[int, Any]:
+        """자산별 최신 실시간 시세를 한 번의 쿼리로 조회"""
+        realtime_dict: Dict[int, Any] = {}
+        if not asset_ids:
+            return realtime_dict
+        quotes = db.query(RealtimeQuote).filter(
+            RealtimeQuote.asset_id.in_(asset_ids)
+        ).order_by(RealtimeQuote.asset_id, desc(RealtimeQuote.timestamp_utc)).all()
+        for quote in quotes:
+            # asset_id별 첫 행이 최신
+            realtime_dict.setdefault(quote.asset_id, quote)
+        return realtime_dict
+    
+    @staticmethod
+    def _get_recent_daily_ohlcv(db: Session, asset_ids: List[int], limit: int) -> Dict[int, List[Any]]:
+        """자산별 최근 일봉 limit개(최신순)를 한 번의 쿼리로 조회 (자산마다 인덱스 역순 스캔)"""
+        recent: Dict[int, List[Any]] = {}
+        if not asset_ids:
+            return recent
+        rows = db.execute(
+            text("""
+                SELECT ids.asset_id, o.timestamp_utc, o.close_price, o.volume
+                FROM unnest(CAST(:asset_ids AS integer[])) AS ids(asset_id)
+                CROSS JOIN LATERAL (
+                    SELECT timestamp_utc, close_price, volume
+                    FROM ohlcv_day_data
+                    WHERE asset_id = ids.asset_id AND data_interval IS NULL
+                    ORDER BY timestamp_utc DESC
+                    LIMIT :limit
+                ) o
+                ORDER BY ids.asset_id, o.timestamp_utc DESC
+            """),
+            {"asset_ids": list(asset_ids), "limit": limit}
+        ).fetchall()
+        for row in rows:
+            recent.setdefault(row.asset_id, []).append(row)
+        return recent
+    
+    @staticmethod
+    async def _fetch_external_quotes(
+        assets_data: List[Dict[str, Any]],
+        data_sources: Dict[int, Optional[str]]
+    ) -> Dict[int, Dict[str, Any]]:
+        """
+        외부 API 실시간 시세 병렬 조회
+        - 공급자별로 페이지당 최대 호출 수(예산)와 동시 호출 수를 제한하고, 호출마다 타임아웃 적용
+        - 실패/타임아웃된 자산은 결과에서 빠지며 OHLCV 기본값이 사용됨
+        """
+        timeout = float(GLOBAL_APP_CONFIGS.get("ASSETS_TABLE_EXTERNAL_QUOTE_TIMEOUT_SECONDS", 3))
+        
+        by_provider: Dict[str, List[Dict[str, Any]]] = {}
+        for asset_item in assets_data:
+            provider = data_sources.get(asset_item['asset_id'])
+            if provider in EXTERNAL_QUOTE_PROVIDERS:
+                by_provider.setdefault(provider, []).append(asset_item)
+        if not by_provider:
+            return {}
+        
+        async def fetch(provider: str, fetcher, semaphore: asyncio.Semaphore, asset_item: Dict[str, Any]):
+            ticker = asset_item['ticker']
+            async with semaphore:
+                try:
+                    quote = await asyncio.wait_for(fetcher(ticker), timeout=timeout)
+                except asyncio.TimeoutError:
+                    logger.warning(f"Timed out fetching real-time data for {ticker} from {provider} ({timeout}s)")
+                    return None
+                except Exception as e:
+                    logger.warning(f"Failed to fetch real-time data for {ticker} from {provider}: {e}")
+                    return None
+            return asset_item['asset_id'], EXTERNAL_QUOTE_PROVIDERS[provider](quote) if quote else None
+        
+        tasks = []
+        for provider, items in by_provider.items():
+            budget, concurrency = EXTERNAL_QUOTE_BUDGETS[provider]
+            if len(items) > budget:
+                logger.debug(f"{provider} 외부 시세 예산 초과: {len(items)}개 중 {budget}개만 조회")
+            fetcher = _external_quote_fetcher(provider)
+            semaphore = asyncio.Semaphore(max(1, concurrency))
+            tasks.extend(fetch(provider, fetcher, semaphore, item) for item in items[:budget])
+        
+        external_quotes: Dict[int, Dict[str, Any]] = {}
+        for result in await asyncio.gather(*tasks):
+            if result and result[1]:
+                external_quotes[result[0]] = result[1]
+        return external_quotes
+    
     @staticmethod
     async def _enrich_with_sparkline_data(
         db: Session,
@@ -686,7 +787,6 @@ class AssetsTableService:
         for asset_item in assets_data:
             ticker = asset_item['ticker']
             asset_type = asset_item['asset_type']
-            asset_id = asset_item['asset_id']
             
             # 1. 스파크라인 데이터 테이블에서 조회
             sparkline_key = f"{ticker}_{asset_type}"
@@ -698,12 +798,20 @@ class AssetsTableService:
                     asset_item['sparkline_30d'] = price_data
                 except (json.JSONDecodeError, TypeError):
                     asset_item['sparkline_30d'] = None
-            
-            # 2. DB에서 OHLCV 데이터로 스파크라인 생성 (fallback)
-            if not asset_item['sparkline_30d']:
-                asset_item['sparkline_30d'] = AssetsTableService._get_sparkline_from_ohlcv(
-                    db, asset_id
+        
+        # 2. DB에서 OHLCV 데이터로 스파크라인 생성 (fallback, 누락된 자산을 한 번에 조회)
+        missing = [asset_item for asset_item in assets_data if not asset_item['sparkline_30d']]
+        if missing:
+            try:
+                recent = AssetsTableService._get_recent_daily_ohlcv(
+                    db, [asset_item['asset_id'] for asset_item in missing], limit=30
                 )
+            except Exception as e:
+                logger.error(f"Error getting sparkline from OHLCV: {e}")
+                recent = {}
+            for asset_item in missing:
+                rows = recent.get(asset_item['asset_id'])
+                asset_item['sparkline_30d'] = [float(row.close_price) for row in reversed(rows)] if rows else None
         
         return assets_data
     
@@ -738,24 +846,6 @@ class AssetsTableService:
         except (ValueError, ZeroDivisionError):
             return None
     
-    @staticmethod
-    def _get_sparkline_from_ohlcv(db: Session, asset_id: int) -> Optional[List[float]]:
-        """OHLCV 데이터에서 스파크라인 생성"""
-        try:
-            sparkline_data = db.query(OHLCVData.close_price).filter(
-                OHLCVData.asset_id == asset_id,
-                OHLCVData.data_interval.is_(None)  # 일봉 데이터는 data_interval이 NULL
-            ).order_by(desc(OHLCVData.timestamp_utc)).limit(30).all()
-            
-            if sparkline_data:
-                return [float(price.close_price) for price in reversed(sparkline_data)]
-            
-            return None
-            
-        except Exception as e:
-            logger.error(f"Error getting sparkline from OHLCV for asset {asset_id}: {e}")
-            return None
-    
     @staticmethod
     async def update_realtime_quotes(
         db: Session,
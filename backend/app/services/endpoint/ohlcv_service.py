@@ -7,13 +7,21 @@ from sqlalchemy import desc, and_, func
 from typing import List, Optional, Dict, Any
 from datetime import datetime, timedelta
 import logging
-from collections import defaultdict
+
+import numpy as np
 
 from ...models.asset import OHLCVData, OHLCVIntradayData, Asset
+from ..ohlcv_resampler import OHLCVColumns, resample
 
 logger = logging.getLogger(__name__)
 
 
+def _as_datetime(timestamp):
+    if isinstance(timestamp, str):
+        return datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
+    return timestamp
+
+
 class OHLCVService:
     """OHLCV 데이터 조회 서비스"""
     
@@ -115,88 +123,55 @@ class OHLCVService:
         if not records:
             return []
         
-        # 시간순으로 정렬 (오래된 것부터)
-        sorted_records = sorted(records, key=lambda x: x.timestamp_utc)
+        # 시간순으로 정렬 (오래된 것부터) 후 컬럼형으로 적재
+        sorted_records = sorted(records, key=lambda x: _as_datetime(x.timestamp_utc))
+        cols = OHLCVColumns.from_arrays(
+            [_as_datetime(r.timestamp_utc) for r in sorted_records],
+            [r.open_price for r in sorted_records],
+            [r.high_price for r in sorted_records],
+            [r.low_price for r in sorted_records],
+            [r.close_price for r in sorted_records],
+            [r.volume for r in sorted_records],
+            sort=False,
+        )
         
-        # 시간 기반으로 그룹화
-        buckets = defaultdict(list)
+        # 버킷: 시(hour) 안에서 target_interval_minutes의 배수로 정렬 (예: 15m 간격이면 0, 15, 30, 45분)
+        result = resample(cols, f"{target_interval_minutes}m", anchor_seconds=3600)
         
-        for record in sorted_records:
-            timestamp = record.timestamp_utc
-            if isinstance(timestamp, str):
-                timestamp = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
-            
-            # 버킷 키 계산: target_interval_minutes의 배수로 정렬된 시간
-            # 예: 15m 간격이면 0, 15, 30, 45분으로 정렬
-            minutes = timestamp.minute
-            aligned_minutes = (minutes // target_interval_minutes) * target_interval_minutes
-            
-            # 버킷 키: 년-월-일-시-정렬된분
-            bucket_key = timestamp.replace(minute=aligned_minutes, second=0, microsecond=0)
-            buckets[bucket_key].append(record)
+        # 버킷 시작 인덱스 (data_source는 버킷 첫 레코드 기준)
+        starts = np.concatenate(([0], np.cumsum(result.count)[:-1]))
+        has_volume = np.logical_or.reduceat(~np.isnan(cols.volume), starts)
+        keep = ~np.isnan(result.first_valid_open) & ~np.isnan(result.last_valid_close)
         
-        # 각 버킷 집계
+        ends = (starts + result.count).tolist()
+        interval_str = f"{target_interval_minutes}m"
         aggregated = []
-        for bucket_time in sorted(buckets.keys()):
-            bucket = buckets[bucket_time]
-            agg_record = OHLCVService._aggregate_bucket(
-                bucket, target_interval_minutes, include_ohlcv
-            )
-            if agg_record:
-                aggregated.append(agg_record)
+        for i in np.flatnonzero(keep).tolist():
+            data_source = getattr(sorted_records[starts[i]], 'data_source', None)
+            timestamp = sorted_records[ends[i] - 1].timestamp_utc.isoformat()
+            close = float(result.last_valid_close[i])
+            if include_ohlcv:
+                aggregated.append({
+                    'timestamp': timestamp,
+                    'open': float(result.first_valid_open[i]),
+                    'high': None if np.isnan(result.high[i]) else float(result.high[i]),
+                    'low': None if np.isnan(result.low[i]) else float(result.low[i]),
+                    'close': close,
+                    'volume': float(result.volume[i]) if has_volume[i] else None,
+                    'data_interval': interval_str,
+                    'data_source': data_source
+                })
+            else:
+                aggregated.append({
+                    'timestamp': timestamp,
+                    'close': close,
+                    'data_interval': interval_str,
+                    'data_source': data_source
+                })
         
         # 최신 데이터가 먼저 오도록 역순 정렬
         return list(reversed(aggregated))
     
-    @staticmethod
-    def _aggregate_bucket(
-        bucket: List[Any],
-        target_interval: int,
-        include_ohlcv: bool = True
-    ) -> Optional[Dict[str, Any]]:
-        """
-        단일 버킷의 OHLCV 데이터 집계
-        """
-        if not bucket:
-            return None
-        
-        # 시간순 정렬
-        sorted_bucket = sorted(bucket, key=lambda x: x.timestamp_utc)
-        
-        first = sorted_bucket[0]
-        last = sorted_bucket[-1]
-        
-        # OHLCV 집계
-        opens = [float(r.open_price) for r in sorted_bucket if r.open_price is not None]
-        highs = [float(r.high_price) for r in sorted_bucket if r.high_price is not None]
-        lows = [float(r.low_price) for r in sorted_bucket if r.low_price is not None]
-        closes = [float(r.close_price) for r in sorted_bucket if r.close_price is not None]
-        volumes = [float(r.volume) for r in sorted_bucket if r.volume is not None]
-        
-        if not opens or not closes:
-            return None
-        
-        data_source = getattr(first, 'data_source', None)
-        
-        if include_ohlcv:
-            return {
-                'timestamp': last.timestamp_utc.isoformat(),
-                'open': opens[0] if opens else None,
-                'high': max(highs) if highs else None,
-                'low': min(lows) if lows else None,
-                'close': closes[-1] if closes else None,
-                'volume': sum(volumes) if volumes else None,
-                'data_interval': f"{target_interval}m",
-                'data_source': data_source
-            }
-        else:
-            return {
-                'timestamp': last.timestamp_utc.isoformat(),
-                'close': closes[-1] if closes else None,
-                'data_interval': f"{target_interval}m",
-                'data_source': data_source
-            }
-    
     @staticmethod
     async def get_ohlcv_data_with_fallback(
         db: Session,
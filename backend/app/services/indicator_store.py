@@ -0,0 +1,370 @@
+"""
+Indicator Store - (asset_id, interval, indicator, params) 단위 지표 시계열 캐시
+- 종가는 float64, 계산된 지표(RSI/SMA)는 float32 배열로 보관하고 읽기 전용 view로 반환 (복사 없음)
+- 새 봉은 마지막 타임스탬프 이후만 DB에서 읽어 뒤에 붙이고, 지표는 필요한 꼬리 구간만 다시 계산
+  (마지막 봉이 갱신된 경우에는 기존 view를 건드리지 않도록 새 버퍼에 복사 후 반영)
+- 캐시 꼬리보다 이전 봉이 새로 들어오거나 값이 바뀌면(백필/정정) 병합 후 지표 전체 재계산
+  * 백필/저장은 데이터 프로세서 프로세스에서 일어나므로 RELOAD_SECONDS 마다 전체 이력을 다시 읽어 병합
+- (asset_id, interval) 묶음 단위 LRU(ttl_cache.TTLCache, 바이트 합계 상한)로 메모리 상한 유지 (조회/갱신 모두 적용)
+- 백테스트, 파라미터 최적화, QuantScoringEngine, QuantSeasonalityEngine 이 함께 사용
+"""
+import logging
+import os
+import threading
+import time
+from typing import Callable, Dict, Iterable, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import or_
+from sqlalchemy.orm import Session
+
+from .ttl_cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_BYTES = int(os.getenv("INDICATOR_STORE_MAX_MB", "256")) * 1024 * 1024
+DEFAULT_REFRESH_SECONDS = float(os.getenv("INDICATOR_STORE_REFRESH_SECONDS", "30"))
+DEFAULT_RELOAD_SECONDS = float(os.getenv("INDICATOR_STORE_RELOAD_SECONDS", "1800"))
+# ohlcv_day_data 에 저장되는 주기 (일봉은 data_interval이 '1d' 또는 NULL)
+DAY_TABLE_INTERVALS = ("1d", "1w", "1M")
+
+
+# ----------------------------------------------------------------------
+# 지표 계산 (전 구간/꼬리 구간 공용, 각 값은 자기 윈도우만으로 계산되므로 증분 결과가 전체 재계산과 동일)
+# ----------------------------------------------------------------------
+def _rolling_mean(values: np.ndarray, window: int) -> np.ndarray:
+    out = np.full(len(values), np.nan, dtype=np.float64)
+    if window > 0 and len(values) >= window:
+        out[window - 1:] = np.lib.stride_tricks.sliding_window_view(values, window).mean(axis=1)
+    return out
+
+
+def rsi(close: np.ndarray, window: int = 14) -> np.ndarray:
+    """
+    단순 이동평균 방식 RSI (기존 calculate_rsi 와 동일한 정의).
+    pandas 구현처럼 첫 봉의 변화량을 0으로 두므로 앞쪽 window-1개가 NaN
+    """
+    close = np.asarray(close, dtype=np.float64)
+    if len(close) == 0:
+        return np.empty(0, dtype=np.float64)
+    delta = np.diff(close, prepend=close[0])
+    gain = _rolling_mean(np.where(delta > 0, delta, 0.0), window)
+    loss = _rolling_mean(np.where(delta < 0, -delta, 0.0), window)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return 100 - (100 / (1 + gain / loss))
+
+
+def sma(close: np.ndarray, window: int = 20) -> np.ndarray:
+    """단순 이동평균 (앞쪽 window-1개는 NaN)"""
+    return _rolling_mean(np.asarray(close, dtype=np.float64), window)
+
+
+INDICATORS: Dict[str, Callable[[np.ndarray, int], np.ndarray]] = {"rsi": rsi, "sma": sma}
+
+
+def calculate_rsi(series: pd.Series, period: int = 14) -> pd.Series:
+    """pandas Series 용 RSI (DataFrame 기반 호출부 호환)"""
+    return pd.Series(rsi(series.to_numpy(dtype=np.float64), period), index=series.index)
+
+
+# ----------------------------------------------------------------------
+# 저장 구조
+# ----------------------------------------------------------------------
+class _Column:
+    """용량을 두 배씩 늘리는 append 전용 배열"""
+    __slots__ = ("data", "size")
+
+    def __init__(self, values: np.ndarray, dtype):
+        self.data = np.array(values, dtype=dtype)
+        self.size = len(self.data)
+
+    def view(self) -> np.ndarray:
+        view = self.data[:self.size]
+        view.flags.writeable = False
+        return view
+
+    def append(self, values: np.ndarray):
+        need = self.size + len(values)
+        if need > len(self.data):
+            grown = np.empty(max(need, len(self.data) * 2, 64), dtype=self.data.dtype)
+            grown[:self.size] = self.data[:self.size]
+            self.data = grown
+        self.data[self.size:need] = values
+        self.size = need
+
+    def truncate(self, size: int):
+        """이미 반환된 view가 바뀌지 않도록 새 버퍼로 복사하며 자름"""
+        self.data = self.data[:size].copy()
+        self.size = size
+
+    @property
+    def nbytes(self) -> int:
+        return self.data.nbytes
+
+
+class _Entry:
+    """(asset_id, interval) 하나의 종가와 지표 묶음"""
+
+    def __init__(self):
+        self.timestamps = _Column(np.empty(0), "datetime64[ns]")
+        self.close = _Column(np.empty(0), np.float64)
+        self.indicators: Dict[Tuple[str, int], _Column] = {}
+        self.refreshed_at = 0.0
+        self.reloaded_at = 0.0
+
+    @property
+    def size(self) -> int:
+        return self.close.size
+
+    @property
+    def last_timestamp(self) -> Optional[np.datetime64]:
+        return self.timestamps.data[self.size - 1] if self.size else None
+
+    @property
+    def nbytes(self) -> int:
+        return self.timestamps.nbytes + self.close.nbytes + sum(c.nbytes for c in self.indicators.values())
+
+
+class IndicatorStore:
+    """프로세스 내 지표 시계열 저장소"""
+
+    def __init__(
+        self,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        refresh_seconds: float = DEFAULT_REFRESH_SECONDS,
+        reload_seconds: float = DEFAULT_RELOAD_SECONDS,
+    ):
+        self.max_bytes = max_bytes
+        self.refresh_seconds = refresh_seconds
+        self.reload_seconds = reload_seconds
+        # (asset_id, interval) -> _Entry, 묶음 바이트 합계 기준 LRU (만료 없음, 갱신 주기는 refreshed_at으로 관리)
+        self._entries = TTLCache(max_weight=max_bytes, weigh=lambda entry: entry.nbytes)
+        self._lock = threading.RLock()
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+    def series(self, db: Optional[Session], asset_id: int, interval: str) -> Tuple[np.ndarray, np.ndarray]:
+        """(timestamps[datetime64 ns, UTC naive], close[float64]) 읽기 전용 view"""
+        with self._lock:
+            entry = self._ensure(db, asset_id, interval)
+            self._entries.evict(keep=(asset_id, interval))
+            return entry.timestamps.view(), entry.close.view()
+
+    def indicator(self, db: Optional[Session], asset_id: int, interval: str, name: str, window: int) -> np.ndarray:
+        """series()의 타임스탬프와 같은 길이의 float32 지표 view"""
+        with self._lock:
+            entry = self._ensure(db, asset_id, interval)
+            column = self._indicator_column(entry, name, window)
+            self._entries.evict(keep=(asset_id, interval))
+            return column.view()
+
+    def frame(
+        self,
+        db: Optional[Session],
+        asset_id: int,
+        interval: str,
+        indicators: Optional[Dict[str, Tuple[str, int]]] = None,
+        start=None,
+        end=None,
+    ) -> pd.DataFrame:
+        """
+        close_price + 요청한 지표 컬럼을 가진 DataFrame (index: timestamp_utc).
+        indicators: {"rsi": ("rsi", 14), "ma20": ("sma", 20)}
+        지표는 전체 이력 기준으로 계산되므로 start 직후 구간도 워밍업 없이 값이 채워짐
+        """
+        with self._lock:
+            entry = self._ensure(db, asset_id, interval)
+            columns = {name: self._indicator_column(entry, *spec).view() for name, spec in (indicators or {}).items()}
+            timestamps = entry.timestamps.view()
+            close = entry.close.view()
+            self._entries.evict(keep=(asset_id, interval))
+
+        lo = 0 if start is None else int(np.searchsorted(timestamps, _to_datetime64(start), side="left"))
+        hi = len(timestamps) if end is None else int(np.searchsorted(timestamps, _to_datetime64(end), side="right"))
+        data = {"close_price": close[lo:hi]}
+        data.update({name: values[lo:hi] for name, values in columns.items()})
+        df = pd.DataFrame(data, index=pd.DatetimeIndex(timestamps[lo:hi], name="timestamp_utc"))
+        return df
+
+    def align(self, db: Optional[Session], asset_id: int, interval: str, name: str, window: int, index: pd.DatetimeIndex) -> pd.Series:
+        """다른 경로로 읽은 DataFrame 인덱스에 지표 값을 맞춰 반환 (없는 시각은 NaN)"""
+        with self._lock:
+            entry = self._ensure(db, asset_id, interval)
+            values = self._indicator_column(entry, name, window).view()
+            timestamps = entry.timestamps.view()
+            self._entries.evict(keep=(asset_id, interval))
+
+        wanted = np.asarray(index.values, dtype="datetime64[ns]")
+        pos = np.clip(np.searchsorted(timestamps, wanted), 0, max(len(timestamps) - 1, 0))
+        out = np.full(len(wanted), np.nan, dtype=np.float64)
+        if len(timestamps):
+            matched = timestamps[pos] == wanted
+            out[matched] = values[pos[matched]]
+        return pd.Series(out, index=index)
+
+    # ------------------------------------------------------------------
+    # 갱신
+    # ------------------------------------------------------------------
+    def update(self, asset_id: int, interval: str, timestamps: Iterable, closes: Iterable) -> int:
+        """
+        새 봉 반영. 마지막 봉과 같은 시각은 갱신으로, 이후 시각은 추가로 처리.
+        그 이전 시각은 캐시와 같으면 무시하고, 없거나 값이 다르면 병합 후 지표를 전체 재계산.
+        반환값: 추가/갱신된 봉 수
+        """
+        ts = np.asarray(list(timestamps) if not isinstance(timestamps, np.ndarray) else timestamps, dtype="datetime64[ns]")
+        values = np.asarray(list(closes) if not isinstance(closes, np.ndarray) else closes, dtype=np.float64)
+        with self._lock:
+            key = (asset_id, interval)
+            entry = self._entry(key)
+            applied = self._apply(entry, ts, values)
+            self._entries.evict(keep=key)
+            return applied
+
+    def invalidate(self, asset_id: Optional[int] = None, interval: Optional[str] = None):
+        """과거 구간이 다시 적재된 경우(백필 등) 해당 자산 캐시 제거"""
+        with self._lock:
+            self._entries.invalidate_where(
+                lambda key: (asset_id is None or key[0] == asset_id) and (interval is None or key[1] == interval)
+            )
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            stats = self._entries.stats()
+            return {
+                "entries": stats["entries"],
+                "bytes": stats["weight"],
+                "max_bytes": self.max_bytes,
+                "hits": stats["hits"],
+                "misses": stats["misses"],
+                "hit_rate": stats["hit_rate"],
+                "evictions": stats["evictions"],
+            }
+
+    # ------------------------------------------------------------------
+    # 내부
+    # ------------------------------------------------------------------
+    def _entry(self, key: Tuple[int, str]) -> _Entry:
+        """묶음 조회 (LRU 끝으로 이동), 없으면 빈 묶음 등록"""
+        entry = self._entries.get(key)
+        if entry is None:
+            entry = _Entry()
+            self._entries.set(key, entry)
+        return entry
+
+    def _ensure(self, db: Optional[Session], asset_id: int, interval: str) -> _Entry:
+        entry = self._entry((asset_id, interval))
+
+        now = time.monotonic()
+        if db is not None and (not entry.size or now - entry.refreshed_at >= self.refresh_seconds):
+            # 주기적으로 전체 이력을 다시 읽어 다른 프로세스가 적재한 과거 구간(백필/정정)을 병합
+            reload = not entry.size or now - entry.reloaded_at >= self.reload_seconds
+            ts, values = self._load(db, asset_id, interval, None if reload else entry.last_timestamp)
+            self._apply(entry, ts, values)
+            entry.refreshed_at = now
+            if reload:
+                entry.reloaded_at = now
+        return entry
+
+    def _apply(self, entry: _Entry, ts: np.ndarray, values: np.ndarray) -> int:
+        valid = ~np.isnan(values)
+        ts, values = ts[valid], values[valid]
+        if not len(ts):
+            return 0
+        order = np.argsort(ts, kind="stable")
+        ts, values = ts[order], values[order]
+        # 같은 시각이 여러 번 들어오면 마지막 값 사용
+        last_of_each = np.r_[ts[1:] != ts[:-1], True]
+        ts, values = ts[last_of_each], values[last_of_each]
+
+        last = entry.last_timestamp
+        if last is not None:
+            older = ts < last
+            if older.any():
+                if self._history_changed(entry, ts[older], values[older]):
+                    return self._merge(entry, ts, values)
+                ts, values = ts[~older], values[~older]
+            if not len(ts):
+                return 0
+            if ts[0] == last:
+                if values[0] == entry.close.data[entry.size - 1] and len(ts) == 1:
+                    return 0
+                # 마지막 봉 갱신: 새 버퍼로 잘라낸 뒤 다시 추가
+                size = entry.size - 1
+                entry.timestamps.truncate(size)
+                entry.close.truncate(size)
+                for column in entry.indicators.values():
+                    column.truncate(size)
+
+        old_size = entry.size
+        entry.timestamps.append(ts)
+        entry.close.append(values)
+        close = entry.close.data[:entry.size]
+        for (name, window), column in entry.indicators.items():
+            tail_start = max(0, old_size - window)
+            tail = INDICATORS[name](close[tail_start:], window)
+            column.append(tail[old_size - tail_start:].astype(np.float32))
+        return len(ts)
+
+    @staticmethod
+    def _history_changed(entry: _Entry, ts: np.ndarray, values: np.ndarray) -> bool:
+        """캐시된 구간의 봉 중 없는 시각이 있거나 종가가 다른지"""
+        cached_ts = entry.timestamps.data[:entry.size]
+        pos = np.minimum(np.searchsorted(cached_ts, ts), entry.size - 1)
+        return bool(((cached_ts[pos] != ts) | (entry.close.data[pos] != values)).any())
+
+    @staticmethod
+    def _merge(entry: _Entry, ts: np.ndarray, values: np.ndarray) -> int:
+        """과거 구간 병합 (같은 시각은 새 값 우선) 후 새 버퍼로 지표 전체 재계산 -> 기존 view 유지"""
+        all_ts = np.concatenate([entry.timestamps.data[:entry.size], ts])
+        all_close = np.concatenate([entry.close.data[:entry.size], values])
+        order = np.argsort(all_ts, kind="stable")
+        all_ts, all_close = all_ts[order], all_close[order]
+        last_of_each = np.r_[all_ts[1:] != all_ts[:-1], True]
+        entry.timestamps = _Column(all_ts[last_of_each], "datetime64[ns]")
+        entry.close = _Column(all_close[last_of_each], np.float64)
+        close = entry.close.data
+        for name, window in list(entry.indicators):
+            entry.indicators[(name, window)] = _Column(INDICATORS[name](close, window), np.float32)
+        return len(ts)
+
+    def _indicator_column(self, entry: _Entry, name: str, window: int) -> _Column:
+        if name not in INDICATORS:
+            raise ValueError(f"Unknown indicator: {name}")
+        key = (name, int(window))
+        column = entry.indicators.get(key)
+        if column is None:
+            column = entry.indicators[key] = _Column(
+                INDICATORS[name](entry.close.data[:entry.size], int(window)), np.float32
+            )
+        return column
+
+    @staticmethod
+    def _load(db: Session, asset_id: int, interval: str, since: Optional[np.datetime64]) -> Tuple[np.ndarray, np.ndarray]:
+        from ..models.asset import OHLCVData, OHLCVIntradayData
+
+        model = OHLCVData if interval in DAY_TABLE_INTERVALS else OHLCVIntradayData
+        query = db.query(model.timestamp_utc, model.close_price).filter(model.asset_id == asset_id)
+        if interval == "1d":
+            query = query.filter(or_(model.data_interval == "1d", model.data_interval.is_(None)))
+        else:
+            query = query.filter(model.data_interval == interval)
+        if since is not None:
+            query = query.filter(model.timestamp_utc >= pd.Timestamp(since).to_pydatetime())
+        rows = query.order_by(model.timestamp_utc).all()
+
+        ts = np.array([row[0] for row in rows], dtype="datetime64[ns]")
+        values = np.array([float(row[1]) if row[1] is not None else np.nan for row in rows], dtype=np.float64)
+        return ts, values
+
+
+def _to_datetime64(value) -> np.datetime64:
+    ts = pd.Timestamp(value)
+    if ts.tzinfo is not None:
+        ts = ts.tz_convert("UTC").tz_localize(None)
+    return ts.to_datetime64().astype("datetime64[ns]")
+
+
+# 프로세스 공용 인스턴스
+indicator_store = IndicatorStore()
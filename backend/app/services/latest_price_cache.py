@@ -0,0 +1,62 @@
+"""
+Latest Price Cache - asset_latest_price 프로젝션 앞단의 프로세스 내 read-through 캐시
+- 티커별 최신 가격을 짧은 TTL 동안 보관하고, 미스만 모아 한 번의 인덱스 조회로 채움
+- 존재하지 않는 티커도 빈 결과로 캐시하여 반복 조회가 DB로 가지 않도록 함
+"""
+import os
+from typing import Any, Dict, Iterable, List
+
+from sqlalchemy import text
+
+from app.services.ttl_cache import TTLCache
+
+DEFAULT_TTL_SECONDS = float(os.getenv("LATEST_PRICE_CACHE_TTL_SECONDS", "2"))
+DEFAULT_MAX_ENTRIES = int(os.getenv("LATEST_PRICE_CACHE_MAX_ENTRIES", "20000"))
+
+LATEST_PRICE_QUERY = text("""
+    SELECT a.asset_id, a.ticker, p.price, p.timestamp_utc, p.data_source
+    FROM assets a
+    LEFT JOIN asset_latest_price p ON p.asset_id = a.asset_id
+    WHERE a.ticker = ANY(:tickers)
+    ORDER BY a.asset_id
+""")
+
+
+class LatestPriceCache:
+    """티커 -> [{'asset_id', 'ticker', 'price', 'last_updated', 'data_source'}] TTL/LRU 캐시"""
+
+    def __init__(self, ttl_seconds: float = DEFAULT_TTL_SECONDS, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self._cache = TTLCache(ttl_seconds=ttl_seconds, max_entries=max_entries)
+
+    def get_many(self, db, tickers: Iterable[str]) -> Dict[str, List[Dict[str, Any]]]:
+        """티커(대문자) 목록의 최신 가격. 같은 티커의 자산이 여러 개면 모두 반환"""
+        result, missing = self._cache.get_many(dict.fromkeys(tickers))
+        if missing:
+            loaded = self._load(db, missing)
+            fresh = {ticker: loaded.get(ticker, []) for ticker in missing}
+            self._cache.set_many(fresh)
+            result.update(fresh)
+        return result
+
+    def _load(self, db, tickers: List[str]) -> Dict[str, List[Dict[str, Any]]]:
+        loaded: Dict[str, List[Dict[str, Any]]] = {}
+        for row in db.execute(LATEST_PRICE_QUERY, {"tickers": tickers}).fetchall():
+            mapped = row._mapping
+            loaded.setdefault(mapped["ticker"], []).append({
+                "asset_id": mapped["asset_id"],
+                "ticker": mapped["ticker"],
+                "price": float(mapped["price"]) if mapped["price"] is not None else None,
+                "last_updated": mapped["timestamp_utc"],
+                "data_source": mapped["data_source"],
+            })
+        return loaded
+
+    def invalidate(self, tickers: Iterable[str] = None):
+        self._cache.invalidate(tickers)
+
+    def stats(self) -> Dict[str, Any]:
+        return self._cache.stats()
+
+
+# 프로세스 공용 인스턴스
+latest_price_cache = LatestPriceCache()
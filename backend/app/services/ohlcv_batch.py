@@ -0,0 +1,247 @@
+"""
+OHLCV 수집 배치 - 공급자 DataFrame -> 배치 큐 페이로드 -> 백필 COPY 행 (컬럼형, 봉별 객체 없음)
+- 기존: 검증된 DataFrame을 iterrows로 OhlcvDataPoint 목록으로 바꾸고, 수집기가 봉마다 model_dump_json + json.loads,
+  push_batch_task에서 다시 json.dumps, DataProcessor는 봉마다 dict 키/ISO 문자열을 다시 해석 (build_ohlcv_rows)
+- OHLCVBatch: ohlcv_resampler.OHLCVColumns와 같은 배열 규약 (ts: epoch 마이크로초 int64, 가격/거래량 float64, 결측 NaN)
+  + change_percent
+  * from_frame: 공급자 컬럼명 혼용(open/open_price/Open, timestamp/date/...)을 NumPy 마스크로 한 번에 정규화
+    (시각 결측, OHLC 결측/비유한/범위 초과 행 제외, volume 결측/음수 -> 0, 같은 시각은 마지막 행, 시각 오름차순)
+  * to_payload / from_payload: 열마다 little-endian 바이트를 base64로 한 번만 직렬화 (봉마다 dict/키 문자열 없음).
+    디코딩은 np.frombuffer로 복사 없이 배열 뷰를 만듦. 큐 envelope(encode_task의 JSON/zlib, DLQ, list 백엔드)는 그대로
+  * to_rows: 백필 COPY 행 / Redis 바구니 항목 (ohlcv_collector가 보내던 항목과 같은 키)
+- price_columns / price_quality: ApiStrategyManager의 가격 0/NULL 비율, 유효 행, OHLC 논리 검사용 벡터 연산
+- 배치 큐 페이로드: {"columns": to_payload(), "metadata": {...}} (task_batch로 꺼냄, 기존 {"items": [...]}도 계속 처리)
+"""
+import base64
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .ohlcv_resampler import OHLCVColumns
+
+PAYLOAD_FORMAT = "ohlcv-columns/1"
+# (열 이름, 직렬화 dtype) - 페이로드의 열 순서
+FIELDS = (
+    ("ts", "<i8"),
+    ("open", "<f8"),
+    ("high", "<f8"),
+    ("low", "<f8"),
+    ("close", "<f8"),
+    ("volume", "<f8"),
+    ("change_percent", "<f8"),
+)
+TIMESTAMP_COLUMNS = ("timestamp_utc", "timestamp", "datetime", "date", "time")
+PRICE_ALIASES = {
+    "open_price": ("open_price", "open", "Open"),
+    "high_price": ("high_price", "high", "High"),
+    "low_price": ("low_price", "low", "Low"),
+    "close_price": ("close_price", "close", "Close"),
+}
+VOLUME_ALIASES = ("volume", "Volume")
+CHANGE_ALIASES = ("change_percent", "change")
+# ohlcv_backfill_loader와 같은 범위 (DECIMAL(24, 10) / DECIMAL(30, 10))
+MAX_PRICE = 1e14
+MAX_VOLUME = 1e20
+MAX_CHANGE_PERCENT = 1e6
+
+
+def _numeric(frame: pd.DataFrame, aliases) -> Optional[np.ndarray]:
+    """별칭 중 처음 있는 컬럼 -> float64 배열 (숫자가 아니면 NaN), 없으면 None"""
+    for name in aliases:
+        if name in frame.columns:
+            return pd.to_numeric(frame[name], errors="coerce").to_numpy(dtype="float64", na_value=np.nan)
+    return None
+
+
+def price_columns(frame: pd.DataFrame) -> Dict[str, np.ndarray]:
+    """있는 가격 컬럼만 표준 이름(open_price 등) -> float64 배열"""
+    prices = {}
+    for name, aliases in PRICE_ALIASES.items():
+        values = _numeric(frame, aliases)
+        if values is not None:
+            prices[name] = values
+    return prices
+
+
+def price_quality(prices: Dict[str, np.ndarray]) -> Dict[str, Any]:
+    """
+    가격 열 검사 (행 단위 반복 없음)
+    zero_null_ratio: 전체 가격 칸 중 0/NULL 비율, valid_rows: 0보다 큰 가격이 하나라도 있는 행 수,
+    high/low_violations: high < max(open, close, low) / low > min(open, close, high) 인 행 수 (결측은 무시)
+    """
+    if not prices:
+        return {"zero_null_ratio": 0.0, "valid_rows": 0, "high_violations": 0, "low_violations": 0}
+    matrix = np.column_stack(list(prices.values()))
+    if not len(matrix):
+        return {"zero_null_ratio": 1.0, "valid_rows": 0, "high_violations": 0, "low_violations": 0}
+
+    high_violations = low_violations = 0
+    high, low = prices.get("high_price"), prices.get("low_price")
+    with np.errstate(invalid="ignore"):
+        if high is not None and low is not None:
+            others = [prices[n] for n in ("open_price", "close_price") if n in prices]
+            high_violations = int(np.count_nonzero(high < np.fmax.reduce([low, *others])))
+            low_violations = int(np.count_nonzero(low > np.fmin.reduce([high, *others])))
+        return {
+            "zero_null_ratio": float(np.count_nonzero(np.isnan(matrix) | (matrix == 0)) / matrix.size),
+            "valid_rows": int(np.count_nonzero((matrix > 0).any(axis=1))),
+            "high_violations": high_violations,
+            "low_violations": low_violations,
+        }
+
+
+def _timestamps_us(frame: pd.DataFrame) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+    """시각 컬럼(없으면 DatetimeIndex) -> (UTC epoch 마이크로초 int64, 변환 성공 마스크)"""
+    source = None
+    for name in TIMESTAMP_COLUMNS:
+        if name in frame.columns:
+            source = frame[name]
+            break
+    if source is None:
+        if not isinstance(frame.index, pd.DatetimeIndex):
+            return None
+        source = frame.index.to_series()
+    parsed = pd.to_datetime(source, errors="coerce", utc=True).to_numpy(dtype="datetime64[us]")
+    return parsed.view("int64"), ~np.isnat(parsed)
+
+
+def _finite_within(values: np.ndarray, limit: float) -> np.ndarray:
+    with np.errstate(invalid="ignore"):
+        return np.isfinite(values) & (np.abs(values) < limit)
+
+
+@dataclass
+class OHLCVBatch:
+    """한 자산/interval의 수집 봉 (열 배열, 시각 오름차순, 시각 중복 없음)"""
+    ts: np.ndarray
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray
+    change_percent: np.ndarray
+    # from_frame에서 제외된 행 수 (직렬화하지 않음)
+    dropped: int = 0
+    # 수집 구간이 백필인지 (ApiStrategyManager.get_ohlcv_batch가 설정, 직렬화하지 않음)
+    is_backfill: bool = False
+
+    def __len__(self) -> int:
+        return len(self.ts)
+
+    @classmethod
+    def empty(cls, dropped: int = 0) -> "OHLCVBatch":
+        return cls(*(np.empty(0, dtype=dtype) for _, dtype in FIELDS), dropped=dropped)
+
+    @classmethod
+    def from_frame(cls, frame: Optional[pd.DataFrame]) -> "OHLCVBatch":
+        """공급자/검증 DataFrame -> 정규화된 배치 (시각이나 OHLC 중 없는 컬럼이 있으면 빈 배치)"""
+        if frame is None or frame.empty:
+            return cls.empty()
+        timestamps = _timestamps_us(frame)
+        prices = price_columns(frame)
+        if timestamps is None or len(prices) < len(PRICE_ALIASES):
+            return cls.empty(dropped=len(frame))
+
+        ts, keep = timestamps
+        for name in PRICE_ALIASES:
+            keep &= _finite_within(prices[name], MAX_PRICE)
+
+        volume = _numeric(frame, VOLUME_ALIASES)
+        if volume is None:
+            volume = np.zeros(len(frame))
+        volume = np.where(_finite_within(volume, MAX_VOLUME) & (volume > 0), volume, 0.0)
+        change = _numeric(frame, CHANGE_ALIASES)
+        if change is None:
+            change = np.full(len(frame), np.nan)
+        change = np.where(_finite_within(change, MAX_CHANGE_PERCENT), change, np.nan)
+
+        # 시각 정렬 (stable) 후 같은 시각은 마지막 행만
+        index = np.flatnonzero(keep)
+        index = index[np.argsort(ts[index], kind="stable")]
+        last = np.ones(len(index), dtype=bool)
+        last[:-1] = ts[index[1:]] != ts[index[:-1]]
+        index = index[last]
+
+        return cls(
+            ts=ts[index],
+            open=prices["open_price"][index],
+            high=prices["high_price"][index],
+            low=prices["low_price"][index],
+            close=prices["close_price"][index],
+            volume=volume[index],
+            change_percent=change[index],
+            dropped=len(frame) - len(index),
+        )
+
+    def to_columns(self) -> OHLCVColumns:
+        """리샘플러 입력 (배열 공유)"""
+        return OHLCVColumns(self.ts, self.open, self.high, self.low, self.close, self.volume)
+
+    def to_payload(self) -> Dict[str, Any]:
+        """JSON 페이로드용 dict (열마다 base64 바이트 한 덩어리)"""
+        return {
+            "format": PAYLOAD_FORMAT,
+            "rows": len(self),
+            "data": {
+                name: base64.b64encode(np.ascontiguousarray(getattr(self, name), dtype=dtype).tobytes()).decode("ascii")
+                for name, dtype in FIELDS
+            },
+        }
+
+    @classmethod
+    def from_payload(cls, payload: Dict[str, Any]) -> "OHLCVBatch":
+        """to_payload 결과 -> 배치 (형식/열 길이가 맞지 않으면 ValueError)"""
+        if payload.get("format") != PAYLOAD_FORMAT:
+            raise ValueError(f"unsupported OHLCV columns format: {payload.get('format')}")
+        rows = int(payload.get("rows", 0))
+        data = payload.get("data") or {}
+        arrays = []
+        for name, dtype in FIELDS:
+            if name not in data:
+                raise ValueError(f"OHLCV columns payload missing '{name}'")
+            array = np.frombuffer(base64.b64decode(data[name]), dtype=dtype)
+            if len(array) != rows:
+                raise ValueError(f"OHLCV columns '{name}' has {len(array)} values, expected {rows}")
+            arrays.append(array)
+        return cls(*arrays)
+
+    def to_rows(self, asset_id: Optional[int] = None, interval: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        봉별 dict (UTC naive datetime, change_percent 결측은 None)
+        키는 백필 COPY 행(ohlcv_backfill_loader)과 같고 Redis 바구니(add_bars_batch)도 그대로 읽을 수 있음
+        """
+        timestamps = self.ts.astype("datetime64[us]").astype(object)
+        change = self.change_percent.astype(object)
+        change[np.isnan(self.change_percent)] = None
+        return [
+            {
+                "asset_id": asset_id,
+                "timestamp_utc": ts,
+                "data_interval": interval,
+                "open_price": o,
+                "high_price": h,
+                "low_price": l,
+                "close_price": c,
+                "volume": v,
+                "change_percent": cp,
+            }
+            for ts, o, h, l, c, v, cp in zip(
+                timestamps.tolist(),
+                self.open.tolist(),
+                self.high.tolist(),
+                self.low.tolist(),
+                self.close.tolist(),
+                self.volume.tolist(),
+                change.tolist(),
+            )
+        ]
+
+
+def task_batch(task: Optional[Dict[str, Any]]) -> Optional[OHLCVBatch]:
+    """배치 태스크 -> 컬럼형 OHLCV 배치 (items 형식 페이로드면 None)"""
+    payload = (task or {}).get("payload")
+    if not isinstance(payload, dict) or "columns" not in payload:
+        return None
+    return OHLCVBatch.from_payload(payload["columns"])
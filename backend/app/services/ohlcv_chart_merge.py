@@ -0,0 +1,105 @@
+"""
+OHLCV Chart Merge - 여러 원천(과거 분봉 / 리샘플 봉 / 지연 시세 / 실시간 봉)의 차트 봉 병합
+- 원천마다 시간순 컬럼(OHLCVColumns)으로 받아, 순위가 명시된 k-way 병합으로 타임스탬프당 한 봉만 선택
+  * 완전한 봉(high != low)은 순위가 높은 원천이 덮어씀 (overrides=True 원천만)
+  * 틱성 봉(high == low)이나 overrides=False 원천은 빈 시각만 채움 (먼저 있던 낮은 순위 값 유지)
+- change_percent는 직전 종가(결측은 건너뜀) 대비로 벡터화 재계산, 직전 종가가 없으면 자기 시가 대비
+- market.get_ohlcv_data_v2 의 분봉/시간봉 경로에서 사용
+"""
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, List, Sequence, Tuple
+
+import numpy as np
+
+from app.services.ohlcv_resampler import OHLCVColumns, _nullable
+
+
+@dataclass
+class MergeSource:
+    """병합 입력 원천 (rank: 높을수록 우선, overrides: 완전한 봉으로 기존 값을 덮어쓸 수 있는지)"""
+    name: str
+    cols: OHLCVColumns
+    rank: int
+    overrides: bool = True
+
+
+def complete_bars(cols: OHLCVColumns) -> np.ndarray:
+    """high != low 인 봉 (둘 다 결측이면 틱성 봉으로 취급)"""
+    both_missing = np.isnan(cols.high) & np.isnan(cols.low)
+    return (cols.high != cols.low) & ~both_missing
+
+
+def merge_sources(sources: Sequence[MergeSource]) -> Tuple[OHLCVColumns, np.ndarray]:
+    """
+    원천들을 타임스탬프당 한 봉으로 병합.
+    반환값: (시간순 병합 컬럼, 각 봉이 선택된 원천의 rank)
+    같은 원천 안에서 타임스탬프가 겹치면 먼저 나온 행을 사용.
+    """
+    sources = [s for s in sources if len(s.cols)]
+    if not sources:
+        return OHLCVColumns.empty(), np.empty(0, dtype=np.int64)
+
+    parts = [s.cols for s in sources]
+    ts = np.concatenate([c.ts for c in parts])
+    ranks = np.concatenate([np.full(len(s.cols), s.rank, dtype=np.int64) for s in sources])
+    override = np.concatenate([complete_bars(s.cols) & s.overrides for s in sources]).astype(np.int8)
+
+    # 선택 우선순위: 덮어쓰기 가능한 봉(높은 rank 우선) > 채우기 봉(낮은 rank 우선) > 원천 내 먼저 나온 행
+    priority = np.where(override == 1, ranks, -ranks)
+    row_order = -np.arange(len(ts))
+    # 각 원천은 이미 시간순이므로 마지막 키(ts) 정렬은 정렬된 구간들의 병합이 됨
+    order = np.lexsort((row_order, priority, override, ts))
+    sorted_ts = ts[order]
+    last_of_group = np.append(sorted_ts[1:] != sorted_ts[:-1], True)
+    winners = order[last_of_group]
+
+    merged = OHLCVColumns(
+        ts[winners],
+        *(np.concatenate([getattr(c, field) for c in parts])[winners]
+          for field in ("open", "high", "low", "close", "volume")),
+    )
+    return merged, ranks[winners]
+
+
+def change_percent(open_: np.ndarray, close: np.ndarray, decimals: int = 4) -> np.ndarray:
+    """
+    직전 유효 종가 대비 변동률(%). 직전 종가가 없거나 0 이하이면 자기 시가 대비,
+    그것도 불가하면 0.0 (기존 _recalculate_change_percent 규칙)
+    """
+    n = len(close)
+    out = np.zeros(n)
+    if not n:
+        return out
+    valid_close = ~np.isnan(close)
+    # 각 행 이전의 마지막 유효 종가 위치 (-1: 없음)
+    last_valid = np.maximum.accumulate(np.where(valid_close, np.arange(n), -1))
+    prev_idx = np.concatenate(([-1], last_valid[:-1]))
+    prev_close = np.where(prev_idx >= 0, close[np.maximum(prev_idx, 0)], np.nan)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        use_prev = valid_close & (prev_close > 0)
+        use_open = valid_close & ~use_prev & (open_ > 0)
+        out[use_prev] = np.round((close[use_prev] - prev_close[use_prev]) / prev_close[use_prev] * 100, decimals)
+        out[use_open] = np.round((close[use_open] - open_[use_open]) / open_[use_open] * 100, decimals)
+    return out
+
+
+def to_chart_dicts(cols: OHLCVColumns, interval: str, change: np.ndarray) -> List[Dict[str, Any]]:
+    """병합 결과 -> get_ohlcv_data_v2 응답 형식 dict 목록 (NaN -> None)"""
+    stamps = cols.ts.astype("datetime64[us]").astype(datetime).tolist()
+    columns = [_nullable(a) for a in (cols.open, cols.high, cols.low, cols.close, cols.volume, change)]
+    return [
+        {
+            'timestamp_utc': ts,
+            'open_price': o,
+            'high_price': h,
+            'low_price': l,
+            'close_price': c,
+            'volume': v,
+            'change_percent': cp,
+            'data_interval': interval,
+        }
+        for ts, o, h, l, c, v, cp in zip(stamps, *columns)
+    ]
+
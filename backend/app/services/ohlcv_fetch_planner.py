@@ -0,0 +1,281 @@
+"""
+OHLCV Fetch Planner - 수집 실행 한 번의 자산 x interval 수집 구간을 일괄 계산
+- 기존: 자산마다 get_ohlcv가 HISTORICAL_DATA_DAYS_PER_RUN을, _get_fetch_parameters_impl이 설정 3~4건 +
+  가장 오래된/최신 시각 + 갭 확인(MIN/MAX/COUNT)을 각각 조회했고, 백필 여부는 공유 인스턴스 속성
+  (_last_fetch_was_backfill)으로 돌려줘 동시에 도는 자산 태스크끼리 덮어씀
+- plan_fetches(db, asset_ids, interval): 설정 1회 + 자산 정보/보유 구간 1회 (자산별 LATERAL 인덱스 조회) 쿼리로
+  자산별 FetchPlan(불변)을 만듦. 수집 경로는 ApiStrategyManager.get_ohlcv_batch(plan=...)로 계획만 사용
+- plan_window: 구간 결정 규칙 (기존 _get_fetch_parameters_impl과 같은 순서)
+  1) 데이터 없음 -> 초기 백필 (1m/5m 최대 730일, 1d 최대 30일), 백필 비활성이면 최근 5일
+  2) 최신 데이터가 하루 이상 지남 -> 최신 구간 채우기 (이틀 이상이면 백필)
+  3) 백필 비활성 -> 최근 1일 갱신
+  4) 백필 활성 -> 최신 쪽 부족분, 과거 쪽 부족분(주식 MIN_HISTORICAL_DATE, 코인 2010-01-01),
+     [최소 날짜, 오늘 - historical_days] 안의 앞/뒤 갭 중 큰 쪽 순으로 하나, 모두 채워졌으면 수집 안 함
+"""
+import logging
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, Iterable, Optional
+
+from sqlalchemy import text
+
+logger = logging.getLogger(__name__)
+
+DAILY_INTERVALS = ("1d", "daily", "1w", "1mo", "1M", "1month")
+SHORT_INTRADAY_INTERVALS = ("1m", "5m")
+DEFAULT_HISTORICAL_DAYS = 165
+DEFAULT_MIN_HISTORICAL_DATE = date(1999, 11, 1)
+CRYPTO_MIN_HISTORICAL_DATE = date(2010, 1, 1)
+
+SETTINGS_QUERY = text("""
+    SELECT config_key, config_value
+    FROM app_configurations
+    WHERE config_key IN ('ENABLE_HISTORICAL_BACKFILL', 'HISTORICAL_DATA_DAYS_PER_RUN', 'MIN_HISTORICAL_DATE')
+""")
+
+# 자산마다 (asset_id, data_interval, timestamp_utc) 인덱스를 LIMIT 1로 4번 탐색
+# range_*: 갭 확인 구간 [range_start, range_end] 안의 첫/마지막 시각 (코인/주식은 시작일이 다름)
+PLAN_STATE_SQL = """
+    SELECT a.asset_id, a.ticker, at.type_name,
+           COALESCE(NULLIF(a.data_source, ''), a.collection_settings ->> 'data_source') AS data_source,
+           oldest.ts AS oldest_ts, newest.ts AS newest_ts,
+           range_first.ts AS range_first_ts, range_last.ts AS range_last_ts
+    FROM assets a
+    LEFT JOIN asset_types at ON at.asset_type_id = a.asset_type_id
+    CROSS JOIN LATERAL (
+        SELECT CASE WHEN lower(at.type_name) LIKE '%crypto%'
+                    THEN CAST(:crypto_range_start AS DATE) ELSE CAST(:stock_range_start AS DATE) END AS start_date
+    ) r
+    LEFT JOIN LATERAL (
+        SELECT d.timestamp_utc AS ts FROM {table} d
+        WHERE d.asset_id = a.asset_id AND d.data_interval = :interval
+        ORDER BY d.timestamp_utc LIMIT 1
+    ) oldest ON TRUE
+    LEFT JOIN LATERAL (
+        SELECT d.timestamp_utc AS ts FROM {table} d
+        WHERE d.asset_id = a.asset_id AND d.data_interval = :interval
+        ORDER BY d.timestamp_utc DESC LIMIT 1
+    ) newest ON TRUE
+    LEFT JOIN LATERAL (
+        SELECT d.timestamp_utc AS ts FROM {table} d
+        WHERE d.asset_id = a.asset_id AND d.data_interval = :interval
+          AND d.timestamp_utc >= r.start_date AND d.timestamp_utc <= CAST(:range_end AS DATE)
+        ORDER BY d.timestamp_utc LIMIT 1
+    ) range_first ON TRUE
+    LEFT JOIN LATERAL (
+        SELECT d.timestamp_utc AS ts FROM {table} d
+        WHERE d.asset_id = a.asset_id AND d.data_interval = :interval
+          AND d.timestamp_utc >= r.start_date AND d.timestamp_utc <= CAST(:range_end AS DATE)
+        ORDER BY d.timestamp_utc DESC LIMIT 1
+    ) range_last ON TRUE
+    WHERE a.asset_id = ANY(:asset_ids)
+"""
+
+
+@dataclass(frozen=True)
+class FetchSettings:
+    enable_backfill: bool = True
+    historical_days: int = DEFAULT_HISTORICAL_DAYS
+    min_historical_date: date = DEFAULT_MIN_HISTORICAL_DATE
+
+
+@dataclass(frozen=True)
+class FetchWindow:
+    start_date: date
+    end_date: date
+    limit: int
+    is_backfill: bool
+
+
+@dataclass(frozen=True)
+class FetchPlan:
+    """자산 하나의 이번 실행 수집 계획 (window가 None이면 수집할 구간 없음)"""
+    asset_id: int
+    interval: str
+    ticker: str
+    asset_type: Optional[str]
+    data_source: Optional[str]
+    window: Optional[FetchWindow]
+    historical_days: int = DEFAULT_HISTORICAL_DAYS
+
+    @property
+    def is_backfill(self) -> bool:
+        return bool(self.window and self.window.is_backfill)
+
+    def params(self) -> Optional[Dict[str, Any]]:
+        """기존 _get_fetch_parameters 반환 형식"""
+        if not self.window:
+            return None
+        return {
+            "start_date": self.window.start_date.strftime('%Y-%m-%d'),
+            "end_date": self.window.end_date.strftime('%Y-%m-%d'),
+            "limit": self.window.limit,
+            "is_backfill": self.window.is_backfill,
+        }
+
+
+def is_daily_interval(interval: Optional[str]) -> bool:
+    # "1m"은 1분이므로 제외, 1개월은 "1mo" / "1M" / "1month"
+    return interval is None or interval in DAILY_INTERVALS
+
+
+def is_crypto_type(asset_type: Optional[str]) -> bool:
+    return bool(asset_type) and 'crypto' in asset_type.lower()
+
+
+def interval_limit(interval: str, days: int) -> int:
+    """간격별 limit (1m, 5m은 고정값)"""
+    if interval == '1m':
+        return 1000  # Binance limit (was 4320)
+    elif interval == '5m':
+        return 1000  # Aligning with 1m for safety (was 8640)
+    elif interval == '15m':
+        return 2016  # 3주
+    elif interval == '30m':
+        return 1440  # 30일
+    elif interval == '1h':
+        return 720   # 30일
+    elif interval == '4h':
+        return 500   # 80일
+    elif interval == '1d':
+        return 365   # 1년
+    return 500
+
+
+def _as_date(value) -> Optional[date]:
+    if value is None:
+        return None
+    return value.date() if isinstance(value, datetime) else value
+
+
+def range_start(interval: str, is_crypto: bool, settings: FetchSettings, today: date) -> date:
+    """과거 백필/갭 확인 구간의 시작일"""
+    if is_crypto:
+        # 1m, 5m 간격은 최대 10년
+        start = CRYPTO_MIN_HISTORICAL_DATE
+        return max(start, today - timedelta(days=3650)) if interval in SHORT_INTRADAY_INTERVALS else start
+    # 1m, 5m 간격은 최대 2년
+    start = settings.min_historical_date
+    return max(start, today - timedelta(days=730)) if interval in SHORT_INTRADAY_INTERVALS else start
+
+
+def plan_window(
+    interval: str,
+    is_crypto: bool,
+    settings: FetchSettings,
+    today: date,
+    oldest_ts=None,
+    newest_ts=None,
+    range_first_ts=None,
+    range_last_ts=None,
+) -> Optional[FetchWindow]:
+    """보유 구간 -> 이번 실행 수집 구간 (None이면 수집 불필요)"""
+    newest = _as_date(newest_ts)
+
+    # 1) 데이터 없음
+    if newest is None:
+        if not settings.enable_backfill:
+            return FetchWindow(today - timedelta(days=5), today, interval_limit(interval, 5), False)
+        backfill_days = settings.historical_days
+        if interval in SHORT_INTRADAY_INTERVALS:
+            backfill_days = min(backfill_days, 730)
+        elif interval == '1d':
+            # OOM 방지를 위해 1일 간격 초기 백필은 30일로 제한
+            backfill_days = min(backfill_days, 30)
+        return FetchWindow(today - timedelta(days=backfill_days), today, interval_limit(interval, backfill_days), True)
+
+    # 2) 최신 구간 채우기
+    days_diff = (today - newest).days
+    if days_diff >= 1:
+        start = newest + timedelta(days=1) if days_diff > 1 else newest
+        return FetchWindow(start, today, interval_limit(interval, days_diff), days_diff > 1)
+
+    # 3) 백필 비활성: 오늘 데이터가 있어도 최근 1일 갱신
+    if not settings.enable_backfill:
+        return FetchWindow(newest, today, interval_limit(interval, 1), False) if days_diff == 0 else None
+
+    # 4) 과거 데이터 심화
+    def limit_for(days: int) -> int:
+        return max(1, days + 5) if is_crypto else interval_limit(interval, days)
+
+    oldest = _as_date(oldest_ts)
+    min_required = range_start(interval, is_crypto, settings, today)
+    max_required = today - timedelta(days=settings.historical_days)
+
+    if newest < max_required:
+        return FetchWindow(newest + timedelta(days=1), max_required, limit_for((max_required - newest).days), True)
+    if oldest > min_required:
+        return FetchWindow(min_required, oldest - timedelta(days=1), limit_for((oldest - min_required).days), True)
+
+    range_first = _as_date(range_first_ts)
+    range_last = _as_date(range_last_ts)
+    gaps = []
+    if range_first is None:
+        gaps.append((min_required, max_required))
+    else:
+        if range_first > min_required:
+            gaps.append((min_required, range_first))
+        if range_last < max_required:
+            gaps.append((range_last, max_required))
+    if gaps:
+        start, end = max(gaps, key=lambda gap: (gap[1] - gap[0]).days)
+        return FetchWindow(start, end, limit_for((end - start).days), True)
+    return None
+
+
+def load_fetch_settings(db) -> FetchSettings:
+    values = {row[0]: row[1] for row in db.execute(SETTINGS_QUERY)}
+    min_date = DEFAULT_MIN_HISTORICAL_DATE
+    if values.get('MIN_HISTORICAL_DATE'):
+        try:
+            min_date = datetime.strptime(values['MIN_HISTORICAL_DATE'], "%Y-%m-%d").date()
+        except ValueError:
+            logger.warning(f"Invalid MIN_HISTORICAL_DATE format: {values['MIN_HISTORICAL_DATE']}. Using default: {min_date}")
+    enable = values.get('ENABLE_HISTORICAL_BACKFILL')
+    days = values.get('HISTORICAL_DATA_DAYS_PER_RUN')
+    return FetchSettings(
+        enable_backfill=enable.lower() == 'true' if enable else True,
+        historical_days=int(days) if days else DEFAULT_HISTORICAL_DAYS,
+        min_historical_date=min_date,
+    )
+
+
+def plan_fetches(db, asset_ids: Iterable[int], interval: str, today: Optional[date] = None) -> Dict[int, FetchPlan]:
+    """
+    asset_id -> FetchPlan (assets에 없는 자산은 빠짐)
+    쿼리 2회: app_configurations, 자산 정보 + 보유 구간
+    """
+    asset_ids = list(dict.fromkeys(asset_ids))
+    if not asset_ids:
+        return {}
+    today = today or datetime.now().date()
+    settings = load_fetch_settings(db)
+    table = "ohlcv_day_data" if is_daily_interval(interval) else "ohlcv_intraday_data"
+    rows = db.execute(text(PLAN_STATE_SQL.format(table=table)), {
+        "asset_ids": asset_ids,
+        "interval": interval,
+        "stock_range_start": range_start(interval, False, settings, today),
+        "crypto_range_start": range_start(interval, True, settings, today),
+        "range_end": today - timedelta(days=settings.historical_days),
+    }).mappings().all()
+
+    plans: Dict[int, FetchPlan] = {}
+    for row in rows:
+        window = plan_window(
+            interval, is_crypto_type(row["type_name"]), settings, today,
+            row["oldest_ts"], row["newest_ts"], row["range_first_ts"], row["range_last_ts"],
+        )
+        plans[row["asset_id"]] = FetchPlan(
+            asset_id=row["asset_id"],
+            interval=interval,
+            ticker=row["ticker"],
+            asset_type=row["type_name"],
+            data_source=row["data_source"],
+            window=window,
+            historical_days=settings.historical_days,
+        )
+
+    backfills = sum(1 for plan in plans.values() if plan.is_backfill)
+    idle = sum(1 for plan in plans.values() if plan.window is None)
+    logger.info(f"🗺️ OHLCV 수집 계획 ({interval}): 자산 {len(plans)}개, 백필 {backfills}개, 수집 불필요 {idle}개")
+    return plans
@@ -0,0 +1,368 @@
+"""
+OHLCV Resampler - 차트용 OHLCV 컬럼형 리샘플링 엔진
+- 행을 바로 NumPy 배열(epoch 마이크로초 + float64 가격/거래량, 결측은 NaN)로 적재
+- 버킷 번호는 epoch 초에 대한 정수 연산으로 계산하고 ufunc.reduceat으로 한 번에 집계
+  * N분봉 (offset_seconds로 세션 정렬, 예: 미국장 13:30 UTC)
+  * ISO 주 (월요일 시작), 달력 월
+- 결과는 배열(OHLCVColumns) 또는 기존 API와 같은 형태의 dict 목록 / 미리 직렬화한 JSON 문자열로 반환
+- market.resample_intraday_data / aggregate_to_weekly_v2 / aggregate_to_monthly_v2 (resample_dicts / aggregate_dicts),
+  OHLCVService._aggregate_ohlcv_data 가 공용으로 사용
+"""
+import json
+from dataclasses import dataclass, replace
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+US_PER_SECOND = 1_000_000
+SECONDS_PER_DAY = 86400
+# 1970-01-01은 목요일이므로 +3일 하면 월요일 시작 주 번호가 됨
+EPOCH_WEEKDAY_SHIFT = 3
+
+_EPOCH = datetime(1970, 1, 1)
+_EPOCH_UTC = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_ONE_US = timedelta(microseconds=1)
+
+PRICE_FIELDS = ("open_price", "high_price", "low_price", "close_price")
+OHLCV_FIELDS = PRICE_FIELDS + ("volume",)
+
+
+@dataclass
+class OHLCVColumns:
+    """시간순 정렬된 OHLCV 컬럼 (ts: epoch 마이크로초 int64, 나머지 float64)"""
+    ts: np.ndarray
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.ts)
+
+    @property
+    def seconds(self) -> np.ndarray:
+        return self.ts // US_PER_SECOND
+
+    def take(self, index) -> "OHLCVColumns":
+        return OHLCVColumns(self.ts[index], self.open[index], self.high[index],
+                            self.low[index], self.close[index], self.volume[index])
+
+    # ------------------------------------------------------------------
+    # 적재
+    # ------------------------------------------------------------------
+    @classmethod
+    def empty(cls) -> "OHLCVColumns":
+        f = np.empty(0, dtype=np.float64)
+        return cls(np.empty(0, dtype=np.int64), f, f.copy(), f.copy(), f.copy(), f.copy())
+
+    @classmethod
+    def from_arrays(cls, timestamps, open_, high, low, close, volume, sort: bool = True) -> "OHLCVColumns":
+        ts = to_epoch_us(timestamps)
+        cols = cls(ts, _floats(open_), _floats(high), _floats(low), _floats(close), _floats(volume))
+        if sort and len(ts) > 1 and np.any(ts[1:] < ts[:-1]):
+            cols = cols.take(np.argsort(ts, kind="stable"))
+        return cols
+
+    @classmethod
+    def from_rows(cls, rows: Sequence[Any], sort: bool = True) -> "OHLCVColumns":
+        """ORM 객체/Row (timestamp_utc, open_price, high_price, low_price, close_price, volume 속성)"""
+        if not rows:
+            return cls.empty()
+        return cls.from_arrays(
+            [r.timestamp_utc for r in rows],
+            *([getattr(r, name) for r in rows] for name in OHLCV_FIELDS),
+            sort=sort,
+        )
+
+    @classmethod
+    def from_dicts(cls, rows: Sequence[Dict[str, Any]], sort: bool = True) -> "OHLCVColumns":
+        """market 엔드포인트 형식의 dict 목록"""
+        if not rows:
+            return cls.empty()
+        return cls.from_arrays(
+            [r['timestamp_utc'] for r in rows],
+            *([r.get(name) for r in rows] for name in OHLCV_FIELDS),
+            sort=sort,
+        )
+
+
+def to_epoch_us(timestamps) -> np.ndarray:
+    """datetime(naive는 UTC로 간주) 목록/datetime64 배열 -> epoch 마이크로초 int64"""
+    if isinstance(timestamps, np.ndarray) and timestamps.dtype.kind == "M":
+        return timestamps.astype("datetime64[us]").astype(np.int64)
+    # object -> datetime64 변환보다 timedelta 정수 나눗셈이 수 배 빠름
+    return np.fromiter(
+        ((ts - (_EPOCH_UTC if ts.tzinfo is not None else _EPOCH)) // _ONE_US for ts in timestamps),
+        dtype=np.int64,
+        count=len(timestamps),
+    )
+
+
+def _floats(values) -> np.ndarray:
+    # None/Decimal/str 숫자를 float64로 (None -> NaN)
+    return np.asarray(values, dtype=np.float64) if not isinstance(values, np.ndarray) else values.astype(np.float64, copy=False)
+
+
+# ----------------------------------------------------------------------
+# 버킷 번호 (epoch 초 기준 정수 연산)
+# ----------------------------------------------------------------------
+def minute_buckets(seconds: np.ndarray, minutes: int, offset_seconds: int = 0,
+                   anchor_seconds: int = SECONDS_PER_DAY) -> np.ndarray:
+    """
+    N분 버킷 시작 시각(epoch 초).
+    버킷은 매 기준 구간(기본: 하루) 시작 시각(UTC 00:00 + offset_seconds)에서 다시 정렬되므로
+    세션 시작(예: 13:30 UTC)에 맞춘 봉이나 하루를 나누어떨어지지 않는 간격도 날짜를 넘나들지 않음.
+    하루 이상 간격은 epoch 기준으로 정렬.
+    """
+    width = int(minutes) * 60
+    if width >= anchor_seconds:
+        return (seconds - offset_seconds) // width * width + offset_seconds
+    session = (seconds - offset_seconds) // anchor_seconds * anchor_seconds + offset_seconds
+    return session + (seconds - session) // width * width
+
+
+def week_buckets(seconds: np.ndarray) -> np.ndarray:
+    """ISO 주(월요일 시작) 버킷 시작 시각(epoch 초)"""
+    days = seconds // SECONDS_PER_DAY
+    week = (days + EPOCH_WEEKDAY_SHIFT) // 7
+    return (week * 7 - EPOCH_WEEKDAY_SHIFT) * SECONDS_PER_DAY
+
+
+def month_buckets(seconds: np.ndarray) -> np.ndarray:
+    """달력 월 버킷 시작 시각(epoch 초)"""
+    months = seconds.astype("datetime64[s]").astype("datetime64[M]")
+    return months.astype("datetime64[s]").astype(np.int64)
+
+
+def bucket_ids(cols: OHLCVColumns, rule: str, offset_seconds: int = 0,
+               anchor_seconds: int = SECONDS_PER_DAY) -> np.ndarray:
+    """
+    rule: '<N>m' (N분), '<N>h', '<N>d', '1W' (ISO 주), '1M' (달력 월)
+    """
+    seconds = cols.seconds
+    if rule == "1W":
+        return week_buckets(seconds)
+    if rule == "1M":
+        return month_buckets(seconds)
+    return minute_buckets(seconds, rule_minutes(rule), offset_seconds, anchor_seconds)
+
+
+def rule_minutes(rule: str) -> int:
+    unit = rule[-1]
+    n = int(rule[:-1] or 1)
+    if unit == "m":
+        return n
+    if unit in ("h", "H"):
+        return n * 60
+    if unit in ("d", "D"):
+        return n * 1440
+    raise ValueError(f"Unsupported resample rule: {rule}")
+
+
+# ----------------------------------------------------------------------
+# 집계
+# ----------------------------------------------------------------------
+@dataclass
+class Resampled:
+    """리샘플 결과 (bucket: 버킷 시작 epoch 초, last_ts: 버킷 마지막 행 epoch 마이크로초)"""
+    bucket: np.ndarray
+    last_ts: np.ndarray
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray
+    first_valid_open: np.ndarray
+    last_valid_close: np.ndarray
+    count: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.bucket)
+
+    def timestamps(self, label: str = "start") -> np.ndarray:
+        """label='start': 버킷 시작 시각, 'last': 버킷 내 마지막 행 시각 (datetime64[us])"""
+        if label == "last":
+            return self.last_ts.astype("datetime64[us]")
+        return (self.bucket * US_PER_SECOND).astype("datetime64[us]")
+
+    def to_columns(self, label: str = "start") -> OHLCVColumns:
+        """다른 소스와 병합할 수 있도록 봉 컬럼으로 변환"""
+        ts = self.last_ts if label == "last" else self.bucket * US_PER_SECOND
+        return OHLCVColumns(ts, self.open, self.high, self.low, self.close, self.volume)
+
+    def to_dicts(self, interval: str, label: str = "start", change_percent: Optional[np.ndarray] = None) -> List[Dict[str, Any]]:
+        """기존 market 엔드포인트와 같은 키의 dict 목록 (NaN -> None)"""
+        stamps = self.timestamps(label).astype(datetime).tolist()
+        change = change_percent if change_percent is not None else np.full(len(self), np.nan)
+        columns = [_nullable(a) for a in (self.open, self.high, self.low, self.close, self.volume, change)]
+        return [
+            {
+                'timestamp_utc': ts,
+                'open_price': o,
+                'high_price': h,
+                'low_price': l,
+                'close_price': c,
+                'volume': v,
+                'change_percent': cp,
+                'data_interval': interval,
+            }
+            for ts, o, h, l, c, v, cp in zip(stamps, *columns)
+        ]
+
+    def to_json(self, interval: str, label: str = "start", change_percent: Optional[np.ndarray] = None) -> str:
+        """to_dicts와 같은 구조의 JSON 배열 문자열 (dict를 만들지 않고 컬럼 단위로 직렬화)"""
+        if not len(self):
+            return "[]"
+        stamps = np.datetime_as_string(self.timestamps(label), unit="s")
+        change = change_percent if change_percent is not None else np.full(len(self), np.nan)
+        columns = [_json_numbers(a) for a in (self.open, self.high, self.low, self.close, self.volume, change)]
+        interval_json = json.dumps(interval)
+        rows = (
+            f'{{"timestamp_utc":"{ts}","open_price":{o},"high_price":{h},"low_price":{l},'
+            f'"close_price":{c},"volume":{v},"change_percent":{cp},"data_interval":{interval_json}}}'
+            for ts, o, h, l, c, v, cp in zip(stamps.tolist(), *columns)
+        )
+        return "[" + ",".join(rows) + "]"
+
+
+def _nullable(values: np.ndarray) -> List[Optional[float]]:
+    out = values.tolist()
+    if np.isnan(values).any():
+        for i in np.flatnonzero(np.isnan(values)).tolist():
+            out[i] = None
+    return out
+
+
+def _json_numbers(values: np.ndarray) -> List[str]:
+    out = [repr(v) for v in values.tolist()]
+    if np.isnan(values).any():
+        for i in np.flatnonzero(np.isnan(values)).tolist():
+            out[i] = "null"
+    return out
+
+
+def _segment_first_valid(values: np.ndarray, starts: np.ndarray, ends: np.ndarray) -> np.ndarray:
+    """버킷별 첫 번째 유효(NaN 아님) 값"""
+    n = len(values)
+    valid = ~np.isnan(values)
+    # 각 위치 이후의 첫 유효 인덱스
+    idx = np.where(valid, np.arange(n), n)
+    next_valid = np.minimum.accumulate(idx[::-1])[::-1]
+    first = next_valid[starts]
+    ok = first < ends
+    out = np.full(len(starts), np.nan)
+    out[ok] = values[first[ok]]
+    return out
+
+
+def _segment_last_valid(values: np.ndarray, starts: np.ndarray, ends: np.ndarray) -> np.ndarray:
+    """버킷별 마지막 유효 값"""
+    valid = ~np.isnan(values)
+    idx = np.where(valid, np.arange(len(values)), -1)
+    prev_valid = np.maximum.accumulate(idx)
+    last = prev_valid[ends - 1]
+    ok = last >= starts
+    out = np.full(len(starts), np.nan)
+    out[ok] = values[last[ok]]
+    return out
+
+
+def resample(cols: OHLCVColumns, rule: str, offset_seconds: int = 0,
+             anchor_seconds: int = SECONDS_PER_DAY) -> Resampled:
+    """
+    정렬된 컬럼을 rule 버킷으로 집계.
+    open/close는 버킷 첫/마지막 행의 값(결측이면 NaN), high/low는 NaN 무시 max/min, volume은 NaN 무시 합.
+    """
+    if not len(cols):
+        e = np.empty(0, dtype=np.float64)
+        i = np.empty(0, dtype=np.int64)
+        return Resampled(i, i.copy(), e, e.copy(), e.copy(), e.copy(), e.copy(), e.copy(), e.copy(), i.copy())
+
+    ids = bucket_ids(cols, rule, offset_seconds, anchor_seconds)
+    starts = np.concatenate(([0], np.flatnonzero(ids[1:] != ids[:-1]) + 1))
+    ends = np.append(starts[1:], len(ids))
+
+    with np.errstate(invalid="ignore"):
+        high = np.fmax.reduceat(cols.high, starts)
+        low = np.fmin.reduceat(cols.low, starts)
+    volume = np.add.reduceat(np.nan_to_num(cols.volume, nan=0.0), starts)
+
+    return Resampled(
+        bucket=ids[starts],
+        last_ts=cols.ts[ends - 1],
+        open=cols.open[starts],
+        high=high,
+        low=low,
+        close=cols.close[ends - 1],
+        volume=volume,
+        first_valid_open=_segment_first_valid(cols.open, starts, ends),
+        last_valid_close=_segment_last_valid(cols.close, starts, ends),
+        count=ends - starts,
+    )
+
+
+def pct_change(close: np.ndarray, decimals: int = 4) -> np.ndarray:
+    """직전 봉 종가 대비 변동률(%) - 직전 종가가 없거나 0 이하이면 NaN"""
+    out = np.full(len(close), np.nan)
+    if len(close) > 1:
+        prev = close[:-1]
+        cur = close[1:]
+        ok = (prev > 0) & ~np.isnan(cur) & (cur != 0)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            change = (cur - prev) / prev * 100
+        out[1:][ok] = np.round(change[ok], decimals)
+    return out
+
+
+def zero_as_nan(values: np.ndarray) -> np.ndarray:
+    """기존 구현의 truthiness 규칙(0 값은 결측) 재현용"""
+    return np.where(values == 0, np.nan, values)
+
+
+
+# ----------------------------------------------------------------------
+# market 엔드포인트 dict 어댑터 (기존 구현의 출력 규칙 유지)
+# ----------------------------------------------------------------------
+def resample_dicts(rows: Sequence[Dict[str, Any]], interval_minutes: int, interval: str,
+                   offset_seconds: int = 0) -> List[Dict[str, Any]]:
+    """
+    intraday dict 목록 -> N분봉 dict 목록 (timestamp_utc = 버킷 시작).
+    1d 이상은 하루 단위, 1시간 이상은 하루 안에서, 1시간 미만은 시(hour) 안에서 정렬.
+    open/close는 첫/마지막 행 값(0이면 None), high/low는 값이 없으면 0.0.
+    """
+    if not rows:
+        return []
+    return resample_candles(OHLCVColumns.from_dicts(rows), interval_minutes, offset_seconds).to_dicts(interval)
+
+
+def resample_candles(cols: OHLCVColumns, interval_minutes: int, offset_seconds: int = 0) -> Resampled:
+    """resample_dicts의 컬럼형 버전 (같은 버킷 정렬/결측 규칙)"""
+    minutes = 1440 if interval_minutes >= 1440 else interval_minutes
+    anchor_seconds = 3600 if minutes < 60 else SECONDS_PER_DAY
+    result = resample(cols, f"{minutes}m", offset_seconds, anchor_seconds)
+    return replace(
+        result,
+        open=zero_as_nan(result.open),
+        high=np.nan_to_num(result.high, nan=0.0),
+        low=np.nan_to_num(result.low, nan=0.0),
+        close=zero_as_nan(result.close),
+    )
+
+
+def aggregate_dicts(rows: Sequence[Dict[str, Any]], rule: str) -> List[Dict[str, Any]]:
+    """
+    일봉 dict 목록 -> 주봉('1W')/월봉('1M') dict 목록 (timestamp_utc = 버킷 마지막 일봉).
+    0 값은 결측으로 취급하고 change_percent는 직전 봉 종가 대비로 계산.
+    """
+    if not rows:
+        return []
+    result = aggregate_daily(OHLCVColumns.from_dicts(rows), rule)
+    return result.to_dicts(rule, label="last", change_percent=pct_change(result.close))
+
+
+def aggregate_daily(cols: OHLCVColumns, rule: str) -> Resampled:
+    """aggregate_dicts의 컬럼형 버전 (0 값은 결측)"""
+    cols = OHLCVColumns(cols.ts, *(zero_as_nan(a) for a in (cols.open, cols.high, cols.low, cols.close, cols.volume)))
+    return resample(cols, rule)
@@ -0,0 +1,232 @@
+"""
+OHLCV Rollup - 일봉(ohlcv_day_data)의 주/월 롤업 테이블(ohlcv_rollup_data) 유지
+- refresh_rollups: 자산별 영향 구간(첫/마지막 일봉 시각)이 속한 주/월만 SQL 한 번씩으로 재계산해 UPSERT
+  (DataRepository.save_ohlcv_data가 일봉 저장과 같은 트랜잭션에서 호출, 백필 스크립트도 같은 경로 사용)
+- 집계 규칙은 기존 aggregate_to_weekly_v2/monthly_v2 + get_daily_data_combined와 동일
+  * 같은 날짜의 일봉이 여러 개면 가장 늦은 행, 0 가격은 결측
+  * open/close: 기간 첫/마지막 일봉 값, high/low: 결측 제외 max/min, volume: 합계
+  * timestamp_utc: 기간 내 마지막 일봉 날짜(00:00)
+- load_rollups: 차트 조회용 최신 limit개 기간 (PK 인덱스 역순 스캔)
+- rollup_chart_data: 롤업 + 최근 일봉 재집계로 주/월봉 차트 응답 (aggregate_to_weekly_v2/monthly_v2와 같은 결과)
+"""
+import logging
+from datetime import date, datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+from sqlalchemy import text
+
+from .ohlcv_chart_merge import to_chart_dicts
+from .ohlcv_resampler import OHLCVColumns, aggregate_daily, pct_change
+
+logger = logging.getLogger(__name__)
+
+# period -> (date_trunc 단위, 기간 길이)
+ROLLUP_PERIODS = {
+    '1W': ('week', '1 week'),
+    '1M': ('month', '1 month'),
+}
+
+DAILY_INTERVALS = ('1d', '1day')
+
+# 최신 기간 재계산에 필요한 일봉 수 (한 달 + 같은 날짜 중복 여유)
+ROLLUP_TAIL_DAILY_LIMIT = 64
+
+REFRESH_SQL = text("""
+    WITH affected AS (
+        SELECT a.asset_id,
+               date_trunc(:unit, a.first_ts) AS range_start,
+               date_trunc(:unit, a.last_ts) + CAST(:step AS interval) AS range_end
+        FROM unnest(CAST(:asset_ids AS integer[]), CAST(:first_ts AS timestamp[]), CAST(:last_ts AS timestamp[]))
+             AS a(asset_id, first_ts, last_ts)
+    ),
+    days AS (
+        SELECT DISTINCT ON (d.asset_id, date_trunc('day', d.timestamp_utc))
+            d.asset_id,
+            date_trunc('day', d.timestamp_utc) AS day,
+            NULLIF(d.open_price, 0) AS open_price,
+            NULLIF(d.high_price, 0) AS high_price,
+            NULLIF(d.low_price, 0) AS low_price,
+            NULLIF(d.close_price, 0) AS close_price,
+            d.volume
+        FROM ohlcv_day_data d
+        JOIN affected a
+          ON d.asset_id = a.asset_id
+         AND d.timestamp_utc >= a.range_start
+         AND d.timestamp_utc < a.range_end
+        WHERE d.data_interval IN ('1d', '1day') OR d.data_interval IS NULL
+        ORDER BY d.asset_id, date_trunc('day', d.timestamp_utc), d.timestamp_utc DESC
+    ),
+    periods AS (
+        SELECT date_trunc(:unit, day) AS period_start, * FROM days
+    )
+    INSERT INTO ohlcv_rollup_data AS r
+        (asset_id, period, period_start, timestamp_utc, open_price, high_price, low_price,
+         close_price, volume, bar_count, updated_at)
+    SELECT
+        asset_id,
+        :period,
+        period_start,
+        max(day),
+        (array_agg(open_price ORDER BY day))[1],
+        max(high_price),
+        min(low_price),
+        (array_agg(close_price ORDER BY day DESC))[1],
+        COALESCE(sum(volume), 0),
+        count(*),
+        now()
+    FROM periods
+    GROUP BY asset_id, period_start
+    ON CONFLICT (asset_id, period, period_start) DO UPDATE SET
+        timestamp_utc = EXCLUDED.timestamp_utc,
+        open_price = EXCLUDED.open_price,
+        high_price = EXCLUDED.high_price,
+        low_price = EXCLUDED.low_price,
+        close_price = EXCLUDED.close_price,
+        volume = EXCLUDED.volume,
+        bar_count = EXCLUDED.bar_count,
+        updated_at = now()
+""")
+
+LOAD_SQL = """
+    SELECT period_start, timestamp_utc, open_price, high_price, low_price, close_price, volume
+    FROM ohlcv_rollup_data
+    WHERE asset_id = :asset_id AND period = :period
+      {range_filter}
+    ORDER BY period_start DESC
+    LIMIT :limit
+"""
+
+
+def _as_datetime(value) -> Optional[datetime]:
+    if isinstance(value, datetime):
+        return value.replace(tzinfo=None) if value.tzinfo else value
+    if isinstance(value, date):
+        return datetime(value.year, value.month, value.day)
+    if isinstance(value, str):
+        try:
+            return _as_datetime(datetime.fromisoformat(value.replace('Z', '+00:00')))
+        except ValueError:
+            return None
+    return None
+
+
+def affected_ranges(items: Iterable[Dict[str, Any]]) -> Dict[int, Tuple[datetime, datetime]]:
+    """저장된 일봉 행 -> {asset_id: (첫 시각, 마지막 시각)}"""
+    ranges: Dict[int, Tuple[datetime, datetime]] = {}
+    for item in items:
+        if item.get('data_interval') not in DAILY_INTERVALS and item.get('data_interval') is not None:
+            continue
+        asset_id = item.get('asset_id')
+        ts = _as_datetime(item.get('timestamp_utc'))
+        if not asset_id or ts is None:
+            continue
+        current = ranges.get(asset_id)
+        ranges[asset_id] = (min(current[0], ts), max(current[1], ts)) if current else (ts, ts)
+    return ranges
+
+
+def refresh_params(ranges: Dict[int, Tuple[datetime, datetime]], periods: Iterable[str] = ROLLUP_PERIODS) -> List[Dict[str, Any]]:
+    """기간 단위별 REFRESH_SQL 파라미터 (동기 세션/비동기 커넥션 공용)"""
+    if not ranges:
+        return []
+    asset_ids = list(ranges)
+    params = {
+        "asset_ids": asset_ids,
+        "first_ts": [ranges[a][0] for a in asset_ids],
+        "last_ts": [ranges[a][1] for a in asset_ids],
+    }
+    return [
+        {**params, "period": period, "unit": ROLLUP_PERIODS[period][0], "step": ROLLUP_PERIODS[period][1]}
+        for period in periods
+    ]
+
+
+def refresh_rollups(db, ranges: Dict[int, Tuple[datetime, datetime]], periods: Iterable[str] = ROLLUP_PERIODS) -> int:
+    """
+    영향 구간이 속한 주/월 롤업 재계산 (커밋은 호출자 담당).
+    반환값: UPSERT된 기간 행 수
+    """
+    total = 0
+    for params in refresh_params(ranges, periods):
+        result = db.execute(REFRESH_SQL, params)
+        total += result.rowcount or 0
+    return total
+
+
+def load_rollups(
+    db,
+    asset_id: int,
+    period: str,
+    start_date: Optional[date],
+    end_date: Optional[date],
+    limit: int,
+) -> List[Any]:
+    """최신 limit개 기간 (period_start 오름차순으로 반환)"""
+    range_filter = ""
+    params: Dict[str, Any] = {"asset_id": asset_id, "period": period, "limit": limit}
+    if start_date:
+        range_filter += " AND timestamp_utc >= :start_date"
+        params["start_date"] = start_date
+    if end_date:
+        range_filter += " AND period_start <= :end_date"
+        params["end_date"] = end_date
+    rows = db.execute(text(LOAD_SQL.format(range_filter=range_filter)), params).fetchall()
+    return list(reversed(rows))
+
+
+def rollup_chart_data(
+    db,
+    asset_id: int,
+    rule: str,
+    start_date: Optional[date],
+    end_date: Optional[date],
+    limit: Optional[int],
+    recent_daily: Callable[[int], List[Dict[str, Any]]],
+) -> Optional[List[Dict[str, Any]]]:
+    """
+    주봉/월봉: ohlcv_rollup_data에서 최신 limit개 기간만 읽음 (롤업이 없으면 None).
+    가장 최근 기간은 인트라데이/지연 시세로 합성한 오늘자 일봉까지 포함하도록
+    recent_daily(n)(get_daily_data_combined의 최근 n개 일봉)로 다시 집계해 덮어씀.
+    """
+    # 첫 봉의 change_percent 계산용으로 한 기간 더 조회
+    rollups = load_rollups(db, asset_id, rule, start_date, end_date, (limit or 20000) + 1)
+    if not rollups:
+        return None
+
+    tail_start = rollups[-1].period_start
+    if start_date and _as_datetime(start_date) > tail_start:
+        tail_start = _as_datetime(start_date)
+    history = rollups[:-1]
+
+    daily = [d for d in recent_daily(ROLLUP_TAIL_DAILY_LIMIT) if d['timestamp_utc'] >= tail_start]
+    tail = aggregate_daily(OHLCVColumns.from_dicts(daily), rule).to_columns(label="last")
+
+    hist_cols = OHLCVColumns.from_arrays(*zip(*(row[1:] for row in history)), sort=False) if history else OHLCVColumns.empty()
+    cols = OHLCVColumns(*(np.concatenate((getattr(hist_cols, f), getattr(tail, f)))
+                          for f in ("ts", "open", "high", "low", "close", "volume")))
+    # 추가로 읽은 한 기간은 호출자의 limit 슬라이스에서 제외됨
+    return to_chart_dicts(cols, rule, pct_change(cols.close))
+
+
+def backfill_rollups(db, asset_ids: Optional[List[int]] = None, batch_size: int = 200) -> int:
+    """
+    ohlcv_day_data 전체 기간으로 롤업을 채움 (자산 batch_size개씩 커밋).
+    반환값: UPSERT된 기간 행 수
+    """
+    where = "WHERE asset_id = ANY(:asset_ids)" if asset_ids else ""
+    bounds = db.execute(text(f"""
+        SELECT asset_id, min(timestamp_utc), max(timestamp_utc)
+        FROM ohlcv_day_data
+        {where}
+        GROUP BY asset_id
+        ORDER BY asset_id
+    """), {"asset_ids": asset_ids} if asset_ids else {}).fetchall()
+
+    total = 0
+    for i in range(0, len(bounds), batch_size):
+        chunk = bounds[i:i + batch_size]
+        total += refresh_rollups(db, {row[0]: (row[1], row[2]) for row in chunk})
+        db.commit()
+        logger.info(f"📦 OHLCV rollup backfill: {min(i + batch_size, len(bounds))}/{len(bounds)} assets, {total} periods")
+    return total
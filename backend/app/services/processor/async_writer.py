@@ -0,0 +1,196 @@
+"""
+비동기 대량 쓰기 경로 (asyncpg binary COPY + 단일 MERGE)
+- 행을 임시 테이블(ON COMMIT DELETE ROWS)에 binary COPY로 적재한 뒤
+  INSERT ... SELECT ... ON CONFLICT 한 번으로 대상 테이블에 병합
+- get_async_engine()의 커넥션 풀을 사용하므로 이벤트 루프를 블로킹하지 않음
+"""
+import logging
+from typing import List, Dict, Any, Sequence, Tuple
+
+from sqlalchemy import text
+
+from ...core.database import get_async_engine
+from ..ohlcv_rollup import REFRESH_SQL, affected_ranges, refresh_params
+
+logger = logging.getLogger(__name__)
+
+# 스테이징 테이블 정의: (테이블명, [(컬럼, 타입)])
+# 숫자 컬럼은 float8로 적재하고 병합 시 대상 테이블의 NUMERIC으로 캐스팅
+REALTIME_QUOTE_STAGE = ("_stage_realtime_quotes", [
+    ("asset_id", "integer"),
+    ("timestamp_utc", "timestamp"),
+    ("price", "float8"),
+    ("volume", "float8"),
+    ("change_amount", "float8"),
+    ("change_percent", "float8"),
+    ("data_source", "varchar(32)"),
+])
+
+QUOTE_DELAY_STAGE = ("_stage_realtime_quotes_time_delay", [
+    ("asset_id", "integer"),
+    ("timestamp_utc", "timestamp"),
+    ("price", "float8"),
+    ("volume", "float8"),
+    ("change_amount", "float8"),
+    ("change_percent", "float8"),
+    ("data_source", "varchar(32)"),
+    ("data_interval", "varchar(10)"),
+])
+
+TIME_BAR_STAGE = ("_stage_realtime_quotes_time_bar", [
+    ("asset_id", "integer"),
+    ("timestamp_utc", "timestamp"),
+    ("data_interval", "varchar(10)"),
+    ("data_source", "varchar(20)"),
+    ("open_price", "float8"),
+    ("high_price", "float8"),
+    ("low_price", "float8"),
+    ("close_price", "float8"),
+    ("volume", "float8"),
+    ("change_amount", "float8"),
+    ("change_percent", "float8"),
+])
+
+OHLCV_STAGE = ("_stage_ohlcv_bars", [
+    ("asset_id", "integer"),
+    ("timestamp_utc", "timestamp"),
+    ("data_interval", "varchar(10)"),
+    ("open_price", "float8"),
+    ("high_price", "float8"),
+    ("low_price", "float8"),
+    ("close_price", "float8"),
+    ("volume", "float8"),
+    ("change_percent", "float8"),
+])
+
+REALTIME_QUOTE_MERGE = """
+    INSERT INTO realtime_quotes
+        (asset_id, timestamp_utc, price, volume, change_amount, change_percent, data_source, updated_at)
+    SELECT asset_id, timestamp_utc, price, volume, change_amount, change_percent, data_source, now()
+    FROM _stage_realtime_quotes
+    ON CONFLICT (asset_id) DO UPDATE SET
+        timestamp_utc = EXCLUDED.timestamp_utc,
+        price = EXCLUDED.price,
+        volume = EXCLUDED.volume,
+        change_amount = EXCLUDED.change_amount,
+        change_percent = EXCLUDED.change_percent,
+        data_source = EXCLUDED.data_source,
+        updated_at = now()
+"""
+
+QUOTE_DELAY_MERGE = """
+    INSERT INTO realtime_quotes_time_delay
+        (asset_id, timestamp_utc, price, volume, change_amount, change_percent, data_source, data_interval, updated_at)
+    SELECT asset_id, timestamp_utc, price, volume, change_amount, change_percent, data_source, data_interval, now()
+    FROM _stage_realtime_quotes_time_delay
+    ON CONFLICT (asset_id, timestamp_utc, data_source, data_interval) DO UPDATE SET
+        price = EXCLUDED.price,
+        volume = EXCLUDED.volume,
+        change_amount = EXCLUDED.change_amount,
+        change_percent = EXCLUDED.change_percent,
+        updated_at = now()
+"""
+
+# 바구니 봉은 항상 전체 봉이므로 volume은 덮어씀 (늦은 틱 조각은 RedisBucketManager가 저장된 봉과 합쳐서 보냄)
+TIME_BAR_MERGE = """
+    INSERT INTO realtime_quotes_time_bar AS t
+        (asset_id, timestamp_utc, data_interval, data_source, open_price, high_price, low_price,
+         close_price, volume, change_amount, change_percent, updated_at)
+    SELECT asset_id, timestamp_utc, data_interval, data_source, open_price, high_price, low_price,
+           close_price, volume, change_amount, change_percent, now()
+    FROM _stage_realtime_quotes_time_bar
+    ON CONFLICT (asset_id, timestamp_utc, data_interval) DO UPDATE SET
+        high_price = GREATEST(t.high_price, EXCLUDED.high_price),
+        low_price = LEAST(t.low_price, EXCLUDED.low_price),
+        close_price = EXCLUDED.close_price,
+        volume = EXCLUDED.volume,
+        change_amount = EXCLUDED.change_amount,
+        change_percent = EXCLUDED.change_percent,
+        updated_at = now()
+"""
+
+# ohlcv_day_data / ohlcv_intraday_data 공용 (DataRepository.save_ohlcv_data의 UPSERT와 같은 갱신 컬럼)
+OHLCV_MERGE = """
+    INSERT INTO {table}
+        (asset_id, timestamp_utc, data_interval, open_price, high_price, low_price, close_price, volume, change_percent)
+    SELECT asset_id, timestamp_utc, data_interval, open_price, high_price, low_price, close_price, volume, change_percent
+    FROM _stage_ohlcv_bars
+    ON CONFLICT (asset_id, timestamp_utc, data_interval) DO UPDATE SET
+        open_price = EXCLUDED.open_price,
+        high_price = EXCLUDED.high_price,
+        low_price = EXCLUDED.low_price,
+        close_price = EXCLUDED.close_price,
+        volume = EXCLUDED.volume,
+        change_percent = EXCLUDED.change_percent
+"""
+
+
+class AsyncBulkWriter:
+    """asyncpg COPY 기반 비동기 UPSERT 실행기"""
+
+    def __init__(self, engine=None):
+        self._engine = engine
+
+    @property
+    def engine(self):
+        if self._engine is None:
+            self._engine = get_async_engine()
+        return self._engine
+
+    async def _copy_merge(self, conn, stage: Tuple[str, List[Tuple[str, str]]], rows: Sequence[Dict[str, Any]], merge_sql: str) -> int:
+        """임시 테이블에 COPY 후 MERGE 실행. 트랜잭션 내부에서 호출되어야 함"""
+        if not rows:
+            return 0
+        table, columns = stage
+        column_names = [name for name, _ in columns]
+        column_defs = ", ".join(f"{name} {col_type}" for name, col_type in columns)
+        await conn.execute(text(
+            f"CREATE TEMP TABLE IF NOT EXISTS {table} ({column_defs}) ON COMMIT DELETE ROWS"
+        ))
+
+        raw = await conn.get_raw_connection()
+        records = [tuple(row.get(name) for name in column_names) for row in rows]
+        await raw.driver_connection.copy_records_to_table(table, records=records, columns=column_names)
+
+        result = await conn.execute(text(merge_sql))
+        return result.rowcount
+
+    async def _write(self, jobs: List[Tuple[Tuple[str, List[Tuple[str, str]]], Sequence[Dict[str, Any]], str]]) -> int:
+        """여러 (스테이지, 행, 병합 SQL)을 한 트랜잭션으로 실행"""
+        written = 0
+        async with self.engine.begin() as conn:
+            for stage, rows, merge_sql in jobs:
+                written += await self._copy_merge(conn, stage, rows, merge_sql)
+        return written
+
+    async def upsert_realtime_quotes(self, realtime_rows: Sequence[Dict[str, Any]], delay_rows: Sequence[Dict[str, Any]]) -> int:
+        """realtime_quotes + realtime_quotes_time_delay 병합"""
+        return await self._write([
+            (REALTIME_QUOTE_STAGE, realtime_rows, REALTIME_QUOTE_MERGE),
+            (QUOTE_DELAY_STAGE, delay_rows, QUOTE_DELAY_MERGE),
+        ])
+
+    async def upsert_realtime_bars(self, bar_rows: Sequence[Dict[str, Any]], delay_rows: Sequence[Dict[str, Any]]) -> int:
+        """realtime_quotes_time_bar (+ 1분봉 지연 테이블) 병합"""
+        return await self._write([
+            (TIME_BAR_STAGE, bar_rows, TIME_BAR_MERGE),
+            (QUOTE_DELAY_STAGE, delay_rows, QUOTE_DELAY_MERGE),
+        ])
+
+    async def upsert_ohlcv_bars(self, table: str, rows: Sequence[Dict[str, Any]]) -> int:
+        """
+        ohlcv_day_data / ohlcv_intraday_data 병합 (백필 대량 적재용).
+        일봉이면 같은 트랜잭션에서 주/월 롤업도 갱신 (실패 시 세이브포인트만 롤백)
+        """
+        if not rows:
+            return 0
+        async with self.engine.begin() as conn:
+            written = await self._copy_merge(conn, OHLCV_STAGE, rows, OHLCV_MERGE.format(table=table))
+            if table == "ohlcv_day_data":
+                try:
+                    async with conn.begin_nested():
+                        for params in refresh_params(affected_ranges(rows)):
+                            await conn.execute(REFRESH_SQL, params)
+                except Exception as e:
+                    logger.warning(f"⚠️ OHLCV 롤업 갱신 실패 (백필 스크립트로 재계산 필요): {e}")
+        return written
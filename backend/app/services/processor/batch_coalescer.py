@@ -0,0 +1,207 @@
+"""
+배치 태스크 병합 쓰기
+- DataProcessor가 큐에서 최대 BATCH_COALESCE_MAX_TASKS개 또는 BATCH_COALESCE_WINDOW_MS 동안 모은 태스크를 process()로 넘김
+- 같은 테이블에 쓰는 태스크(주식 프로필, 코인 정보, ETF 정보, 온체인 메트릭)는 DataRepository.save_coalesced로
+  한 번의 멀티 로우 UPSERT (태스크마다 세션/커밋을 따로 열던 기존 경로 대비 왕복 수 감소)
+- 나머지 타입과 한 개뿐인 그룹은 기존처럼 태스크 단위로 처리
+- 결과는 태스크별 성공 여부 (실패한 태스크만 호출자가 DLQ로 이동)
+- on_done: 그룹(병합 쓰기 1회 또는 단일 태스크 1개)이 끝날 때마다 (인덱스, 성공 여부)로 호출
+  -> 호출자가 배치 전체(최대 BATCH_COALESCE_MAX_TASKS개)를 기다리지 않고 바로 ACK (CLAIM_IDLE_MS 안에 ACK,
+  배치 도중 예외가 나도 이미 저장한 태스크는 ACK된 상태)
+- merge_rows: 충돌 키가 같은 행은 태스크 순서대로 합침 (뒤 값 우선, 뒤 행에 없는 컬럼은 앞 값 유지
+  = 개별 UPSERT를 순서대로 실행한 결과와 동일)
+- group_by_columns: 멀티 로우 VALUES는 모든 행의 컬럼 구성이 같아야 하므로 컬럼 구성별로 나눔
+"""
+import logging
+import os
+import time
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+COALESCE_ENABLED = os.getenv("BATCH_COALESCE_ENABLED", "true").lower() == "true"
+COALESCE_MAX_TASKS = int(os.getenv("BATCH_COALESCE_MAX_TASKS", "200"))
+COALESCE_WINDOW_MS = int(os.getenv("BATCH_COALESCE_WINDOW_MS", "50"))
+
+# 태스크 타입 -> 병합 대상 (DataRepository.save_coalesced 의 kind)
+COALESCE_KINDS = {
+    "stock_profile": "stock_profile",
+    "crypto_info": "crypto_data",
+    "crypto_data": "crypto_data",
+    "etf_info": "etf_info",
+    "onchain_metric": "onchain_metric",
+}
+# kind -> ON CONFLICT 키
+CONFLICT_KEYS = {
+    "stock_profile": ("asset_id",),
+    "crypto_data": ("asset_id",),
+    "etf_info": ("asset_id",),
+    "onchain_metric": ("asset_id", "timestamp_utc"),
+}
+
+BATCH_SIZE_BUCKETS = (1, 2, 5, 10, 20, 50, 100, 200, 500)
+LATENCY_MS_BUCKETS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+
+def task_items(task: Optional[Dict[str, Any]]) -> Optional[List[Any]]:
+    """배치 태스크 -> 저장할 항목 목록 (타입/페이로드가 없으면 None)"""
+    if not task:
+        return None
+    task_type = task.get("type")
+    payload = task.get("payload")
+    if not task_type or not payload:
+        return None
+
+    items = payload.get("items") if isinstance(payload, dict) else None
+    if items is None:
+        items = payload if isinstance(payload, list) else [payload]
+
+    if task_type == "onchain_metric":
+        # Payload wrapper handling: extract 'data' list if present
+        onchain_items = []
+        for it in items:
+            if isinstance(it, dict) and "data" in it and isinstance(it["data"], list):
+                onchain_items.extend(it["data"])
+            else:
+                onchain_items.append(it)
+        return onchain_items
+    return items
+
+
+def merge_rows(rows: Iterable[Dict[str, Any]], key_columns: Sequence[str]) -> List[Dict[str, Any]]:
+    """충돌 키가 같은 행을 순서대로 합침 (처음 나온 순서 유지)"""
+    merged: Dict[Tuple, Dict[str, Any]] = {}
+    for row in rows:
+        key = tuple(row[c] for c in key_columns)
+        prev = merged.get(key)
+        merged[key] = {**prev, **row} if prev else dict(row)
+    return list(merged.values())
+
+
+def group_by_columns(rows: Iterable[Dict[str, Any]]) -> List[List[Dict[str, Any]]]:
+    """컬럼 구성이 같은 행끼리 묶음"""
+    groups: Dict[frozenset, List[Dict[str, Any]]] = {}
+    for row in rows:
+        groups.setdefault(frozenset(row), []).append(row)
+    return list(groups.values())
+
+
+class Histogram:
+    """고정 구간 히스토그램 (구간별 개수, 마지막 구간은 +Inf)"""
+
+    def __init__(self, bounds: Sequence[float]):
+        self.bounds = tuple(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+
+    def observe(self, value: float) -> None:
+        index = len(self.bounds)
+        for i, bound in enumerate(self.bounds):
+            if value <= bound:
+                index = i
+                break
+        self.counts[index] += 1
+        self.count += 1
+        self.total += value
+
+    def quantile(self, q: float) -> Optional[float]:
+        """q 분위가 속한 구간의 상한 (+Inf 구간이면 inf)"""
+        if not self.count:
+            return None
+        target = q * self.count
+        seen = 0
+        for i, n in enumerate(self.counts):
+            seen += n
+            if seen >= target and n:
+                return self.bounds[i] if i < len(self.bounds) else float("inf")
+        return float("inf")
+
+    def snapshot(self) -> Dict[str, Any]:
+        buckets = {str(b): n for b, n in zip(self.bounds, self.counts)}
+        buckets["+Inf"] = self.counts[-1]
+        return {
+            "count": self.count,
+            "sum": self.total,
+            "p50": self.quantile(0.5),
+            "p95": self.quantile(0.95),
+            "buckets": buckets,
+        }
+
+    def summary(self) -> str:
+        if not self.count:
+            return "n=0"
+        return f"n={self.count}, avg={self.total / self.count:.1f}, p50≤{self.quantile(0.5):g}, p95≤{self.quantile(0.95):g}"
+
+
+class BatchCoalescer:
+    """같은 타입의 배치 태스크를 한 번의 저장으로 합침 (repository: DataRepository)"""
+
+    def __init__(self, repository, enabled: bool = COALESCE_ENABLED):
+        self.repository = repository
+        self.enabled = enabled
+        self.batch_size = Histogram(BATCH_SIZE_BUCKETS)
+        self.latency_ms = Histogram(LATENCY_MS_BUCKETS)
+        self.stats = {"tasks": 0, "writes": 0, "coalesced_tasks": 0, "failed": 0}
+
+    def _observe(self, tasks: int, start: float) -> float:
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        self.batch_size.observe(tasks)
+        self.latency_ms.observe(elapsed_ms)
+        self.stats["tasks"] += tasks
+        self.stats["writes"] += 1
+        return elapsed_ms
+
+    async def process(
+        self,
+        tasks: List[Optional[Dict[str, Any]]],
+        run_single: Callable[[Dict[str, Any]], Awaitable[bool]],
+        on_done: Optional[Callable[[List[int], List[bool]], Awaitable[None]]] = None,
+    ) -> List[bool]:
+        """태스크 목록 처리 -> 태스크별 성공 여부 (입력 순서)"""
+        results = [False] * len(tasks)
+        groups: Dict[str, List[int]] = {}
+        singles: List[int] = []
+        for i, task in enumerate(tasks):
+            kind = COALESCE_KINDS.get(task.get("type")) if (self.enabled and task) else None
+            if kind:
+                groups.setdefault(kind, []).append(i)
+            else:
+                singles.append(i)
+
+        for kind, indexes in groups.items():
+            batches = {i: task_items(tasks[i]) for i in indexes}
+            valid = [i for i in indexes if batches[i] is not None]
+            if len(valid) < 2:
+                singles.extend(indexes)
+                continue
+            # 페이로드가 없는 태스크는 단일 경로에서 실패로 보고
+            singles.extend(i for i in indexes if batches[i] is None)
+
+            start = time.perf_counter()
+            saved = await self.repository.save_coalesced(kind, [batches[i] for i in valid])
+            elapsed_ms = self._observe(len(valid), start)
+            self.stats["coalesced_tasks"] += len(valid)
+            for i, ok in zip(valid, saved):
+                results[i] = ok
+            logger.info(f"🧺 배치 병합 저장: {kind} 태스크 {len(valid)}개 -> 1회 쓰기 ({elapsed_ms:.0f}ms, 실패 {len(valid) - sum(saved)}개)")
+            if on_done:
+                await on_done(valid, [results[i] for i in valid])
+
+        for i in sorted(singles):
+            task = tasks[i]
+            if task and task_items(task) is not None:
+                start = time.perf_counter()
+                results[i] = await run_single(task)
+                self._observe(1, start)
+            if on_done:
+                await on_done([i], [results[i]])
+
+        self.stats["failed"] += results.count(False)
+        return results
+
+    def summary(self) -> str:
+        return (
+            f"태스크 {self.stats['tasks']:,}개 / 쓰기 {self.stats['writes']:,}회 (병합 {self.stats['coalesced_tasks']:,}개), "
+            f"쓰기당 태스크 [{self.batch_size.summary()}], 지연 ms [{self.latency_ms.summary()}]"
+        )
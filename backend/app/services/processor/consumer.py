@@ -5,19 +5,22 @@ from typing import Dict, List, Any, Optional
 import time
 import pytz
 from ...utils.trading_calendar import is_regular_market_hours
+from ..symbol_resolver import SymbolResolver, symbol_resolver as default_symbol_resolver
 
 logger = logging.getLogger(__name__)
 
 class StreamConsumer:
     """Redis Stream 소비 및 처리를 담당하는 클래스"""
 
-    def __init__(self, redis_url: str, adapter_factory, repository, bucket_manager=None, batch_size: int = 100):
+    def __init__(self, redis_url: str, adapter_factory, repository, bucket_manager=None, batch_size: int = 100,
+                 symbol_resolver: Optional[SymbolResolver] = None):
         self.redis_url = redis_url
         self.redis_client = None
         self.adapter_factory = adapter_factory
         self.repository = repository
         self.bucket_manager = bucket_manager
         self.batch_size = batch_size
+        self.symbol_resolver = symbol_resolver or default_symbol_resolver
         self.realtime_streams = {
             # Highest priority: Stocks (Finnhub)
             "finnhub:realtime": "finnhub_group",
@@ -31,6 +34,9 @@ class StreamConsumer:
             "twelvedata:realtime": "twelvedata_group",
             "kis:realtime": "kis_group",
         }
+        self._groups_ready = False
+        self.consumer_name = "processor_worker"
+        self.idle_sleep = 0.1
         self.last_heartbeat = 0
         self.last_lag_check = 0
         self.consecutive_errors = 0
@@ -69,6 +75,7 @@ class StreamConsumer:
             except Exception:
                 pass
             self.redis_client = None
+        self._groups_ready = False
 
     async def _reconnect(self):
         """재연결 시도"""
@@ -77,6 +84,104 @@ class StreamConsumer:
         await asyncio.sleep(1) # 잠시 대기
         return await self.connect()
 
+    def _group_streams(self) -> Dict[str, List[str]]:
+        """Consumer Group별로 스트림을 묶음 (같은 그룹은 XREADGROUP 한 번으로 읽음)"""
+        groups: Dict[str, List[str]] = {}
+        for stream_name, group_name in self.realtime_streams.items():
+            groups.setdefault(group_name, []).append(stream_name)
+        return groups
+
+    async def _ensure_groups(self):
+        """Consumer Group 생성 (연결당 1회, 파이프라인으로 일괄 실행)"""
+        if self._groups_ready:
+            return
+        pipe = self.redis_client.pipeline(transaction=False)
+        for stream_name, group_name in self.realtime_streams.items():
+            # mkstream=True ensures stream exists
+            pipe.xgroup_create(name=stream_name, groupname=group_name, id="0", mkstream=True)
+        results = await pipe.execute(raise_on_error=False)
+        for stream_name, result in zip(self.realtime_streams, results):
+            if isinstance(result, Exception) and "BUSYGROUP" not in str(result):
+                logger.warning(f"xgroup_create error {stream_name}: {result}")
+        self._groups_ready = True
+
+    async def _check_lag(self):
+        """🚀 Lag 모니터링 및 자동 리셋 (실시간성 유지) - 전체 스트림을 한 번의 파이프라인으로 조회"""
+        pipe = self.redis_client.pipeline(transaction=False)
+        for stream_name in self.realtime_streams:
+            pipe.xinfo_groups(stream_name)
+        results = await pipe.execute(raise_on_error=False)
+
+        # 사용자 요청 공식: (수집 수 * 시간 * 0.5)
+        # 예: 200개 자산 * 15분 * (분당 10개 틱 예상) * 0.5 = 15,000
+        asset_count = self.symbol_resolver.asset_count or 100
+        # 한도는 넉넉하게 설정 (최소 30,000개 이상 적체 시 실시간성 저하로 판단)
+        dynamic_threshold = max(30000, int(asset_count * 15 * 10 * 0.5))
+
+        for (stream_name, group_name), groups_info in zip(self.realtime_streams.items(), results):
+            if isinstance(groups_info, Exception):
+                logger.debug(f"XINFO check failed for {stream_name}: {groups_info}")
+                continue
+            for g in groups_info:
+                if g.get('name') == group_name.encode('utf-8') or g.get('name') == group_name:
+                    lag = g.get('lag')
+                    if lag is not None and lag > dynamic_threshold:
+                        logger.warning(f"🚨 [StreamConsumer] {stream_name} Lag {lag} (임계치 {dynamic_threshold}) 초과! 최신 지점으로 리셋합니다.")
+                        await self.redis_client.xgroup_setid(stream_name, group_name, "$")
+
+    async def _read_all_streams(self) -> List[Any]:
+        """
+        모든 스트림을 한 번의 왕복으로 읽음.
+        그룹별로 Pending("0")과 신규(">") XREADGROUP을 하나의 파이프라인에 담아 실행.
+        Pending 읽기가 먼저 실행되므로 같은 메시지가 두 번 전달되지 않음.
+        """
+        pipe = self.redis_client.pipeline(transaction=False)
+        for group_name, stream_names in self._group_streams().items():
+            pipe.xreadgroup(
+                groupname=group_name,
+                consumername=self.consumer_name,
+                streams={name: "0" for name in stream_names},
+                count=self.batch_size,
+            )
+            pipe.xreadgroup(
+                groupname=group_name,
+                consumername=self.consumer_name,
+                streams={name: ">" for name in stream_names},
+                count=self.batch_size,
+            )
+        results = await pipe.execute(raise_on_error=False)
+
+        stream_data = []
+        for result in results:
+            if isinstance(result, Exception):
+                # Connection errors should propagate to trigger reconnect
+                if "Connection" in str(result) or "reset by peer" in str(result):
+                    raise result
+                if "NOGROUP" in str(result):
+                    # 스트림이 삭제되었거나 그룹이 사라진 경우 다음 루프에서 재생성
+                    self._groups_ready = False
+                logger.debug(f"스트림 읽기 실패: {result}")
+                continue
+            for stream_name, messages in result or []:
+                # 처리 완료된 Pending 항목은 비어 있으므로 건너뜀
+                if messages:
+                    stream_data.append((stream_name, messages))
+        return stream_data
+
+    async def _ack_messages(self, ack_items):
+        """ACK를 (스트림, 그룹) 단위로 묶어 파이프라인 한 번으로 전송"""
+        grouped: Dict[tuple, List[Any]] = {}
+        for stream_name, group_name, message_id in ack_items:
+            grouped.setdefault((stream_name, group_name), []).append(message_id)
+
+        pipe = self.redis_client.pipeline(transaction=False)
+        for (stream_name, group_name), message_ids in grouped.items():
+            pipe.xack(stream_name, group_name, *message_ids)
+        results = await pipe.execute(raise_on_error=False)
+        for ((stream_name, _), message_ids), result in zip(grouped.items(), results):
+            if isinstance(result, Exception):
+                logger.warning(f"ACK 실패 {stream_name} ({len(message_ids)}건): {result}")
+
     async def process_streams(self) -> int:
         """실시간 스트림 데이터 처리"""
         # 연결 확인
@@ -96,86 +201,27 @@ class StreamConsumer:
                 self.last_heartbeat = now
 
             # Consumer Group 생성
-            for stream_name, group_name in self.realtime_streams.items():
-                try:
-                    # mkstream=True ensures stream exists
-                    await self.redis_client.xgroup_create(
-                        name=stream_name, groupname=group_name, id="0", mkstream=True
-                    )
-                except Exception as e:
-                    if "BUSYGROUP" not in str(e):
-                        logger.warning(f"xgroup_create error {stream_name}: {e}")
+            await self._ensure_groups()
 
-            # Pending 메시지 먼저 처리
-            for stream_name, group_name in self.realtime_streams.items():
+            # 15분(900초)마다 Lag 체크
+            if now - self.last_lag_check > 900:
+                self.last_lag_check = now
                 try:
-                    pending_info = await self.redis_client.xpending(stream_name, group_name)
-                    if pending_info and pending_info.get('pending', 0) > 0:
-                        pending_data = await self.redis_client.xreadgroup(
-                            groupname=group_name,
-                            consumername="processor_worker",
-                            streams={stream_name: "0"},
-                            count=min(self.batch_size, pending_info['pending']),
-                            block=0 
-                        )
-                        if pending_data:
-                            await self._process_messages(pending_data, records_to_save, ack_items)
-                except Exception as e:
-                    # Connection errors should propagate to trigger reconnect
-                    if "Connection" in str(e) or "reset by peer" in str(e):
-                        raise e
-                    logger.debug(f"Pending 처리 실패 {stream_name}: {e}")
+                    await self._check_lag()
+                except Exception as xinfo_error:
+                    if "Connection" in str(xinfo_error) or "reset by peer" in str(xinfo_error):
+                        raise xinfo_error
+                    logger.debug(f"XINFO check failed: {xinfo_error}")
+
+            # Pending + 신규 메시지 일괄 읽기
+            stream_data = await self._read_all_streams()
+            if stream_data:
+                await self._process_messages(stream_data, records_to_save, ack_items)
 
-            # 각 스트림별로 개별 처리 및 Lag 모니터링
-            for stream_name, group_name in self.realtime_streams.items():
-                try:
-                    # 🚀 Lag 모니터링 및 자동 리셋 (실시간성 유지)
-                    # 15분(900초)마다 체크하도록 주기를 조정
-                    if now - self.last_lag_check > 900:
-                        try:
-                            self.last_lag_check = now
-                            groups_info = await self.redis_client.xinfo_groups(stream_name)
-                            for g in groups_info:
-                                if g.get('name') == group_name.encode('utf-8') or g.get('name') == group_name:
-                                    lag = g.get('lag')
-                                    # 사용자 요청 공식: (수집 수 * 시간 * 0.5)
-                                    # 예: 200개 자산 * 15분 * (분당 10개 틱 예상) * 0.5 = 15,000
-                                    asset_count = len(getattr(self, 'ticker_to_asset_id', {})) or 100
-                                    # 한도는 넉넉하게 설정 (최소 30,000개 이상 적체 시 실시간성 저하로 판단)
-                                    dynamic_threshold = max(30000, int(asset_count * 15 * 10 * 0.5))
-                                    
-                                    if lag is not None and lag > dynamic_threshold:
-                                        logger.warning(f"🚨 [StreamConsumer] {stream_name} Lag {lag} (임계치 {dynamic_threshold}) 초과! 최신 지점으로 리셋합니다.")
-                                        await self.redis_client.xgroup_setid(stream_name, group_name, "$")
-                        except Exception as xinfo_error:
-                            logger.debug(f"XINFO check failed for {stream_name}: {xinfo_error}")
-
-                    block_time = 100 
-                    
-                    new_data = await self.redis_client.xreadgroup(
-                        groupname=group_name,
-                        consumername="processor_worker",
-                        streams={stream_name: ">"},
-                        count=self.batch_size,
-                        block=block_time
-                    )
-                    
-                    if new_data:
-                        total_messages = sum(len(msgs) for _, msgs in new_data)
-                        if total_messages > 0:
-                            # logger.info(f"📨 스트림 {stream_name}에서 {total_messages}개 메시지 읽음")
-                            pass
-                        await self._process_messages(new_data, records_to_save, ack_items)
-                        
-                except Exception as stream_error:
-                    if "Connection" in str(stream_error) or "reset by peer" in str(stream_error):
-                        raise stream_error
-                    logger.debug(f"스트림 {stream_name} 읽기 실패: {stream_error}")
-            
             # 데이터가 없으면 추가 대기로 CPU 부하 완화
-            if not records_to_save:
-                await asyncio.sleep(0.1)
-            else:
+            if not stream_data:
+                await asyncio.sleep(self.idle_sleep)
+            elif records_to_save:
                 logger.debug(f"📥 처리할 레코드: {len(records_to_save)}개")
 
             # DB 저장 및 Redis Bucket 집계
@@ -186,27 +232,15 @@ class StreamConsumer:
                 # 1. DB 저장 (RT, Delay)
                 success = await self.repository.bulk_save_realtime_quotes(records_to_save)
                 
-                # 2. Redis Bucket 집계 (OHLCV Bars)
+                # 2. Redis Bucket 집계 (OHLCV Bars) - 배치 전체를 한 번의 Lua 호출로 반영
                 if self.bucket_manager:
-                    for r in records_to_save:
-                        try:
-                            # Ticks are aggregated into 1m and 5m bars
-                            await self.bucket_manager.aggregate_tick(
-                                asset_id=r['asset_id'],
-                                interval="1m",
-                                price=r['price'],
-                                volume=r.get('volume') or 0,
-                                timestamp_utc=r['timestamp_utc']
-                            )
-                            await self.bucket_manager.aggregate_tick(
-                                asset_id=r['asset_id'],
-                                interval="5m",
-                                price=r['price'],
-                                volume=r.get('volume') or 0,
-                                timestamp_utc=r['timestamp_utc']
-                            )
-                        except Exception as aggregation_error:
-                            logger.error(f"❌ Aggregation tick failed for {r.get('ticker')}: {aggregation_error}")
+                    try:
+                        await self.bucket_manager.aggregate_ticks_batch(
+                            (r['asset_id'], r['price'], r.get('volume') or 0, r['timestamp_utc'])
+                            for r in records_to_save
+                        )
+                    except Exception as aggregation_error:
+                        logger.error(f"❌ Aggregation batch failed ({len(records_to_save)} ticks): {aggregation_error}")
 
                 if success:
                     processed_count = len(records_to_save)
@@ -214,13 +248,9 @@ class StreamConsumer:
                 else:
                     logger.error("❌ DB 저장 실패")
 
-            # ACK 처리
+            # ACK 처리 (스트림별 일괄)
             if ack_items:
-                for stream_name, group_name, message_id in ack_items:
-                    try:
-                        await self.redis_client.xack(stream_name, group_name, message_id)
-                    except Exception as e:
-                        logger.warning(f"ACK 실패 {stream_name}:{message_id}: {e}")
+                await self._ack_messages(ack_items)
 
             # 성공적으로 실행되면 에러 카운트 리셋
             self.consecutive_errors = 0
@@ -258,36 +288,12 @@ class StreamConsumer:
                             ack_items.append((stream_name, group_name, message_id))
                             continue
                         
-                        # Ticker resolution logic
-                        asset_info = None
-                        if hasattr(self, 'ticker_to_asset_id'):
-                            # 1. Exact match
-                            if ticker in self.ticker_to_asset_id:
-                                asset_info = self.ticker_to_asset_id[ticker]
-                            # 2. Try removing 'USDT' (e.g. BTCUSDT -> BTC)
-                            elif ticker.endswith('USDT') and len(ticker) > 4:
-                                normalized = ticker[:-4]
-                                if normalized in self.ticker_to_asset_id:
-                                    asset_info = self.ticker_to_asset_id[normalized]
-                             # 3. Try removing '-USD' (e.g. SOL-USD -> SOL)
-                            elif ticker.endswith('-USD') and len(ticker) > 4:
-                                normalized = ticker[:-4]
-                                if normalized in self.ticker_to_asset_id:
-                                    asset_info = self.ticker_to_asset_id[normalized]
-                            # 4. Try removing '-USDT' (e.g. BTC-USDT -> BTC)
-                            elif ticker.endswith('-USDT') and len(ticker) > 5:
-                                normalized = ticker[:-5]
-                                if normalized in self.ticker_to_asset_id:
-                                    asset_info = self.ticker_to_asset_id[normalized]
-                            # 5. Handle slash (e.g. XAU/USD -> XAU)
-                            elif '/USD' in ticker:
-                                normalized = ticker.split('/')[0]
-                                if normalized in self.ticker_to_asset_id:
-                                    asset_info = self.ticker_to_asset_id[normalized]
-                        
+                        # Ticker resolution (공급자별 변형이 미리 계산된 인덱스에서 단일 조회)
+                        asset_info = self.symbol_resolver.resolve(provider, ticker)
+
                         if asset_info is not None:
-                            asset_id = asset_info['id']
-                            asset_type = asset_info['type']
+                            asset_id = asset_info.asset_id
+                            asset_type = asset_info.asset_type
                             
                             # 정규장 외 시간 필터링 (주식/ETF 전용)
                             # is_regular_market_hours()는 현재 시간을 기준으로 판단
@@ -319,5 +325,6 @@ class StreamConsumer:
                     # 파싱 실패 시에도 ACK (DLQ가 없으므로)
                     ack_items.append((stream_name, group_name, message_id))
 
-    def set_asset_map(self, asset_map: Dict[str, int]):
-        self.ticker_to_asset_id = asset_map
+    def set_asset_map(self, asset_map: Dict[str, Dict[str, Any]]):
+        """{ticker: {'id', 'type'}} 맵으로 심볼 인덱스 전체 적재"""
+        self.symbol_resolver.load_mapping(asset_map)
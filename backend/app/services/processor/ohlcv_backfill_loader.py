@@ -0,0 +1,183 @@
+"""
+OHLCV 백필 대량 적재 - Redis 바구니를 거치지 않고 Postgres로 직접 적재
+- DataProcessor가 metadata.is_backfill 인 ohlcv_* 배치 태스크를 이 경로로 보냄
+  (기존 경로는 봉마다 realtime:bars:* 해시를 만들고 10초 주기 flush가 키 단위로 삭제)
+- build_ohlcv_rows: 수집기 항목(open / open_price 혼용, ISO 문자열 시각)을 COPY용 행으로 정규화
+  * 시각은 UTC naive, 가격은 float, OHLC 중 하나라도 없거나 비정상이면 제외
+  * 같은 (asset_id, 시각, interval)은 마지막 항목 사용 (한 MERGE 안의 중복 키 충돌 방지)
+  * 테이블 선택은 DataRepository.save_ohlcv_data와 동일 (1d/1w/1M -> ohlcv_day_data, 나머지 -> ohlcv_intraday_data)
+- OHLCVBackfillLoader.load: 테이블별로 chunk_size 행씩 AsyncBulkWriter.upsert_ohlcv_bars(COPY + MERGE)
+  하고 진행률과 rows/s를 로그로 남김
+- OHLCVBackfillLoader.load_batch: 컬럼형 배치(app.services.ohlcv_batch.OHLCVBatch)는 이미 정규화/정렬/중복 제거된
+  배열이므로 항목 해석 없이 바로 COPY 행으로 적재 (asset_id/interval은 metadata)
+"""
+import logging
+import math
+import os
+import time
+from dataclasses import dataclass
+from datetime import date, datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..ohlcv_batch import OHLCVBatch
+
+logger = logging.getLogger(__name__)
+
+CHUNK_SIZE = int(os.getenv("OHLCV_BACKFILL_CHUNK_SIZE", "20000"))
+
+DAY_TABLE_INTERVALS = ('1d', '1w', '1M')
+# 수집기별 interval 표기 -> 저장 표기
+INTERVAL_ALIASES = {
+    'daily': '1d',
+    'weekly': '1w',
+    '1mo': '1M',
+    '1month': '1M',
+    'monthly': '1M',
+}
+PRICE_KEYS = (('open_price', 'open'), ('high_price', 'high'), ('low_price', 'low'), ('close_price', 'close'))
+# DECIMAL(24, 10) / DECIMAL(30, 10) 범위
+MAX_PRICE = 1e14
+MAX_VOLUME = 1e20
+
+
+def _first(item: Dict[str, Any], *keys):
+    for key in keys:
+        value = item.get(key)
+        if value is not None:
+            return value
+    return None
+
+
+def _number(value, limit: float) -> Optional[float]:
+    try:
+        f = float(value)
+    except (TypeError, ValueError):
+        return None
+    if not math.isfinite(f) or abs(f) >= limit:
+        return None
+    return f
+
+
+def _timestamp(value) -> Optional[datetime]:
+    if isinstance(value, str):
+        try:
+            value = datetime.fromisoformat(value.replace('Z', '+00:00'))
+        except ValueError:
+            return None
+    if isinstance(value, datetime):
+        if value.tzinfo is not None:
+            value = value.astimezone(timezone.utc).replace(tzinfo=None)
+        return value
+    if isinstance(value, date):
+        return datetime(value.year, value.month, value.day)
+    return None
+
+
+def normalize_interval(interval: Optional[str]) -> str:
+    if not interval:
+        return '1d'
+    return INTERVAL_ALIASES.get(interval, interval)
+
+
+def target_table(interval: str) -> str:
+    return 'ohlcv_day_data' if interval in DAY_TABLE_INTERVALS else 'ohlcv_intraday_data'
+
+
+def build_ohlcv_rows(items: List[Dict[str, Any]], metadata: Optional[Dict[str, Any]] = None) -> Tuple[Dict[str, List[Dict[str, Any]]], int]:
+    """
+    수집기 항목 -> {테이블: COPY 행 목록 ((asset_id, 시각) 정렬)}, 제외된 항목 수
+    """
+    metadata = metadata or {}
+    meta_asset_id = metadata.get('asset_id')
+    meta_interval = metadata.get('interval')
+
+    unique: Dict[Tuple[int, datetime, str], Dict[str, Any]] = {}
+    skipped = 0
+    for item in items:
+        asset_id = item.get('asset_id') or meta_asset_id
+        ts = _timestamp(_first(item, 'timestamp_utc', 'date'))
+        interval = normalize_interval(_first(item, 'interval', 'data_interval') or meta_interval)
+        prices = [_number(_first(item, *keys), MAX_PRICE) for keys in PRICE_KEYS]
+        if not asset_id or ts is None or any(p is None for p in prices):
+            skipped += 1
+            continue
+        row = {
+            'asset_id': int(asset_id),
+            'timestamp_utc': ts,
+            'data_interval': interval,
+            'open_price': prices[0],
+            'high_price': prices[1],
+            'low_price': prices[2],
+            'close_price': prices[3],
+            'volume': _number(item.get('volume'), MAX_VOLUME) or 0.0,
+            'change_percent': _number(item.get('change_percent'), 1e6),
+        }
+        unique[(row['asset_id'], ts, interval)] = row
+
+    tables: Dict[str, List[Dict[str, Any]]] = {}
+    for key in sorted(unique):
+        tables.setdefault(target_table(key[2]), []).append(unique[key])
+    return tables, skipped
+
+
+@dataclass
+class BackfillLoadResult:
+    rows: int
+    skipped: int
+    elapsed: float
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.elapsed if self.elapsed > 0 else 0.0
+
+
+class OHLCVBackfillLoader:
+    """백필 OHLCV를 청크 단위 COPY + MERGE로 적재 (writer: AsyncBulkWriter)"""
+
+    def __init__(self, writer, chunk_size: int = CHUNK_SIZE):
+        self.writer = writer
+        self.chunk_size = chunk_size
+        self.stats = {"tasks": 0, "rows": 0, "skipped": 0, "seconds": 0.0}
+
+    async def load(self, items: List[Dict[str, Any]], metadata: Optional[Dict[str, Any]] = None, label: str = "") -> BackfillLoadResult:
+        start = time.perf_counter()
+        tables, skipped = build_ohlcv_rows(items, metadata)
+        return await self._write_tables(tables, skipped, label, start)
+
+    async def load_batch(self, batch: OHLCVBatch, metadata: Optional[Dict[str, Any]] = None, label: str = "") -> BackfillLoadResult:
+        """컬럼형 배치 적재 (metadata에 asset_id가 없으면 ValueError)"""
+        start = time.perf_counter()
+        metadata = metadata or {}
+        if not metadata.get('asset_id'):
+            raise ValueError("OHLCV columns payload requires metadata.asset_id")
+        interval = normalize_interval(metadata.get('interval'))
+        tables = {target_table(interval): batch.to_rows(int(metadata['asset_id']), interval)} if len(batch) else {}
+        return await self._write_tables(tables, 0, label, start)
+
+    async def _write_tables(self, tables: Dict[str, List[Dict[str, Any]]], skipped: int, label: str, start: float) -> BackfillLoadResult:
+        total = sum(len(rows) for rows in tables.values())
+        done = 0
+        for table, rows in tables.items():
+            for offset in range(0, len(rows), self.chunk_size):
+                chunk = rows[offset:offset + self.chunk_size]
+                await self.writer.upsert_ohlcv_bars(table, chunk)
+                done += len(chunk)
+                elapsed = time.perf_counter() - start
+                rate = done / elapsed if elapsed > 0 else 0.0
+                logger.info(
+                    f"📥 OHLCV 백필 적재{f' [{label}]' if label else ''}: {table} "
+                    f"{done:,}/{total:,} rows ({done / total:.0%}), {rate:,.0f} rows/s"
+                )
+
+        result = BackfillLoadResult(rows=done, skipped=skipped, elapsed=time.perf_counter() - start)
+        self.stats["tasks"] += 1
+        self.stats["rows"] += result.rows
+        self.stats["skipped"] += skipped
+        self.stats["seconds"] += result.elapsed
+        if skipped:
+            logger.warning(f"⚠️ OHLCV 백필 적재: 필수 값이 없는 항목 {skipped}건 제외")
+        return result
+
+    def throughput(self) -> float:
+        """누적 rows/s"""
+        return self.stats["rows"] / self.stats["seconds"] if self.stats["seconds"] > 0 else 0.0
@@ -1,45 +1,65 @@
--- Redis Lua script to aggregate ticks into OHLCV candles
--- KEYS[1]: candle_key (e.g., "realtime:bars:1m:1:202603161025")
--- ARGV[1]: price (float)
--- ARGV[2]: volume (float)
--- ARGV[3]: updated_at (timestamp string or number)
+-- Redis Lua script to merge a batch of pre-reduced ticks into OHLCV candles
+-- KEYS: pairs per candle, in order
+--   KEYS[2i-1]: candle_key (e.g., "realtime:bars:1m:1:202603161025")
+--   KEYS[2i]:   index_key  (e.g., "realtime:closeidx:1m")
+-- ARGV[1]: TTL seconds for candle keys
+-- ARGV[2..]: 7 values per candle, in order
+--   open, high, low, close, volume, updated_at, close_epoch
+-- index_key is a sorted set scored by the candle's window close (epoch seconds),
+-- so the flusher can range-read only closed windows. Every key the script touches
+-- is declared in KEYS (required for Redis Cluster slot routing).
+-- Ticks of the same candle are reduced in Python before the call, so each
+-- candle key appears at most once per batch.
 
-local price = tonumber(ARGV[1])
-local volume = tonumber(ARGV[2])
-local updated_at = ARGV[3]
+local ttl = tonumber(ARGV[1])
+local stride = 7
+local count = #KEYS / 2
 
-local candle = redis.call('HMGET', KEYS[1], 'open', 'high', 'low', 'close', 'volume')
-local open = tonumber(candle[1])
-local high = tonumber(candle[2])
-local low = tonumber(candle[3])
-local close = tonumber(candle[4])
-local current_volume = tonumber(candle[5]) or 0
+for i = 1, count do
+    local key = KEYS[2 * i - 1]
+    local index_key = KEYS[2 * i]
+    local base = 1 + (i - 1) * stride
+    local open = tonumber(ARGV[base + 1])
+    local high = tonumber(ARGV[base + 2])
+    local low = tonumber(ARGV[base + 3])
+    local close = tonumber(ARGV[base + 4])
+    local volume = tonumber(ARGV[base + 5])
+    local updated_at = ARGV[base + 6]
+    local close_epoch = ARGV[base + 7]
 
-if not open then
-    -- New candle
-    redis.call('HMSET', KEYS[1], 
-        'open', price, 
-        'high', price, 
-        'low', price, 
-        'close', price, 
-        'volume', volume,
-        'updated_at', updated_at
-    )
-else
-    -- Update existing candle
-    if price > high then high = price end
-    if price < low then low = price end
-    
-    redis.call('HMSET', KEYS[1],
-        'high', high,
-        'low', low,
-        'close', price,
-        'volume', current_volume + volume,
-        'updated_at', updated_at
-    )
-end
+    local candle = redis.call('HMGET', key, 'open', 'high', 'low', 'volume')
+    local cur_open = tonumber(candle[1])
+
+    if not cur_open then
+        -- New candle
+        redis.call('HSET', key,
+            'open', open,
+            'high', high,
+            'low', low,
+            'close', close,
+            'volume', volume,
+            'updated_at', updated_at
+        )
+    else
+        -- Update existing candle
+        local cur_high = tonumber(candle[2])
+        local cur_low = tonumber(candle[3])
+        local cur_volume = tonumber(candle[4]) or 0
+        if cur_high and cur_high > high then high = cur_high end
+        if cur_low and cur_low < low then low = cur_low end
 
--- Set TTL for 2 days (172800 seconds) to save memory
-redis.call('EXPIRE', KEYS[1], 172800)
+        redis.call('HSET', key,
+            'high', high,
+            'low', low,
+            'close', close,
+            'volume', cur_volume + volume,
+            'updated_at', updated_at
+        )
+    end
+
+    -- Set TTL (default 2 days) to save memory
+    redis.call('EXPIRE', key, ttl)
+    redis.call('ZADD', index_key, close_epoch, key)
+end
 
-return 1
+return count
@@ -3,17 +3,163 @@ import os
 import json
 import time
 import traceback
-from typing import Dict, Any, Optional, List
+from dataclasses import dataclass, field
+from typing import Dict, Any, Optional, List, Iterable, Tuple
 import redis.asyncio as redis
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 
 logger = logging.getLogger(__name__)
 
+# 실시간 틱을 집계하는 기본 주기 (분 단위)
+DEFAULT_TICK_INTERVALS = ("1m", "5m", "15m", "1h")
+INTERVAL_MINUTES = {"1m": 1, "5m": 5, "15m": 15, "30m": 30, "1h": 60, "4h": 240}
+BAR_TTL_SECONDS = 172800
+# Lua 호출 1회당 최대 캔들 수 (스크립트 실행 중 Redis가 블로킹되므로 상한을 둠)
+MAX_CANDLES_PER_CALL = 500
+
+# 창 마감 후 늦게 도착하는 틱을 기다리는 유예 시간 (초)
+CLOSE_GRACE_SECONDS = 5
+# 완성 봉 flush 시 한 번에 읽는 키 수
+FLUSH_CHUNK_SIZE = 500
+# 저장이 끝난 봉 값을 보관하는 시간 (초). 이 안에 늦게 도착한 틱 조각은 저장된 봉에 합쳐서 다시 저장
+LATE_MERGE_SECONDS = int(os.getenv("BAR_LATE_MERGE_SECONDS", "21600"))
+
+_EPOCH = datetime(1970, 1, 1)
+
+
+def index_key(interval: str) -> str:
+    """마감 시각(epoch seconds)을 score로 갖는 봉 인덱스 (sorted set)"""
+    return f"realtime:closeidx:{interval}"
+
+
+def claim_index_key(interval: str) -> str:
+    """flush 중(DB 저장 대기)인 봉 인덱스 (sorted set, score는 마감 시각)"""
+    return f"realtime:claimidx:{interval}"
+
+
+CLAIMED_SUFFIX = ":claimed"
+
+
+def claimed_key(key: str) -> str:
+    """flush용으로 떼어낸 봉 해시 키 (원래 키 뒤에 접미사를 붙여 asset_id/시각 파싱 위치 유지)"""
+    return f"{key}{CLAIMED_SUFFIX}"
+
+
+def flushed_key(key: str) -> str:
+    """DB 저장이 끝난 봉 값 (늦게 도착한 틱 조각을 합칠 기준, LATE_MERGE_SECONDS 동안 보관)"""
+    return f"{key}:flushed"
+
+
+# 마감된 봉 해시를 원자적으로 claimed 키로 RENAME하고 인덱스를 옮김
+# KEYS[1]: 마감 인덱스, KEYS[2]: claim 인덱스, KEYS[3..]: (봉 키, claimed 키, flushed 키) 묶음
+# ARGV[1]: 마감 기준 epoch (score <= cutoff인 봉만)
+# 이후 도착한 틱/수집기 봉은 새 해시를 만들고 다음 주기에 flush됨 (삭제 시점 사이에 유실되지 않음)
+# 이전 claim이 아직 저장되지 않았으면(claimed 키 존재) 이번에는 건너뜀
+# 이미 저장된 봉(flushed 키 존재)에 늦게 붙은 틱 조각은 저장된 봉과 합쳐 전체 봉으로 만듦
+# (open은 저장된 값, high/low는 최대/최소, volume은 합산, close는 조각 값) -> DB는 덮어쓰기 UPSERT 그대로
+# 수집기 봉(snapshot)은 그 자체로 전체 봉이므로 합치지 않음
+CLAIM_BARS_LUA = """
+local cutoff = tonumber(ARGV[1])
+local claimed = {}
+for i = 3, #KEYS, 3 do
+    local key = KEYS[i]
+    local target = KEYS[i + 1]
+    local done = KEYS[i + 2]
+    local score = redis.call('ZSCORE', KEYS[1], key)
+    if score and tonumber(score) <= cutoff and redis.call('EXISTS', target) == 0 then
+        redis.call('ZREM', KEYS[1], key)
+        if redis.call('EXISTS', key) == 1 then
+            redis.call('RENAME', key, target)
+            if redis.call('HEXISTS', target, 'snapshot') == 0 and redis.call('EXISTS', done) == 1 then
+                local prev = redis.call('HMGET', done, 'open', 'high', 'low', 'volume')
+                local cur = redis.call('HMGET', target, 'high', 'low', 'volume')
+                redis.call('HSET', target,
+                    'open', prev[1],
+                    'high', tostring(math.max(tonumber(prev[2]), tonumber(cur[1]))),
+                    'low', tostring(math.min(tonumber(prev[3]), tonumber(cur[2]))),
+                    'volume', tostring(tonumber(prev[4] or 0) + tonumber(cur[3] or 0)))
+            end
+            redis.call('ZADD', KEYS[2], score, target)
+            claimed[#claimed + 1] = target
+        end
+    end
+end
+return claimed
+"""
+
+
+def legacy_index_key(interval: str) -> str:
+    """이전 버전의 SET 인덱스 (마이그레이션 용도)"""
+    return f"realtime:index:{interval}"
+
+
+def to_epoch(ts: datetime) -> int:
+    if ts.tzinfo is not None:
+        ts = ts.astimezone(timezone.utc).replace(tzinfo=None)
+    return int((ts - _EPOCH).total_seconds())
+
+
+def window_close(ts_window: datetime, interval: str) -> datetime:
+    """봉 시작 시각과 주기로 마감 시각 계산"""
+    if interval in INTERVAL_MINUTES:
+        return ts_window + timedelta(minutes=INTERVAL_MINUTES[interval])
+    if interval == "1d":
+        return ts_window + timedelta(days=1)
+    if interval == "1w":
+        return ts_window + timedelta(days=7)
+    if interval == "1M":
+        year, month = (ts_window.year + 1, 1) if ts_window.month == 12 else (ts_window.year, ts_window.month + 1)
+        return ts_window.replace(year=year, month=month, day=1, hour=0, minute=0, second=0, microsecond=0)
+    return ts_window
+
+
+@dataclass
+class CompletedBarBatch:
+    """마감된 봉 묶음 (컬럼 단위 보관)"""
+    interval: str
+    keys: List[str] = field(default_factory=list)
+    asset_ids: List[int] = field(default_factory=list)
+    timestamps: List[datetime] = field(default_factory=list)
+    open: List[float] = field(default_factory=list)
+    high: List[float] = field(default_factory=list)
+    low: List[float] = field(default_factory=list)
+    close: List[float] = field(default_factory=list)
+    volume: List[float] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def as_dicts(self) -> List[Dict[str, Any]]:
+        """DataRepository 저장 경로용 dict 목록"""
+        return [
+            {
+                'asset_id': self.asset_ids[i],
+                'interval': self.interval,
+                'timestamp_utc': self.timestamps[i],
+                'open': self.open[i],
+                'high': self.high[i],
+                'low': self.low[i],
+                'close': self.close[i],
+                'volume': self.volume[i],
+            }
+            for i in range(len(self.keys))
+        ]
+
+
+def bucket_start(timestamp_utc: datetime, minutes: int) -> datetime:
+    """타임스탬프가 속한 N분 버킷의 시작 시각 (naive UTC)"""
+    epoch_seconds = to_epoch(timestamp_utc)
+    return _EPOCH + timedelta(seconds=epoch_seconds - epoch_seconds % (minutes * 60))
+
+
 class RedisBucketManager:
-    def __init__(self, redis_url: str):
+    def __init__(self, redis_url: str, tick_intervals: Iterable[str] = DEFAULT_TICK_INTERVALS):
         self.redis_url = redis_url
         self.redis_client = None
         self._lua_aggregator = None
+        self._lua_claim = None
+        self.tick_intervals = tuple(tick_intervals)
+        self._migrated_intervals = set()
         
         self.lua_path = os.path.join(os.path.dirname(__file__), "redis_aggregator.lua")
         self._lua_script_content = None
@@ -34,6 +180,7 @@ class RedisBucketManager:
                 if self._lua_script_content:
                     self._lua_aggregator = self.redis_client.register_script(self._lua_script_content)
                     logger.info("✅ Lua script registered successfully")
+                self._lua_claim = self.redis_client.register_script(CLAIM_BARS_LUA)
                 
                 logger.info(f"✅ RedisBucketManager Connected to {self.redis_url}")
         except Exception as e:
@@ -41,36 +188,73 @@ class RedisBucketManager:
             logger.error(traceback.format_exc())
             raise
 
-    async def aggregate_tick(self, asset_id: int, interval: str, price: float, volume: float, timestamp_utc: datetime):
+    def reduce_ticks(self, ticks: Iterable[Tuple[int, float, float, datetime]], intervals: Optional[Iterable[str]] = None) -> Dict[str, List[Any]]:
+        """
+        (asset_id, price, volume, timestamp_utc) 틱 목록을 캔들 키 단위로 사전 집계.
+        같은 캔들에 속한 틱은 도착 순서대로 open(첫 가격)/close(마지막 가격)를 정하고
+        high/low/volume은 누적하므로 Lua 병합 결과는 틱 단위 호출과 동일함.
+        """
+        intervals = tuple(intervals or self.tick_intervals)
+        windows = [(interval, INTERVAL_MINUTES[interval]) for interval in intervals]
+        candles: Dict[str, List[Any]] = {}
+        for asset_id, price, volume, timestamp_utc in ticks:
+            price = float(price)
+            volume = float(volume or 0)
+            minute_start = bucket_start(timestamp_utc, 1)
+            updated_at = timestamp_utc.isoformat()
+            for interval, minutes in windows:
+                ts_window = minute_start if minutes == 1 else bucket_start(minute_start, minutes)
+                key = f"realtime:bars:{interval}:{asset_id}:{ts_window.strftime('%Y%m%d%H%M')}"
+                candle = candles.get(key)
+                if candle is None:
+                    # [open, high, low, close, volume, updated_at, index_key, close_epoch]
+                    close_epoch = to_epoch(ts_window) + minutes * 60
+                    candles[key] = [price, price, price, price, volume, updated_at, index_key(interval), close_epoch]
+                else:
+                    if price > candle[1]: candle[1] = price
+                    if price < candle[2]: candle[2] = price
+                    candle[3] = price
+                    candle[4] += volume
+                    candle[5] = updated_at
+        return candles
+
+    async def aggregate_ticks_batch(self, ticks: Iterable[Tuple[int, float, float, datetime]], intervals: Optional[Iterable[str]] = None) -> bool:
+        """틱 배치를 모든 집계 주기의 캔들에 반영 (청크당 EVALSHA 1회)"""
         if not self._lua_aggregator:
             await self.connect()
-            
-        # minutes = 1 if interval == "1m" else 5
-        ts_window = timestamp_utc.replace(second=0, microsecond=0)
-        if interval == "5m":
-            ts_window = ts_window.replace(minute=(ts_window.minute // 5) * 5)
-            
-        ts_str = ts_window.strftime("%Y%m%d%H%M")
-        key = f"realtime:bars:{interval}:{asset_id}:{ts_str}"
-        
+
+        candles = self.reduce_ticks(ticks, intervals)
+        if not candles:
+            return True
+
+        items = list(candles.items())
         try:
-            await self._lua_aggregator(
-                keys=[key],
-                args=[price, volume, timestamp_utc.isoformat()]
-            )
-            index_key = f"realtime:index:{interval}"
-            await self.redis_client.sadd(index_key, key)
+            for offset in range(0, len(items), MAX_CANDLES_PER_CALL):
+                chunk = items[offset:offset + MAX_CANDLES_PER_CALL]
+                keys: List[str] = []
+                args: List[Any] = [BAR_TTL_SECONDS]
+                for key, candle in chunk:
+                    # 인덱스 키도 KEYS로 전달 (Redis Cluster 슬롯 라우팅)
+                    keys.extend((key, candle[6]))
+                    args.extend(candle[:6])
+                    args.append(candle[7])
+                await self._lua_aggregator(keys=keys, args=args)
             return True
         except Exception as e:
-            logger.error(f"❌ Redis aggregation failed: {e}")
+            logger.error(f"❌ Redis batch aggregation failed: {e}")
             return False
 
+    async def aggregate_tick(self, asset_id: int, interval: str, price: float, volume: float, timestamp_utc: datetime):
+        """단일 틱 집계 (하위 호환용, 내부적으로 배치 경로 사용)"""
+        return await self.aggregate_ticks_batch([(asset_id, price, volume, timestamp_utc)], intervals=[interval])
+
     async def add_bars_batch(self, bars: List[Dict[str, Any]]):
         """이미 형성된 바(Bar) 목록을 Redis 바구니에 일괄 추가 (Collector용)"""
         if not self.redis_client: await self.connect()
         
         try:
             pipeline = self.redis_client.pipeline()
+            now_epoch = to_epoch(datetime.utcnow())
             for b in bars:
                 interval = b.get('interval', '1m')
                 asset_id = b.get('asset_id')
@@ -86,6 +270,8 @@ class RedisBucketManager:
                 else:
                     ts_dt = ts
                     
+                if ts_dt.tzinfo is not None:
+                    ts_dt = ts_dt.astimezone(timezone.utc).replace(tzinfo=None)
                 ts_str = ts_dt.strftime("%Y%m%d%H%M")
                 key = f"realtime:bars:{interval}:{asset_id}:{ts_str}"
                 
@@ -95,12 +281,13 @@ class RedisBucketManager:
                     'low': str(b.get('low_price', b.get('low', 0))),
                     'close': str(b.get('close_price', b.get('close', 0))),
                     'volume': str(b.get('volume', 0)),
-                    'updated_at': datetime.now().isoformat()
+                    'updated_at': datetime.now().isoformat(),
+                    'snapshot': '1'
                 }
                 pipeline.hset(key, mapping=bar_data)
-                
-                index_key = f"realtime:index:{interval}"
-                pipeline.sadd(index_key, key)
+                # 수집기 봉은 그 시점의 전체 봉(스냅샷, DB는 덮어쓰기)이므로 진행 중인 봉도 다음 flush 주기에 바로 저장
+                # (마감 시각 기준 인덱싱은 틱 집계 봉만 해당)
+                pipeline.zadd(index_key(interval), {key: now_epoch})
                 
             await pipeline.execute()
             return True
@@ -108,27 +295,117 @@ class RedisBucketManager:
             logger.error(f"❌ Redis add_bars_batch failed: {e}")
             return False
 
-    async def get_completed_bars(self, interval: str) -> List[Dict[str, Any]]:
+    async def _migrate_legacy_index(self, interval: str):
+        """이전 SET 인덱스(realtime:index:*)에 남은 키를 sorted set 인덱스로 이전"""
+        if interval in self._migrated_intervals:
+            return
+        legacy_key = legacy_index_key(interval)
+        if await self.redis_client.type(legacy_key) in (b'set', 'set'):
+            keys = await self.redis_client.smembers(legacy_key)
+            if keys:
+                # 기존 키는 마감 여부를 알 수 없으므로 봉 시작 시각 기준으로 마감 시각을 계산
+                mapping = {}
+                for key_bytes in keys:
+                    key = key_bytes.decode('utf-8') if isinstance(key_bytes, bytes) else key_bytes
+                    parts = key.split(':')
+                    if len(parts) < 5:
+                        continue
+                    ts = datetime.strptime(parts[4], "%Y%m%d%H%M")
+                    mapping[key] = to_epoch(window_close(ts, interval))
+                if mapping:
+                    await self.redis_client.zadd(index_key(interval), mapping)
+            await self.redis_client.delete(legacy_key)
+            logger.info(f"🔁 Legacy bar index migrated: {legacy_key} ({len(keys)} keys)")
+        self._migrated_intervals.add(interval)
+
+    async def get_completed_bars(self, interval: str, now: Optional[datetime] = None, limit: int = FLUSH_CHUNK_SIZE) -> CompletedBarBatch:
+        """
+        마감 시각이 지난(유예 시간 포함) 봉을 인덱스 score 순으로 최대 limit개 claim 후 조회.
+        claim(RENAME)은 Lua로 원자적이므로 조회 이후 도착한 틱은 새 해시로 남아 다음 flush에 저장됨.
+        이전 주기에 저장 실패로 남은 claim이 있으면 그것부터 다시 돌려줌.
+        DB 저장 성공 후 ack_completed_bars로 claimed 해시를 삭제해야 함.
+        """
         if not self.redis_client: await self.connect()
-        index_key = f"realtime:index:{interval}"
-        keys = await self.redis_client.smembers(index_key)
-        completed_bars = []
-        for key_bytes in keys:
-            key = key_bytes.decode('utf-8')
+        await self._migrate_legacy_index(interval)
+
+        now = now or datetime.utcnow()
+        cutoff = to_epoch(now) - CLOSE_GRACE_SECONDS
+        batch = CompletedBarBatch(interval=interval)
+
+        claim_idx = claim_index_key(interval)
+        keys = [self._text(k) for k in await self.redis_client.zrange(claim_idx, 0, limit - 1)]
+        if len(keys) < limit:
+            raw_keys = await self.redis_client.zrangebyscore(index_key(interval), "-inf", cutoff, start=0, num=limit - len(keys))
+            if raw_keys:
+                lua_keys = [index_key(interval), claim_idx]
+                for raw in raw_keys:
+                    key = self._text(raw)
+                    lua_keys.extend((key, claimed_key(key), flushed_key(key)))
+                claimed = await self._lua_claim(keys=lua_keys, args=[cutoff])
+                keys.extend(self._text(k) for k in claimed)
+        if not keys:
+            return batch
+
+        pipe = self.redis_client.pipeline(transaction=False)
+        for key in keys:
+            pipe.hmget(key, 'open', 'high', 'low', 'close', 'volume')
+        values = await pipe.execute()
+
+        expired = []
+        for key, (o, h, l, c, v) in zip(keys, values):
             parts = key.split(':')
-            if len(parts) < 5: continue
-            asset_id = int(parts[3])
-            ts_str = parts[4]
-            data = await self.redis_client.hgetall(key)
-            if data:
-                bar = {k.decode('utf-8'): v.decode('utf-8') for k, v in data.items()}
-                bar['asset_id'] = asset_id
-                bar['interval'] = interval
-                bar['timestamp_utc'] = datetime.strptime(ts_str, "%Y%m%d%H%M")
-                completed_bars.append(bar)
-                await self.redis_client.srem(index_key, key)
-        return completed_bars
+            if o is None or len(parts) < 5:
+                # TTL 만료 등으로 해시가 사라진 키는 인덱스에서만 제거
+                expired.append(key)
+                continue
+            try:
+                ohlcv = (float(o), float(h), float(l), float(c), float(v or 0))
+            except (TypeError, ValueError):
+                expired.append(key)
+                continue
+            batch.open.append(ohlcv[0])
+            batch.high.append(ohlcv[1])
+            batch.low.append(ohlcv[2])
+            batch.close.append(ohlcv[3])
+            batch.volume.append(ohlcv[4])
+            batch.keys.append(key)
+            batch.asset_ids.append(int(parts[3]))
+            batch.timestamps.append(datetime.strptime(parts[4], "%Y%m%d%H%M"))
+
+        if expired:
+            pipe = self.redis_client.pipeline(transaction=True)
+            pipe.delete(*expired)
+            pipe.zrem(claim_idx, *expired)
+            await pipe.execute()
+        return batch
+
+    async def ack_completed_bars(self, batch: CompletedBarBatch):
+        """
+        저장이 끝난 claimed 봉 해시를 flushed 키로 옮기고(LATE_MERGE_SECONDS 후 만료) claim 인덱스 항목과 함께
+        MULTI/EXEC로 처리 (claimed 키에는 다른 쓰기가 없음). 이후 같은 봉에 늦게 붙은 틱 조각은 claim 시 이 값과 합쳐짐
+        """
+        if not batch.keys:
+            return
+        if not self.redis_client: await self.connect()
+        pipe = self.redis_client.pipeline(transaction=True)
+        for key in batch.keys:
+            done = flushed_key(key[:-len(CLAIMED_SUFFIX)] if key.endswith(CLAIMED_SUFFIX) else key)
+            pipe.rename(key, done)
+            pipe.expire(done, LATE_MERGE_SECONDS)
+        pipe.zrem(claim_index_key(batch.interval), *batch.keys)
+        # TTL 만료로 claimed 해시가 사라진 경우 RENAME만 실패 (나머지 명령은 실행됨)
+        await pipe.execute(raise_on_error=False)
+
+    @staticmethod
+    def _text(value) -> str:
+        return value.decode('utf-8') if isinstance(value, bytes) else value
 
     async def delete_bar_key(self, key: str):
+        """단일 봉 키 삭제 (하위 호환용)"""
         if self.redis_client:
-            await self.redis_client.delete(key)
+            parts = key.split(':')
+            pipe = self.redis_client.pipeline(transaction=True)
+            pipe.delete(key)
+            if len(parts) >= 3:
+                pipe.zrem(index_key(parts[2]), key)
+            await pipe.execute()
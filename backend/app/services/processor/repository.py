@@ -3,10 +3,13 @@ import os
 import time
 from typing import List, Dict, Any, Optional
 from datetime import datetime, date, timedelta, timezone
-from sqlalchemy import func
+from sqlalchemy import case, func
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 
 from ...core.database import get_postgres_db
+from .async_writer import AsyncBulkWriter
+from .batch_coalescer import CONFLICT_KEYS, group_by_columns, merge_rows
+from ..ohlcv_rollup import affected_ranges, refresh_rollups
 from ...models.asset import (
     RealtimeQuote, RealtimeQuoteTimeDelay, StockProfile, ETFInfo, 
     CryptoData, StockFinancial, StockAnalystEstimate, WorldAssetsRanking,
@@ -22,6 +25,9 @@ class DataRepository:
         self.validator = validator
         self.bulk_upsert_enabled = os.getenv("BULK_UPSERT_ENABLED", "true").lower() == "true"
         self.batch_size = int(os.getenv("BULK_BATCH_SIZE", "1000"))
+        # 실시간 쓰기 경로: "copy" (asyncpg COPY + MERGE, 기본) | "sync" (기존 동기 세션 UPSERT)
+        self.realtime_write_mode = os.getenv("REALTIME_WRITE_MODE", "copy").lower()
+        self.async_writer = AsyncBulkWriter()
 
     def _sanitize_number(self, val, min_abs=0.0, max_abs=1e9, digits=8):
         try:
@@ -46,6 +52,52 @@ class DataRepository:
         except Exception:
             return timestamp
 
+    def _build_realtime_quote_rows(self, batch: List[Dict[str, Any]]):
+        """검증된 틱 배치를 realtime_quotes / realtime_quotes_time_delay 행으로 변환"""
+        # 실시간 테이블용 데이터
+        dedup_rt = {}
+        rt_allowed_keys = {'asset_id', 'timestamp_utc', 'price', 'volume', 'change_amount', 'change_percent', 'data_source'}
+        for rec in batch:
+            r = {k: v for k, v in rec.items() if k in rt_allowed_keys}
+            r['price'] = self._sanitize_number(rec.get('price'))
+            r['volume'] = self._sanitize_number(rec.get('volume'))
+            r['change_amount'] = self._sanitize_number(rec.get('change_amount'))
+            r['change_percent'] = self._sanitize_number(rec.get('change_percent'))
+            if r['price'] is None:
+                continue
+            # Ensure required fields
+            if 'asset_id' not in r or 'timestamp_utc' not in r or 'data_source' not in r:
+                continue
+            dedup_rt[r['asset_id']] = r
+        realtime_rows = list(dedup_rt.values())
+
+        # 지연 테이블용 데이터 (1m 단위로 집계) - 영구 저장용
+        delay_dedup = {}
+        delay_allowed_keys = {'asset_id', 'timestamp_utc', 'price', 'volume', 'change_amount', 'change_percent', 'data_source', 'data_interval'}
+        for rec in batch:
+            d = {k: v for k, v in rec.items() if k in delay_allowed_keys}
+            tw = self._get_time_window(rec['timestamp_utc'], 1) # 1m window
+            d['timestamp_utc'] = tw
+            d['data_interval'] = "1m"
+            d['price'] = self._sanitize_number(rec.get('price'))
+            d['volume'] = self._sanitize_number(rec.get('volume'))
+            d['change_amount'] = self._sanitize_number(rec.get('change_amount'))
+            d['change_percent'] = self._sanitize_number(rec.get('change_percent'))
+
+            if 'asset_id' not in d: d['asset_id'] = rec.get('asset_id')
+            if 'data_source' not in d: d['data_source'] = rec.get('data_source')
+
+            if d['price'] is None:
+                continue
+
+            key = (d['asset_id'], d['timestamp_utc'], d['data_source'], d['data_interval'])
+            if key not in delay_dedup:
+                delay_dedup[key] = d
+            else:
+                delay_dedup[key].update(d)
+        delay_rows = list(delay_dedup.values())
+        return realtime_rows, delay_rows
+
     async def bulk_save_realtime_quotes(self, records: List[Dict[str, Any]]) -> bool:
         """실시간 인용 데이터 일괄 저장"""
         if not records:
@@ -65,6 +117,15 @@ class DataRepository:
         
         logger.debug(f"✅ 검증 통과: {len(validated_records)}/{len(records)}개")
 
+        if self.realtime_write_mode == "copy":
+            try:
+                realtime_rows, delay_rows = self._build_realtime_quote_rows(validated_records)
+                await self.async_writer.upsert_realtime_quotes(realtime_rows, delay_rows)
+                logger.debug(f"💾 COPY 저장 성공: RT {len(realtime_rows)}, Delay {len(delay_rows)}")
+                return True
+            except Exception as e:
+                logger.error(f"❌ COPY 저장 실패, 동기 경로로 재시도: {e}", exc_info=True)
+
         pg_db = next(get_postgres_db())
         try:
             batch_size = self.batch_size if self.bulk_upsert_enabled else 1
@@ -75,55 +136,8 @@ class DataRepository:
                 if not batch:
                     continue
 
-                # 실시간 테이블용 데이터
-                dedup_rt = {}
-                rt_allowed_keys = {'asset_id', 'timestamp_utc', 'price', 'volume', 'change_amount', 'change_percent', 'data_source'}
-                for rec in batch:
-                    r = {k: v for k, v in rec.items() if k in rt_allowed_keys}
-                    r['price'] = self._sanitize_number(rec.get('price'))
-                    r['volume'] = self._sanitize_number(rec.get('volume'))
-                    r['change_amount'] = self._sanitize_number(rec.get('change_amount'))
-                    r['change_percent'] = self._sanitize_number(rec.get('change_percent'))
-                    if r['price'] is None:
-                        continue
-                    # Ensure required fields
-                    if 'asset_id' not in r or 'timestamp_utc' not in r or 'data_source' not in r:
-                        continue
-                    dedup_rt[r['asset_id']] = r
-                realtime_rows = list(dedup_rt.values())
-
-                # 지연 테이블용 데이터 (1m 단위로 집계) - 영구 저장용
-                delay_dedup = {}
-                delay_allowed_keys = {'asset_id', 'timestamp_utc', 'price', 'volume', 'change_amount', 'change_percent', 'data_source', 'data_interval'}
-                for rec in batch:
-                    d = {k: v for k, v in rec.items() if k in delay_allowed_keys}
-                    tw = self._get_time_window(rec['timestamp_utc'], 1) # 1m window
-                    d['timestamp_utc'] = tw
-                    d['data_interval'] = "1m"
-                    d['price'] = self._sanitize_number(rec.get('price'))
-                    d['volume'] = self._sanitize_number(rec.get('volume'))
-                    d['change_amount'] = self._sanitize_number(rec.get('change_amount'))
-                    d['change_percent'] = self._sanitize_number(rec.get('change_percent'))
-                    
-                    if 'asset_id' not in d: d['asset_id'] = rec.get('asset_id')
-                    if 'data_source' not in d: d['data_source'] = rec.get('data_source')
-                    
-                    if d['price'] is None:
-                        continue
-                        
-                    key = (d['asset_id'], d['timestamp_utc'], d['data_source'], d['data_interval'])
-                    if key not in delay_dedup:
-                        delay_dedup[key] = d
-                    else:
-                        delay_dedup[key].update(d)
-                delay_rows = list(delay_dedup.values())
-
-                realtime_rows = list(dedup_rt.values())
-
-                # 실시간 봉 테이블 집계 - REDIS로 대체됨 (중복 계산 방지를 위해 주석 처리)
+                realtime_rows, delay_rows = self._build_realtime_quote_rows(batch)
                 rt_bar_rows = []
-                # for interval in ["1m", "5m"]:
-                #     ...
 
                 try:
                     # 1. 실시간 테이블 UPSERT
@@ -187,46 +201,71 @@ class DataRepository:
         finally:
             pg_db.close()
 
+    def _build_realtime_bar_rows(self, bars: List[Dict[str, Any]]):
+        """Redis 바구니 봉 데이터를 realtime_quotes_time_bar 행과 1분봉 지연 테이블 행으로 변환"""
+        rows = []
+        for b in bars:
+            try:
+                open_p = float(b.get('open'))
+                close_p = float(b.get('close'))
+                source = b.get('data_source') or 'binance'
+                interval = b.get('interval') or '1m'
+                row = {
+                    'asset_id': int(b.get('asset_id')),
+                    'timestamp_utc': b.get('timestamp_utc'),
+                    'data_interval': interval,
+                    'open_price': open_p,
+                    'high_price': float(b.get('high')),
+                    'low_price': float(b.get('low')),
+                    'close_price': close_p,
+                    'volume': float(b.get('volume')),
+                    'change_amount': close_p - open_p,
+                    'data_source': source,
+                }
+                if row['open_price'] and row['open_price'] != 0:
+                    row['change_percent'] = (row['change_amount'] / row['open_price']) * 100
+                else:
+                    row['change_percent'] = 0
+                rows.append(row)
+            except (ValueError, TypeError) as e:
+                logger.warning(f"⚠️ 바구니 데이터 데이터 변환 실패: {e} | bar: {b}")
+                continue
+
+        # 1분봉인 경우 RealtimeQuoteTimeDelay에도 저장 (영구 백업용)
+        delay_rows = []
+        for r in rows:
+            if r['data_interval'] == '1m':
+                delay_rows.append({
+                    'asset_id': r['asset_id'],
+                    'timestamp_utc': r['timestamp_utc'],
+                    'price': r['close_price'],
+                    'volume': r['volume'],
+                    'change_amount': r['change_amount'],
+                    'change_percent': r['change_percent'],
+                    'data_source': r['data_source'],
+                    'data_interval': '1m',
+                })
+        return rows, delay_rows
+
     async def save_realtime_bars_batch(self, bars: List[Dict[str, Any]]) -> bool:
         """Redis 바구니에서 넘어온 집계된 봉 데이터를 DB에 일괄 저장"""
         if not bars:
             return True
-            
-        pg_db = next(get_postgres_db())
-        try:
-            # SQLAlchemy 모델에 맞게 변환
-            rows = []
-            for b in bars:
-                try:
-                    open_p = float(b.get('open'))
-                    close_p = float(b.get('close'))
-                    source = b.get('data_source') or 'binance'
-                    interval = b.get('interval') or '1m'
-                    row = {
-                        'asset_id': int(b.get('asset_id')),
-                        'timestamp_utc': b.get('timestamp_utc'),
-                        'data_interval': interval,
-                        'open_price': open_p,
-                        'high_price': float(b.get('high')),
-                        'low_price': float(b.get('low')),
-                        'close_price': close_p,
-                        'volume': float(b.get('volume')),
-                        'change_amount': close_p - open_p,
-                        'data_source': source,
-                        'updated_at': func.now()
-                    }
-                    if row['open_price'] and row['open_price'] != 0:
-                        row['change_percent'] = (row['change_amount'] / row['open_price']) * 100
-                    else:
-                        row['change_percent'] = 0
-                    rows.append(row)
-                except (ValueError, TypeError) as e:
-                    logger.warning(f"⚠️ 바구니 데이터 데이터 변환 실패: {e} | bar: {b}")
-                    continue
 
-            if not rows:
+        rows, delay_rows = self._build_realtime_bar_rows(bars)
+        if not rows:
+            return True
+
+        if self.realtime_write_mode == "copy":
+            try:
+                await self.async_writer.upsert_realtime_bars(rows, delay_rows)
+                logger.info(f"💾 Redis 바구니 데이터 DB 저장 완료 (COPY): {len(rows)}건 ({rows[0]['data_interval']})")
                 return True
+            except Exception as e:
+                logger.error(f"❌ COPY 저장 실패, 동기 경로로 재시도: {e}", exc_info=True)
 
+        pg_db = next(get_postgres_db())
+        try:
             # 1. RealtimeQuotesTimeBar UPSERT
             stmt = pg_insert(RealtimeQuotesTimeBar).values(rows)
             stmt = stmt.on_conflict_do_update(
@@ -235,7 +274,8 @@ class DataRepository:
                     'high_price': func.greatest(RealtimeQuotesTimeBar.high_price, stmt.excluded.high_price),
                     'low_price': func.least(RealtimeQuotesTimeBar.low_price, stmt.excluded.low_price),
                     'close_price': stmt.excluded.close_price,
-                    'volume': RealtimeQuotesTimeBar.volume + stmt.excluded.volume,
+                    # 바구니 봉은 항상 전체 봉 (늦은 틱 조각은 RedisBucketManager가 저장된 봉과 합쳐서 보냄) -> 덮어씀 (재flush 시 이중 합산 방지)
+                    'volume': stmt.excluded.volume,
                     'change_amount': stmt.excluded.change_amount,
                     'change_percent': stmt.excluded.change_percent,
                     'updated_at': func.now()
@@ -244,21 +284,6 @@ class DataRepository:
             pg_db.execute(stmt)
 
             # 2. 1분봉인 경우 RealtimeQuoteTimeDelay에도 저장 (영구 백업용)
-            delay_rows = []
-            for r in rows:
-                if r['data_interval'] == '1m':
-                    delay_rows.append({
-                        'asset_id': r['asset_id'],
-                        'timestamp_utc': r['timestamp_utc'],
-                        'price': r['close_price'],
-                        'volume': r['volume'],
-                        'change_amount': r['change_amount'],
-                        'change_percent': r['change_percent'],
-                        'data_source': r['data_source'],
-                        'data_interval': '1m',
-                        'updated_at': func.now()
-                    })
-            
             if delay_rows:
                 stmt_delay = pg_insert(RealtimeQuoteTimeDelay).values(delay_rows)
                 stmt_delay = stmt_delay.on_conflict_do_update(
@@ -327,6 +352,33 @@ class DataRepository:
             logger.error(f"실시간 봉 데이터 정리 실패: {e}")
             return 0
 
+    def _stock_profile_row(self, item: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        asset_id = item.get("asset_id") or item.get("assetId")
+        data = item.get("data") if "data" in item else item
+        if not asset_id or not isinstance(data, dict):
+            return None
+
+        # 데이터 매핑 (간소화됨, 필요시 필드 추가)
+        pg_data = {
+            'asset_id': asset_id,
+            'company_name': data.get("name") or data.get("company_name"),
+            'description_en': data.get("description_en") or data.get("description"),
+            'sector': data.get("sector"),
+            'industry': data.get("industry"),
+            'market_cap': data.get("market_cap"),
+            # ... 기타 필드들 ...
+        }
+        # None 제거
+        return {k: v for k, v in pg_data.items() if v is not None}
+
+    def _stock_profile_upsert(self, rows: List[Dict[str, Any]]):
+        stmt = pg_insert(StockProfile).values(rows)
+        set_ = {k: getattr(stmt.excluded, k) for k in rows[0].keys() if k != 'asset_id'}
+        # updated_at 추가
+        if 'updated_at' in StockProfile.__table__.columns:
+            set_['updated_at'] = func.now()
+        return stmt.on_conflict_do_update(index_elements=['asset_id'], set_=set_)
+
     async def save_stock_profile(self, items: List[Dict[str, Any]]) -> bool:
         if not items:
             return True
@@ -335,37 +387,10 @@ class DataRepository:
         try:
             for item in items:
                 try:
-                    asset_id = item.get("asset_id") or item.get("assetId")
-                    data = item.get("data") if "data" in item else item
-                    if not asset_id or not isinstance(data, dict):
+                    pg_data = self._stock_profile_row(item)
+                    if not pg_data:
                         continue
-
-                    # 데이터 매핑 (간소화됨, 필요시 필드 추가)
-                    pg_data = {
-                        'asset_id': asset_id,
-                        'company_name': data.get("name") or data.get("company_name"),
-                        'description_en': data.get("description_en") or data.get("description"),
-                        'sector': data.get("sector"),
-                        'industry': data.get("industry"),
-                        'market_cap': data.get("market_cap"),
-                        # ... 기타 필드들 ...
-                    }
-                    # None 제거
-                    pg_data = {k: v for k, v in pg_data.items() if v is not None}
-
-                    stmt = pg_insert(StockProfile).values(**pg_data)
-                    stmt = stmt.on_conflict_do_update(
-                        index_elements=['asset_id'],
-                        set_={k: getattr(stmt.excluded, k) for k in pg_data.keys() if k != 'asset_id'}
-                    )
-                    # updated_at 추가
-                    if 'updated_at' in StockProfile.__table__.columns:
-                         stmt = stmt.on_conflict_do_update(
-                            index_elements=['asset_id'],
-                            set_={**{k: getattr(stmt.excluded, k) for k in pg_data.keys() if k != 'asset_id'}, 'updated_at': func.now()}
-                        )
-
-                    pg_db.execute(stmt)
+                    pg_db.execute(self._stock_profile_upsert([pg_data]))
                 except Exception as e:
                     logger.warning(f"개별 주식 프로필 저장 실패: {e}")
                     continue
@@ -379,6 +404,62 @@ class DataRepository:
         finally:
             pg_db.close()
 
+    def _crypto_data_row(self, item: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        asset_id = item.get('asset_id')
+        if not asset_id:
+            return None
+
+        crypto_data_dict = {
+            'asset_id': asset_id,
+            'symbol': item.get('symbol', ''),
+            'name': item.get('name', ''),
+            'price': item.get('price'),
+            'current_price': item.get('price'),  # price와 current_price 동기화
+            'market_cap': item.get('market_cap'),
+            'circulating_supply': item.get('circulating_supply'),
+            'total_supply': item.get('total_supply'),
+            'max_supply': item.get('max_supply'),
+            'volume_24h': item.get('volume_24h'),
+            'percent_change_1h': item.get('percent_change_1h'),
+            'percent_change_24h': item.get('percent_change_24h'),
+            'percent_change_7d': item.get('percent_change_7d'),
+            'percent_change_30d': item.get('percent_change_30d'),
+            'cmc_rank': item.get('rank'),
+            'category': item.get('category'),
+            'description': item.get('description'),
+            'logo_url': item.get('logo_url'),
+            'website_url': item.get('website_url'),
+            'slug': item.get('slug'),
+            'date_added': item.get('date_added'),
+            'platform': item.get('platform'),
+            'explorer': item.get('explorer'),
+            'source_code': item.get('source_code'),
+            'tags': item.get('tags'),
+            'is_active': True
+        }
+        return {k: v for k, v in crypto_data_dict.items() if v is not None}
+
+    def _crypto_data_upsert(self, rows: List[Dict[str, Any]]):
+        # logo_url: 이미 로컬 경로('/images/')로 설정된 경우 덮어쓰지 않음
+        stmt = pg_insert(CryptoData).values(rows)
+        set_dict = {k: getattr(stmt.excluded, k) for k in rows[0].keys() if k != 'asset_id'}
+
+        # logo_url에 대한 조건부 업데이트 로직 적용
+        if 'logo_url' in set_dict:
+            # 기존 값이 '/images/%'로 시작하면(로컬 아이콘), 기존 값 유지. 아니면 새로운 값으로 업데이트
+            set_dict['logo_url'] = case(
+                (CryptoData.logo_url.like('/images/%'), CryptoData.logo_url),
+                else_=stmt.excluded.logo_url
+            )
+
+        return stmt.on_conflict_do_update(
+            index_elements=['asset_id'],
+            set_={
+                **set_dict,
+                'last_updated': func.now()
+            }
+        )
+
     async def save_crypto_data(self, items: List[Dict[str, Any]]) -> bool:
         if not items:
             return True
@@ -388,62 +469,10 @@ class DataRepository:
             saved_count = 0
             for item in items:
                 try:
-                    asset_id = item.get('asset_id')
-                    if not asset_id:
+                    crypto_data_dict = self._crypto_data_row(item)
+                    if not crypto_data_dict:
                         continue
-                    
-                    crypto_data_dict = {
-                        'asset_id': asset_id,
-                        'symbol': item.get('symbol', ''),
-                        'name': item.get('name', ''),
-                        'price': item.get('price'),
-                        'current_price': item.get('price'),  # price와 current_price 동기화
-                        'market_cap': item.get('market_cap'),
-                        'circulating_supply': item.get('circulating_supply'),
-                        'total_supply': item.get('total_supply'),
-                        'max_supply': item.get('max_supply'),
-                        'volume_24h': item.get('volume_24h'),
-                        'percent_change_1h': item.get('percent_change_1h'),
-                        'percent_change_24h': item.get('percent_change_24h'),
-                        'percent_change_7d': item.get('percent_change_7d'),
-                        'percent_change_30d': item.get('percent_change_30d'),
-                        'cmc_rank': item.get('rank'),
-                        'category': item.get('category'),
-                        'description': item.get('description'),
-                        'logo_url': item.get('logo_url'),
-                        'website_url': item.get('website_url'),
-                        'slug': item.get('slug'),
-                        'date_added': item.get('date_added'),
-                        'platform': item.get('platform'),
-                        'explorer': item.get('explorer'),
-                        'source_code': item.get('source_code'),
-                        'tags': item.get('tags'),
-                        'is_active': True
-                    }
-                    crypto_data_dict = {k: v for k, v in crypto_data_dict.items() if v is not None}
-                    
-
-                    # logo_url: 이미 로컬 경로('/images/')로 설정된 경우 덮어쓰지 않음
-                    stmt = pg_insert(CryptoData).values(**crypto_data_dict)
-                    set_dict = {k: getattr(stmt.excluded, k) for k in crypto_data_dict.keys() if k != 'asset_id'}
-                    
-                    # logo_url에 대한 조건부 업데이트 로직 적용
-                    if 'logo_url' in set_dict:
-                        from sqlalchemy import case, literal
-                        # 기존 값이 '/images/%'로 시작하면(로컬 아이콘), 기존 값 유지. 아니면 새로운 값으로 업데이트
-                        set_dict['logo_url'] = case(
-                            (CryptoData.logo_url.like('/images/%'), CryptoData.logo_url),
-                            else_=stmt.excluded.logo_url
-                        )
-
-                    stmt = stmt.on_conflict_do_update(
-                        index_elements=['asset_id'],
-                        set_={
-                            **set_dict,
-                            'last_updated': func.now()
-                        }
-                    )
-                    pg_db.execute(stmt)
+                    pg_db.execute(self._crypto_data_upsert([crypto_data_dict]))
                     saved_count += 1
                 except Exception as e:
                     logger.error(f"crypto_data 저장 중 오류: {e}")
@@ -643,6 +672,15 @@ class DataRepository:
                         logger.error(f"❌ 일봉 데이터 저장 실패: {e}", exc_info=True)
                         raise
 
+                # 주/월 롤업: 저장된 일봉이 속한 기간만 재계산 (실패해도 일봉 저장은 유지)
+                try:
+                    with pg_db.begin_nested():
+                        refreshed = refresh_rollups(pg_db, affected_ranges(daily_items))
+                    if refreshed:
+                        logger.debug(f"📦 OHLCV 롤업 갱신: {refreshed}개 기간")
+                except Exception as e:
+                    logger.warning(f"⚠️ OHLCV 롤업 갱신 실패 (백필 스크립트로 재계산 필요): {e}")
+
             # 인트라데이 데이터 저장
             if intraday_items:
                 try:
@@ -743,6 +781,34 @@ class DataRepository:
         finally:
             pg_db.close()
 
+    def _etf_info_row(self, item: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        asset_id = item.get('asset_id')
+        if not asset_id:
+            return None
+
+        data = item.get('data') if 'data' in item else item
+
+        pg_data = {
+            'asset_id': asset_id,
+            'snapshot_date': data.get('snapshot_date') or date.today(),
+            'net_assets': self._sanitize_number(data.get('net_assets'), max_abs=1e18),
+            'net_expense_ratio': self._sanitize_number(data.get('net_expense_ratio')),
+            'portfolio_turnover': self._sanitize_number(data.get('portfolio_turnover')),
+            'dividend_yield': self._sanitize_number(data.get('dividend_yield')),
+            'inception_date': data.get('inception_date'),
+            'leveraged': data.get('leveraged'),
+            'sectors': data.get('sectors'),
+            'holdings': data.get('holdings'),
+        }
+        return {k: v for k, v in pg_data.items() if v is not None}
+
+    def _etf_info_upsert(self, rows: List[Dict[str, Any]]):
+        stmt = pg_insert(ETFInfo).values(rows)
+        return stmt.on_conflict_do_update(
+            index_elements=['asset_id'],
+            set_={k: getattr(stmt.excluded, k) for k in rows[0].keys() if k != 'asset_id'}
+        )
+
     async def save_etf_info(self, items: List[Dict[str, Any]]) -> bool:
         """ETF 정보 저장"""
         if not items:
@@ -750,37 +816,13 @@ class DataRepository:
             
         pg_db = next(get_postgres_db())
         try:
-            from ...models.asset import ETFInfo
-            
             saved_count = 0
             for item in items:
                 try:
-                    asset_id = item.get('asset_id')
-                    if not asset_id:
+                    pg_data = self._etf_info_row(item)
+                    if not pg_data:
                         continue
-                    
-                    data = item.get('data') if 'data' in item else item
-                    
-                    pg_data = {
-                        'asset_id': asset_id,
-                        'snapshot_date': data.get('snapshot_date') or date.today(),
-                        'net_assets': self._sanitize_number(data.get('net_assets'), max_abs=1e18),
-                        'net_expense_ratio': self._sanitize_number(data.get('net_expense_ratio')),
-                        'portfolio_turnover': self._sanitize_number(data.get('portfolio_turnover')),
-                        'dividend_yield': self._sanitize_number(data.get('dividend_yield')),
-                        'inception_date': data.get('inception_date'),
-                        'leveraged': data.get('leveraged'),
-                        'sectors': data.get('sectors'),
-                        'holdings': data.get('holdings'),
-                    }
-                    pg_data = {k: v for k, v in pg_data.items() if v is not None}
-                    
-                    stmt = pg_insert(ETFInfo).values(**pg_data)
-                    stmt = stmt.on_conflict_do_update(
-                        index_elements=['asset_id'],
-                        set_={k: getattr(stmt.excluded, k) for k in pg_data.keys() if k != 'asset_id'}
-                    )
-                    pg_db.execute(stmt)
+                    pg_db.execute(self._etf_info_upsert([pg_data]))
                     saved_count += 1
                 except Exception as e:
                     logger.warning(f"ETF 정보 저장 실패: {e}")
@@ -854,6 +896,56 @@ class DataRepository:
         finally:
             pg_db.close()
 
+    # 수집 가능한 모든 온체인 필드 (Group A + Group B 전체)
+    ONCHAIN_METRIC_FIELDS = (
+        # Group A (홀수일)
+        'mvrv_z_score', 'mvrv', 'nupl', 'sopr', 'realized_price',
+        'sth_realized_price', 'lth_mvrv', 'sth_mvrv', 'lth_nupl',
+        'sth_nupl', 'aviv', 'true_market_mean', 'terminal_price',
+        'delta_price_usd', 'market_cap',
+        # Group B (짝수일)
+        'hashrate', 'difficulty', 'thermo_cap', 'puell_multiple',
+        'reserve_risk', 'rhodl_ratio', 'nvts', 'nrpl_usd',
+        'utxos_in_profit_pct', 'utxos_in_loss_pct', 'realized_cap',
+        'etf_btc_flow', 'etf_btc_total', 'hodl_waves_supply', 'cdd_90dma',
+        'hodl_age_distribution', 'open_interest_futures', 'funding_rate', 'bitcoin_dominance'
+    )
+
+    def _onchain_metric_row(self, item: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        asset_id = item.get('asset_id')
+        ts = item.get('timestamp_utc')
+        if not asset_id or not ts:
+            return None
+
+        pg_data = {'asset_id': asset_id, 'timestamp_utc': ts}
+        has_metric = False
+        for field in self.ONCHAIN_METRIC_FIELDS:
+            val = item.get(field)
+            if val is not None:
+                # Onchain data varies widely (e.g. hashrate, market_cap are huge). 
+                # Relax max_abs to 1e30 and increase digits.
+                pg_data[field] = val if field in ('hodl_age_distribution', 'open_interest_futures') else self._sanitize_number(val, max_abs=1e30, digits=10)
+                has_metric = True
+        return pg_data if has_metric else None
+
+    def _onchain_metric_upsert(self, rows: List[Dict[str, Any]]):
+        stmt = pg_insert(CryptoMetric).values(rows)
+
+        # 업데이트할 필드 결정 (배치 내에 존재하는 모든 메트릭 필드)
+        update_fields = set()
+        for d in rows:
+            for k in d.keys():
+                if k not in ('asset_id', 'timestamp_utc'):
+                    update_fields.add(k)
+
+        update_dict = {k: getattr(stmt.excluded, k) for k in update_fields}
+        update_dict['updated_at'] = func.now()
+
+        return stmt.on_conflict_do_update(
+            index_elements=['asset_id', 'timestamp_utc'],
+            set_=update_dict
+        )
+
     async def save_onchain_metrics(self, items: List[Dict[str, Any]]) -> bool:
         """온체인 메트릭 데이터 저장 (Bulk UPSERT 최적화 버전)"""
         if not items:
@@ -861,69 +953,16 @@ class DataRepository:
         
         pg_db = next(get_postgres_db())
         try:
-            # Debug: Check known columns
-            # logger.info(f"DEBUG: CryptoMetric columns: {CryptoMetric.__table__.columns.keys()}")
-
-            # 1. 수집 가능한 모든 필드 정의 (Group A + Group B 전체)
-            all_metric_fields = [
-                # Group A (홀수일)
-                'mvrv_z_score', 'mvrv', 'nupl', 'sopr', 'realized_price',
-                'sth_realized_price', 'lth_mvrv', 'sth_mvrv', 'lth_nupl',
-                'sth_nupl', 'aviv', 'true_market_mean', 'terminal_price',
-                'delta_price_usd', 'market_cap',
-                # Group B (짝수일)
-                'hashrate', 'difficulty', 'thermo_cap', 'puell_multiple',
-                'reserve_risk', 'rhodl_ratio', 'nvts', 'nrpl_usd',
-                'utxos_in_profit_pct', 'utxos_in_loss_pct', 'realized_cap',
-                'etf_btc_flow', 'etf_btc_total', 'hodl_waves_supply', 'cdd_90dma',
-                'hodl_age_distribution', 'open_interest_futures', 'funding_rate', 'bitcoin_dominance'
-            ]
-            
-            # 2. 데이터 유효성 검사 및 정제
-            valid_pg_data_list = []
-            for item in items:
-                asset_id = item.get('asset_id')
-                ts = item.get('timestamp_utc')
-                if not asset_id or not ts: continue
-                
-                pg_data = {'asset_id': asset_id, 'timestamp_utc': ts}
-                has_metric = False
-                for field in all_metric_fields:
-                    val = item.get(field)
-                    if val is not None:
-                        # Onchain data varies widely (e.g. hashrate, market_cap are huge). 
-                        # Relax max_abs to 1e30 and increase digits.
-                        pg_data[field] = val if field in ('hodl_age_distribution', 'open_interest_futures') else self._sanitize_number(val, max_abs=1e30, digits=10)
-                        has_metric = True
-                if has_metric:
-                    valid_pg_data_list.append(pg_data)
+            # 데이터 유효성 검사 및 정제
+            valid_pg_data_list = [row for row in map(self._onchain_metric_row, items) if row]
 
             if not valid_pg_data_list:
                 return True
 
-            # 3. 배치 처리 (대량 데이터인 경우 1000개씩 끊어서 처리)
+            # 배치 처리 (대량 데이터인 경우 1000개씩 끊어서 처리)
             batch_size = 1000
             for i in range(0, len(valid_pg_data_list), batch_size):
-                batch = valid_pg_data_list[i : i + batch_size]
-                
-                stmt = pg_insert(CryptoMetric).values(batch)
-                
-                # 업데이트할 필드 결정 (배치 내에 존재하는 모든 메트릭 필드)
-                update_fields = set()
-                for d in batch:
-                    for k in d.keys():
-                        if k not in ('asset_id', 'timestamp_utc'):
-                            update_fields.add(k)
-                
-                update_dict = {k: getattr(stmt.excluded, k) for k in update_fields}
-                update_dict['updated_at'] = func.now()
-                
-                stmt = stmt.on_conflict_do_update(
-                    index_elements=['asset_id', 'timestamp_utc'],
-                    set_=update_dict
-                )
-                
-                pg_db.execute(stmt)
+                pg_db.execute(self._onchain_metric_upsert(valid_pg_data_list[i : i + batch_size]))
             
             pg_db.commit()
             logger.info(f"✅ 온체인 메트릭 저장 완료: {len(valid_pg_data_list)}건 (Bulk UPSERT)")
@@ -935,3 +974,52 @@ class DataRepository:
             return False
         finally:
             pg_db.close()
+
+    async def save_coalesced(self, kind: str, batches: List[List[Dict[str, Any]]]) -> List[bool]:
+        """
+        같은 테이블에 쓰는 여러 배치 태스크를 한 번에 저장 (BatchCoalescer 경로)
+        - batches: 태스크별 항목 목록 (큐에서 읽은 순서)
+        - 충돌 키가 같은 행은 뒤 태스크 값 우선으로 합치고, 컬럼 구성별로 batch_size 행씩 멀티 로우 UPSERT 후 한 번 커밋
+        - 반환: 태스크별 성공 여부 (태스크 단위 save_* 와 같은 기준)
+        - 병합 쓰기가 실패하면 롤백 후 태스크 단위 save_* 로 다시 저장해 실패한 태스크만 골라냄
+        """
+        builders = {
+            'stock_profile': (self._stock_profile_row, self._stock_profile_upsert, self.save_stock_profile, True),
+            'crypto_data': (self._crypto_data_row, self._crypto_data_upsert, self.save_crypto_data, False),
+            'etf_info': (self._etf_info_row, self._etf_info_upsert, self.save_etf_info, False),
+            'onchain_metric': (self._onchain_metric_row, self._onchain_metric_upsert, self.save_onchain_metrics, True),
+        }
+        build_row, build_upsert, save_single, empty_ok = builders[kind]
+
+        task_rows = []
+        for items in batches:
+            rows = []
+            for item in items or []:
+                try:
+                    row = build_row(item) if isinstance(item, dict) else None
+                except Exception as e:
+                    logger.warning(f"{kind} 행 변환 실패: {e}")
+                    row = None
+                if row:
+                    rows.append(row)
+            task_rows.append(rows)
+
+        merged = merge_rows((row for rows in task_rows for row in rows), CONFLICT_KEYS[kind])
+        results = [bool(rows) or empty_ok or not items for rows, items in zip(task_rows, batches)]
+        if not merged:
+            return results
+
+        pg_db = next(get_postgres_db())
+        try:
+            for group in group_by_columns(merged):
+                for i in range(0, len(group), self.batch_size):
+                    pg_db.execute(build_upsert(group[i:i + self.batch_size]))
+            pg_db.commit()
+            return results
+        except Exception as e:
+            pg_db.rollback()
+            logger.error(f"{kind} 병합 저장 실패, 태스크 단위로 재시도: {e}")
+        finally:
+            pg_db.close()
+
+        return [await save_single(items) for items in batches]
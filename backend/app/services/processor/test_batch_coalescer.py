@@ -0,0 +1,88 @@
+"""
+batch_coalescer 테스트
+- 충돌 키 병합(뒤 값 우선, 없는 컬럼은 앞 값 유지), 컬럼 구성별 묶음, 히스토그램 분위 확인
+- DB 대신 save_coalesced 호출을 기록하는 간단한 repository 대역으로 태스크 분배/결과 순서 확인
+- on_done은 병합 쓰기/단일 태스크가 끝날 때마다 호출 (배치 끝까지 ACK를 미루지 않음)
+"""
+import asyncio
+
+from app.services.processor.batch_coalescer import (
+    BatchCoalescer, Histogram, group_by_columns, merge_rows, task_items,
+)
+
+
+class RecordingRepository:
+    def __init__(self, fail_index=None):
+        self.calls = []
+        self.fail_index = fail_index
+
+    async def save_coalesced(self, kind, batches):
+        self.calls.append((kind, batches))
+        return [i != self.fail_index for i in range(len(batches))]
+
+
+def test_merge_rows_keeps_last_value_per_column():
+    rows = [
+        {"asset_id": 1, "sector": "Tech", "market_cap": 10},
+        {"asset_id": 2, "sector": "Energy"},
+        {"asset_id": 1, "market_cap": 12, "industry": "Chips"},
+    ]
+    merged = merge_rows(rows, ("asset_id",))
+
+    assert merged == [
+        {"asset_id": 1, "sector": "Tech", "market_cap": 12, "industry": "Chips"},
+        {"asset_id": 2, "sector": "Energy"},
+    ]
+    groups = group_by_columns(merged + [{"asset_id": 3, "sector": "Retail"}])
+    assert [[r["asset_id"] for r in g] for g in groups] == [[1], [2, 3]]
+
+
+def test_task_items_unwraps_payloads():
+    assert task_items({"type": "etf_info", "payload": {"items": [{"asset_id": 1}]}}) == [{"asset_id": 1}]
+    assert task_items({"type": "stock_profile", "payload": {"asset_id": 1}}) == [{"asset_id": 1}]
+    assert task_items({"type": "onchain_metric", "payload": [{"data": [{"a": 1}, {"a": 2}]}, {"a": 3}]}) == [{"a": 1}, {"a": 2}, {"a": 3}]
+    assert task_items({"type": "etf_info", "payload": None}) is None
+
+
+def test_histogram_quantiles():
+    hist = Histogram((1, 5, 10))
+    for value in (1, 1, 3, 4, 8, 50):
+        hist.observe(value)
+
+    snapshot = hist.snapshot()
+    assert snapshot["buckets"] == {"1": 2, "5": 2, "10": 1, "+Inf": 1}
+    assert snapshot["count"] == 6 and snapshot["sum"] == 67
+    assert hist.quantile(0.5) == 5 and hist.quantile(0.95) == float("inf")
+
+
+def test_coalescer_groups_by_kind_and_keeps_task_order():
+    tasks = [
+        {"type": "crypto_info", "payload": {"items": [{"asset_id": 1}]}},
+        {"type": "stock_financials", "payload": {"items": [{"asset_id": 9}]}},
+        {"type": "crypto_data", "payload": {"items": [{"asset_id": 2}]}},
+        {"type": "etf_info", "payload": {"items": [{"asset_id": 3}]}},
+        {"type": "crypto_info", "payload": {"items": [{"asset_id": 1}]}},
+        {"type": "crypto_info", "payload": None},
+    ]
+    repository = RecordingRepository(fail_index=1)
+    singles = []
+
+    settled = []
+
+    async def run_single(task):
+        singles.append(task["type"])
+        return True
+
+    async def on_done(indexes, results):
+        settled.append((indexes, results))
+
+    coalescer = BatchCoalescer(repository, enabled=True)
+    results = asyncio.run(coalescer.process(tasks, run_single, on_done))
+
+    assert [kind for kind, _ in repository.calls] == ["crypto_data"]
+    assert repository.calls[0][1] == [[{"asset_id": 1}], [{"asset_id": 2}], [{"asset_id": 1}]]
+    assert singles == ["stock_financials", "etf_info"]
+    assert results == [True, True, False, True, True, False]
+    assert settled == [([0, 2, 4], [True, False, True]), ([1], [True]), ([3], [True]), ([5], [False])]
+    assert coalescer.stats["writes"] == 3 and coalescer.stats["coalesced_tasks"] == 3
+    assert coalescer.batch_size.counts[:3] == [2, 0, 1]
@@ -0,0 +1,93 @@
+"""
+ohlcv_backfill_loader 테스트
+- 수집기 항목 정규화(키 혼용, ISO/타임존 시각, interval 별칭, 중복 키), 테이블 분리, 청크 적재 확인
+- 컬럼형 배치(OHLCVBatch) 적재가 기존 항목 경로와 같은 행을 만드는지 확인
+- DB 대신 upsert_ohlcv_bars 호출을 기록하는 간단한 writer 대역 사용
+"""
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import pandas as pd
+
+from app.services.ohlcv_batch import OHLCVBatch
+from app.services.processor.ohlcv_backfill_loader import OHLCVBackfillLoader, build_ohlcv_rows
+
+
+class RecordingWriter:
+    def __init__(self):
+        self.calls = []
+
+    async def upsert_ohlcv_bars(self, table, rows):
+        self.calls.append((table, list(rows)))
+        return len(rows)
+
+
+def test_build_rows_normalizes_collector_items():
+    items = [
+        # us_backfill_collector 형식 (open/high/..., ISO 문자열)
+        {"asset_id": 7, "timestamp_utc": "2024-01-02T14:31:00", "data_interval": "1m",
+         "open": 1, "high": 2, "low": 0.5, "close": 1.5, "volume": 10},
+        # ohlcv_collector 형식 (open_price/..., UTC 표기), asset_id/interval은 metadata
+        {"timestamp_utc": "2024-01-02T14:30:00Z", "open_price": 1, "high_price": 2, "low_price": 0.5,
+         "close_price": 1.2, "volume": None, "change_percent": 0.4},
+        # 같은 키의 뒤 항목이 우선
+        {"asset_id": 7, "timestamp_utc": datetime(2024, 1, 2, 23, 31, tzinfo=timezone(timedelta(hours=9))),
+         "interval": "1m", "open": 1, "high": 3, "low": 0.5, "close": 2.5, "volume": 11},
+        # 가격 결측/비정상 -> 제외
+        {"asset_id": 7, "timestamp_utc": "2024-01-02T14:32:00", "open": None, "high": 2, "low": 1, "close": 1},
+        {"asset_id": 7, "timestamp_utc": "2024-01-02T14:33:00", "open": "nan", "high": 2, "low": 1, "close": 1},
+        {"asset_id": 7, "timestamp_utc": "bad", "open": 1, "high": 2, "low": 1, "close": 1},
+        # 일봉 별칭
+        {"asset_id": 8, "timestamp_utc": "2024-01-02", "interval": "daily", "open": 5, "high": 6, "low": 4, "close": 5.5},
+        {"asset_id": 8, "timestamp_utc": "2024-02-01", "interval": "1mo", "open": 5, "high": 6, "low": 4, "close": 5.5},
+    ]
+    tables, skipped = build_ohlcv_rows(items, {"asset_id": 7, "interval": "1m"})
+
+    assert skipped == 3
+    intraday = tables["ohlcv_intraday_data"]
+    assert [(r["asset_id"], r["timestamp_utc"]) for r in intraday] == [
+        (7, datetime(2024, 1, 2, 14, 30)),
+        (7, datetime(2024, 1, 2, 14, 31)),
+    ]
+    assert intraday[0]["volume"] == 0.0 and intraday[0]["change_percent"] == 0.4
+    assert intraday[1]["close_price"] == 2.5 and intraday[1]["volume"] == 11.0
+    assert [r["data_interval"] for r in tables["ohlcv_day_data"]] == ["1d", "1M"]
+
+
+def test_loader_writes_in_chunks_and_tracks_throughput():
+    start = datetime(2024, 1, 1)
+    items = [
+        {"asset_id": 1 + i % 3, "timestamp_utc": (start + timedelta(minutes=i // 3)).isoformat(),
+         "interval": "1m", "open": 1, "high": 1, "low": 1, "close": 1, "volume": 1}
+        for i in range(2500)
+    ]
+    writer = RecordingWriter()
+    loader = OHLCVBackfillLoader(writer, chunk_size=1000)
+    result = asyncio.run(loader.load(items, {"is_backfill": True}))
+
+    assert result.rows == 2500 and result.skipped == 0
+    assert [len(rows) for _, rows in writer.calls] == [1000, 1000, 500]
+    written = [(r["asset_id"], r["timestamp_utc"]) for _, rows in writer.calls for r in rows]
+    assert written == sorted(written)
+    assert loader.stats["rows"] == 2500 and loader.throughput() > 0
+
+
+def test_loader_writes_columnar_batch_without_item_parsing():
+    frame = pd.DataFrame({
+        "timestamp_utc": pd.date_range("2024-01-01", periods=2500, freq="min", tz="UTC"),
+        "open": 1.0, "high": 2.0, "low": 0.5, "close": 1.5, "volume": 3.0,
+    })
+    batch = OHLCVBatch.from_frame(frame)
+    writer = RecordingWriter()
+    loader = OHLCVBackfillLoader(writer, chunk_size=1000)
+    result = asyncio.run(loader.load_batch(batch, {"asset_id": 9, "interval": "1m", "is_backfill": True}))
+
+    assert result.rows == 2500 and result.skipped == 0
+    assert [(table, len(rows)) for table, rows in writer.calls] == [
+        ("ohlcv_intraday_data", 1000), ("ohlcv_intraday_data", 1000), ("ohlcv_intraday_data", 500),
+    ]
+    first = writer.calls[0][1][0]
+    assert first["asset_id"] == 9 and first["data_interval"] == "1m" and first["timestamp_utc"] == datetime(2024, 1, 1)
+    # 같은 값을 기존 항목 경로로 만든 행과 동일
+    items_tables, _ = build_ohlcv_rows(batch.to_rows(None, None), {"asset_id": 9, "interval": "1m"})
+    assert items_tables["ohlcv_intraday_data"] == [r for _, rows in writer.calls for r in rows]
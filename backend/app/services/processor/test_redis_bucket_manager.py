@@ -0,0 +1,110 @@
+"""
+redis_bucket_manager 테스트 (fakeredis + lupa가 있을 때만 실행)
+- 틱 집계 Lua (인덱스 키를 KEYS로 전달) 결과와 마감 인덱스
+- 수집기 봉은 전체 봉 스냅샷이므로 진행 중인 봉도 바로 flush, 다시 보낸 스냅샷은 그대로 덮어씀
+- claim 이후 도착한 틱은 ack로 유실되지 않고, 다음 flush에서 저장된 봉과 합쳐진 전체 봉으로 저장
+  (덮어쓰기 UPSERT를 흉내 낸 DB 대역의 최종 행 확인)
+- 저장 실패(ack 없음) 시 같은 claim을 다시 돌려줌
+"""
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+
+fakeredis = pytest.importorskip("fakeredis")
+pytest.importorskip("lupa")
+
+from app.services.processor.redis_bucket_manager import (
+    CLAIM_BARS_LUA,
+    RedisBucketManager,
+    claim_index_key,
+    index_key,
+    to_epoch,
+)
+
+
+def make_manager():
+    manager = RedisBucketManager("redis://unused")
+    manager.redis_client = fakeredis.FakeAsyncRedis()
+    manager._lua_aggregator = manager.redis_client.register_script(manager._lua_script_content)
+    manager._lua_claim = manager.redis_client.register_script(CLAIM_BARS_LUA)
+    return manager
+
+
+def test_tick_aggregation_and_close_index():
+    async def run():
+        manager = make_manager()
+        t = datetime(2024, 1, 2, 14, 30, 10)
+        assert await manager.aggregate_ticks_batch([(1, 10.0, 2, t), (1, 12.0, 3, t)], intervals=["1m", "5m"])
+        assert await manager.aggregate_ticks_batch([(1, 9.0, 1, t)], intervals=["1m"])
+        candle = await manager.redis_client.hgetall("realtime:bars:1m:1:202401021430")
+        scores = await manager.redis_client.zrange(index_key("5m"), 0, -1, withscores=True)
+        return candle, scores
+
+    candle, scores = asyncio.run(run())
+    assert (candle[b"open"], candle[b"high"], candle[b"low"], candle[b"close"], candle[b"volume"]) == (b"10", b"12", b"9", b"9", b"6")
+    # 5분봉 14:30 -> 마감 14:35
+    assert scores == [(b"realtime:bars:5m:1:202401021430", float(to_epoch(datetime(2024, 1, 2, 14, 35))))]
+
+
+def upsert(table, batch):
+    """DataProcessor 저장 경로의 덮어쓰기 UPSERT ((asset_id, 시각)별 마지막 값)"""
+    for row in batch.as_dicts():
+        table[(row["asset_id"], row["timestamp_utc"])] = (row["open"], row["high"], row["low"], row["close"], row["volume"])
+
+
+def test_collector_snapshots_flush_every_cycle():
+    async def run():
+        manager = make_manager()
+        bar = {"asset_id": 1, "interval": "1d", "timestamp_utc": "2024-01-02T00:00:00",
+               "open_price": 1, "high_price": 2, "low_price": 0.5, "close_price": 1.5, "volume": 10}
+        table = {}
+        # 진행 중인 일봉도 다음 flush 주기에 저장
+        await manager.add_bars_batch([bar])
+        first = await manager.get_completed_bars("1d", now=datetime.utcnow() + timedelta(seconds=10))
+        upsert(table, first)
+        await manager.ack_completed_bars(first)
+        # 수집기가 같은 봉을 갱신해서 다시 보냄 -> 합산하지 않고 스냅샷 그대로
+        await manager.add_bars_batch([{**bar, "close_price": 1.8, "volume": 12}])
+        second = await manager.get_completed_bars("1d", now=datetime.utcnow() + timedelta(seconds=10))
+        upsert(table, second)
+        await manager.ack_completed_bars(second)
+        return first, second, table
+
+    first, second, table = asyncio.run(run())
+    assert len(first) == 1 and first.volume == [10.0]
+    assert second.close == [1.8] and second.volume == [12.0]
+    assert table == {(1, datetime(2024, 1, 2)): (1.0, 2.0, 0.5, 1.8, 12.0)}
+
+
+def test_late_ticks_merge_into_stored_bar_and_failed_flush_is_retried():
+    async def run():
+        manager = make_manager()
+        t = datetime(2024, 1, 2, 14, 30, 10)
+        await manager.aggregate_ticks_batch([(1, 10.0, 2, t), (1, 12.0, 3, t)], intervals=["1m"])
+        now = datetime(2024, 1, 2, 14, 32)
+        first = await manager.get_completed_bars("1m", now=now)
+        # 저장 실패 -> ack 없이 다시 조회하면 같은 claim
+        retried = await manager.get_completed_bars("1m", now=now)
+        table = {}
+        upsert(table, retried)
+        # claim 이후 늦게 도착한 틱 -> 새 해시
+        await manager.aggregate_ticks_batch([(1, 9.0, 5, t), (1, 11.0, 1, t)], intervals=["1m"])
+        await manager.ack_completed_bars(retried)
+        late = await manager.get_completed_bars("1m", now=now)
+        upsert(table, late)
+        await manager.ack_completed_bars(late)
+        leftovers = (
+            await manager.redis_client.zcard(index_key("1m")),
+            await manager.redis_client.zcard(claim_index_key("1m")),
+            sorted(await manager.redis_client.keys("realtime:bars:*")),
+        )
+        return first, retried, late, table, leftovers
+
+    first, retried, late, table, leftovers = asyncio.run(run())
+    assert first.keys == retried.keys and first.volume == [5.0]
+    # 늦은 조각은 저장된 봉과 합쳐 전체 봉으로 다시 저장 (open 유지, high/low 확장, volume 합산, close는 마지막 틱)
+    assert (late.open, late.high, late.low, late.close, late.volume) == ([10.0], [12.0], [9.0], [11.0], [11.0])
+    assert table == {(1, datetime(2024, 1, 2, 14, 30)): (10.0, 12.0, 9.0, 11.0, 11.0)}
+    # 저장이 끝난 봉은 flushed 키로만 남음 (LATE_MERGE_SECONDS 후 만료)
+    assert leftovers == (0, 0, [b"realtime:bars:1m:1:202401021430:flushed"])
@@ -0,0 +1,293 @@
+"""
+공급자 상태/지연 통계와 헤지(hedged) 폴백 실행
+- 기존: ApiStrategyManager.get_ohlcv가 공급자를 순서대로 하나씩 시도 -> 느린 공급자 하나가 타임아웃까지 기다린 시간이
+  자산마다 수집 지연에 그대로 더해짐
+- run_hedged: 첫 공급자를 바로 시작하고, 그 공급자의 최근 p95 지연 안에 답이 없으면 다음 공급자를 헤지로 추가 시작.
+  유효한 데이터를 먼저 돌려준 쪽이 이기고 나머지는 취소. 실패한 시도가 있으면 다음 공급자를 바로 시작 (기존 폴백)
+  * max_parallel=1 이면 기존 순차 폴백과 동일
+  * 헤지는 can_hedge(후보)가 True일 때만 시작 (예: 기다리지 않고 rate limit 토큰을 얻을 수 있을 때).
+    확인은 실행 중인 시도와 동시에 기다리므로 그 사이 시도가 끝나면 바로 처리
+- ProviderHealth: 공급자별 최근 지연 슬라이딩 윈도우, 성공/실패/연속 실패, 헤지 시작/승리/취소 횟수,
+  정책별 수집 지연(p50/p95/p99). 모듈 싱글톤 provider_health 로 호출/인스턴스/스레드 간 유지
+  * 답을 받지 못한 시도(헤지에 져서 취소, 타임아웃 등으로 실패)는 실제 지연이 경과 시간 이상인 중도 절단 표본.
+    현재 p95(표본이 없으면 기본 헤지 지연) 이상이면 경과 시간을 지연 표본으로 넣음
+    -> 느린 시도가 취소/실패로 통계에서 빠져 p95가 실제보다 짧아지지 않음 (더 짧은 절단 표본은 정보가 없어 제외)
+"""
+import asyncio
+import os
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Deque, Dict, Generic, List, Optional, Sequence, Tuple, TypeVar
+
+LATENCY_WINDOW = int(os.getenv("PROVIDER_LATENCY_WINDOW", "200"))
+COLLECTION_WINDOW = int(os.getenv("OHLCV_COLLECTION_LATENCY_WINDOW", "1000"))
+HEDGE_MIN_SAMPLES = 10
+HEDGE_DEFAULT_DELAY_SECONDS = 5.0
+HEDGE_MIN_DELAY_SECONDS = 0.2
+UNHEALTHY_CONSECUTIVE_FAILURES = 3
+
+T = TypeVar("T")
+
+
+def quantile(values: Sequence[float], q: float) -> Optional[float]:
+    """정렬 후 최근접 순위 분위수 (값이 없으면 None)"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(q * len(ordered) + 0.999999) - 1))
+    return ordered[index]
+
+
+class ProviderStats:
+    """공급자 하나의 최근 지연/성공 통계"""
+
+    def __init__(self, window: int = LATENCY_WINDOW):
+        self.latencies: Deque[float] = deque(maxlen=window)
+        self.successes = 0
+        self.failures = 0
+        self.consecutive_failures = 0
+        self.hedges_started = 0
+        self.hedges_won = 0
+        self.cancelled = 0
+
+    def observe(self, seconds: float, ok: bool) -> None:
+        if ok:
+            self.latencies.append(seconds)
+            self.successes += 1
+            self.consecutive_failures = 0
+        else:
+            self.failures += 1
+            self.consecutive_failures += 1
+            self.observe_censored(seconds)
+
+    def observe_censored(self, seconds: float) -> None:
+        """답 없이 끝난 시도 (실제 지연 >= seconds)"""
+        p95 = quantile(list(self.latencies), 0.95)
+        if seconds >= (p95 if p95 is not None else HEDGE_DEFAULT_DELAY_SECONDS):
+            self.latencies.append(seconds)
+
+    def snapshot(self) -> Dict[str, Any]:
+        latencies = list(self.latencies)
+        return {
+            "successes": self.successes,
+            "failures": self.failures,
+            "consecutive_failures": self.consecutive_failures,
+            "p50_seconds": quantile(latencies, 0.5),
+            "p95_seconds": quantile(latencies, 0.95),
+            "hedges_started": self.hedges_started,
+            "hedges_won": self.hedges_won,
+            "cancelled": self.cancelled,
+        }
+
+
+class ProviderHealth:
+    """공급자별 통계 + 정책별 수집 지연 (스레드 안전)"""
+
+    def __init__(self, window: int = LATENCY_WINDOW, collection_window: int = COLLECTION_WINDOW):
+        self.window = window
+        self.collection_window = collection_window
+        self._providers: Dict[str, ProviderStats] = {}
+        self._collections: Dict[str, Deque[float]] = {}
+        self._collection_counts: Dict[str, Dict[str, int]] = {}
+        self._lock = threading.Lock()
+
+    def _stats(self, provider: str) -> ProviderStats:
+        stats = self._providers.get(provider)
+        if stats is None:
+            stats = self._providers.setdefault(provider, ProviderStats(self.window))
+        return stats
+
+    def observe(self, provider: str, seconds: float, ok: bool) -> None:
+        with self._lock:
+            self._stats(provider).observe(seconds, ok)
+
+    def observe_cancelled(self, provider: str, seconds: float) -> None:
+        """취소된 시도의 경과 시간 (성공/실패 횟수에는 넣지 않음)"""
+        with self._lock:
+            self._stats(provider).observe_censored(seconds)
+
+    def record(self, provider: str, event: str) -> None:
+        """hedges_started / hedges_won / cancelled 카운터 증가"""
+        with self._lock:
+            stats = self._stats(provider)
+            setattr(stats, event, getattr(stats, event) + 1)
+
+    def hedge_delay(
+        self,
+        provider: str,
+        default: float = HEDGE_DEFAULT_DELAY_SECONDS,
+        min_samples: int = HEDGE_MIN_SAMPLES,
+        minimum: float = HEDGE_MIN_DELAY_SECONDS,
+    ) -> float:
+        """
+        헤지 시작까지 기다릴 시간
+        최근 연속 실패가 많으면 0 (바로 헤지), 표본이 부족하면 default, 아니면 p95 (minimum 이상)
+        """
+        with self._lock:
+            stats = self._stats(provider)
+            if stats.consecutive_failures >= UNHEALTHY_CONSECUTIVE_FAILURES:
+                return 0.0
+            latencies = list(stats.latencies)
+        if len(latencies) < min_samples:
+            return default
+        return max(minimum, quantile(latencies, 0.95))
+
+    def observe_collection(self, policy: str, seconds: float, ok: bool) -> int:
+        """get_ohlcv 한 번의 공급자 시도 구간 지연 기록 -> 해당 정책의 누적 수집 횟수"""
+        with self._lock:
+            window = self._collections.setdefault(policy, deque(maxlen=self.collection_window))
+            window.append(seconds)
+            counts = self._collection_counts.setdefault(policy, {"count": 0, "failed": 0})
+            counts["count"] += 1
+            counts["failed"] += 0 if ok else 1
+            return counts["count"]
+
+    def collection_summary(self, policy: str) -> str:
+        with self._lock:
+            latencies = list(self._collections.get(policy, ()))
+            counts = dict(self._collection_counts.get(policy, {"count": 0, "failed": 0}))
+        if not latencies:
+            return f"[{policy}] n=0"
+        return (
+            f"[{policy}] n={counts['count']:,} (실패 {counts['failed']:,}), 최근 {len(latencies)}건 "
+            f"p50={quantile(latencies, 0.5):.2f}s p95={quantile(latencies, 0.95):.2f}s p99={quantile(latencies, 0.99):.2f}s"
+        )
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            providers = {name: stats.snapshot() for name, stats in self._providers.items()}
+            collections = {
+                policy: {
+                    **self._collection_counts.get(policy, {}),
+                    "window": len(latencies),
+                    "p50_seconds": quantile(list(latencies), 0.5),
+                    "p95_seconds": quantile(list(latencies), 0.95),
+                    "p99_seconds": quantile(list(latencies), 0.99),
+                }
+                for policy, latencies in self._collections.items()
+            }
+        return {"providers": providers, "collections": collections}
+
+
+@dataclass
+class HedgeOutcome(Generic[T]):
+    result: Any = None
+    winner: Optional[T] = None
+    failures: List[str] = field(default_factory=list)
+    hedges: int = 0
+
+
+async def run_hedged(
+    candidates: Sequence[T],
+    attempt: Callable[[T, bool], Awaitable[Tuple[Any, Optional[str]]]],
+    hedge_delay: Callable[[T], float],
+    can_hedge: Optional[Callable[[T], Awaitable[bool]]] = None,
+    max_parallel: int = 2,
+    on_event: Optional[Callable[[T, str], None]] = None,
+) -> HedgeOutcome:
+    """
+    candidates를 우선순위 순서로 시도
+    attempt(후보, hedged) -> (결과, 실패 사유). 결과가 None이 아니면 성공. hedged=True는 can_hedge를 통과해 시작된 헤지
+    hedge_delay(후보): 이 후보를 시작한 뒤 다음 후보를 헤지로 시작하기까지 기다릴 초
+    on_event(후보, 'hedges_started' | 'hedges_won' | 'cancelled')
+    동시에 성공하면 우선순위가 높은 후보의 결과 사용
+    """
+    outcome = HedgeOutcome()
+    order = {id(c): i for i, c in enumerate(candidates)}
+    queue = list(candidates)
+    running: Dict[asyncio.Task, T] = {}
+    hedged_tasks = set()
+    last_started = 0.0
+    last_delay = 0.0
+    hedging = max_parallel > 1
+    # 진행 중인 헤지 가능 여부 확인 (queue[0] 대상)
+    probe: Optional[asyncio.Task] = None
+
+    def start(candidate: T, hedged: bool) -> None:
+        nonlocal last_started, last_delay
+        task = asyncio.ensure_future(attempt(candidate, hedged))
+        running[task] = candidate
+        if hedged:
+            hedged_tasks.add(task)
+            outcome.hedges += 1
+            if on_event:
+                on_event(candidate, "hedges_started")
+        last_started = time.monotonic()
+        last_delay = hedge_delay(candidate)
+
+    def drop_probe() -> None:
+        nonlocal probe
+        if probe is not None:
+            probe.cancel()
+            probe = None
+
+    try:
+        while running or queue:
+            if not running:
+                # 확인 중이던 후보를 순차 폴백으로 바로 시작
+                drop_probe()
+                start(queue.pop(0), False)
+                continue
+
+            timeout = None
+            if hedging and probe is None and queue and len(running) < max_parallel:
+                timeout = max(0.0, last_started + last_delay - time.monotonic())
+            waiting = list(running) + ([probe] if probe is not None else [])
+            done, _ = await asyncio.wait(waiting, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+
+            if not done:
+                # 헤지 시작 시점: 다음 후보가 바로 시작 가능할 때만 (확인하는 동안에도 실행 중인 시도의 완료를 처리)
+                if can_hedge is None:
+                    start(queue.pop(0), True)
+                else:
+                    probe = asyncio.ensure_future(can_hedge(queue[0]))
+                continue
+
+            if probe is not None and probe in done:
+                done.discard(probe)
+                allowed = not probe.cancelled() and probe.exception() is None and probe.result()
+                probe = None
+                if allowed and queue and len(running) < max_parallel:
+                    start(queue.pop(0), True)
+                elif not allowed:
+                    hedging = False
+                if not done:
+                    continue
+
+            winners = []
+            for task in sorted(done, key=lambda t: order[id(running[t])]):
+                candidate = running.pop(task)
+                try:
+                    result, reason = task.result()
+                except Exception as e:
+                    result, reason = None, f"{candidate.__class__.__name__} failed: {e}"
+                if result is not None:
+                    winners.append((task, candidate, result))
+                else:
+                    outcome.failures.append(reason or f"{candidate.__class__.__name__} failed")
+            if winners:
+                task, candidate, result = winners[0]
+                outcome.result, outcome.winner = result, candidate
+                if task in hedged_tasks and on_event:
+                    on_event(candidate, "hedges_won")
+                return outcome
+            # 실패한 만큼 다음 후보를 바로 시작 (순차 폴백과 동일, 확인 중이던 후보면 확인은 취소)
+            for _ in range(len(done)):
+                if queue and len(running) < max_parallel:
+                    drop_probe()
+                    start(queue.pop(0), False)
+        return outcome
+    finally:
+        pending = [probe] if probe is not None else []
+        drop_probe()
+        for task, candidate in running.items():
+            task.cancel()
+            if on_event:
+                on_event(candidate, "cancelled")
+        if running or pending:
+            await asyncio.gather(*running, *pending, return_exceptions=True)
+
+
+provider_health = ProviderHealth()
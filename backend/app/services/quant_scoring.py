@@ -6,6 +6,7 @@ from datetime import datetime
 import logging
 
 from app.models.asset import Asset, OHLCVData, CryptoMetric
+from app.services.indicator_store import indicator_store
 
 logger = logging.getLogger(__name__)
 
@@ -39,19 +40,12 @@ class QuantScoringEngine:
         return df
 
     def get_price_df(self, asset_id: int) -> pd.DataFrame:
-        """Fetch OHLCV price as a Pandas DataFrame."""
-        records = self.db.query(
-            OHLCVData.timestamp_utc,
-            OHLCVData.close_price
-        ).filter(OHLCVData.asset_id == asset_id).order_by(OHLCVData.timestamp_utc).all()
-
-        if not records:
+        """Fetch daily close price as a Pandas DataFrame (indicator_store의 증분 캐시 사용)."""
+        timestamps, close = indicator_store.series(self.db, asset_id, '1d')
+        if not len(timestamps):
             return pd.DataFrame()
 
-        df = pd.DataFrame(records)
-        df.set_index('timestamp_utc', inplace=True)
-        df.index = pd.to_datetime(df.index).normalize()
-        df['close_price'] = pd.to_numeric(df['close_price'], errors='coerce')
+        df = pd.DataFrame({'close_price': close}, index=pd.DatetimeIndex(timestamps, name='timestamp_utc').normalize())
         df = df[~df.index.duplicated(keep='last')]
         return df
 
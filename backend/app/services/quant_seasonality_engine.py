@@ -6,6 +6,7 @@ import logging
 from typing import Dict, Any, List, Optional
 
 from app.models.asset import Asset, OHLCVData, OHLCVIntradayData, EconomicIndicator
+from app.services.indicator_store import calculate_rsi, indicator_store
 
 logger = logging.getLogger(__name__)
 
@@ -236,14 +237,12 @@ class QuantSeasonalityEngine:
 
     def calculate_rsi(self, series: pd.Series, window: int = 14) -> pd.Series:
         """Calculate Relative Strength Index."""
-        delta = series.diff()
-        gain = (delta.where(delta > 0, 0)).rolling(window=window).mean()
-        loss = (-delta.where(delta < 0, 0)).rolling(window=window).mean()
-        rs = gain / loss
-        return 100 - (100 / (1 + rs))
-
-    def calculate_rsi_strategy_backtest(self, df: pd.DataFrame, rsi_buy: float = 30, rsi_sell: float = 70) -> Dict[str, Any]:
-        """Simulate RSI strategy: Buy < rsi_buy, Sell > rsi_sell across timeframes."""
+        return calculate_rsi(series, window)
+
+    def calculate_rsi_strategy_backtest(self, df: pd.DataFrame, rsi_buy: float = 30, rsi_sell: float = 70,
+                                        asset_id: Optional[int] = None) -> Dict[str, Any]:
+        """Simulate RSI strategy: Buy < rsi_buy, Sell > rsi_sell across timeframes.
+        asset_id가 주어지면 1h RSI는 indicator_store의 캐시된 시계열을 사용."""
         if df.empty:
             return {}
 
@@ -265,7 +264,10 @@ class QuantSeasonalityEngine:
             if len(tf_df) < 30: # Need enough data for RSI and trades
                 continue
 
-            rsi = self.calculate_rsi(tf_df)
+            if rule is None and asset_id is not None:
+                rsi = indicator_store.align(self.db, asset_id, '1h', 'rsi', 14, tf_df.index)
+            else:
+                rsi = self.calculate_rsi(tf_df)
             
             trades = []
             holding = False
@@ -334,7 +336,8 @@ class QuantSeasonalityEngine:
         seasonality = self.calculate_monthly_seasonality(btc_daily, rate_regime)
         correlation = self.calculate_rolling_correlation(btc_daily, other_daily)
         intraday = self.calculate_intraday_effect(btc_hourly, tz_offset=tz_offset)
-        rsi_backtest = self.calculate_rsi_strategy_backtest(btc_hourly, rsi_buy=rsi_buy, rsi_sell=rsi_sell)
+        rsi_backtest = self.calculate_rsi_strategy_backtest(btc_hourly, rsi_buy=rsi_buy, rsi_sell=rsi_sell,
+                                                            asset_id=btc_asset_id)
         
         return {
             "generated_at": datetime.utcnow().isoformat() + "Z",
@@ -0,0 +1,482 @@
+"""
+API Rate Limiter - 공급자(+API 키)별 토큰 버킷, 수집기/프로세스 간 공유
+- 기존: ApiStrategyManager 인스턴스마다 최근 1분 호출 시각 리스트를 매 호출 다시 만들고, 한도를 넘으면 가장 오래된
+  호출이 만료될 때까지 대기. 스케줄러 잡마다 ApiStrategyManager를 새로 만들어 병렬 잡끼리 한도가 공유되지 않았음
+- 한도: 클라이언트 get_rate_limit_info()['free_tier'] 와 app/utils/api_client_free_plan_limit.json 의 free_plan 중
+  기간(초/분/시/일)별로 더 엄격한 값. 기간마다 버킷 하나 (용량 = 한도, 기간 동안 한도만큼 연속 충전)
+  * 여러 API 키를 순환하는 클라이언트(api_keys)는 키 묶음 하나를 버킷 단위로 보고 한도 x 키 수
+- 토큰 차감: Redis Lua 스크립트 하나로 모든 기간 버킷을 원자적으로 확인/차감 (Redis TIME 기준, 키당 O(1))
+  * 한도가 큰 공급자는 토큰을 묶음(리스)으로 받아 프로세스 안에서 소진 (Redis 왕복 감소). 리스 크기는 직전
+    LEASE_TTL_SECONDS 동안의 호출 수(최대 최소 버킷 용량의 LEASE_FRACTION) -> 호출이 드문 경우 호출당 토큰 1개만
+    차감하고, 만료되는 미사용 리스 토큰은 지속적인 수요가 있을 때의 한 구간 분량 이하
+  * Redis를 쓸 수 없으면 같은 계산을 프로세스 내 버킷으로 수행 (REDIS_RETRY_SECONDS 후 재시도)
+- 대기: 게이트(공급자 + 키)마다 FIFO. 맨 앞 대기자만 토큰을 확인하며 잠들고, 토큰을 얻으면 다음 대기자를 깨움
+  (스케줄러 잡은 스레드마다 asyncio.run을 쓰므로 깨우기는 대기자 루프의 call_soon_threadsafe)
+- 필요한 대기가 max_wait를 넘으면 False를 돌려 호출자가 다음 공급자로 넘어가게 함
+- stats(): 프로세스 내 허용/대기/거절 횟수와 대기 시간, utilization(): Redis 버킷 잔량 기준 사용률 (전 프로세스 공통)
+"""
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+import time
+from collections import deque
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+
+import redis.asyncio as redis
+
+logger = logging.getLogger(__name__)
+
+RATE_LIMIT_BACKEND = os.getenv("RATE_LIMIT_BACKEND", "redis").lower()
+MAX_WAIT_SECONDS = float(os.getenv("RATE_LIMIT_MAX_WAIT_SECONDS", "60"))
+LEASE_FRACTION = float(os.getenv("RATE_LIMIT_LEASE_FRACTION", "0.05"))
+LEASE_TTL_SECONDS = 1.0
+REDIS_RETRY_SECONDS = 30.0
+KEY_PREFIX = "ratelimit"
+
+PLAN_LIMITS_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), "utils", "api_client_free_plan_limit.json")
+PERIOD_SECONDS = {"second": 1, "minute": 60, "hour": 3600, "day": 86400}
+LIMIT_KEY = re.compile(r"(?:calls|requests)_per_(second|minute|hour|day)")
+
+# KEYS: 기간별 버킷, ARGV: [요청 토큰 수, 용량1, 기간1(ms), 용량2, 기간2(ms), ...]
+# 반환: {허용 토큰 수, 대기(ms), 가장 적게 남은 버킷의 잔량 비율}
+TAKE_TOKENS_LUA = """
+local t = redis.call('TIME')
+local now = tonumber(t[1]) * 1000 + math.floor(tonumber(t[2]) / 1000)
+local grant = tonumber(ARGV[1])
+local wait = 0
+local tokens = {}
+for i, key in ipairs(KEYS) do
+    local capacity = tonumber(ARGV[2 * i])
+    local period = tonumber(ARGV[2 * i + 1])
+    local state = redis.call('HMGET', key, 'tokens', 'ts')
+    local current = tonumber(state[1])
+    local ts = tonumber(state[2])
+    if current == nil or ts == nil then
+        current = capacity
+        ts = now
+    end
+    current = math.min(capacity, current + math.max(0, now - ts) * capacity / period)
+    tokens[i] = current
+    if math.floor(current) < grant then
+        grant = math.floor(current)
+    end
+    if current < 1 then
+        wait = math.max(wait, (1 - current) * period / capacity)
+    end
+end
+if grant < 1 then
+    grant = 0
+end
+local remaining = 1
+for i, key in ipairs(KEYS) do
+    local capacity = tonumber(ARGV[2 * i])
+    local period = tonumber(ARGV[2 * i + 1])
+    local left = tokens[i] - grant
+    redis.call('HSET', key, 'tokens', tostring(left), 'ts', tostring(now), 'capacity', capacity, 'period', period)
+    redis.call('PEXPIRE', key, period * 2)
+    remaining = math.min(remaining, left / capacity)
+end
+return {grant, math.ceil(wait), tostring(remaining)}
+"""
+
+
+@lru_cache(maxsize=1)
+def _plan_limits() -> Dict[str, Dict[str, Any]]:
+    try:
+        with open(PLAN_LIMITS_PATH, encoding="utf-8") as f:
+            return {name: info.get("free_plan") or {} for name, info in json.load(f).get("api_clients", {}).items()}
+    except Exception as e:
+        logger.warning(f"⚠️ API 무료 플랜 한도 파일을 읽지 못했습니다: {e}")
+        return {}
+
+
+def _limit_value(value) -> Optional[int]:
+    """정수 또는 '10-30' 같은 범위 (보수적으로 하한)"""
+    if isinstance(value, bool) or value is None:
+        return None
+    if isinstance(value, (int, float)):
+        return int(value) if value > 0 else None
+    match = re.match(r"\s*(\d+)", str(value))
+    return int(match.group(1)) if match and int(match.group(1)) > 0 else None
+
+
+def parse_limits(*sources: Optional[Dict[str, Any]]) -> Tuple[Tuple[int, int], ...]:
+    """한도 dict들 -> ((용량, 기간 초), ...) 기간 오름차순, 같은 기간은 가장 작은 값"""
+    limits: Dict[int, int] = {}
+    for source in sources:
+        for key, value in (source or {}).items():
+            match = LIMIT_KEY.fullmatch(str(key))
+            calls = _limit_value(value) if match else None
+            if calls:
+                period = PERIOD_SECONDS[match.group(1)]
+                limits[period] = min(calls, limits.get(period, calls))
+    return tuple((calls, period) for period, calls in sorted(limits.items()))
+
+
+def take_tokens(
+    state: Dict[int, List[float]],
+    limits: Tuple[Tuple[int, int], ...],
+    requested: int,
+    now: float,
+) -> Tuple[int, float, float]:
+    """
+    TAKE_TOKENS_LUA 와 같은 계산을 프로세스 내 상태로 수행
+    state: 기간 -> [토큰, 마지막 갱신 시각(초)], 반환: (허용 토큰 수, 대기 초, 최소 잔량 비율)
+    """
+    grant = requested
+    wait = 0.0
+    current = {}
+    for capacity, period in limits:
+        tokens, ts = state.get(period, (capacity, now))
+        tokens = min(capacity, tokens + max(0.0, now - ts) * capacity / period)
+        current[period] = tokens
+        grant = min(grant, int(tokens))
+        if tokens < 1:
+            wait = max(wait, (1 - tokens) * period / capacity)
+    grant = max(grant, 0)
+    remaining = 1.0
+    for capacity, period in limits:
+        left = current[period] - grant
+        state[period] = [left, now]
+        remaining = min(remaining, left / capacity)
+    return grant, wait, remaining
+
+
+class _Gate:
+    """공급자 + API 키 하나의 버킷 묶음, 리스 토큰, FIFO 대기열"""
+
+    def __init__(self, provider: str, key_id: str, limits: Tuple[Tuple[int, int], ...]):
+        self.provider = provider
+        self.key_id = key_id
+        self.limits = limits
+        self.redis_keys = [f"{KEY_PREFIX}:{provider}:{key_id}:{period}" for _, period in limits]
+        self.lease_size = max(1, int(min(capacity for capacity, _ in limits) * LEASE_FRACTION))
+        self.lock = threading.Lock()
+        self.leased = 0
+        self.lease_expires = 0.0
+        # 리스 크기 산정용 호출 수 (현재 / 직전 LEASE_TTL_SECONDS 구간)
+        self.demand = 0
+        self.prev_demand = 0
+        self.demand_started = 0.0
+        self.local_state: Dict[int, List[float]] = {}
+        self.waiters: deque = deque()
+        self.busy = False
+        self.remaining = 1.0
+        self.stats = {"granted": 0, "waited": 0, "rejected": 0, "wait_seconds": 0.0, "max_wait_seconds": 0.0}
+
+    def record_demand(self) -> None:
+        """토큰 요청 1회 기록"""
+        with self.lock:
+            now = time.monotonic()
+            elapsed = now - self.demand_started
+            if elapsed >= LEASE_TTL_SECONDS:
+                # 바로 직전 구간이 아니면(호출이 끊겼으면) 수요 없음으로 봄
+                self.prev_demand = self.demand if elapsed < 2 * LEASE_TTL_SECONDS else 0
+                self.demand = 0
+                self.demand_started = now
+            self.demand += 1
+
+    def lease_request(self) -> int:
+        """이번에 받을 토큰 수: 최근 수요만큼 (1 이상 lease_size 이하)"""
+        with self.lock:
+            return max(1, min(self.lease_size, max(self.demand, self.prev_demand)))
+
+    def take_leased(self, fast_path: bool = False) -> bool:
+        with self.lock:
+            if fast_path and (self.busy or self.waiters):
+                return False
+            if self.leased > 0 and time.monotonic() < self.lease_expires:
+                self.leased -= 1
+                self.stats["granted"] += 1
+                return True
+            return False
+
+    def store_lease(self, granted: int, remaining: float) -> None:
+        with self.lock:
+            self.leased = granted - 1
+            self.lease_expires = time.monotonic() + LEASE_TTL_SECONDS
+            self.remaining = remaining
+            self.stats["granted"] += 1
+
+    def enqueue(self) -> Optional[asyncio.Future]:
+        """맨 앞이 되면 None, 아니면 차례가 오면 완료되는 future"""
+        with self.lock:
+            if not self.busy and not self.waiters:
+                self.busy = True
+                return None
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            self.waiters.append((loop, future))
+            return future
+
+    def try_enter(self) -> bool:
+        """대기 없이 맨 앞이 될 수 있을 때만 차례를 잡음 (release_head 필요)"""
+        with self.lock:
+            if self.busy or self.waiters:
+                return False
+            self.busy = True
+            return True
+
+    def release_head(self) -> None:
+        """다음 대기자에게 차례를 넘김 (없으면 비움)"""
+        with self.lock:
+            while self.waiters:
+                loop, future = self.waiters.popleft()
+                if future.done():
+                    continue
+                try:
+                    loop.call_soon_threadsafe(self._wake, future)
+                    return
+                except RuntimeError:
+                    # 대기자 루프가 이미 닫힘
+                    continue
+            self.busy = False
+
+    def _wake(self, future: asyncio.Future) -> None:
+        if future.done():
+            # 깨우기 전에 취소된 대기자 -> 다음 대기자에게
+            self.release_head()
+        else:
+            future.set_result(None)
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "provider": self.provider,
+            "key": self.key_id,
+            "limits": {f"per_{period}s": capacity for capacity, period in self.limits},
+            "waiters": len(self.waiters) + (1 if self.busy else 0),
+            "utilization": round(1 - max(0.0, self.remaining), 4),
+            **self.stats,
+        }
+
+
+class RateLimiter:
+    """공급자별 토큰 버킷 (모듈 싱글톤 rate_limiter 사용)"""
+
+    def __init__(self, backend: str = RATE_LIMIT_BACKEND):
+        self.backend = backend
+        self._gates: Dict[Tuple[str, str], _Gate] = {}
+        self._gates_lock = threading.Lock()
+        self._clients: Dict[asyncio.AbstractEventLoop, Any] = {}
+        self._clients_lock = threading.Lock()
+        self._redis_down_until = 0.0
+
+    # ---- 게이트 / 한도 ----
+
+    @staticmethod
+    def _key_identity(client, api_key: Optional[str]) -> Tuple[str, int]:
+        if api_key:
+            keys = [api_key]
+        else:
+            keys = [k for k in (getattr(client, "api_keys", None) or []) if k]
+            if not keys and getattr(client, "api_key", None):
+                keys = [client.api_key]
+        if not keys:
+            return "default", 1
+        keys = sorted(set(map(str, keys)))
+        return hashlib.sha1("|".join(keys).encode("utf-8")).hexdigest()[:12], len(keys)
+
+    def _gate(self, provider: str, client=None, api_key: Optional[str] = None) -> Optional[_Gate]:
+        key_id, key_count = self._key_identity(client, api_key)
+        gate = self._gates.get((provider, key_id))
+        if gate is not None:
+            return gate
+
+        client_limits = None
+        if client is not None and hasattr(client, "get_rate_limit_info"):
+            try:
+                client_limits = (client.get_rate_limit_info() or {}).get("free_tier")
+            except Exception as e:
+                logger.warning(f"Failed to get rate limit info for {provider}: {e}")
+        limits = parse_limits(client_limits, _plan_limits().get(provider))
+        limits = tuple((capacity * key_count, period) for capacity, period in limits)
+        with self._gates_lock:
+            gate = self._gates.get((provider, key_id))
+            if gate is None:
+                gate = _Gate(provider, key_id, limits) if limits else None
+                if gate is not None:
+                    self._gates[(provider, key_id)] = gate
+                    logger.info(f"🚦 Rate limit gate: {provider} ({key_count} key) {gate.snapshot()['limits']}, lease {gate.lease_size}")
+        return gate
+
+    # ---- Redis ----
+
+    async def _redis(self):
+        if self.backend != "redis" or time.monotonic() < self._redis_down_until:
+            return None
+        loop = asyncio.get_running_loop()
+        with self._clients_lock:
+            for stale in [l for l in self._clients if l.is_closed()]:
+                del self._clients[stale]
+            entry = self._clients.get(loop)
+        if entry is not None:
+            return entry
+        try:
+            password = os.getenv("REDIS_PASSWORD") or None
+            client = redis.from_url(
+                f"redis://{os.getenv('REDIS_HOST', 'redis')}:{os.getenv('REDIS_PORT', '6379')}/{os.getenv('REDIS_DB', '0')}",
+                password=password,
+            )
+            await client.ping()
+            entry = (client, client.register_script(TAKE_TOKENS_LUA))
+        except Exception as e:
+            self._redis_down_until = time.monotonic() + REDIS_RETRY_SECONDS
+            logger.warning(f"⚠️ Rate limiter Redis 연결 실패, 프로세스 내 버킷 사용: {e}")
+            return None
+        with self._clients_lock:
+            self._clients[loop] = entry
+        return entry
+
+    async def _take(self, gate: _Gate) -> float:
+        """토큰 하나 확보 시도 -> 0이면 허용, 아니면 대기할 초"""
+        if gate.take_leased():
+            return 0.0
+        entry = await self._redis()
+        result = None
+        if entry is not None:
+            _, script = entry
+            args = [gate.lease_request()]
+            for capacity, period in gate.limits:
+                args += [capacity, period * 1000]
+            try:
+                granted, wait_ms, remaining = await script(keys=gate.redis_keys, args=args)
+                result = (int(granted), int(wait_ms) / 1000, float(remaining))
+            except Exception as e:
+                self._redis_down_until = time.monotonic() + REDIS_RETRY_SECONDS
+                with self._clients_lock:
+                    self._clients.pop(asyncio.get_running_loop(), None)
+                logger.warning(f"⚠️ Rate limiter Redis 스크립트 실패, 프로세스 내 버킷 사용: {e}")
+        if result is None:
+            requested = gate.lease_request()
+            with gate.lock:
+                result = take_tokens(gate.local_state, gate.limits, requested, time.monotonic())
+
+        granted, wait, remaining = result
+        if granted >= 1:
+            gate.store_lease(granted, remaining)
+            return 0.0
+        gate.remaining = remaining
+        return max(wait, 0.001)
+
+    # ---- 공개 API ----
+
+    async def acquire(self, provider: str, client=None, api_key: Optional[str] = None, max_wait: float = MAX_WAIT_SECONDS) -> bool:
+        """
+        호출 한 번 분량의 토큰을 확보할 때까지 순서대로 대기
+        한도 정보가 없는 공급자는 바로 True, 필요한 대기가 max_wait를 넘으면 False
+        """
+        gate = self._gate(provider, client, api_key)
+        if gate is None:
+            return True
+        gate.record_demand()
+        if gate.take_leased(fast_path=True):
+            return True
+
+        start = time.monotonic()
+        turn = gate.enqueue()
+        if turn is not None:
+            try:
+                await turn
+            except asyncio.CancelledError:
+                if turn.done() and not turn.cancelled():
+                    gate.release_head()
+                raise
+        try:
+            while True:
+                wait = await self._take(gate)
+                waited = time.monotonic() - start
+                if wait <= 0:
+                    if waited > 0.01:
+                        gate.stats["waited"] += 1
+                        gate.stats["wait_seconds"] += waited
+                        gate.stats["max_wait_seconds"] = max(gate.stats["max_wait_seconds"], waited)
+                    return True
+                if waited + wait > max_wait:
+                    gate.stats["rejected"] += 1
+                    logger.warning(f"Rate limit exceeded for {provider}: next token in {wait:.1f}s (max wait {max_wait:.0f}s)")
+                    return False
+                await asyncio.sleep(wait)
+        finally:
+            gate.release_head()
+
+    async def try_acquire(self, provider: str, client=None, api_key: Optional[str] = None) -> bool:
+        """
+        기다리지 않고 토큰을 얻을 수 있을 때만 True (헤지 시작 여부 확인용)
+        대기 중인 호출이 있으면 줄을 서지 않고 바로 False, 아니면 확보 시도 한 번 (리스 또는 버킷 1회 조회)
+        """
+        gate = self._gate(provider, client, api_key)
+        if gate is None:
+            return True
+        gate.record_demand()
+        if gate.take_leased(fast_path=True):
+            return True
+        if not gate.try_enter():
+            return False
+        try:
+            if await self._take(gate) <= 0:
+                return True
+            gate.stats["rejected"] += 1
+            return False
+        finally:
+            gate.release_head()
+
+    def stats(self) -> List[Dict[str, Any]]:
+        """프로세스 내 게이트별 통계"""
+        return [gate.snapshot() for gate in list(self._gates.values())]
+
+    async def utilization(self) -> List[Dict[str, Any]]:
+        """
+        버킷별 사용률
+        Redis를 쓸 수 있으면 모든 프로세스가 만든 버킷(ratelimit:*)을 Redis TIME 기준으로, 아니면 이 프로세스의 버킷
+        """
+        entry = await self._redis()
+        if entry is None:
+            return self._local_utilization()
+
+        client = entry[0]
+        try:
+            seconds, micros = await client.time()
+            now_ms = seconds * 1000 + micros // 1000
+            gates: Dict[Tuple[str, str], Dict[str, Any]] = {}
+            async for raw_key in client.scan_iter(match=f"{KEY_PREFIX}:*", count=500):
+                key = raw_key.decode() if isinstance(raw_key, bytes) else raw_key
+                _, provider, key_id, _ = key.split(":", 3)
+                tokens, ts, capacity, period = await client.hmget(key, "tokens", "ts", "capacity", "period")
+                if None in (tokens, ts, capacity, period):
+                    continue
+                capacity, period_ms = float(capacity), float(period)
+                available = min(capacity, float(tokens) + max(0.0, now_ms - float(ts)) * capacity / period_ms)
+                gate = gates.setdefault((provider, key_id), {"provider": provider, "key": key_id, "buckets": {}})
+                gate["buckets"][f"per_{int(period_ms // 1000)}s"] = self._bucket(capacity, available)
+        except Exception as e:
+            logger.warning(f"⚠️ Rate limiter Redis 사용률 조회 실패: {e}")
+            return self._local_utilization()
+
+        local = {(gate.provider, gate.key_id): gate.snapshot() for gate in list(self._gates.values())}
+        return [
+            {**local.get(ident, {}), **gate, "shared": True}
+            for ident, gate in sorted(gates.items())
+        ]
+
+    @staticmethod
+    def _bucket(capacity: float, available: float) -> Dict[str, Any]:
+        return {"capacity": int(capacity), "available": round(available, 2), "utilization": round(1 - available / capacity, 4)}
+
+    def _local_utilization(self) -> List[Dict[str, Any]]:
+        result = []
+        now = time.monotonic()
+        for gate in list(self._gates.values()):
+            buckets = {}
+            for capacity, period in gate.limits:
+                tokens, ts = gate.local_state.get(period, (capacity, now))
+                available = min(capacity, tokens + max(0.0, now - ts) * capacity / period)
+                buckets[f"per_{period}s"] = self._bucket(capacity, available)
+            result.append({**gate.snapshot(), "buckets": buckets, "shared": False})
+        return result
+
+rate_limiter = RateLimiter()
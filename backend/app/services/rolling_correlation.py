@@ -0,0 +1,349 @@
+"""
+Rolling Correlation - 상위 N개 자산 유니버스의 상관계수 계산용 일봉 종가 매트릭스 사전 적재
+- 유니버스: world_assets_ranking 최신 ranking_date 의 rank 상위 N개 (asset_id 오름차순으로 고정)
+- 최근 (최대 창 365 + PRICE_BUFFER_DAYS) 달력일 x 자산 종가를 링 버퍼로 유지하고
+  매일 새로 닫힌 일봉만 조회해 한 행씩 갱신 (유니버스가 바뀌거나 REBUILD_INTERVAL_DAYS 마다 전체 재적재)
+- 결과는 rolling_correlation_snapshot 한 행에 저장
+  * result: 날짜 순서로 정렬한 종가 매트릭스 (API 슬라이스용)
+  * state: 증분 갱신용 링 버퍼
+- SchedulerService 일일 잡이 update_rolling_correlations 호출,
+  app/analysis/quantitative.py 의 calculate_correlation_matrix 는 저장 종가에 저장 이후 일봉을 이어 붙여
+  (RollingMatrices.price_matrix_through) DB 조회 경로와 같은 PriceMatrix 로 correlation_snapshot 계산
+  * 쌍별 달력일 수익률로 상관계수/베타를 미리 계산하면 주식/코인 혼합 집합의 공통 거래일 수익률과
+    결과가 달라지므로 상관계수는 요청 티커 집합마다 계산
+"""
+import io
+import json
+import logging
+import os
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+from sqlalchemy import text
+
+from app.services.cross_asset_analytics import PriceMatrix
+from app.services.ttl_cache import MISSING, TTLCache
+
+logger = logging.getLogger(__name__)
+
+ROLLING_WINDOWS = (30, 90, 365)
+UNIVERSE_NAME = 'top_assets'
+UNIVERSE_SIZE = int(os.getenv("ROLLING_CORRELATION_UNIVERSE_SIZE", "100"))
+REBUILD_INTERVAL_DAYS = int(os.getenv("ROLLING_CORRELATION_REBUILD_DAYS", "7"))
+CACHE_TTL_SECONDS = float(os.getenv("ROLLING_CORRELATION_CACHE_SECONDS", "300"))
+# calculate_correlation_matrix 는 (days + 30) 달력일 전부터 조회하므로 종가는 최대 창보다 그만큼 더 보관
+PRICE_BUFFER_DAYS = 30
+# 결과가 이보다 오래되면 API가 사용하지 않음 (잡 장애 시 기존 경로로, 그 사이 일봉은 요청 시 조회)
+MAX_STALE_DAYS = 3
+
+UNIVERSE_QUERY = text("""
+    SELECT u.asset_id, u.ticker, u.name, u.type_name
+    FROM (
+        SELECT DISTINCT ON (w.asset_id) w.asset_id, w.rank, a.ticker, a.name, at.type_name
+        FROM world_assets_ranking w
+        JOIN assets a ON a.asset_id = w.asset_id
+        LEFT JOIN asset_types at ON at.asset_type_id = a.asset_type_id
+        WHERE w.ranking_date = (SELECT max(ranking_date) FROM world_assets_ranking)
+          AND w.asset_id IS NOT NULL
+        ORDER BY w.asset_id, w.rank
+    ) u
+    ORDER BY u.rank, u.asset_id
+    LIMIT :limit
+""")
+
+DAILY_CLOSES_QUERY = text("""
+    SELECT DISTINCT ON (d.asset_id, date_trunc('day', d.timestamp_utc))
+        d.asset_id, date_trunc('day', d.timestamp_utc) AS day, d.close_price
+    FROM ohlcv_day_data d
+    WHERE d.asset_id = ANY(:asset_ids)
+      AND d.timestamp_utc >= :start_date
+      AND d.timestamp_utc < :end_date
+      AND d.data_interval = '1d'
+    ORDER BY d.asset_id, date_trunc('day', d.timestamp_utc), d.timestamp_utc DESC
+""")
+
+LOAD_SNAPSHOT_SQL = """
+    SELECT as_of_date, rebuilt_on, assets, {columns}
+    FROM rolling_correlation_snapshot
+    WHERE universe = :universe
+"""
+
+SAVE_SNAPSHOT_SQL = text("""
+    INSERT INTO rolling_correlation_snapshot
+        (universe, as_of_date, rebuilt_on, windows, assets, result, state, updated_at)
+    VALUES
+        (:universe, :as_of_date, :rebuilt_on, CAST(:windows AS json), CAST(:assets AS json), :result, :state, now())
+    ON CONFLICT (universe) DO UPDATE SET
+        as_of_date = EXCLUDED.as_of_date,
+        rebuilt_on = EXCLUDED.rebuilt_on,
+        windows = EXCLUDED.windows,
+        assets = EXCLUDED.assets,
+        result = EXCLUDED.result,
+        state = EXCLUDED.state,
+        updated_at = now()
+""")
+
+
+class RollingCorrelationState:
+    """유니버스 전체의 종가 링 버퍼 (날짜는 하루씩 빠짐없이 advance 해야 함)"""
+
+    def __init__(self, asset_ids: Sequence[int], windows: Sequence[int] = ROLLING_WINDOWS):
+        self.asset_ids = [int(a) for a in asset_ids]
+        self.windows = tuple(sorted(windows))
+        self.as_of: Optional[date] = None
+        self.rebuilt_on: Optional[date] = None
+        self.history = self.windows[-1] + PRICE_BUFFER_DAYS
+        self.close_ring = np.full((self.history, len(self.asset_ids)), np.nan)
+
+    def advance(self, day: date, closes: np.ndarray):
+        """day 의 종가 벡터(결측 NaN) 반영: history 일 전 행을 덮어씀"""
+        if self.as_of is not None and day != self.as_of + timedelta(days=1):
+            raise ValueError(f"advance 는 연속된 날짜만 가능 (as_of={self.as_of}, day={day})")
+        self.close_ring[day.toordinal() % self.history] = np.where(closes > 0, closes, np.nan)
+        self.as_of = day
+
+    def recent_closes(self) -> np.ndarray:
+        """(history 달력일 x 자산) 종가, 마지막 행이 as_of"""
+        end = self.as_of.toordinal()
+        return self.close_ring[np.arange(end - self.history + 1, end + 1) % self.history]
+
+    def to_bytes(self) -> bytes:
+        buffer = io.BytesIO()
+        np.savez_compressed(
+            buffer,
+            asset_ids=np.asarray(self.asset_ids, dtype=np.int64),
+            windows=np.asarray(self.windows, dtype=np.int64),
+            days=np.asarray([self.as_of.toordinal(), self.rebuilt_on.toordinal()], dtype=np.int64),
+            close_ring=self.close_ring,
+        )
+        return buffer.getvalue()
+
+    @classmethod
+    def from_bytes(cls, payload: bytes) -> "RollingCorrelationState":
+        """직렬화된 상태 복원 (종가 링 버퍼가 없는 이전 형식이면 ValueError -> 전체 재적재)"""
+        with np.load(io.BytesIO(payload)) as data:
+            if "close_ring" not in data.files:
+                raise ValueError("rolling correlation state without close history")
+            state = cls(data["asset_ids"].tolist(), data["windows"].tolist())
+            as_of, rebuilt_on = data["days"].tolist()
+            state.as_of = date.fromordinal(as_of)
+            state.rebuilt_on = date.fromordinal(rebuilt_on)
+            state.close_ring = data["close_ring"]
+        return state
+
+    def result_bytes(self) -> bytes:
+        """API 용 압축 결과: 최근 종가 float64"""
+        buffer = io.BytesIO()
+        np.savez_compressed(buffer, asset_ids=np.asarray(self.asset_ids, dtype=np.int64), closes=self.recent_closes())
+        return buffer.getvalue()
+
+
+@dataclass
+class RollingMatrices:
+    """저장된 결과 (API 조회용)"""
+    as_of: date
+    tickers: List[str]
+    asset_ids: List[int]
+    asset_info: Dict[str, Dict[str, Any]]
+    # (달력일 x 자산) 종가, 마지막 행이 as_of (결측 NaN)
+    closes: np.ndarray
+
+    def __post_init__(self):
+        self.index = {t: i for i, t in enumerate(self.tickers)}
+
+    @property
+    def first_close_date(self) -> date:
+        return self.as_of - timedelta(days=len(self.closes) - 1)
+
+    def prices_cover(self, tickers: Sequence[str], start_date: date) -> bool:
+        """start_date ~ as_of 종가가 저장되어 있고 모든 티커가 유니버스에 있는지"""
+        return self.first_close_date <= start_date and all(t in self.index for t in tickers)
+
+    def price_matrix(self, tickers: Sequence[str], start_date: date, limit: int,
+                     recent: Optional[np.ndarray] = None) -> PriceMatrix:
+        """
+        저장 종가 -> load_price_matrix 와 같은 형태 (start_date 이후 자산별 최신 limit개 일봉,
+        row_counts 는 그 일봉 수, 어느 티커에도 종가가 없는 날짜는 제외).
+        recent: as_of 다음 날부터 이어지는 (달력일 x 요청 티커) 종가
+        """
+        offset = (start_date - self.first_close_date).days
+        closes = self.closes[offset:, [self.index[t] for t in tickers]]
+        if recent is not None:
+            closes = np.vstack([closes, recent])
+        else:
+            closes = closes.copy()
+        priced = ~np.isnan(closes)
+        # 뒤에서부터 센 일봉 순번이 limit 을 넘는 행은 LATERAL ... LIMIT 에서 빠지는 행
+        dropped = priced & (np.cumsum(priced[::-1], axis=0)[::-1] > limit)
+        closes[dropped] = np.nan
+        priced &= ~dropped
+        keep = priced.any(axis=1)
+        dates = np.datetime64(start_date, "D") + np.flatnonzero(keep)
+        return PriceMatrix(
+            tickers=list(tickers),
+            dates=dates,
+            closes=closes[keep],
+            row_counts={t: int(n) for t, n in zip(tickers, priced.sum(axis=0))},
+            asset_info={t: self.asset_info[t] for t in tickers},
+        )
+
+    def price_matrix_through(self, db, tickers: Sequence[str], start_date: date, end_date: date,
+                             limit: int) -> PriceMatrix:
+        """
+        price_matrix + 저장 이후(as_of 다음 날 ~ end_date) 일봉을 요청 티커만 조회해 이어 붙임
+        -> 잡이 아직 돌지 않았거나 당일 일봉이 진행 중이어도 DB 조회 경로와 같은 기간
+        """
+        since = self.as_of + timedelta(days=1)
+        recent = None
+        if since <= end_date:
+            recent = load_daily_closes(db, [self.asset_ids[self.index[t]] for t in tickers], since, end_date)
+        return self.price_matrix(tickers, start_date, limit, recent)
+
+    @classmethod
+    def from_bytes(cls, payload: bytes, as_of: date, assets: List[Dict[str, Any]]) -> "RollingMatrices":
+        tickers = [a["ticker"] for a in assets]
+        asset_ids = [int(a["asset_id"]) for a in assets]
+        info = {a["ticker"]: {"name": a["name"], "type": a.get("type") or "Unknown"} for a in assets}
+        with np.load(io.BytesIO(payload)) as data:
+            if "closes" not in data.files:
+                raise ValueError("rolling correlation result without close history")
+            closes = data["closes"]
+        return cls(as_of, tickers, asset_ids, info, closes)
+
+
+def _as_date(value) -> date:
+    return value.date() if isinstance(value, datetime) else value
+
+
+def load_universe(db, size: int = UNIVERSE_SIZE) -> List[Dict[str, Any]]:
+    """최신 랭킹 상위 size개 자산 (asset_id 오름차순 -> 순위 변동만으로는 상태를 다시 만들지 않음)"""
+    rows = db.execute(UNIVERSE_QUERY, {"limit": size}).fetchall()
+    assets = [
+        {"asset_id": int(row.asset_id), "ticker": row.ticker, "name": row.name, "type": row.type_name or "Unknown"}
+        for row in rows
+    ]
+    return sorted(assets, key=lambda a: a["asset_id"])
+
+
+def load_daily_closes(db, asset_ids: Sequence[int], start: date, end: date) -> np.ndarray:
+    """[start, end] 달력일 x 자산 종가 (날짜별 가장 늦은 일봉, 결측/0 은 NaN)"""
+    column_of = {asset_id: i for i, asset_id in enumerate(asset_ids)}
+    closes = np.full(((end - start).days + 1, len(asset_ids)), np.nan)
+    rows = db.execute(DAILY_CLOSES_QUERY, {
+        "asset_ids": list(asset_ids),
+        "start_date": start,
+        "end_date": end + timedelta(days=1),
+    }).fetchall()
+    for row in rows:
+        if row.close_price is None:
+            continue
+        closes[(_as_date(row.day) - start).days, column_of[row.asset_id]] = float(row.close_price)
+    closes[closes <= 0] = np.nan
+    return closes
+
+
+def _load_state(db, asset_ids: List[int]) -> Optional[RollingCorrelationState]:
+    row = db.execute(text(LOAD_SNAPSHOT_SQL.format(columns="state")), {"universe": UNIVERSE_NAME}).fetchone()
+    if row is None or row.state is None:
+        return None
+    try:
+        state = RollingCorrelationState.from_bytes(bytes(row.state))
+    except ValueError as e:
+        logger.info(f"🔄 Rolling correlation 상태 재적재: {e}")
+        return None
+    if state.asset_ids != asset_ids or state.windows != tuple(sorted(ROLLING_WINDOWS)):
+        return None
+    return state
+
+
+def update_rolling_correlations(db, today: Optional[date] = None) -> Optional[Dict[str, Any]]:
+    """
+    어제(UTC)까지의 일봉으로 상태를 갱신하고 결과를 저장 (커밋 포함).
+    반환값: 요약 dict (유니버스가 비어 있으면 None)
+    """
+    today = today or datetime.utcnow().date()
+    through = today - timedelta(days=1)
+    assets = load_universe(db)
+    if len(assets) < 2:
+        logger.warning("⚠️ Rolling correlation: 랭킹 유니버스가 비어 있어 건너뜀")
+        return None
+    asset_ids = [a["asset_id"] for a in assets]
+
+    state = _load_state(db, asset_ids)
+    rebuild = (
+        state is None
+        or (through - state.rebuilt_on).days >= REBUILD_INTERVAL_DAYS
+        or (through - state.as_of).days > state.history
+    )
+    if rebuild:
+        state = RollingCorrelationState(asset_ids)
+        state.rebuilt_on = through
+        start = through - timedelta(days=state.history - 1)
+    else:
+        start = state.as_of + timedelta(days=1)
+
+    advanced = 0
+    if start <= through:
+        closes = load_daily_closes(db, asset_ids, start, through)
+        for offset, row in enumerate(closes):
+            state.advance(start + timedelta(days=offset), row)
+        advanced = len(closes)
+
+    db.execute(SAVE_SNAPSHOT_SQL, {
+        "universe": UNIVERSE_NAME,
+        "as_of_date": state.as_of,
+        "rebuilt_on": state.rebuilt_on,
+        "windows": json.dumps(list(state.windows)),
+        "assets": json.dumps(assets),
+        "result": state.result_bytes(),
+        "state": state.to_bytes(),
+    })
+    db.commit()
+    rolling_matrices_cache.invalidate()
+    return {
+        "assets": len(asset_ids),
+        "as_of": state.as_of.isoformat() if state.as_of else None,
+        "days_processed": advanced,
+        "rebuilt": rebuild,
+    }
+
+
+class _MatricesCache:
+    """프로세스 내 결과 캐시 (TTL 동안 DB 를 다시 읽지 않음, 조회 실패로 인한 None 도 캐시)"""
+
+    def __init__(self, ttl_seconds: float = CACHE_TTL_SECONDS):
+        self._cache = TTLCache(ttl_seconds=ttl_seconds, max_entries=1)
+
+    def get(self, db) -> Optional[RollingMatrices]:
+        value = self._cache.get(UNIVERSE_NAME, MISSING)
+        if value is not MISSING:
+            return value
+        value = None
+        try:
+            row = db.execute(text(LOAD_SNAPSHOT_SQL.format(columns="result")), {"universe": UNIVERSE_NAME}).fetchone()
+            if row is not None and row.result is not None:
+                assets = row.assets if isinstance(row.assets, list) else json.loads(row.assets)
+                value = RollingMatrices.from_bytes(bytes(row.result), _as_date(row.as_of_date), assets)
+        except Exception as e:
+            # 테이블 미생성 등: 기존 경로로 응답하도록 None 을 TTL 동안 캐시
+            logger.warning(f"⚠️ Rolling correlation 결과 조회 실패: {e}")
+            db.rollback()
+        self._cache.set(UNIVERSE_NAME, value)
+        return value
+
+    def invalidate(self):
+        self._cache.invalidate()
+
+
+rolling_matrices_cache = _MatricesCache()
+
+
+def load_rolling_matrices(db, today: Optional[date] = None) -> Optional[RollingMatrices]:
+    """최신 사전 계산 결과 (없거나 MAX_STALE_DAYS 보다 오래되면 None)"""
+    matrices = rolling_matrices_cache.get(db)
+    today = today or datetime.utcnow().date()
+    if matrices is None or (today - matrices.as_of).days > MAX_STALE_DAYS:
+        return None
+    return matrices
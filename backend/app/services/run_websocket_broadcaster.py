@@ -25,7 +25,7 @@ project_root = Path(__file__).resolve().parent.parent.parent
 sys.path.insert(0, str(project_root))
 
 from app.core.database import SessionLocal
-from app.models.asset import Asset, AssetType
+from app.services.symbol_resolver import symbol_resolver
 
 from dotenv import load_dotenv
 
@@ -81,12 +81,10 @@ sio_client = socketio.AsyncClient(
 
 # --- Broadcaster 전용 상태 및 캐시 관리 ---
 
-ticker_to_asset_id_cache: Dict[str, int] = {}
-asset_id_to_ticker_cache: Dict[int, str] = {}
-ticker_to_asset_type_cache: Dict[str, str] = {}
 last_asset_cache_refresh: Optional[datetime] = None
 last_broadcast_prices = {}  # { (asset_id, ticker): last_price }
-asset_cache_refresh_interval = timedelta(minutes=10)
+# 증분 갱신(updated_at 워터마크)이므로 짧은 주기로 확인
+asset_cache_refresh_interval = timedelta(minutes=1)
 
 # REALTIME_STREAMS 설정이 없을 경우를 대비한 기본값
 default_streams = ["binance:realtime", "coinbase:realtime", "finnhub:realtime", "alpaca:realtime", "swissquote:realtime", "kis:realtime", "polygon:realtime", "twelvedata:realtime"]
@@ -108,55 +106,17 @@ async def disconnect():
 
 
 async def _refresh_asset_cache():
-    """DB에서 실제 자산 목록을 가져와 캐시를 갱신합니다."""
-    global ticker_to_asset_id_cache, last_asset_cache_refresh, ticker_to_asset_type_cache, asset_id_to_ticker_cache
+    """DB에서 변경된 자산만 읽어 심볼 인덱스(SymbolResolver)를 갱신합니다."""
+    global last_asset_cache_refresh
     
     try:
         # 동기 세션 사용
         db = SessionLocal()
         try:
-            # 모든 활성 자산 가져오기
-            # AssetType.type_name 대신 AssetType 객체 자체를 가져와서 .name 속성을 사용
-            assets = db.query(Asset, AssetType)\
-                .join(AssetType, Asset.asset_type_id == AssetType.asset_type_id)\
-                .filter(Asset.is_active == True)\
-                .all()
-            
-            new_id_cache = {}
-            new_id_to_ticker_cache = {}
-            new_type_cache = {}
-            
-            for asset_obj, asset_type_obj in assets:
-                t = asset_obj.ticker.upper()
-                aid = asset_obj.asset_id
-                
-                # 중복 티커 체크 (예: 같은 티커가 여러 타입으로 존재할 경우)
-                if t in new_id_cache:
-                    prev_aid = new_id_cache[t]
-                    logger.warning(f"⚠️ [Broadcaster] Duplicate ticker mapping: {t} already points to {prev_aid}, skipping {aid}")
-                    continue
-                
-                new_id_cache[t] = aid
-                new_id_to_ticker_cache[aid] = t
-                asset_type_str = asset_type_obj.type_name if asset_type_obj else "Unknown"
-                new_type_cache[t] = asset_type_str
-                
-                # 변형 심볼 매핑 (USDT 등)
-                for variant in [f"{t}USDT", f"{t}-USDT", f"{t}-USD"]:
-                    if variant not in new_id_cache:
-                        new_id_cache[variant] = aid
-                        new_type_cache[variant] = asset_type_str
-            
-            ticker_to_asset_id_cache = new_id_cache
-            asset_id_to_ticker_cache = new_id_to_ticker_cache
-            ticker_to_asset_type_cache = new_type_cache
-            
+            updated = symbol_resolver.refresh(db)
             last_asset_cache_refresh = datetime.now(timezone.utc)
-            logger.info(f"✅ Ticker-AssetID Cache updated from DB: {len(ticker_to_asset_id_cache)} entries")
-            # 디버그: 주요 자산 매핑 확인
-            for test_s in ['BTC', 'ETH', 'QQQ', 'SPY', 'NVDA', 'TSLA']:
-                if test_s in ticker_to_asset_id_cache:
-                    logger.info(f"📌 [Cache-Check] {test_s} -> ID: {ticker_to_asset_id_cache[test_s]}, Type: {ticker_to_asset_type_cache.get(test_s)}")
+            if updated:
+                logger.info(f"✅ Symbol index updated from DB: {updated} assets ({symbol_resolver.stats()})")
         finally:
             db.close()
     except Exception as e:
@@ -286,45 +246,17 @@ async def listen_to_redis_and_broadcast():
                             volume = safe_float(message_data.get(b'volume', b'').decode('utf-8'))
                             provider = provider_raw
 
-                            # 🛠 [심볼 매핑 고도화]
-                            ticker_for_broadcast = symbol
-                            asset_id = None
-                            
-                            # 1. 공급자별 특화 정규화
-                            search_symbols = [symbol]
-                            if provider == 'coinbase' and '-' in symbol:
-                                # "BTC-USD" -> ["BTC", "BTCUSDT"] 추가 탐색
-                                base = symbol.split('-')[0]
-                                search_symbols.extend([base, f"{base}USDT"])
-                            elif provider == 'binance' and symbol.endswith('USDT'):
-                                # "BTCUSDT" -> ["BTC"] 추가 탐색
-                                base = symbol.replace('USDT', '')
-                                search_symbols.append(base)
-                            
-                            # 2. 가능한 모든 변형으로 매핑 조회
-                            for s in search_symbols:
-                                asset_id = ticker_to_asset_id_cache.get(s)
-                                if not asset_id and provider == 'binance':
-                                    # "BINANCE:BTCUSDT" 형태 처리
-                                    s_clean = s.replace('BINANCE:', '')
-                                    asset_id = ticker_to_asset_id_cache.get(s_clean)
-                                    if asset_id: s = s_clean
-
-                                if asset_id:
-                                    # [개선] 항상 캐시된 원본(Canonical) 티커를 방송용으로 사용
-                                    # 이렇게 해야 프론트엔드에서 구독한 티커와 일치하게 됨
-                                    ticker_for_broadcast = asset_id_to_ticker_cache.get(asset_id, s)
-                                    
-                                    # [MAPPING TRACE] - Stocks/ETFs도 추적 대상에 추가
-                                    if symbol in ['SOL', 'ETHUSDT', 'BTCUSDT', 'QQQ', 'SPY', 'NVDA', 'TSLA']:
-                                        logger.info(f"🔍 [MAPPING-TRACE] {provider} | {symbol} -> Internal: {ticker_for_broadcast} (ID: {asset_id})")
-                                    break
-                            
-                            if not asset_id:
+                            # 🛠 [심볼 매핑] 공급자별 변형이 미리 계산된 인덱스에서 단일 조회
+                            resolved = symbol_resolver.resolve(provider, symbol)
+                            if resolved is None or not resolved.is_active:
                                 if symbol in ['SOL', 'ETHUSDT', 'BTCUSDT']:
                                     logger.warning(f"⚠️ [Broadcaster] Mapping failed for critical asset: {symbol} ({provider})")
                                 continue
 
+                            # 항상 원본(Canonical) 티커를 방송용으로 사용 (프론트엔드 구독 티커와 일치)
+                            asset_id = resolved.asset_id
+                            ticker_for_broadcast = resolved.ticker
+
                             # 🚨 [추가] 가격 이상치 검증 (급격한 변동 차단)
                             # 매우 짧은 시간(배치 간격) 내에 10% 이상 변동은 데이터 오류일 가능성이 높음
                             cache_key = (asset_id, ticker_for_broadcast)
@@ -342,7 +274,7 @@ async def listen_to_redis_and_broadcast():
                             target_quotes[(asset_id, ticker_for_broadcast)] = {
                                 "asset_id": asset_id,
                                 "ticker": ticker_for_broadcast,
-                                "asset_type": ticker_to_asset_type_cache.get(ticker_for_broadcast, "Unknown"),
+                                "asset_type": resolved.asset_type,
                                 "timestamp_utc": datetime.now(timezone.utc).isoformat(),
                                 "price": price,
                                 "volume": volume,
@@ -0,0 +1,203 @@
+"""
+SchedulerRuntime - 스케줄러 잡용 상시 이벤트 루프 풀
+- 기존: 잡마다 새 이벤트 루프 + ApiStrategyManager(= API 클라이언트 객체 전부) + 호출마다 새 HTTP 커넥션 풀
+  -> 1분 주기 OHLCV 잡이 매번 모든 공급자에 TLS 핸드셰이크
+- persistent 모드 (SCHEDULER_LOOP_MODE, 기본): 데몬 스레드에서 계속 도는 루프 SCHEDULER_LOOP_POOL_SIZE개에
+  잡 코루틴을 제출. 루프마다 리소스(ApiStrategyManager, RedisQueueManager)를 한 번 만들어 재사용하고,
+  공유 httpx 풀(app.external_apis.base.http_pool)을 켜 keep-alive 커넥션을 재사용
+  * 잡은 실행 중인 잡이 가장 적은 루프로 배정 (동기 DB 호출이 루프를 막으므로 한 루프에 몰리지 않게)
+  * 리소스는 SCHEDULER_RESOURCE_TTL_SECONDS가 지나면 해당 루프가 비었을 때 다시 생성 (설정 변경 반영)
+- per_job 모드: 기존과 같이 잡마다 새 루프/리소스 (비교/롤백용)
+- 잡 격리는 잡마다 만드는 JobContext (잡 이름, DB 세션, 루프 리소스, 시작 시각)로. DB 엔진은 원래 프로세스 공유
+- run()은 APScheduler 워커 스레드에서 호출되어 잡이 끝날 때까지 기다림 (잡 동시 실행/오버랩 규칙은 그대로)
+"""
+import asyncio
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, List, Optional, TypeVar
+
+from app.external_apis.base.http_pool import close_shared_pool, enable_shared_pool, pool_stats
+
+logger = logging.getLogger(__name__)
+
+SCHEDULER_LOOP_MODE = os.getenv("SCHEDULER_LOOP_MODE", "persistent").lower()
+SCHEDULER_LOOP_POOL_SIZE = int(os.getenv("SCHEDULER_LOOP_POOL_SIZE", "4"))
+SCHEDULER_RESOURCE_TTL_SECONDS = int(os.getenv("SCHEDULER_RESOURCE_TTL_SECONDS", "3600"))
+
+T = TypeVar("T")
+
+
+@dataclass
+class JobContext:
+    """잡 한 번 실행 분량의 상태 (리소스는 루프 공유, 나머지는 잡 전용)"""
+    job_name: str
+    db: Any = None
+    resources: Dict[str, Any] = field(default_factory=dict)
+    loop_index: Optional[int] = None
+    started_at: datetime = field(default_factory=datetime.now)
+
+    @property
+    def api_manager(self):
+        return self.resources.get("api_manager")
+
+    @property
+    def redis_queue_manager(self):
+        return self.resources.get("redis_queue_manager")
+
+
+class _LoopWorker:
+    """데몬 스레드에서 run_forever로 도는 루프 하나와 그 루프의 공유 리소스"""
+
+    def __init__(self, index: int):
+        self.index = index
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self._run, name=f"scheduler-loop-{index}", daemon=True)
+        self.resources: Optional[Dict[str, Any]] = None
+        self.resources_created = 0.0
+        self.active = 0
+        self.jobs_run = 0
+        self.job_seconds = 0.0
+        self.thread.start()
+
+    def _run(self):
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+
+class SchedulerRuntime:
+    """
+    resource_factory: 루프 안에서 호출되어 루프 공유 리소스 dict를 만듦
+    (예: {"api_manager": ApiStrategyManager(...), "redis_queue_manager": RedisQueueManager(...)})
+    """
+
+    def __init__(
+        self,
+        resource_factory: Callable[[], Dict[str, Any]],
+        mode: str = SCHEDULER_LOOP_MODE,
+        pool_size: int = SCHEDULER_LOOP_POOL_SIZE,
+        resource_ttl_seconds: int = SCHEDULER_RESOURCE_TTL_SECONDS,
+    ):
+        self.resource_factory = resource_factory
+        self.mode = mode if mode in ("persistent", "per_job") else "persistent"
+        self.pool_size = max(1, pool_size)
+        self.resource_ttl_seconds = resource_ttl_seconds
+        self._workers: List[_LoopWorker] = []
+        self._lock = threading.Lock()
+
+    def run(self, job_name: str, job: Callable[[JobContext], Awaitable[T]], db=None) -> T:
+        """job(ctx) 코루틴을 실행하고 결과를 돌려줌 (동기, 예외는 그대로 전파)"""
+        ctx = JobContext(job_name=job_name, db=db)
+        if self.mode == "per_job":
+            return self._run_per_job(ctx, job)
+
+        with self._lock:
+            if not self._workers:
+                self._workers = [_LoopWorker(i) for i in range(self.pool_size)]
+                logger.info(f"🔁 Scheduler 상시 이벤트 루프 {self.pool_size}개 시작")
+            worker = min(self._workers, key=lambda w: (w.active, w.jobs_run))
+            worker.active += 1
+        try:
+            future = asyncio.run_coroutine_threadsafe(self._run_on_worker(worker, ctx, job), worker.loop)
+            return future.result()
+        finally:
+            with self._lock:
+                worker.active -= 1
+
+    def _run_per_job(self, ctx: JobContext, job: Callable[[JobContext], Awaitable[T]]) -> T:
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        try:
+            async def _run():
+                ctx.resources = self.resource_factory()
+                try:
+                    return await job(ctx)
+                finally:
+                    await self._close_resources(ctx.resources)
+            return loop.run_until_complete(_run())
+        finally:
+            loop.close()
+
+    async def _run_on_worker(self, worker: _LoopWorker, ctx: JobContext, job: Callable[[JobContext], Awaitable[T]]) -> T:
+        expired = (
+            worker.resources is not None
+            and self.resource_ttl_seconds > 0
+            and time.monotonic() - worker.resources_created > self.resource_ttl_seconds
+            and worker.active == 1
+        )
+        if expired:
+            old, worker.resources = worker.resources, None
+            await self._close_resources(old)
+            logger.info(f"🔁 scheduler-loop-{worker.index} 리소스 TTL 만료, 다시 생성")
+        if worker.resources is None:
+            enable_shared_pool()
+            worker.resources = self.resource_factory()
+            worker.resources_created = time.monotonic()
+
+        ctx.resources = worker.resources
+        ctx.loop_index = worker.index
+        start = time.monotonic()
+        try:
+            return await job(ctx)
+        finally:
+            worker.jobs_run += 1
+            worker.job_seconds += time.monotonic() - start
+
+    @staticmethod
+    async def _close_resources(resources: Optional[Dict[str, Any]]) -> None:
+        """리소스 중 Redis 클라이언트 등 루프에 묶인 연결 정리"""
+        for resource in (resources or {}).values():
+            client = getattr(resource, "redis_client", None)
+            if client is not None:
+                try:
+                    await client.aclose()
+                except Exception:
+                    pass
+                resource.redis_client = None
+
+    def stats(self) -> Dict[str, Any]:
+        workers = []
+        for worker in list(self._workers):
+            info = {
+                "index": worker.index,
+                "active_jobs": worker.active,
+                "jobs_run": worker.jobs_run,
+                "avg_job_seconds": round(worker.job_seconds / worker.jobs_run, 2) if worker.jobs_run else None,
+                "resources_age_seconds": int(time.monotonic() - worker.resources_created) if worker.resources else None,
+            }
+            if worker.loop.is_running():
+                try:
+                    info["http_pool"] = asyncio.run_coroutine_threadsafe(self._pool_stats(), worker.loop).result(timeout=1)
+                except Exception:
+                    info["http_pool"] = None
+            workers.append(info)
+        return {"mode": self.mode, "pool_size": self.pool_size, "workers": workers}
+
+    @staticmethod
+    async def _pool_stats() -> Dict[str, int]:
+        return pool_stats()
+
+    def shutdown(self, timeout: float = 10.0) -> None:
+        """공유 리소스/HTTP 풀을 닫고 루프 스레드 종료 (이후 run()이 호출되면 루프를 다시 만듦)"""
+        with self._lock:
+            workers, self._workers = self._workers, []
+
+        async def _close(worker: _LoopWorker):
+            await self._close_resources(worker.resources)
+            worker.resources = None
+            await close_shared_pool()
+
+        for worker in workers:
+            try:
+                asyncio.run_coroutine_threadsafe(_close(worker), worker.loop).result(timeout=timeout)
+            except Exception as e:
+                logger.warning(f"scheduler-loop-{worker.index} 리소스 정리 실패: {e}")
+            worker.loop.call_soon_threadsafe(worker.loop.stop)
+            worker.thread.join(timeout=timeout)
+            if not worker.thread.is_alive():
+                worker.loop.close()
+        if workers:
+            logger.info(f"🔁 Scheduler 상시 이벤트 루프 {len(workers)}개 종료")
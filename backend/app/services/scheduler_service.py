@@ -18,6 +18,7 @@ from app.utils.logger import logger
 from app.core.config_manager import ConfigManager
 from app.services.api_strategy_manager import ApiStrategyManager
 from app.utils.redis_queue_manager import RedisQueueManager
+from app.services.scheduler_runtime import JobContext, SchedulerRuntime
 
 # --- Import all available collectors ---
 from app.collectors.base_collector import BaseCollector
@@ -160,6 +161,8 @@ class SchedulerService:
         # clients/locks under the hood, so it must be created within the target event loop.
         self.config_manager = ConfigManager()
         self.redis_queue_manager = RedisQueueManager(config_manager=self.config_manager)
+        # Jobs run as coroutines on long-lived event loops; loop-bound resources are created per loop.
+        self.job_runtime = SchedulerRuntime(self._create_job_resources)
         
         # 스케줄러 시작 시 OHLCV intervals 설정 확인
         try:
@@ -172,6 +175,16 @@ class SchedulerService:
         """Sets up the logger for this service."""
         self.logger = logging.getLogger(__name__)
 
+    def _create_job_resources(self) -> Dict[str, Any]:
+        """
+        Loop-bound resources shared by every job on one runtime event loop.
+        Called inside the target loop (ApiStrategyManager creates async clients/locks).
+        """
+        return {
+            "api_manager": ApiStrategyManager(config_manager=self.config_manager),
+            "redis_queue_manager": RedisQueueManager(config_manager=self.config_manager),
+        }
+
     def _create_collection_function(self, collector_class: Type[BaseCollector], collector_config: Dict[str, Any] = None):
         """
         Creates a wrapper function to run an async collector from the sync scheduler.
@@ -182,10 +195,6 @@ class SchedulerService:
             collector_config: Optional configuration for the collector (filters, etc.)
         """
         def run_collection_sync():
-            # Create a new event loop for this thread.
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            
             db: Session = SessionLocal()
             start_time = datetime.now()
             job_name = collector_class.__name__
@@ -205,33 +214,33 @@ class SchedulerService:
                 
                 self.logger.info(f"📋 Scheduler log created for {job_name} (ID: {scheduler_log.log_id})")
                 
-                # Instantiate the collector with all required dependencies.
-                # IMPORTANT: ApiStrategyManager must be constructed inside this loop to avoid
-                # cross-event-loop Futures/Locks.
-                api_manager = ApiStrategyManager(config_manager=self.config_manager)
-                collector_instance = collector_class(
-                    db=db,
-                    config_manager=self.config_manager,
-                    api_manager=api_manager,
-                    redis_queue_manager=self.redis_queue_manager,
-                )
-                
-                # Apply filters for OHLCVCollector
-                if isinstance(collector_instance, OHLCVCollector) and collector_config:
-                    scheduled_intervals = collector_config.get("scheduled_intervals")
-                    asset_type_filter = collector_config.get("asset_type_filter")
-                    if scheduled_intervals or asset_type_filter:
-                        collector_instance.set_schedule_config(
-                            scheduled_intervals=scheduled_intervals,
-                            asset_type_filter=asset_type_filter
-                        )
-                        self.logger.info(
-                            f"Applied filters to {job_name} - intervals: {scheduled_intervals}, "
-                            f"asset_types: {asset_type_filter}"
-                        )
-                
-                # The `collect_with_settings` method in BaseCollector handles all logging.
-                result = loop.run_until_complete(collector_instance.collect_with_settings())
+                async def _collect(ctx: JobContext):
+                    # Instantiate the collector with the runtime loop's shared dependencies.
+                    collector_instance = collector_class(
+                        db=ctx.db,
+                        config_manager=self.config_manager,
+                        api_manager=ctx.api_manager,
+                        redis_queue_manager=ctx.redis_queue_manager,
+                    )
+
+                    # Apply filters for OHLCVCollector
+                    if isinstance(collector_instance, OHLCVCollector) and collector_config:
+                        scheduled_intervals = collector_config.get("scheduled_intervals")
+                        asset_type_filter = collector_config.get("asset_type_filter")
+                        if scheduled_intervals or asset_type_filter:
+                            collector_instance.set_schedule_config(
+                                scheduled_intervals=scheduled_intervals,
+                                asset_type_filter=asset_type_filter
+                            )
+                            self.logger.info(
+                                f"Applied filters to {job_name} - intervals: {scheduled_intervals}, "
+                                f"asset_types: {asset_type_filter}"
+                            )
+
+                    # The `collect_with_settings` method in BaseCollector handles all logging.
+                    return await collector_instance.collect_with_settings()
+
+                result = self.job_runtime.run(job_name, _collect, db=db)
                 
                 # 성공 로그 업데이트
                 end_time = datetime.now()
@@ -290,7 +299,6 @@ class SchedulerService:
                     db.close()
                 except Exception as close_error:
                     self.logger.error(f"Failed to close database session: {close_error}")
-                loop.close()
 
         return run_collection_sync
 
@@ -299,8 +307,6 @@ class SchedulerService:
         Creates a sync wrapper for the News AI Pipeline (Cluster -> Analyze -> Save).
         """
         def run_pipeline_sync():
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
             job_name = "NewsAIPipeline"
             
             try:
@@ -427,13 +433,11 @@ class SchedulerService:
                                 self.logger.error(f"[{job_name}] AI analysis failed for cluster: {e}")
                     return processed_count
 
-                processed = loop.run_until_complete(_pipeline_logic())
+                processed = self.job_runtime.run(job_name, lambda ctx: _pipeline_logic())
                 self.logger.info(f"[{job_name}] Completed. Generated {processed} AI insights.")
                 
             except Exception as e:
                 self.logger.error(f"[{job_name}] Failed: {e}", exc_info=True)
-            finally:
-                loop.close()
         
         return run_pipeline_sync
 
@@ -468,8 +472,6 @@ class SchedulerService:
         매일 00:00 UTC (09:00 KST) 실행.
         """
         def run_daily_merge_sync():
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
             db: Session = SessionLocal()
             job_name = "DailyAutoMerge"
 
@@ -564,7 +566,7 @@ class SchedulerService:
 
                     return merged_count
 
-                count = loop.run_until_complete(_merge_logic())
+                count = self.job_runtime.run(job_name, lambda ctx: _merge_logic(), db=db)
                 self.logger.info(f"[{job_name}] Completed. Created {count} merged posts.")
 
             except Exception as e:
@@ -575,7 +577,6 @@ class SchedulerService:
                     pass
             finally:
                 db.close()
-                loop.close()
 
         return run_daily_merge_sync
 
@@ -709,11 +710,11 @@ class SchedulerService:
                 result = engine.run_full_analysis(btc_asset.asset_id, compare_assets)
                 
                 # Save to Redis for high-speed API access
-                async def save_to_redis(res):
-                    client = await self.redis_queue_manager._ensure_client()
-                    await client.set("quant:seasonality:btc", json.dumps(res), ex=86400)
+                async def save_to_redis(ctx: JobContext):
+                    client = await ctx.redis_queue_manager._ensure_client()
+                    await client.set("quant:seasonality:btc", json.dumps(result), ex=86400)
 
-                loop.run_until_complete(save_to_redis(result))
+                self.job_runtime.run("QuantSeasonalityJob", save_to_redis, db=db)
                 self.logger.info("[QuantSeasonalityJob] Successfully saved result to Redis.")
                 
                 self.logger.info("[QuantSeasonalityJob] Completed successfully.")
@@ -724,6 +725,27 @@ class SchedulerService:
 
         return run_quant_seasonality_sync
 
+    def _create_rolling_correlation_function(self):
+        """
+        Creates a sync wrapper for the daily rolling correlation price snapshot
+        over the top-ranked asset universe.
+        """
+        def run_rolling_correlation_sync():
+            from app.services.rolling_correlation import update_rolling_correlations
+
+            db: Session = SessionLocal()
+            try:
+                self.logger.info("[RollingCorrelationJob] Updating rolling correlation matrices...")
+                summary = update_rolling_correlations(db)
+                self.logger.info(f"[RollingCorrelationJob] Completed: {summary}")
+            except Exception as e:
+                self.logger.error(f"[RollingCorrelationJob] Failed: {e}", exc_info=True)
+                db.rollback()
+            finally:
+                db.close()
+
+        return run_rolling_correlation_sync
+
     def setup_jobs(self, test_mode: bool = False):
         """
         Sets up all data collection jobs based on DB configuration.
@@ -794,112 +816,9 @@ class SchedulerService:
                                 # We schedule via wrapper to call each enabled collector in that logical group
                                 def _make_group_runner(group_name: str):
                                     def _run_group():
-                                        loop = asyncio.new_event_loop()
-                                        asyncio.set_event_loop(loop)
                                         db: Session = SessionLocal()
                                         try:
-                                            # ApiStrategyManager must be per-event-loop to avoid cross-loop issues
-                                            api_manager = ApiStrategyManager(config_manager=self.config_manager)
-                                            tasks = []
-                                            # Determine which collectors to run from group name
-                                            mapping = {
-                                                "ohlcv_day_clients": ["OHLCV"],
-                                                "ohlcv_intraday_clients": ["OHLCV"],
-                                                "crypto_ohlcv_clients": ["OHLCV"],
-                                                "commodity_ohlcv_clients": ["OHLCV"],
-                                                "stock_profiles_clients": ["StockProfile"],
-                                                "stock_profiles_fmp_clients": ["StockProfile"],  # ⭐ FMP 전용 프로필 수집 (일요일)
-                                                "crypto_clients": ["CryptoInfo"],
-                                                "onchain_clients": ["Onchain"],
-                                                "stock_financials_clients": [],
-                                                "stock_financials_macrotrends_clients": ["StockFinancialsMacrotrends"],
-                                                "stock_analyst_estimates_clients": [],
-                                                "etf_clients": ["ETFInfo"],
-                                                "world_assets_clients": ["WorldAssets"],
-                                                "commodity_ohlcv_aggregator_intraday": ["CommodityOHLCVAggregator"],
-                                                "commodity_ohlcv_aggregator_intraday": ["CommodityOHLCVAggregator"],
-                                                "commodity_ohlcv_aggregator_daily": ["CommodityOHLCVAggregator"],
-                                                "fred_clients": ["Fred"],
-                                            }
-                                            job_names = mapping.get(group_name, [])
-                                            for job_name in job_names:
-                                                meta = self.JOB_MAPPING.get(job_name)
-                                                if not meta:
-                                                    continue
-                                                is_enabled_method = getattr(self.config_manager, meta["config_key"])
-                                                if not is_enabled_method():
-                                                    continue
-                                                collector_class = meta["class"]
-                                                collector_instance = collector_class(
-                                                    db=db,
-                                                    config_manager=self.config_manager,
-                                                    api_manager=api_manager,
-                                                    redis_queue_manager=self.redis_queue_manager,
-                                                )
-                                                
-                                                # StockCollector인 경우 스케줄 그룹에 따라 데이터 타입 제한 설정
-                                                if collector_class.__name__ == "StockCollector" and hasattr(collector_instance, 'set_schedule_config'):
-                                                    if group_name == "stock_profiles_clients":
-                                                        # 프로필만 수집
-                                                        collector_instance.set_schedule_config(scheduled_data_types=["profile"])
-                                                        self.logger.info(f"Setting scheduled_data_types=['profile'] for {group_name}")
-                                                    elif group_name == "stock_profiles_fmp_clients":
-                                                        # FMP 프로필만 수집
-                                                        collector_instance.set_schedule_config(scheduled_data_types=["profile"])
-                                                        collector_instance.use_fmp_clients = True
-                                                        self.logger.info(f"Setting scheduled_data_types=['profile'] and use_fmp_clients=True for {group_name}")
-                                                    elif group_name == "stock_financials_clients":
-                                                        # 재무만 수집
-                                                        collector_instance.set_schedule_config(scheduled_data_types=["financials"])
-                                                        self.logger.info(f"Setting scheduled_data_types=['financials'] for {group_name}")
-                                                    elif group_name == "stock_analyst_estimates_clients":
-                                                        # 추정치만 수집
-                                                        collector_instance.set_schedule_config(scheduled_data_types=["estimates"])
-                                                        self.logger.info(f"Setting scheduled_data_types=['estimates'] for {group_name}")
-                                                
-                                                # OHLCVCollector인 경우 스케줄 그룹에 따라 interval 필터링 설정
-                                                if collector_class.__name__ == "OHLCVCollector" and hasattr(collector_instance, 'set_schedule_config'):
-                                                    if group_name == "ohlcv_day_clients":
-                                                        # 일봉 데이터만 수집 (1d, 1w, 1mo 등)
-                                                        collector_instance.set_schedule_config(scheduled_intervals=["1d", "1w", "1mo", "1month"])
-                                                        self.logger.info(f"Setting scheduled_intervals=['1d', '1w', '1mo', '1month'] for {group_name}")
-                                                    elif group_name == "ohlcv_intraday_clients":
-                                                        # 인트라데이 데이터만 수집 (1m, 5m, 15m, 30m, 1h, 4h 등)
-                                                        collector_instance.set_schedule_config(scheduled_intervals=["1m", "5m", "15m", "30m", "1h", "4h"])
-                                                        self.logger.info(f"Setting scheduled_intervals=['1m', '5m', '15m', '30m', '1h', '4h'] for {group_name}")
-                                                    elif group_name == "crypto_ohlcv_clients":
-                                                        # 암호화폐 OHLCV 데이터 수집 (1m, 5m, 15m, 30m, 1h, 4h, 1d)
-                                                        collector_instance.set_schedule_config(
-                                                            scheduled_intervals=["1m", "5m", "15m", "30m", "1h", "4h", "1d"],
-                                                            asset_type_filter=["Crypto"]
-                                                        )
-                                                        self.logger.info(f"Setting scheduled_intervals=['1m', '5m', '15m', '30m', '1h', '4h', '1d'] and asset_type_filter=['Crypto'] for {group_name}")
-                                                    elif group_name == "commodity_ohlcv_clients":
-                                                        # 원자재 OHLCV 데이터 수집 (1d)
-                                                        collector_instance.set_schedule_config(
-                                                            scheduled_intervals=["1d"],
-                                                            asset_type_filter=["Commodities"]
-                                                        )
-                                                        self.logger.info(f"Setting scheduled_intervals=['1d'] and asset_type_filter=['Commodities'] for {group_name}")
-                                                
-                                                # CommodityOHLCVAggregatorCollector인 경우 집계할 interval 설정
-                                                if collector_class.__name__ == "CommodityOHLCVAggregatorCollector" and hasattr(collector_instance, 'set_schedule_config'):
-                                                    if group_name == "commodity_ohlcv_aggregator_intraday":
-                                                        collector_instance.set_schedule_config(intervals=["1h", "4h"])
-                                                        self.logger.info(f"Setting aggregation intervals=['1h', '4h'] for {group_name}")
-                                                    elif group_name == "commodity_ohlcv_aggregator_daily":
-                                                        collector_instance.set_schedule_config(intervals=["1d"])
-                                                        self.logger.info(f"Setting aggregation intervals=['1d'] for {group_name}")
-                                                
-                                                # stock_profiles_fmp_clients 그룹인 경우 FMP 클라이언트 사용 설정 (위에서 이미 처리됨)
-                                                if group_name == "stock_profiles_fmp_clients" and hasattr(collector_instance, 'use_fmp_clients'):
-                                                    if not collector_instance.use_fmp_clients:  # 위에서 설정하지 않은 경우에만
-                                                        collector_instance.use_fmp_clients = True
-                                                        self.logger.info(f"Setting use_fmp_clients=True for {collector_instance.__class__.__name__}")
-                                                
-                                                tasks.append(collector_instance.collect_with_settings())
-                                            if tasks:
-                                                loop.run_until_complete(asyncio.gather(*tasks))
+                                            self.job_runtime.run(group_name, _run_group_collectors, db=db)
                                         except Exception as e:
                                             self.logger.error(f"Group runner error for {group_name}: {e}", exc_info=True)
                                             # Ensure transaction is rolled back on error
@@ -912,7 +831,109 @@ class SchedulerService:
                                                 db.close()
                                             except Exception as close_error:
                                                 self.logger.error(f"Failed to close database session: {close_error}")
-                                            loop.close()
+
+                                    async def _run_group_collectors(ctx: JobContext):
+                                        tasks = []
+                                        # Determine which collectors to run from group name
+                                        mapping = {
+                                            "ohlcv_day_clients": ["OHLCV"],
+                                            "ohlcv_intraday_clients": ["OHLCV"],
+                                            "crypto_ohlcv_clients": ["OHLCV"],
+                                            "commodity_ohlcv_clients": ["OHLCV"],
+                                            "stock_profiles_clients": ["StockProfile"],
+                                            "stock_profiles_fmp_clients": ["StockProfile"],  # ⭐ FMP 전용 프로필 수집 (일요일)
+                                            "crypto_clients": ["CryptoInfo"],
+                                            "onchain_clients": ["Onchain"],
+                                            "stock_financials_clients": [],
+                                            "stock_financials_macrotrends_clients": ["StockFinancialsMacrotrends"],
+                                            "stock_analyst_estimates_clients": [],
+                                            "etf_clients": ["ETFInfo"],
+                                            "world_assets_clients": ["WorldAssets"],
+                                            "commodity_ohlcv_aggregator_intraday": ["CommodityOHLCVAggregator"],
+                                            "commodity_ohlcv_aggregator_intraday": ["CommodityOHLCVAggregator"],
+                                            "commodity_ohlcv_aggregator_daily": ["CommodityOHLCVAggregator"],
+                                            "fred_clients": ["Fred"],
+                                        }
+                                        job_names = mapping.get(group_name, [])
+                                        for job_name in job_names:
+                                            meta = self.JOB_MAPPING.get(job_name)
+                                            if not meta:
+                                                continue
+                                            is_enabled_method = getattr(self.config_manager, meta["config_key"])
+                                            if not is_enabled_method():
+                                                continue
+                                            collector_class = meta["class"]
+                                            collector_instance = collector_class(
+                                                db=ctx.db,
+                                                config_manager=self.config_manager,
+                                                api_manager=ctx.api_manager,
+                                                redis_queue_manager=ctx.redis_queue_manager,
+                                            )
+                                            
+                                            # StockCollector인 경우 스케줄 그룹에 따라 데이터 타입 제한 설정
+                                            if collector_class.__name__ == "StockCollector" and hasattr(collector_instance, 'set_schedule_config'):
+                                                if group_name == "stock_profiles_clients":
+                                                    # 프로필만 수집
+                                                    collector_instance.set_schedule_config(scheduled_data_types=["profile"])
+                                                    self.logger.info(f"Setting scheduled_data_types=['profile'] for {group_name}")
+                                                elif group_name == "stock_profiles_fmp_clients":
+                                                    # FMP 프로필만 수집
+                                                    collector_instance.set_schedule_config(scheduled_data_types=["profile"])
+                                                    collector_instance.use_fmp_clients = True
+                                                    self.logger.info(f"Setting scheduled_data_types=['profile'] and use_fmp_clients=True for {group_name}")
+                                                elif group_name == "stock_financials_clients":
+                                                    # 재무만 수집
+                                                    collector_instance.set_schedule_config(scheduled_data_types=["financials"])
+                                                    self.logger.info(f"Setting scheduled_data_types=['financials'] for {group_name}")
+                                                elif group_name == "stock_analyst_estimates_clients":
+                                                    # 추정치만 수집
+                                                    collector_instance.set_schedule_config(scheduled_data_types=["estimates"])
+                                                    self.logger.info(f"Setting scheduled_data_types=['estimates'] for {group_name}")
+                                            
+                                            # OHLCVCollector인 경우 스케줄 그룹에 따라 interval 필터링 설정
+                                            if collector_class.__name__ == "OHLCVCollector" and hasattr(collector_instance, 'set_schedule_config'):
+                                                if group_name == "ohlcv_day_clients":
+                                                    # 일봉 데이터만 수집 (1d, 1w, 1mo 등)
+                                                    collector_instance.set_schedule_config(scheduled_intervals=["1d", "1w", "1mo", "1month"])
+                                                    self.logger.info(f"Setting scheduled_intervals=['1d', '1w', '1mo', '1month'] for {group_name}")
+                                                elif group_name == "ohlcv_intraday_clients":
+                                                    # 인트라데이 데이터만 수집 (1m, 5m, 15m, 30m, 1h, 4h 등)
+                                                    collector_instance.set_schedule_config(scheduled_intervals=["1m", "5m", "15m", "30m", "1h", "4h"])
+                                                    self.logger.info(f"Setting scheduled_intervals=['1m', '5m', '15m', '30m', '1h', '4h'] for {group_name}")
+                                                elif group_name == "crypto_ohlcv_clients":
+                                                    # 암호화폐 OHLCV 데이터 수집 (1m, 5m, 15m, 30m, 1h, 4h, 1d)
+                                                    collector_instance.set_schedule_config(
+                                                        scheduled_intervals=["1m", "5m", "15m", "30m", "1h", "4h", "1d"],
+                                                        asset_type_filter=["Crypto"]
+                                                    )
+                                                    self.logger.info(f"Setting scheduled_intervals=['1m', '5m', '15m', '30m', '1h', '4h', '1d'] and asset_type_filter=['Crypto'] for {group_name}")
+                                                elif group_name == "commodity_ohlcv_clients":
+                                                    # 원자재 OHLCV 데이터 수집 (1d)
+                                                    collector_instance.set_schedule_config(
+                                                        scheduled_intervals=["1d"],
+                                                        asset_type_filter=["Commodities"]
+                                                    )
+                                                    self.logger.info(f"Setting scheduled_intervals=['1d'] and asset_type_filter=['Commodities'] for {group_name}")
+                                            
+                                            # CommodityOHLCVAggregatorCollector인 경우 집계할 interval 설정
+                                            if collector_class.__name__ == "CommodityOHLCVAggregatorCollector" and hasattr(collector_instance, 'set_schedule_config'):
+                                                if group_name == "commodity_ohlcv_aggregator_intraday":
+                                                    collector_instance.set_schedule_config(intervals=["1h", "4h"])
+                                                    self.logger.info(f"Setting aggregation intervals=['1h', '4h'] for {group_name}")
+                                                elif group_name == "commodity_ohlcv_aggregator_daily":
+                                                    collector_instance.set_schedule_config(intervals=["1d"])
+                                                    self.logger.info(f"Setting aggregation intervals=['1d'] for {group_name}")
+                                            
+                                            # stock_profiles_fmp_clients 그룹인 경우 FMP 클라이언트 사용 설정 (위에서 이미 처리됨)
+                                            if group_name == "stock_profiles_fmp_clients" and hasattr(collector_instance, 'use_fmp_clients'):
+                                                if not collector_instance.use_fmp_clients:  # 위에서 설정하지 않은 경우에만
+                                                    collector_instance.use_fmp_clients = True
+                                                    self.logger.info(f"Setting use_fmp_clients=True for {collector_instance.__class__.__name__}")
+                                            
+                                            tasks.append(collector_instance.collect_with_settings())
+                                        if tasks:
+                                            await asyncio.gather(*tasks)
+
                                     return _run_group
 
                                 self.scheduler.add_job(
@@ -1009,6 +1030,18 @@ class SchedulerService:
                 )
                 self.logger.info(f"✅ Scheduled job: 'daily_quant_seasonality_job' (Daily at 01:00 UTC)")
 
+                # --- Daily Rolling Correlation Job ---
+                # Run at 01:30 UTC: 전일(UTC) 일봉까지 반영 (미국장 마감 + 크립토 일봉 확정 이후)
+                self.scheduler.add_job(
+                    self._create_rolling_correlation_function(),
+                    'cron',
+                    hour=1,
+                    minute=30,
+                    id='daily_rolling_correlation_job',
+                    replace_existing=True
+                )
+                self.logger.info(f"✅ Scheduled job: 'daily_rolling_correlation_job' (Daily at 01:30 UTC)")
+
                 return
 
         # --- Legacy interval-based path ---
@@ -1093,6 +1126,17 @@ class SchedulerService:
         )
         self.logger.info("✅ Scheduled job: 'treemap_view_refresh' (15m)")
 
+        # --- Daily Rolling Correlation Job ---
+        self.scheduler.add_job(
+            self._create_rolling_correlation_function(),
+            'cron',
+            hour=1,
+            minute=30,
+            id='daily_rolling_correlation_job',
+            replace_existing=True
+        )
+        self.logger.info(f"✅ Scheduled job: 'daily_rolling_correlation_job' (Daily at 01:30 {self.scheduler.timezone})")
+
         # --- Daily US Stock Backfill Job ---
         # Run at 06:00 KST / 21:00 UTC
         if self.config_manager.is_ohlcv_collection_enabled():
@@ -1287,6 +1331,7 @@ class SchedulerService:
         if self.scheduler.running:
             self.scheduler.shutdown()
             self.logger.info("Scheduler shut down successfully.")
+        self.job_runtime.shutdown()
 
     async def start_all_jobs(self) -> Dict:
         """Starts all scheduled jobs."""
@@ -1388,7 +1433,8 @@ class SchedulerService:
         return {
             "is_running": self.scheduler.running,
             "job_count": len(jobs_info),
-            "jobs": jobs_info
+            "jobs": jobs_info,
+            "runtime": self.job_runtime.stats()
         }
 
 # --- Global Singleton Instance ---
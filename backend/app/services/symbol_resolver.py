@@ -0,0 +1,275 @@
+"""
+Symbol Resolver - 공급자별 원시 심볼을 자산으로 해석하는 공용 인덱스
+- (provider, raw_symbol) 키의 단일 dict에 공급자별 심볼 변형을 미리 계산해 두고
+  핫 루프에서는 dict 조회 한 번으로 해석 (추가 규칙이 없는 공급자는 공통 그룹 "*" 공유)
+- assets.updated_at 워터마크(>=, 같은 시각은 asset_id로 구분) 기준으로 변경된 자산만 증분 반영
+  (바뀐 자산의 이전/새 키만 다시 계산 -> 비용은 변경 행 수에 비례)
+- 삭제된 자산은 updated_at으로 잡히지 않으므로 SYMBOL_RECONCILE_SECONDS 마다 전체 재적재로 정리
+- StreamConsumer(데이터 처리기)와 WebSocket Broadcaster가 함께 사용
+"""
+import logging
+import os
+import threading
+import time
+from datetime import datetime
+from typing import Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+from sqlalchemy.orm import Session
+
+from ..models.asset import Asset, AssetType
+
+logger = logging.getLogger(__name__)
+
+ANY_PROVIDER = "*"
+# 전체 재적재(삭제된 자산 정리) 주기
+RECONCILE_SECONDS = int(os.getenv("SYMBOL_RECONCILE_SECONDS", "3600"))
+
+# 스트림에 들어오는 심볼 형태 ({t} = DB 티커)
+# 기존 StreamConsumer / Broadcaster 해석 규칙의 합집합
+COMMON_VARIANTS = ("{t}USDT", "{t}-USD", "{t}-USDT", "{t}/USD", "BINANCE:{t}USDT", "BINANCE:{t}")
+
+# 공통 규칙 외에 추가 변형이 필요한 공급자만 별도 그룹으로 인덱싱
+# 정확히 일치하는 티커가 항상 우선하며, 변형은 비어 있는 키에만 등록됨
+PROVIDER_VARIANTS: Dict[str, Tuple[str, ...]] = {
+    ANY_PROVIDER: COMMON_VARIANTS,
+    "coinbase": COMMON_VARIANTS + ("{t}-USDC", "{t}-EUR"),
+}
+
+# 사용자 입력 식별자 보정 규칙 (resolve_asset_identifier와 동일한 순서)
+STRIP_SUFFIXES = ("USDT", "-USD", "USD")
+APPEND_SUFFIXES = ("USDT", "USD", "-USD")
+
+
+def identifier_candidates(identifier: str) -> List[str]:
+    """식별자를 티커 후보 목록으로 변환: 정확한 티커 -> 접미사 제거 -> 접미사 추가"""
+    candidates = [identifier]
+    for suffix in STRIP_SUFFIXES:
+        if identifier.endswith(suffix) and len(identifier) > len(suffix):
+            candidates.append(identifier[:-len(suffix)])
+            break
+    candidates.extend(f"{identifier}{suffix}" for suffix in APPEND_SUFFIXES)
+    return candidates
+
+
+class ResolvedSymbol(NamedTuple):
+    asset_id: int
+    ticker: str          # 방송/저장에 사용하는 원본(Canonical) 티커
+    asset_type: str
+    is_active: bool
+
+
+class SymbolResolver:
+    """(provider, raw_symbol) -> ResolvedSymbol 사전 계산 인덱스"""
+
+    def __init__(self, provider_variants: Dict[str, Tuple[str, ...]] = None, reconcile_seconds: int = RECONCILE_SECONDS):
+        self.provider_variants = provider_variants or PROVIDER_VARIANTS
+        self.reconcile_seconds = reconcile_seconds
+        self._index: Dict[Tuple[str, str], ResolvedSymbol] = {}
+        self._assets: Dict[int, ResolvedSymbol] = {}
+        # 티커 -> {asset_id: 자산} (증분 갱신 시 키를 두고 경쟁하는 자산 조회용)
+        self._by_ticker: Dict[str, Dict[int, ResolvedSymbol]] = {}
+        self._reconciled_at = float("-inf")
+        self._watermark: Optional[datetime] = None
+        # 워터마크와 같은 updated_at으로 이미 반영한 asset_id
+        self._watermark_ids: Set[int] = set()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    # ------------------------------------------------------------------
+    # 조회 (핫 루프)
+    # ------------------------------------------------------------------
+    def resolve(self, provider: str, raw_symbol: str) -> Optional[ResolvedSymbol]:
+        """공급자와 원시 심볼(대문자)로 자산 해석"""
+        group = provider if provider in self.provider_variants else ANY_PROVIDER
+        resolved = self._index.get((group, raw_symbol))
+        if resolved is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return resolved
+
+    def resolve_identifier(self, identifier: str) -> Optional[ResolvedSymbol]:
+        """사용자 입력 티커(BTC, BTCUSDT, SOL-USD 등)를 인덱스만으로 해석. 없으면 None"""
+        for candidate in identifier_candidates(identifier.upper()):
+            resolved = self._index.get((ANY_PROVIDER, candidate))
+            if resolved is not None:
+                self.hits += 1
+                return resolved
+        self.misses += 1
+        return None
+
+    def get_asset(self, asset_id: int) -> Optional[ResolvedSymbol]:
+        return self._assets.get(asset_id)
+
+    @property
+    def asset_count(self) -> int:
+        return len(self._assets)
+
+    def stats(self) -> Dict[str, float]:
+        total = self.hits + self.misses
+        return {
+            "assets": len(self._assets),
+            "index_size": len(self._index),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": (self.hits / total) if total else 0.0,
+            "watermark": self._watermark.isoformat() if self._watermark else None,
+        }
+
+    # ------------------------------------------------------------------
+    # 갱신
+    # ------------------------------------------------------------------
+    def refresh(self, db: Session, full: bool = False) -> int:
+        """
+        assets 테이블에서 인덱스를 갱신.
+        최초 호출, full=True, 또는 reconcile_seconds 가 지났으면 전체 적재 (삭제된 자산 정리),
+        그 외에는 updated_at이 워터마크 이상인 자산만 반영.
+        - 워터마크와 같은 시각의 행은 늦게 커밋될 수 있으므로 다시 조회하고 (>=),
+          그 시각에 이미 반영한 asset_id는 건너뜀 (tie-break)
+        반환값: 반영(추가/변경/삭제)된 자산 수 (전체 적재는 적재한 자산 수)
+        """
+        query = db.query(
+            Asset.asset_id, Asset.ticker, AssetType.type_name, Asset.is_active, Asset.updated_at
+        ).join(AssetType, Asset.asset_type_id == AssetType.asset_type_id)
+
+        now = time.monotonic()
+        incremental = not full and self._watermark is not None and now - self._reconciled_at < self.reconcile_seconds
+        if incremental:
+            watermark, seen = self._watermark, self._watermark_ids
+            query = query.filter(Asset.updated_at >= watermark)
+            rows = [r for r in query.all() if not (r[4] == watermark and r[0] in seen)]
+            if not rows:
+                return 0
+            self.load_rows(rows, replace=False)
+            removed = 0
+        else:
+            rows = query.all()
+            previous = set(self._assets)
+            self.load_rows(rows, replace=True)
+            removed = len(previous - set(self._assets))
+            self._reconciled_at = now
+
+        logger.info(
+            f"🔎 SymbolResolver {'incremental' if incremental else 'full'} refresh: "
+            f"{len(rows)} assets, {removed} removed, index {len(self._index)} entries"
+        )
+        return len(rows) + removed
+
+    def load_rows(self, rows: Iterable[tuple], replace: bool = True, removed: Iterable[int] = ()):
+        """
+        (asset_id, ticker, type_name, is_active[, updated_at]) 행으로 자산 목록을 갱신.
+        replace=True 이면 인덱스를 전체 자산에서 새로 만들고, 아니면 바뀐 자산의 이전/새 키만 다시 계산
+        (두 경우 모두 삭제/티커 변경/비활성화된 자산의 이전 키가 남지 않고 결과 인덱스가 같음)
+        """
+        with self._lock:
+            if replace:
+                watermark, watermark_ids = None, set()
+            else:
+                watermark, watermark_ids = self._watermark, set(self._watermark_ids)
+
+            changed: Dict[int, Optional[ResolvedSymbol]] = {asset_id: None for asset_id in removed}
+            for row in rows:
+                asset_id, ticker, type_name, is_active = row[0], row[1], row[2], row[3]
+                updated_at = row[4] if len(row) > 4 else None
+                if updated_at is not None:
+                    if watermark is None or updated_at > watermark:
+                        watermark, watermark_ids = updated_at, {asset_id}
+                    elif updated_at == watermark:
+                        watermark_ids.add(asset_id)
+                changed[asset_id] = (
+                    ResolvedSymbol(asset_id, ticker.upper(), type_name or "Unknown", bool(is_active)) if ticker else None
+                )
+
+            if replace:
+                self._rebuild({asset_id: resolved for asset_id, resolved in changed.items() if resolved is not None})
+            else:
+                self._apply_changes(changed)
+            self._watermark = watermark
+            self._watermark_ids = watermark_ids
+
+    def _rebuild(self, assets: Dict[int, ResolvedSymbol]):
+        # 활성 자산이 먼저 등록되도록 정렬 (중복 티커는 먼저 등록된 자산이 유지됨)
+        entries = sorted(assets.values(), key=self._priority)
+        index: Dict[Tuple[str, str], ResolvedSymbol] = {}
+        by_ticker: Dict[str, Dict[int, ResolvedSymbol]] = {}
+        # 1차: 정확한 티커, 2차: 공급자별 변형 (정확 일치가 항상 우선)
+        for resolved in entries:
+            by_ticker.setdefault(resolved.ticker, {})[resolved.asset_id] = resolved
+            for provider in self.provider_variants:
+                self._register(index, (provider, resolved.ticker), resolved)
+        for resolved in entries:
+            for provider, templates in self.provider_variants.items():
+                for template in templates:
+                    self._register(index, (provider, template.format(t=resolved.ticker)), resolved)
+
+        self._index = index
+        self._assets = assets
+        self._by_ticker = by_ticker
+
+    def _apply_changes(self, changed: Dict[int, Optional[ResolvedSymbol]]):
+        """바뀐 자산(None 이면 제거)의 이전/새 키만 다시 계산 (조회 스레드는 키 단위로 교체된 값을 봄)"""
+        affected = set()
+        for asset_id, resolved in changed.items():
+            previous = self._assets.pop(asset_id, None)
+            if previous is not None:
+                affected.update(self._keys(previous))
+                holders = self._by_ticker.get(previous.ticker, {})
+                holders.pop(asset_id, None)
+                if not holders:
+                    self._by_ticker.pop(previous.ticker, None)
+            if resolved is not None:
+                self._assets[asset_id] = resolved
+                self._by_ticker.setdefault(resolved.ticker, {})[asset_id] = resolved
+                affected.update(self._keys(resolved))
+
+        for key in affected:
+            winner = None
+            for candidate in self._claimants(key):
+                if winner is None or (not winner.is_active and candidate.is_active):
+                    winner = candidate
+            if winner is None:
+                self._index.pop(key, None)
+            else:
+                self._index[key] = winner
+
+    def _keys(self, resolved: ResolvedSymbol) -> List[Tuple[str, str]]:
+        keys = []
+        for provider, templates in self.provider_variants.items():
+            keys.append((provider, resolved.ticker))
+            keys.extend((provider, template.format(t=resolved.ticker)) for template in templates)
+        return keys
+
+    def _claimants(self, key: Tuple[str, str]) -> List[ResolvedSymbol]:
+        """_rebuild 등록 순서대로 key 를 가질 수 있는 자산 (정확한 티커 -> 변형)"""
+        provider, symbol = key
+        exact = sorted(self._by_ticker.get(symbol, {}).values(), key=self._priority)
+        variants = []
+        for order, template in enumerate(self.provider_variants[provider]):
+            prefix, suffix = template.split("{t}")
+            if len(symbol) > len(prefix) + len(suffix) and symbol.startswith(prefix) and symbol.endswith(suffix):
+                ticker = symbol[len(prefix):len(symbol) - len(suffix)]
+                variants.extend((self._priority(r), order, r) for r in self._by_ticker.get(ticker, {}).values())
+        return exact + [r for _, _, r in sorted(variants, key=lambda v: (v[0], v[1]))]
+
+    @staticmethod
+    def _priority(resolved: ResolvedSymbol) -> Tuple[bool, int]:
+        return (not resolved.is_active, resolved.asset_id)
+
+    @staticmethod
+    def _register(index, key, resolved: ResolvedSymbol):
+        current = index.get(key)
+        # 비활성 자산이 점유한 키는 활성 자산이 가져감
+        if current is None or (not current.is_active and resolved.is_active):
+            index[key] = resolved
+
+    def load_mapping(self, asset_map: Dict[str, Dict[str, object]]):
+        """{ticker: {'id': asset_id, 'type': type_name}} 형태의 맵으로 전체 적재"""
+        self.load_rows(
+            (info['id'], ticker, info.get('type'), info.get('is_active', True))
+            for ticker, info in asset_map.items()
+        )
+
+
+# 프로세스 공용 인스턴스
+symbol_resolver = SymbolResolver()
@@ -0,0 +1,216 @@
+"""
+backtest_engine 패리티 테스트
+- legacy_simulate: 기존 /api/v2/backtest POST의 iterrows 루프 (참조 구현)
+- 무작위 가격/규칙 조합에서 벡터화 엔진과 통계/곡선이 완전히 일치하는지 확인
+"""
+import random
+from datetime import timedelta
+
+import numpy as np
+import pandas as pd
+
+from app.services.backtest_engine import run_backtest
+
+
+def calculate_rsi(series, period=14):
+    delta = series.diff()
+    gain = (delta.where(delta > 0, 0)).rolling(window=period).mean()
+    loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
+    rs = gain / loss
+    return 100 - (100 / (1 + rs))
+
+
+def legacy_simulate(df, entry_rules, exit_rules, initial_capital=1000.0, leverage=1.0, side="long"):
+    """기존 엔드포인트의 시뮬레이션 루프 (변경 전 코드 그대로)"""
+    balance = initial_capital
+    position_size = 0
+    equity_curve = []
+    trades = []
+    in_position = False
+    liquidated = False
+    liquidation_time = None
+    peak_equity = initial_capital
+    max_dd = 0
+    winning_trades = 0
+    total_trades = 0
+
+    month_map = {1: "Jan", 2: "Feb", 3: "Mar", 4: "Apr", 5: "May", 6: "Jun", 7: "Jul", 8: "Aug", 9: "Sep", 10: "Oct", 11: "Nov", 12: "Dec"}
+    day_map = {0: "Mon", 1: "Tue", 2: "Wed", 3: "Thu", 4: "Fri", 5: "Sat", 6: "Sun"}
+
+    for ts, row in df.iterrows():
+        if liquidated:
+            equity_curve.append([int(ts.timestamp() * 1000), 0.0])
+            continue
+
+        current_price = float(row['close_price'])
+        ts_local = ts
+        if entry_rules.get('timezone') == 'KST':
+            ts_local = ts + timedelta(hours=9)
+
+        current_month = month_map[ts_local.month]
+        current_day = day_map[ts_local.weekday()]
+        current_hour = ts_local.hour
+
+        should_exit = False
+        if in_position:
+            if current_month in exit_rules.get('months', []):
+                should_exit = True
+            if exit_rules.get('rsi', {}).get('enabled'):
+                rsi_val = exit_rules['rsi'].get('value', 70)
+                if side == "long":
+                    if row['rsi'] > rsi_val: should_exit = True
+                else:
+                    if row['rsi'] < rsi_val: should_exit = True
+
+            if side == "long":
+                unrealized_pnl = (current_price - entry_price) * position_size
+            else:
+                unrealized_pnl = (entry_price - current_price) * position_size
+            current_equity = balance + unrealized_pnl
+            if current_equity <= 0:
+                liquidated = True
+                liquidation_time = ts
+                balance = 0
+                position_size = 0
+                in_position = False
+                trades.append({'type': 'liquidation', 'price': current_price, 'time': ts})
+                equity_curve.append([int(ts.timestamp() * 1000), 0.0])
+                continue
+
+        should_entry = False
+        if not in_position and not liquidated:
+            if current_month in entry_rules.get('months', []):
+                if entry_rules.get('day') == 'Any' or current_day == entry_rules.get('day'):
+                    if current_hour == entry_rules.get('hour'):
+                        rsi_cond = True
+                        if entry_rules.get('rsi', {}).get('enabled'):
+                            rsi_val = entry_rules['rsi'].get('value', 40)
+                            operator = entry_rules['rsi'].get('operator', '<')
+                            if side == "long":
+                                if operator == '<': rsi_cond = row['rsi'] < rsi_val
+                                else: rsi_cond = row['rsi'] > rsi_val
+                            else:
+                                if operator == '>': rsi_cond = row['rsi'] > rsi_val
+                                else: rsi_cond = row['rsi'] < rsi_val
+                        if rsi_cond:
+                            should_entry = True
+
+        if should_entry and not in_position:
+            position_size = (balance * leverage) / current_price
+            entry_price = current_price
+            in_position = True
+            trades.append({'type': 'entry', 'side': side, 'price': current_price, 'time': ts})
+        elif should_exit and in_position:
+            if side == "long":
+                profit_loss = (current_price - entry_price) * position_size
+            else:
+                profit_loss = (entry_price - current_price) * position_size
+            balance += profit_loss
+            total_trades += 1
+            if profit_loss > 0:
+                winning_trades += 1
+            position_size = 0
+            in_position = False
+            trades.append({'type': 'exit', 'side': side, 'price': current_price, 'time': ts})
+
+        current_equity = balance
+        if in_position:
+            if side == "long":
+                unrealized_pnl = (current_price - entry_price) * position_size
+            else:
+                unrealized_pnl = (entry_price - current_price) * position_size
+            current_equity += unrealized_pnl
+
+        if current_equity > peak_equity:
+            peak_equity = current_equity
+        dd = (peak_equity - current_equity) / peak_equity * 100 if peak_equity > 0 else 0
+        if dd > max_dd:
+            max_dd = dd
+
+        equity_curve.append([int(ts.timestamp() * 1000), round(float(current_equity), 2)])
+
+    final_value = equity_curve[-1][1]
+    total_roi = ((final_value / initial_capital) - 1) * 100 if initial_capital > 0 else 0
+    win_rate = (winning_trades / total_trades * 100) if total_trades > 0 else 0
+
+    first_price = float(df['close_price'].iloc[0])
+    benchmark_curve = [[int(ts.timestamp() * 1000), round(float(initial_capital * (row['close_price'] / first_price)), 2)] for ts, row in df.iterrows()]
+
+    if len(equity_curve) > 500:
+        step = len(equity_curve) // 500
+        equity_curve = equity_curve[::step]
+        benchmark_curve = benchmark_curve[::step]
+
+    return {
+        "liquidated": liquidated,
+        "liquidation_time": liquidation_time,
+        "stats": {
+            "initial_capital": initial_capital,
+            "final_value": round(final_value, 2),
+            "total_roi": round(total_roi, 2),
+            "max_drawdown": round(max_dd, 2),
+            "win_rate": round(win_rate, 2),
+            "total_trades": total_trades
+        },
+        "graph": {
+            "strategy": equity_curve,
+            "benchmark": benchmark_curve
+        }
+    }
+
+
+def make_hourly_df(hours: int, seed: int = 0, volatility: float = 0.01) -> pd.DataFrame:
+    """무작위 보행 시간봉 가격 + RSI"""
+    rng = np.random.default_rng(seed)
+    index = pd.date_range("2021-01-01", periods=hours, freq="h")
+    close = 30000 * np.exp(np.cumsum(rng.normal(0, volatility, hours)))
+    df = pd.DataFrame({"close_price": close}, index=index)
+    df.index.name = "timestamp_utc"
+    df["rsi"] = calculate_rsi(df["close_price"])
+    return df
+
+
+def random_rules(rnd: random.Random):
+    months = ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
+    days = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun", "Any"]
+    entry_rules = {
+        "months": rnd.sample(months, rnd.randint(1, 12)),
+        "day": rnd.choice(days),
+        "hour": rnd.randint(0, 23),
+        "timezone": rnd.choice(["UTC", "KST"]),
+        "rsi": {"enabled": rnd.random() < 0.6, "value": rnd.randint(20, 80), "operator": rnd.choice(["<", ">"])},
+    }
+    exit_rules = {
+        "months": rnd.sample(months, rnd.randint(0, 6)),
+        "rsi": {"enabled": rnd.random() < 0.7, "value": rnd.randint(20, 80)},
+    }
+    return entry_rules, exit_rules
+
+
+def test_vectorized_backtest_matches_legacy_loop():
+    rnd = random.Random(7)
+    for case in range(60):
+        df = make_hourly_df(hours=rnd.choice([300, 2000, 9000]), seed=case, volatility=rnd.choice([0.005, 0.02, 0.05]))
+        entry_rules, exit_rules = random_rules(rnd)
+        side = rnd.choice(["long", "short"])
+        leverage = rnd.choice([1.0, 3.0, 20.0])
+
+        expected = legacy_simulate(df, entry_rules, exit_rules, 1000.0, leverage, side)
+        actual = run_backtest(df, entry_rules, exit_rules, 1000.0, leverage, side)
+        assert actual == expected, f"case {case} mismatch: {entry_rules} {exit_rules} {side} x{leverage}"
+
+
+def test_liquidation_stops_equity():
+    df = make_hourly_df(hours=3000, seed=3, volatility=0.05)
+    entry_rules = {"months": ["Jan"], "day": "Any", "hour": 0, "rsi": {"enabled": False}}
+    exit_rules = {"months": [], "rsi": {"enabled": False}}
+    result = run_backtest(df, entry_rules, exit_rules, 1000.0, 50.0, "long")
+    assert result == legacy_simulate(df, entry_rules, exit_rules, 1000.0, 50.0, "long")
+    if result["liquidated"]:
+        assert result["stats"]["final_value"] == 0.0
+
+
+if __name__ == "__main__":
+    test_vectorized_backtest_matches_legacy_loop()
+    test_liquidation_stops_equity()
+    print("✅ backtest_engine parity OK")
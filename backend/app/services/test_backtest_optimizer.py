@@ -0,0 +1,135 @@
+"""
+backtest_optimizer 패리티 테스트
+- legacy_run_simulation: 기존 scripts/optimize_btcusdt.py의 iterrows 루프 (참조 구현)
+- 전체 그리드 ROI 일치, 상한 기반 제외 후에도 Top-N 동일, 워커 프로세스 경로 결과 동일 확인
+"""
+from app.services.backtest_optimizer import (
+    GridSpec,
+    optimize_grid,
+    seasonal_roi,
+)
+from app.services.test_backtest_engine import make_hourly_df
+
+
+def legacy_run_simulation(df, entry_rules, exit_rules):
+    """기존 optimize_btcusdt.run_simulation (변경 전 코드 그대로)"""
+    initial_capital = 1000.0
+    balance = initial_capital
+    position_size = 0
+    in_position = False
+
+    month_map = {1: "Jan", 2: "Feb", 3: "Mar", 4: "Apr", 5: "May", 6: "Jun", 7: "Jul", 8: "Aug", 9: "Sep", 10: "Oct", 11: "Nov", 12: "Dec"}
+    day_map = {0: "Mon", 1: "Tue", 2: "Wed", 3: "Thu", 4: "Fri", 5: "Sat", 6: "Sun"}
+
+    for ts, row in df.iterrows():
+        current_price = float(row['close_price'])
+        current_month = month_map[ts.month]
+        current_day = day_map[ts.weekday()]
+        current_hour = ts.hour
+
+        should_entry = False
+        if not in_position:
+            if not entry_rules.get('months') or current_month in entry_rules.get('months', []):
+                if entry_rules.get('day') == 'Any' or current_day == entry_rules.get('day'):
+                    if entry_rules.get('hour') is None or current_hour == entry_rules.get('hour'):
+                        rsi_cond = True
+                        if entry_rules.get('rsi_enabled'):
+                            rsi_val = entry_rules.get('rsi_value', 40)
+                            operator = entry_rules.get('rsi_operator', '<')
+                            if operator == '<':
+                                rsi_cond = row['rsi'] < rsi_val
+                            else:
+                                rsi_cond = row['rsi'] > rsi_val
+                        if rsi_cond:
+                            should_entry = True
+
+        should_exit = False
+        if in_position:
+            if current_month in exit_rules.get('months', []):
+                should_exit = True
+            if exit_rules.get('rsi_enabled'):
+                rsi_val = exit_rules.get('rsi_value', 70)
+                if row['rsi'] > rsi_val:
+                    should_exit = True
+
+        if should_entry and not in_position:
+            position_size = balance / current_price
+            entry_price = current_price
+            in_position = True
+        elif should_exit and in_position:
+            profit_loss = (current_price - entry_price) * position_size
+            balance += profit_loss
+            position_size = 0
+            in_position = False
+
+    if in_position:
+        final_price = float(df['close_price'].iloc[-1])
+        balance += (final_price - entry_price) * position_size
+
+    return round(((balance / initial_capital) - 1) * 100, 2)
+
+
+PERIODS = {"1 Month": 30, "3 Months": 90}
+
+
+def legacy_grid(df, grid, periods):
+    latest = df.index[-1]
+    expected = {}
+    for period, days in periods.items():
+        period_df = df[df.index >= latest - __import__("datetime").timedelta(days=days)]
+        for combo in grid.combinations():
+            hour, day, rsi_value = combo
+            entry_rules = {'hour': hour, 'day': day, 'rsi_enabled': True, 'rsi_value': rsi_value, 'rsi_operator': '<'}
+            exit_rules = {'rsi_enabled': True, 'rsi_value': 70}
+            expected[(period, combo)] = legacy_run_simulation(period_df, entry_rules, exit_rules)
+    return expected
+
+
+def test_grid_matches_legacy_and_pruning_keeps_top_n():
+    df = make_hourly_df(hours=24 * 120, seed=11, volatility=0.01)
+    grid = GridSpec()
+    expected = legacy_grid(df, grid, PERIODS)
+
+    full = optimize_grid(df, grid, periods=PERIODS, top_n=len(grid.combinations()), workers=1, prune=False)
+    for period, result in full.items():
+        assert result.evaluated == len(grid.combinations())
+        for entry in result.top:
+            assert entry["roi"] == expected[(period, tuple(entry["params"]))]
+
+    pruned = optimize_grid(df, grid, periods=PERIODS, top_n=3, workers=1, batch_size=4)
+    for period, result in pruned.items():
+        assert result.pruned > 0
+        assert [e["params"] for e in result.top] == [e["params"] for e in full[period].top[:3]]
+        # 기존 스크립트의 '첫 최댓값' 선택과 동일
+        legacy_best = max(grid.combinations(), key=lambda c: (expected[(period, c)], -grid.combinations().index(c)))
+        assert tuple(result.best["params"]) == legacy_best
+
+
+def test_worker_processes_and_cache():
+    df = make_hourly_df(hours=24 * 100, seed=5, volatility=0.02)
+    grid = GridSpec()
+    in_process = optimize_grid(df, grid, periods=PERIODS, workers=1)
+
+    cache = {}
+    parallel = optimize_grid(df, grid, periods=PERIODS, workers=2, cache=cache)
+    for period in PERIODS:
+        assert parallel[period].top == in_process[period].top
+
+    cached = optimize_grid(df, grid, periods=PERIODS, workers=2, cache=cache)
+    for period in PERIODS:
+        assert cached[period].evaluated == 0
+        assert [e["roi"] for e in cached[period].top] == [e["roi"] for e in in_process[period].top]
+
+
+def test_seasonal_matches_legacy():
+    df = make_hourly_df(hours=24 * 400, seed=2, volatility=0.01)
+    sim_entry = {'months': ['Nov', 'Dec', 'Jan', 'Feb', 'Mar', 'Apr'], 'day': 'Any', 'hour': None, 'rsi_enabled': False}
+    sim_exit = {'months': ['May']}
+    assert seasonal_roi(df) == legacy_run_simulation(df, sim_entry, sim_exit)
+
+
+if __name__ == "__main__":
+    test_grid_matches_legacy_and_pruning_keeps_top_n()
+    test_worker_processes_and_cache()
+    test_seasonal_matches_legacy()
+    print("✅ backtest_optimizer parity OK")
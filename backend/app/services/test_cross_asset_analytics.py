@@ -0,0 +1,118 @@
+"""
+cross_asset_analytics 패리티 테스트
+- 기존 quantitative.py 의 pandas 경로(티커별 Series -> DataFrame.dropna -> pct_change -> corr,
+  rolling(30).mean/std)와 NumPy 가격 매트릭스 결과 비교
+- DB 대신 PRICE_MATRIX_QUERY 결과 행을 돌려주는 간단한 세션 대역 사용
+"""
+import random
+from collections import namedtuple
+from datetime import date, datetime, timedelta
+
+import numpy as np
+import pandas as pd
+
+from app.services.cross_asset_analytics import (
+    AnalyticsCache,
+    correlation_matrix,
+    load_price_matrix,
+    rolling_zscore,
+    ticker_set_key,
+)
+
+Row = namedtuple("Row", "ord asset_id name type_name timestamp_utc close_price")
+
+
+class FakeResult:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def fetchall(self):
+        return self.rows
+
+
+class FakeSession:
+    """요청 티커 순서(ord)에 맞춰 미리 만든 행을 돌려줌"""
+
+    def __init__(self, series):
+        self.series = series
+
+    def execute(self, query, params):
+        rows = []
+        for ord_, ticker in enumerate(params["tickers"], start=1):
+            if ticker not in self.series:
+                continue
+            points = sorted(self.series[ticker], key=lambda p: p[0], reverse=True)[:params["limit"]]
+            if not points:
+                rows.append(Row(ord_, ord_, ticker, "Stocks", None, None))
+            for ts, close in points:
+                rows.append(Row(ord_, ord_, ticker, "Stocks", ts, close))
+        return FakeResult(rows)
+
+
+def make_series(seed, days=200, skip=0.1, start=datetime(2024, 1, 1)):
+    rng = random.Random(seed)
+    price = 100.0
+    points = []
+    for d in range(days):
+        price *= 1 + rng.gauss(0, 0.02)
+        if rng.random() < skip:
+            continue
+        ts = start + timedelta(days=d, hours=rng.choice([0, 0, 21]))
+        points.append((ts, round(price, 4)))
+        if rng.random() < 0.05:
+            # 같은 날짜의 더 늦은 행 (이 값이 사용되어야 함)
+            points.append((ts + timedelta(hours=2), round(price * 1.01, 4)))
+    return points
+
+
+def legacy_frame(series, tickers, limit):
+    data = {}
+    for ticker in tickers:
+        points = sorted(series[ticker], key=lambda p: p[0], reverse=True)[:limit]
+        points = sorted(points, key=lambda p: p[0])
+        s = pd.Series([c for _, c in points], index=[ts.date() for ts, _ in points], name=ticker)
+        data[ticker] = s[~s.index.duplicated(keep='last')]
+    return pd.DataFrame(data).dropna()
+
+
+def test_correlation_matches_pandas():
+    tickers = ["AAA", "BBB", "CCC", "DDD"]
+    series = {t: make_series(i) for i, t in enumerate(tickers)}
+    prices = load_price_matrix(FakeSession(series), tickers, date(2023, 12, 1), limit=180)
+
+    assert prices.tickers == tickers
+    overlap = prices.complete_rows()
+    expected_df = legacy_frame(series, tickers, 180)
+    assert np.datetime_as_string(overlap.dates, unit="D").tolist() == [d.isoformat() for d in expected_df.index]
+    np.testing.assert_allclose(overlap.closes, expected_df.to_numpy())
+
+    expected = expected_df.pct_change().dropna().corr(method="pearson").to_numpy()
+    np.testing.assert_allclose(correlation_matrix(overlap.closes), expected, rtol=1e-12, atol=1e-12)
+
+
+def test_missing_and_empty_tickers():
+    series = {"AAA": make_series(1), "EMPTY": []}
+    prices = load_price_matrix(FakeSession(series), ["AAA", "NOPE", "EMPTY", "AAA"], date(2023, 12, 1), limit=50)
+    assert prices.tickers == ["AAA", "EMPTY"]
+    assert prices.missing == ["NOPE"]
+    assert prices.row_counts["EMPTY"] == 0
+    assert np.isnan(prices.column("EMPTY")).all()
+
+
+def test_rolling_zscore_matches_pandas():
+    rng = np.random.default_rng(7)
+    spread = np.cumsum(rng.normal(0, 0.01, 400))
+    mean, std, z = rolling_zscore(spread, 30)
+    s = pd.Series(spread)
+    np.testing.assert_allclose(mean, s.rolling(30).mean().to_numpy(), rtol=1e-9, equal_nan=True)
+    np.testing.assert_allclose(std, s.rolling(30).std().to_numpy(), rtol=1e-9, equal_nan=True)
+    np.testing.assert_allclose(z, ((s - s.rolling(30).mean()) / s.rolling(30).std()).to_numpy(), rtol=1e-7, equal_nan=True)
+
+
+def test_cache_key_ignores_ticker_order():
+    assert ticker_set_key(["A", "B", "C"]) == ticker_set_key(["C", "A", "B", "A"])
+    cache = AnalyticsCache(ttl_seconds=60, max_entries=1)
+    cache.set(("correlation", "x", 90, date(2024, 1, 1)), 1)
+    cache.set(("correlation", "y", 90, date(2024, 1, 1)), 2)
+    assert cache.get(("correlation", "x", 90, date(2024, 1, 1))) is None
+    assert cache.get(("correlation", "y", 90, date(2024, 1, 1))) == 2
@@ -0,0 +1,105 @@
+"""
+indicator_store 테스트
+- RSI/SMA가 기존 pandas 구현과 일치하는지
+- 증분 추가/마지막 봉 갱신 결과가 전체 재계산과 동일하고, 이미 반환된 view는 바뀌지 않는지
+- 백필/정정된 과거 봉(주기적 전체 재적재 포함)이 병합되는지
+- 메모리 상한을 넘으면 오래된 (asset_id, interval) 묶음부터 제거되는지
+"""
+import numpy as np
+
+from app.services.indicator_store import IndicatorStore, calculate_rsi, rsi, sma
+from app.services.test_backtest_engine import calculate_rsi as pandas_rsi
+from app.services.test_backtest_engine import make_hourly_df
+
+
+def test_indicators_match_pandas():
+    df = make_hourly_df(hours=3000, seed=4)
+    expected = pandas_rsi(df["close_price"])
+    actual = calculate_rsi(df["close_price"])
+    assert actual.isna().equals(expected.isna())
+    assert np.allclose(actual.dropna(), expected.dropna(), rtol=0, atol=1e-9)
+
+    ma = sma(df["close_price"].to_numpy(), 20)
+    assert np.allclose(ma, df["close_price"].rolling(20).mean().to_numpy(), equal_nan=True)
+
+
+def test_incremental_update_matches_full_recompute():
+    df = make_hourly_df(hours=5000, seed=9)
+    ts = df.index.values
+    close = df["close_price"].to_numpy()
+    store = IndicatorStore(max_bytes=10 ** 9)
+
+    store.update(1, "1h", ts[:3000], close[:3000])
+    before = store.indicator(None, 1, "1h", "rsi", 14)
+    snapshot = before.copy()
+    store.indicator(None, 1, "1h", "sma", 60)
+
+    store.update(1, "1h", ts[2990:4000], close[2990:4000])
+    revised = close[3999] * 1.01
+    store.update(1, "1h", [ts[3999]], [revised])
+    store.update(1, "1h", ts[4000:], close[4000:])
+
+    final_close = close.copy()
+    final_close[3999] = revised
+    assert np.array_equal(store.indicator(None, 1, "1h", "rsi", 14), rsi(final_close, 14).astype(np.float32), equal_nan=True)
+    assert np.array_equal(store.indicator(None, 1, "1h", "sma", 60), sma(final_close, 60).astype(np.float32), equal_nan=True)
+    assert np.array_equal(before, snapshot, equal_nan=True)
+    assert not before.flags.writeable
+
+    frame = store.frame(None, 1, "1h", {"rsi": ("rsi", 14)}, start=df.index[100], end=df.index[199])
+    assert len(frame) == 100 and frame.index[0] == df.index[100]
+    assert frame["rsi"].dtype == np.float32
+
+
+def test_backfilled_and_corrected_history_is_merged(monkeypatch):
+    df = make_hourly_df(hours=3000, seed=5)
+    ts = df.index.values
+    close = df["close_price"].to_numpy()
+    db_close = close.copy()
+    db_close[:1000] = np.nan  # 아직 백필되지 않은 구간
+    loads = []
+
+    def load(db, asset_id, interval, since):
+        loads.append(since)
+        keep = ~np.isnan(db_close) & (True if since is None else ts >= since)
+        return ts[keep], db_close[keep]
+
+    monkeypatch.setattr(IndicatorStore, "_load", staticmethod(load))
+    store = IndicatorStore(max_bytes=10 ** 9, refresh_seconds=0, reload_seconds=3600)
+    before = store.indicator(object(), 1, "1h", "rsi", 14).copy()
+    assert len(before) == 2000
+
+    # 다른 프로세스의 백필 + 과거 봉 정정 -> 증분 갱신(since=마지막 봉)으로는 보이지 않음
+    db_close[:1000] = close[:1000]
+    db_close[1500] *= 1.05
+    store.indicator(object(), 1, "1h", "rsi", 14)
+    assert loads[-1] is not None and len(store.series(None, 1, "1h")[0]) == 2000
+
+    store.reload_seconds = 0
+    merged = store.indicator(object(), 1, "1h", "rsi", 14)
+    assert loads[-1] is None
+    assert np.array_equal(merged, rsi(db_close, 14).astype(np.float32), equal_nan=True)
+    assert np.array_equal(store.indicator(None, 1, "1h", "sma", 20), sma(db_close, 20).astype(np.float32), equal_nan=True)
+
+    # 과거 봉을 직접 반영해도 같은 결과, 변경 없는 과거 봉은 무시
+    direct = IndicatorStore(max_bytes=10 ** 9)
+    direct.update(1, "1h", ts[1000:], close[1000:])
+    view = direct.indicator(None, 1, "1h", "sma", 20)
+    snapshot = view.copy()
+    assert direct.update(1, "1h", ts[1990:2000], close[1990:2000]) == 0
+    direct.update(1, "1h", ts[:1000], close[:1000])
+    direct.update(1, "1h", [ts[1500]], [db_close[1500]])
+    assert np.array_equal(direct.indicator(None, 1, "1h", "sma", 20), sma(db_close, 20).astype(np.float32), equal_nan=True)
+    assert np.array_equal(view, snapshot, equal_nan=True)
+
+
+def test_lru_memory_budget():
+    df = make_hourly_df(hours=5000, seed=1)
+    store = IndicatorStore(max_bytes=200_000)
+    for asset_id in range(5):
+        store.update(asset_id, "1h", df.index.values, df["close_price"].to_numpy())
+    stats = store.stats()
+    assert stats["bytes"] <= stats["max_bytes"]
+    assert stats["evictions"] == 3
+    ts, _ = store.series(None, 4, "1h")
+    assert len(ts) == 5000
@@ -0,0 +1,75 @@
+"""
+ohlcv_batch 테스트
+- 공급자 DataFrame 정규화 (컬럼명 혼용, 결측/비정상 값, 중복 시각, 정렬)
+- 큐 페이로드 왕복 (JSON envelope 통과 후 같은 배열, 잘못된 페이로드는 ValueError)
+- 가격 품질 검사 (0/NULL 비율, 유효 행, OHLC 논리 위반)
+"""
+import json
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.services.ohlcv_batch import OHLCVBatch, price_columns, price_quality, task_batch
+
+
+def provider_frame():
+    return pd.DataFrame({
+        "date": ["2024-01-03T00:00:00Z", "2024-01-02T09:00:00+09:00", "bad", "2024-01-02T00:00:00Z",
+                 "2024-01-04T00:00:00Z", "2024-01-05T00:00:00Z"],
+        "open": [1, 2, 3, 4, "x", 6],
+        "High": [2, 3, 4, 5, 6, 7],
+        "low_price": [0.5, 1, 1, 1, 1, 5],
+        "close": [1.5, 2.5, 3, 4.5, 5, 1e15],
+        "volume": [None, -1, 3, 4, 5, 6],
+        "change_percent": [0.5, None, 1, 2, 3, 4],
+    })
+
+
+def test_from_frame_normalizes_with_masks():
+    batch = OHLCVBatch.from_frame(provider_frame())
+
+    # 잘못된 시각, 숫자가 아닌 open, 범위 초과 close 행 제외 + 같은 시각(2024-01-02 00:00 UTC)은 뒤 행
+    assert len(batch) == 2 and batch.dropped == 4
+    rows = batch.to_rows(7, "1d")
+    assert [r["timestamp_utc"] for r in rows] == [datetime(2024, 1, 2), datetime(2024, 1, 3)]
+    assert rows[0] == {
+        "asset_id": 7, "timestamp_utc": datetime(2024, 1, 2), "data_interval": "1d",
+        "open_price": 4.0, "high_price": 5.0, "low_price": 1.0, "close_price": 4.5,
+        "volume": 4.0, "change_percent": 2.0,
+    }
+    assert rows[1]["volume"] == 0.0 and rows[1]["change_percent"] == 0.5
+    assert batch.to_columns().close.tolist() == [4.5, 1.5]
+
+    assert len(OHLCVBatch.from_frame(pd.DataFrame({"date": ["2024-01-02"], "open": [1]}))) == 0
+
+
+def test_payload_round_trip_through_json():
+    batch = OHLCVBatch.from_frame(provider_frame())
+    task = json.loads(json.dumps({"type": "ohlcv_day_data", "payload": {"columns": batch.to_payload(), "metadata": {}}}))
+
+    decoded = task_batch(task)
+    assert decoded.to_rows(7, "1d") == batch.to_rows(7, "1d")
+    assert task_batch({"type": "ohlcv_day_data", "payload": {"items": []}}) is None
+
+    broken = dict(task["payload"]["columns"], rows=5)
+    with pytest.raises(ValueError):
+        OHLCVBatch.from_payload(broken)
+    with pytest.raises(ValueError):
+        OHLCVBatch.from_payload({"format": "other"})
+
+
+def test_price_quality_matches_row_checks():
+    frame = pd.DataFrame({
+        "open": [1, 0, np.nan, 3],
+        "high": [2, 0, 2, 2],
+        "low": [0.5, 0, 1, 1],
+        "close": [1.5, 0, 3, 2.5],
+    })
+    quality = price_quality(price_columns(frame))
+
+    assert quality["zero_null_ratio"] == pytest.approx(5 / 16)
+    assert quality["valid_rows"] == 3
+    # 3행: high 2 < close 3, 4행: high 2 < open 3
+    assert quality["high_violations"] == 2 and quality["low_violations"] == 0
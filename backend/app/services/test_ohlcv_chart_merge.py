@@ -0,0 +1,149 @@
+"""
+ohlcv_chart_merge 패리티 테스트
+- legacy_merge / legacy_recalculate_change_percent: 기존 get_ohlcv_data_v2 의 unique_final dict 병합과
+  _recalculate_change_percent (참조 구현)
+- 겹치는 시각, 틱성 봉(high == low), 결측 값이 섞인 무작위 원천에서 순위 병합 결과가 일치하는지 확인
+"""
+import random
+from datetime import datetime, timedelta
+
+import numpy as np
+
+from app.services.ohlcv_chart_merge import MergeSource, change_percent, merge_sources, to_chart_dicts
+from app.services.ohlcv_resampler import OHLCVColumns, resample_candles, resample_dicts
+
+
+def legacy_recalculate_change_percent(data_list):
+    """기존 _recalculate_change_percent (변경 전 코드 그대로)"""
+    sorted_data = sorted(data_list, key=lambda x: x['timestamp_utc'])
+    prev_close = None
+    for row in sorted_data:
+        close_p = row.get('close_price')
+        open_p = row.get('open_price')
+        if prev_close is not None and prev_close > 0 and close_p is not None:
+            row['change_percent'] = round(((close_p - prev_close) / prev_close) * 100, 4)
+        elif open_p is not None and open_p > 0 and close_p is not None:
+            row['change_percent'] = round(((close_p - open_p) / open_p) * 100, 4)
+        else:
+            row['change_percent'] = 0.0
+        if close_p is not None:
+            prev_close = close_p
+    return sorted_data
+
+
+def legacy_merge(base, *layers):
+    """기존 unique_final 병합: 바탕 위에 high != low 인 봉만 덮어쓰고, 나머지는 빈 시각만 채움"""
+    unique_final = {d['timestamp_utc']: dict(d) for d in base}
+    for layer in layers:
+        for d in layer:
+            ts = d['timestamp_utc']
+            if ts not in unique_final or d.get('high_price') != d.get('low_price'):
+                unique_final[ts] = dict(d)
+    return legacy_recalculate_change_percent(sorted(unique_final.values(), key=lambda x: x['timestamp_utc']))
+
+
+def make_source(seed, count=400, tick=False, start=datetime(2024, 3, 4, 13, 30), step=1):
+    """_format_ohlcv_rows 형식의 원천 (시각은 서로 겹치도록 무작위 추출)"""
+    rng = random.Random(seed)
+    minutes = sorted(rng.sample(range(count * 2), count))
+    rows = []
+    for m in minutes:
+        price = round(100 + rng.gauss(0, 5), 4)
+        if tick:
+            row = dict(open_price=price, high_price=price, low_price=price, close_price=price)
+        else:
+            row = dict(
+                open_price=round(price + rng.gauss(0, 0.5), 4),
+                high_price=round(price + 1, 4),
+                low_price=round(price - 1, 4),
+                close_price=price,
+            )
+            roll = rng.random()
+            if roll < 0.05:
+                row['high_price'] = row['low_price']
+            elif roll < 0.08:
+                row['high_price'] = row['low_price'] = None
+            elif roll < 0.10:
+                row['close_price'] = None
+            elif roll < 0.12:
+                row['open_price'] = None
+        row['timestamp_utc'] = start + timedelta(minutes=m * step)
+        row['volume'] = float(rng.randint(0, 500))
+        row['change_percent'] = None
+        rows.append(row)
+    return rows
+
+
+def assert_same(actual, expected):
+    assert len(actual) == len(expected)
+    for a, e in zip(actual, expected):
+        for key in ('timestamp_utc', 'open_price', 'high_price', 'low_price', 'close_price', 'volume'):
+            assert a[key] == e[key], (key, a, e)
+        assert abs(a['change_percent'] - e['change_percent']) <= 1e-4 + 1e-9, (a, e)
+
+
+def merged_dicts(sources, interval):
+    merged, _ = merge_sources(sources)
+    return to_chart_dicts(merged, interval, change_percent(merged.open, merged.close))
+
+
+def test_live_chart_merge_parity():
+    hist = make_source(1)
+    delay = make_source(2, tick=True)
+    rt_bar = make_source(3)
+    actual = merged_dicts([
+        MergeSource('intraday', OHLCVColumns.from_dicts(hist), 0, overrides=False),
+        MergeSource('delay', OHLCVColumns.from_dicts(delay), 2),
+        MergeSource('realtime_bar', OHLCVColumns.from_dicts(rt_bar), 3),
+    ], '1m')
+    assert_same(actual, legacy_merge(hist, delay, rt_bar))
+
+
+def test_resampled_chart_merge_parity():
+    native = make_source(4, count=60, step=15)
+    raw_hist = make_source(5, count=900, step=5)
+    raw_rt = make_source(6, count=900, step=5)
+    delay = make_source(7, count=60, tick=True, step=15)
+    rt_bar = make_source(8, count=60, step=15)
+
+    # 기존: 하위 분봉은 먼저 나온(과거 테이블) 값 우선으로 중복 제거 후 리샘플
+    unique_sources = {}
+    for d in sorted(raw_hist + raw_rt, key=lambda x: x['timestamp_utc']):
+        unique_sources.setdefault(d['timestamp_utc'], d)
+    synth_legacy = resample_dicts(list(unique_sources.values()), 15, '15m')
+    expected = legacy_merge(native, synth_legacy, delay, rt_bar)
+
+    raw, _ = merge_sources([
+        MergeSource('intraday', OHLCVColumns.from_dicts(raw_hist), 0, overrides=False),
+        MergeSource('realtime_bar', OHLCVColumns.from_dicts(raw_rt), 3, overrides=False),
+    ])
+    synth = resample_candles(raw, 15).to_columns()
+    actual = merged_dicts([
+        MergeSource('intraday', OHLCVColumns.from_dicts(native), 0, overrides=False),
+        MergeSource('resampled', synth, 1),
+        MergeSource('delay', OHLCVColumns.from_dicts(delay), 2),
+        MergeSource('realtime_bar', OHLCVColumns.from_dicts(rt_bar), 3),
+    ], '15m')
+    for row in expected:
+        row['data_interval'] = '15m'
+    assert_same(actual, expected)
+
+
+def test_merge_reports_winning_rank():
+    ts = [datetime(2024, 1, 1, 0, m) for m in range(3)]
+    base = OHLCVColumns.from_arrays(ts, [1, 1, 1], [2, 2, 2], [0.5, 0.5, 0.5], [1, 1, 1], [0, 0, 0])
+    tick = OHLCVColumns.from_arrays(ts[1:], [3, 3], [3, 3], [3, 3], [3, 3], [0, 0])
+    bar = OHLCVColumns.from_arrays(ts[2:], [4], [5], [3], [4], [0])
+    merged, ranks = merge_sources([
+        MergeSource('intraday', base, 0, overrides=False),
+        MergeSource('delay', tick, 2),
+        MergeSource('realtime_bar', bar, 3),
+    ])
+    assert ranks.tolist() == [0, 0, 3]
+    assert merged.close.tolist() == [1.0, 1.0, 4.0]
+
+
+def test_change_percent_skips_missing_close():
+    open_ = np.array([10.0, np.nan, 0.0, 20.0])
+    close = np.array([11.0, np.nan, 12.1, 0.0])
+    assert change_percent(open_, close).tolist() == [10.0, 0.0, 10.0, -100.0]
@@ -0,0 +1,63 @@
+"""
+ohlcv_fetch_planner.plan_window 테스트
+- 데이터 없음 / 최신 구간 채우기 / 백필 비활성 / 과거 심화(최신 쪽, 과거 쪽, 구간 내 갭) 순서 확인
+- FetchPlan이 기존 _get_fetch_parameters 반환 형식을 그대로 만드는지 확인
+"""
+from datetime import date, datetime, timedelta
+
+from app.services.ohlcv_fetch_planner import FetchPlan, FetchSettings, plan_window
+
+TODAY = date(2026, 3, 10)
+SETTINGS = FetchSettings(enable_backfill=True, historical_days=165, min_historical_date=date(1999, 11, 1))
+
+
+def test_initial_backfill_and_recent_gap():
+    window = plan_window('1d', False, SETTINGS, TODAY)
+    assert (window.start_date, window.end_date, window.limit, window.is_backfill) == (TODAY - timedelta(days=30), TODAY, 365, True)
+
+    window = plan_window('1m', True, FetchSettings(enable_backfill=False), TODAY)
+    assert (window.start_date, window.is_backfill) == (TODAY - timedelta(days=5), False)
+
+    # 최신 데이터가 어제 -> 어제부터 다시 수집 (백필 아님), 사흘 전 -> 다음 날부터 백필
+    window = plan_window('1h', False, SETTINGS, TODAY, date(2000, 1, 1), datetime(2026, 3, 9, 20))
+    assert (window.start_date, window.is_backfill) == (date(2026, 3, 9), False)
+    window = plan_window('1h', False, SETTINGS, TODAY, date(2000, 1, 1), datetime(2026, 3, 7, 20))
+    assert (window.start_date, window.end_date, window.is_backfill) == (date(2026, 3, 8), TODAY, True)
+
+
+def test_up_to_date_without_backfill_refreshes_today():
+    window = plan_window('1d', False, FetchSettings(enable_backfill=False), TODAY, date(2020, 1, 1), TODAY)
+    assert (window.start_date, window.end_date, window.limit, window.is_backfill) == (TODAY, TODAY, 365, False)
+
+
+def test_historical_deepening_order():
+    newest = datetime(2026, 3, 10, 0, 0)
+    # 과거 쪽 부족분: 주식은 MIN_HISTORICAL_DATE, 코인은 2010-01-01까지
+    window = plan_window('1d', False, SETTINGS, TODAY, date(2005, 6, 1), newest)
+    assert (window.start_date, window.end_date, window.limit) == (date(1999, 11, 1), date(2005, 5, 31), 365)
+    window = plan_window('1d', True, SETTINGS, TODAY, date(2012, 1, 1), newest)
+    assert (window.start_date, window.end_date, window.limit) == (date(2010, 1, 1), date(2011, 12, 31), 735)
+
+    # 구간 [최소 날짜, 오늘 - historical_days] 안의 앞/뒤 갭 중 큰 쪽
+    max_required = TODAY - timedelta(days=165)
+    window = plan_window('1d', False, SETTINGS, TODAY, date(1999, 1, 1), newest, date(1999, 11, 3), max_required - timedelta(days=20))
+    assert (window.start_date, window.end_date, window.is_backfill) == (max_required - timedelta(days=20), max_required, True)
+    window = plan_window('1d', False, SETTINGS, TODAY, date(1999, 1, 1), newest, None, None)
+    assert (window.start_date, window.end_date) == (date(1999, 11, 1), max_required)
+
+    # 모두 채워짐
+    assert plan_window('1d', False, SETTINGS, TODAY, date(1999, 1, 1), newest, date(1999, 11, 1), max_required) is None
+
+
+def test_short_intraday_range_is_capped():
+    newest = datetime(2026, 3, 10, 14, 30)
+    window = plan_window('5m', False, SETTINGS, TODAY, datetime(2025, 1, 1, 14, 30), newest)
+    assert (window.start_date, window.limit) == (TODAY - timedelta(days=730), 1000)
+
+
+def test_plan_params_match_legacy_format():
+    window = plan_window('1d', False, SETTINGS, TODAY)
+    plan = FetchPlan(asset_id=1, interval='1d', ticker='AAPL', asset_type='Stocks', data_source=None, window=window)
+    assert plan.is_backfill
+    assert plan.params() == {"start_date": "2026-02-08", "end_date": "2026-03-10", "limit": 365, "is_backfill": True}
+    assert FetchPlan(1, '1d', 'AAPL', 'Stocks', None, None).params() is None
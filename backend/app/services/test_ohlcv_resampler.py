@@ -0,0 +1,192 @@
+"""
+ohlcv_resampler 패리티 테스트
+- legacy_resample / legacy_aggregate: 기존 market.resample_intraday_data, aggregate_to_weekly_v2 /
+  aggregate_to_monthly_v2 의 dict 루프 (참조 구현)
+- 결측(None)/0 값이 섞인 무작위 봉에서 컬럼형 리샘플러와 결과가 일치하는지 확인
+"""
+import json
+import random
+from collections import defaultdict
+from datetime import datetime, timedelta
+
+import numpy as np
+
+from app.services.ohlcv_resampler import (
+    OHLCVColumns,
+    aggregate_dicts,
+    resample,
+    resample_dicts,
+)
+
+
+def legacy_make_candle(rows, timestamp, interval_str):
+    first = rows[0]
+    last = rows[-1]
+    high = max((float(x['high_price']) for x in rows if x['high_price'] is not None), default=0.0)
+    low = min((float(x['low_price']) for x in rows if x['low_price'] is not None), default=0.0)
+    vol = sum((float(x['volume']) for x in rows if x['volume'] is not None))
+    return {
+        'timestamp_utc': timestamp,
+        'open_price': float(first['open_price']) if first['open_price'] else None,
+        'high_price': high,
+        'low_price': low,
+        'close_price': float(last['close_price']) if last['close_price'] else None,
+        'volume': vol,
+        'change_percent': None,
+        'data_interval': interval_str,
+    }
+
+
+def legacy_resample(rows, interval_minutes, label):
+    """기존 resample_intraday_data (변경 전 코드 그대로)"""
+    aggregated = []
+    bucket_start_time = None
+    bucket_rows = []
+    for r in sorted(rows, key=lambda x: x['timestamp_utc']):
+        ts = r['timestamp_utc']
+        if interval_minutes >= 1440:
+            current_bucket_time = ts.replace(hour=0, minute=0, second=0, microsecond=0)
+        elif interval_minutes >= 60:
+            hours_floor = (ts.hour // (interval_minutes // 60)) * (interval_minutes // 60)
+            current_bucket_time = ts.replace(hour=hours_floor, minute=0, second=0, microsecond=0)
+        else:
+            minute_floor = (ts.minute // interval_minutes) * interval_minutes
+            current_bucket_time = ts.replace(minute=minute_floor, second=0, microsecond=0)
+
+        if bucket_start_time is None:
+            bucket_start_time = current_bucket_time
+            bucket_rows.append(r)
+        elif current_bucket_time == bucket_start_time:
+            bucket_rows.append(r)
+        else:
+            aggregated.append(legacy_make_candle(bucket_rows, bucket_start_time, label))
+            bucket_start_time = current_bucket_time
+            bucket_rows = [r]
+    if bucket_rows:
+        aggregated.append(legacy_make_candle(bucket_rows, bucket_start_time, label))
+    return aggregated
+
+
+def legacy_aggregate(daily_data, rule):
+    """기존 aggregate_to_weekly_v2 / aggregate_to_monthly_v2 (변경 전 코드 그대로)"""
+    buckets = defaultdict(list)
+    for r in daily_data:
+        if rule == '1W':
+            iso = r['timestamp_utc'].isocalendar()
+            key = (iso[0], iso[1])
+        else:
+            key = (r['timestamp_utc'].year, r['timestamp_utc'].month)
+        buckets[key].append(r)
+
+    aggregated = []
+    for key in sorted(buckets.keys()):
+        rows = sorted(buckets[key], key=lambda x: x['timestamp_utc'])
+        first = rows[0]
+        last = rows[-1]
+        aggregated.append({
+            'timestamp_utc': last['timestamp_utc'],
+            'open_price': float(first['open_price']) if first['open_price'] else None,
+            'high_price': max((float(x['high_price']) for x in rows if x['high_price']), default=None),
+            'low_price': min((float(x['low_price']) for x in rows if x['low_price']), default=None),
+            'close_price': float(last['close_price']) if last['close_price'] else None,
+            'volume': sum(float(x['volume']) for x in rows if x['volume']),
+            'change_percent': None,
+            'data_interval': rule,
+        })
+
+    prev_close = None
+    for candle in aggregated:
+        if prev_close and candle['close_price'] and prev_close > 0:
+            candle['change_percent'] = round(((candle['close_price'] - prev_close) / prev_close) * 100, 4)
+        prev_close = candle['close_price']
+    return aggregated
+
+
+def make_rows(count, step_minutes, seed=0, start=datetime(2023, 12, 28, 13, 30), gap_ratio=0.05):
+    """무작위 보행 봉 (None/0 값과 누락 구간 포함)"""
+    rng = random.Random(seed)
+    rows = []
+    ts = start
+    price = 100.0
+    for _ in range(count):
+        ts += timedelta(minutes=step_minutes * (rng.randint(2, 5) if rng.random() < gap_ratio else 1))
+        price = max(1.0, price * (1 + rng.gauss(0, 0.01)))
+        row = {
+            'timestamp_utc': ts,
+            'open_price': round(price * (1 + rng.gauss(0, 0.002)), 4),
+            'high_price': round(price * 1.01, 4),
+            'low_price': round(price * 0.99, 4),
+            'close_price': round(price, 4),
+            'volume': float(rng.randint(0, 1000)),
+        }
+        for field in ('open_price', 'high_price', 'low_price', 'close_price', 'volume'):
+            roll = rng.random()
+            if roll < 0.03:
+                row[field] = None
+            elif roll < 0.05:
+                row[field] = 0.0
+        rows.append(row)
+    rng.shuffle(rows)
+    return rows
+
+
+def assert_same(actual, expected):
+    assert len(actual) == len(expected)
+    for a, e in zip(actual, expected):
+        assert a.keys() == e.keys()
+        for key in e:
+            if isinstance(e[key], float) and a[key] is not None:
+                assert abs(a[key] - e[key]) <= 1e-9 * max(1.0, abs(e[key])), (key, a, e)
+            else:
+                assert a[key] == e[key], (key, a, e)
+
+
+def test_intraday_resample_parity():
+    rows = make_rows(5000, 1, seed=1)
+    for minutes in (5, 15, 30, 60, 240, 1440):
+        label = f'{minutes}m'
+        assert_same(resample_dicts(rows, minutes, label), legacy_resample(rows, minutes, label))
+
+
+def test_weekly_monthly_parity():
+    rows = make_rows(800, 1440, seed=2, start=datetime(2021, 12, 27))
+    for rule in ('1W', '1M'):
+        assert_same(aggregate_dicts(rows, rule), legacy_aggregate(rows, rule))
+
+
+def test_session_offset_buckets():
+    # 13:30 UTC 세션 정렬 4시간봉: 13:30, 17:30, 21:30 버킷 (다음 날 세션 시작에서 다시 정렬)
+    rows = make_rows(600, 5, seed=3, gap_ratio=0.0)
+    candles = resample_dicts(rows, 240, '4h', offset_seconds=13 * 3600 + 30 * 60)
+    starts = [c['timestamp_utc'] for c in candles]
+    assert starts == sorted(starts)
+    assert {(ts.hour, ts.minute) for ts in starts} <= {(13, 30), (17, 30), (21, 30), (1, 30), (5, 30), (9, 30)}
+    assert all(any(s <= r['timestamp_utc'] < s + timedelta(hours=4) for s in starts) for r in rows)
+
+
+def test_first_last_valid_per_bucket():
+    rows = make_rows(3000, 1, seed=4)
+    cols = OHLCVColumns.from_dicts(rows)
+    result = resample(cols, '15m', anchor_seconds=3600)
+    ordered = sorted(rows, key=lambda r: r['timestamp_utc'])
+    offset = 0
+    for i, count in enumerate(result.count.tolist()):
+        bucket = ordered[offset:offset + count]
+        offset += count
+        opens = [r['open_price'] for r in bucket if r['open_price'] is not None]
+        closes = [r['close_price'] for r in bucket if r['close_price'] is not None]
+        assert (opens[0] if opens else None) == (None if np.isnan(result.first_valid_open[i]) else result.first_valid_open[i])
+        assert (closes[-1] if closes else None) == (None if np.isnan(result.last_valid_close[i]) else result.last_valid_close[i])
+    assert offset == len(rows)
+
+
+def test_to_json_matches_to_dicts():
+    rows = make_rows(2000, 1, seed=5)
+    result = resample(OHLCVColumns.from_dicts(rows), '30m', anchor_seconds=3600)
+    decoded = json.loads(result.to_json('30m'))
+    expected = result.to_dicts('30m')
+    assert len(decoded) == len(expected)
+    for d, e in zip(decoded, expected):
+        assert d['timestamp_utc'] == e['timestamp_utc'].isoformat()
+        for key in ('open_price', 'high_price', 'low_price', 'close_price', 'volume', 'change_percent'):
+            assert d[key] == e[key]
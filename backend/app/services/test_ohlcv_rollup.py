@@ -0,0 +1,85 @@
+"""
+ohlcv_rollup 테스트 (SQL 재계산은 DB 필요)
+- 영향 구간 계산
+- 롤업 차트 (스텁 DB): 롤업 행 + 최근 일봉 재집계 결과가 같은 일봉의 aggregate_dicts(ohlcv_resampler)와 일치
+"""
+from collections import namedtuple
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from app.services.ohlcv_resampler import aggregate_dicts
+from app.services.ohlcv_rollup import affected_ranges, rollup_chart_data
+
+RollupRow = namedtuple("RollupRow", "period_start timestamp_utc open_price high_price low_price close_price volume")
+
+
+def test_affected_ranges_per_asset():
+    items = [
+        {'asset_id': 1, 'timestamp_utc': datetime(2024, 3, 5), 'data_interval': '1d'},
+        {'asset_id': 1, 'timestamp_utc': '2024-02-27T00:00:00Z', 'data_interval': '1d'},
+        {'asset_id': 2, 'timestamp_utc': date(2024, 1, 31), 'data_interval': '1d'},
+        # 주/월봉 원천 행과 식별 불가 행은 롤업 대상이 아님
+        {'asset_id': 1, 'timestamp_utc': datetime(2023, 1, 1), 'data_interval': '1w'},
+        {'asset_id': 3, 'timestamp_utc': 'not-a-date', 'data_interval': '1d'},
+        {'asset_id': None, 'timestamp_utc': datetime(2024, 1, 1), 'data_interval': '1d'},
+    ]
+    assert affected_ranges(items) == {
+        1: (datetime(2024, 2, 27), datetime(2024, 3, 5)),
+        2: (datetime(2024, 1, 31), datetime(2024, 1, 31)),
+    }
+
+
+def daily_bars():
+    """2024-01-01(월) ~ 2024-03-13(수) 평일 일봉"""
+    bars, day, i = [], datetime(2024, 1, 1), 0
+    while day <= datetime(2024, 3, 13):
+        if day.weekday() < 5:
+            close = 100.0 + (i * 7 % 11) - i * 0.25
+            bars.append({'timestamp_utc': day, 'open_price': close - 1, 'high_price': close + 2,
+                         'low_price': close - 3, 'close_price': close, 'volume': 1000.0 + i})
+            i += 1
+        day += timedelta(days=1)
+    return bars
+
+
+def period_start(ts: datetime, rule: str) -> datetime:
+    if rule == '1W':
+        return ts - timedelta(days=ts.weekday())
+    return ts.replace(day=1)
+
+
+def rollup_rows(bars, rule):
+    """REFRESH_SQL과 같은 규칙의 롤업 행 (첫 open, max high, min low, 마지막 close, volume 합, 마지막 일봉 날짜)"""
+    periods = {}
+    for bar in bars:
+        periods.setdefault(period_start(bar['timestamp_utc'], rule), []).append(bar)
+    return [
+        RollupRow(start, days[-1]['timestamp_utc'], days[0]['open_price'], max(d['high_price'] for d in days),
+                  min(d['low_price'] for d in days), days[-1]['close_price'], sum(d['volume'] for d in days))
+        for start, days in sorted(periods.items())
+    ]
+
+
+class StubDB:
+    """load_rollups의 SELECT만 흉내 (period_start 역순 + LIMIT)"""
+
+    def __init__(self, rows):
+        self.rows = rows
+
+    def execute(self, statement, params):
+        rows = sorted(self.rows, key=lambda r: r.period_start, reverse=True)[:params['limit']]
+        return type("Result", (), {"fetchall": lambda _self: rows})()
+
+
+@pytest.mark.parametrize("rule, limit", [("1W", 5), ("1M", 2)])
+def test_rollup_chart_matches_resampler(rule, limit):
+    bars = daily_bars()
+    # 롤업은 어제까지의 일봉으로만 계산됨 -> 오늘자(합성) 일봉은 최근 일봉 재집계로 반영되어야 함
+    db = StubDB(rollup_rows(bars[:-1], rule))
+    chart = rollup_chart_data(db, 1, rule, None, None, limit, lambda n: bars[-n:])
+
+    expected = aggregate_dicts(bars, rule)[-limit:]
+    assert chart[-limit:] == expected
+    assert chart[-1]['close_price'] == bars[-1]['close_price']
+    assert rollup_chart_data(StubDB([]), 1, rule, None, None, limit, lambda n: bars[-n:]) is None
@@ -0,0 +1,130 @@
+"""
+provider_health 테스트
+- 분위수, 헤지 지연 규칙 (표본 부족 / p95 / 연속 실패)
+- 취소/느린 실패 시도는 중도 절단 지연 표본으로 기록 (p95 이상일 때만)
+- run_hedged: 느린 1순위를 헤지가 앞지름, 실패 시 순차 폴백, 헤지 불가 시 대기, 동시 성공 시 우선순위,
+  헤지 가능 여부 확인이 느려도 실행 중인 시도의 결과를 기다리게 하지 않음
+"""
+import asyncio
+
+from app.services.provider_health import ProviderHealth, quantile, run_hedged
+
+
+class Provider:
+    def __init__(self, name, delay, result="ok"):
+        self.name = name
+        self.delay = delay
+        self.result = result
+        self.started = False
+        self.cancelled = False
+
+
+def make_attempt(calls):
+    async def attempt(provider, hedged):
+        provider.started = True
+        calls.append((provider.name, hedged))
+        try:
+            await asyncio.sleep(provider.delay)
+        except asyncio.CancelledError:
+            provider.cancelled = True
+            raise
+        if provider.result is None:
+            return None, f"{provider.name} failed"
+        return f"{provider.name}:{provider.result}", None
+    return attempt
+
+
+def test_quantile_and_hedge_delay():
+    assert quantile([], 0.5) is None
+    assert quantile([1, 2, 3, 4], 0.5) == 2 and quantile(list(range(1, 101)), 0.95) == 95
+
+    health = ProviderHealth()
+    assert health.hedge_delay("tiingo", default=3.0) == 3.0
+    for i in range(20):
+        health.observe("tiingo", (i + 1) / 10, True)
+    assert health.hedge_delay("tiingo") == 1.9
+    for _ in range(3):
+        health.observe("tiingo", 5.0, False)
+    assert health.hedge_delay("tiingo") == 0.0
+
+    # 취소된 시도: p95(1.9) 이상만 표본으로, 짧은 것은 무시
+    health = ProviderHealth()
+    for i in range(20):
+        health.observe("slow", (i + 1) / 10, True)
+    health.observe_cancelled("slow", 0.5)
+    health.observe_cancelled("slow", 4.0)
+    health.observe("slow", 6.0, False)
+    assert sorted(health._providers["slow"].latencies)[-2:] == [4.0, 6.0] and len(health._providers["slow"].latencies) == 22
+    assert health.snapshot()["providers"]["slow"]["successes"] == 20
+
+    health.observe_collection("hedged", 1.0, True)
+    assert health.observe_collection("hedged", 2.0, False) == 2
+    assert health.snapshot()["collections"]["hedged"]["p99_seconds"] == 2.0
+
+
+def test_hedge_beats_slow_primary_and_cancels_it():
+    slow, fast = Provider("slow", 1.0), Provider("fast", 0.01)
+    calls, events = [], []
+    outcome = asyncio.run(run_hedged(
+        [slow, fast], make_attempt(calls), hedge_delay=lambda p: 0.05,
+        on_event=lambda p, e: events.append((p.name, e)),
+    ))
+    assert outcome.result == "fast:ok" and outcome.winner is fast and outcome.hedges == 1
+    assert calls == [("slow", False), ("fast", True)]
+    assert slow.cancelled and ("fast", "hedges_won") in events and ("slow", "cancelled") in events
+
+
+def test_sequential_fallback_and_refused_hedge():
+    failing, good, unused = Provider("a", 0.01, None), Provider("b", 0.01), Provider("c", 0.01)
+    calls = []
+    outcome = asyncio.run(run_hedged([failing, good, unused], make_attempt(calls), hedge_delay=lambda p: 0.0, max_parallel=1))
+    assert outcome.result == "b:ok" and outcome.failures == ["a failed"] and outcome.hedges == 0
+    assert not unused.started
+
+    async def no_tokens(provider):
+        return False
+
+    slow, other = Provider("slow", 0.1), Provider("other", 0.0)
+    outcome = asyncio.run(run_hedged([slow, other], make_attempt([]), hedge_delay=lambda p: 0.0, can_hedge=no_tokens))
+    assert outcome.result == "slow:ok" and not other.started
+
+
+def test_simultaneous_results_prefer_priority_order():
+    # 두 시도가 같은 순간에 끝나면 우선순위가 높은 쪽
+    first, second = Provider("first", 0.0), Provider("second", 0.0)
+
+    async def run():
+        gate = asyncio.Event()
+        started = []
+
+        async def together(provider, hedged):
+            started.append(provider)
+            if len(started) == 2:
+                gate.set()
+            await gate.wait()
+            return provider.name, None
+
+        return await run_hedged([first, second], together, hedge_delay=lambda p: 0.01)
+
+    outcome = asyncio.run(run())
+    assert outcome.winner is first and outcome.hedges == 1
+
+
+def test_slow_hedge_probe_does_not_delay_primary_result():
+    primary, backup = Provider("primary", 0.05), Provider("backup", 0.0)
+    probes = []
+
+    async def slow_probe(provider):
+        probes.append(provider.name)
+        await asyncio.sleep(1.0)
+        return True
+
+    async def run():
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        outcome = await run_hedged([primary, backup], make_attempt([]), hedge_delay=lambda p: 0.0, can_hedge=slow_probe)
+        return outcome, loop.time() - started
+
+    outcome, elapsed = asyncio.run(run())
+    assert outcome.winner is primary and outcome.hedges == 0 and not backup.started
+    assert probes == ["backup"] and elapsed < 0.5
@@ -0,0 +1,133 @@
+"""
+rate_limiter 테스트
+- 한도 파싱 (기간별 더 엄격한 값, '10-30' 범위는 하한), 프로세스 내 버킷 계산, 다중 키 용량
+- Redis 없이(backend="local") FIFO 대기 순서와 max_wait 초과 시 거절 확인
+- try_acquire는 줄을 서거나 기다리지 않음
+- 리스는 최근 수요만큼: 드문 호출은 호출당 토큰 1개, 연속 호출은 묶음으로 받아 버킷 조회 횟수 감소
+"""
+import asyncio
+
+from app.services import rate_limiter as rate_limiter_module
+from app.services.rate_limiter import RateLimiter, parse_limits, take_tokens
+
+
+class FakeClient:
+    def __init__(self, free_tier, api_keys=None):
+        self.free_tier = free_tier
+        self.api_keys = api_keys
+
+    def get_rate_limit_info(self):
+        return {"free_tier": self.free_tier}
+
+
+def test_parse_limits_takes_strictest_per_period():
+    limits = parse_limits(
+        {"calls_per_minute": 30, "requests_per_hour": 500, "burst": 5},
+        {"calls_per_minute": "10-30", "calls_per_day": 10000, "calls_per_month": 100000},
+    )
+    assert limits == ((10, 60), (500, 3600), (10000, 86400))
+    assert parse_limits({"calls_per_minute": None}, None) == ()
+
+
+def test_take_tokens_refills_continuously():
+    state = {}
+    limits = ((6, 60), (100, 86400))
+    assert take_tokens(state, limits, 4, now=0.0)[0] == 4
+    granted, wait, remaining = take_tokens(state, limits, 4, now=0.0)
+    assert (granted, wait) == (2, 0.0) and remaining == 0.0
+
+    granted, wait, _ = take_tokens(state, limits, 1, now=5.0)
+    assert granted == 0 and abs(wait - 5.0) < 1e-9
+    assert take_tokens(state, limits, 1, now=10.0)[0] == 1
+
+
+def test_key_pool_scales_capacity():
+    limiter = RateLimiter(backend="local")
+    gate = limiter._gate("pooled_provider", FakeClient({"calls_per_hour": 50}, api_keys=["a", "b", "c"]))
+    assert gate.limits == ((150, 3600),)
+    assert limiter._gate("unknown_provider", FakeClient({})) is None
+
+
+def test_waiters_are_served_in_order_and_rejected_past_max_wait():
+    limiter = RateLimiter(backend="local")
+    client = FakeClient({"calls_per_second": 20})
+    order = []
+
+    async def call(i):
+        assert await limiter.acquire("fast", client, max_wait=5)
+        order.append(i)
+
+    async def run():
+        await asyncio.gather(*[call(i) for i in range(30)])
+        slow = FakeClient({"calls_per_minute": 1})
+        return [await limiter.acquire("slow", slow, max_wait=1) for _ in range(2)]
+
+    assert asyncio.run(run()) == [True, False]
+    assert order == list(range(30))
+    stats = {s["provider"]: s for s in limiter.stats()}
+    assert stats["fast"]["granted"] == 30 and stats["fast"]["waited"] > 0
+    assert stats["slow"]["rejected"] == 1
+
+
+def test_try_acquire_never_waits():
+    limiter = RateLimiter(backend="local")
+    client = FakeClient({"calls_per_minute": 1})
+
+    async def run():
+        assert await limiter.try_acquire("probe", client)
+        # 토큰 소진: 다음 토큰까지 대기하지 않고 바로 거절
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        exhausted = await limiter.try_acquire("probe", client)
+        elapsed = loop.time() - started
+
+        # 다른 호출이 차례를 잡고 있으면 토큰이 남아 있어도 줄을 서지 않고 거절
+        roomy = FakeClient({"calls_per_minute": 100})
+        gate = limiter._gate("queued", roomy)
+        assert gate.enqueue() is None
+        queued = await limiter.try_acquire("queued", roomy)
+        gate.release_head()
+        return exhausted, elapsed, queued, await limiter.try_acquire("queued", roomy)
+
+    exhausted, elapsed, queued, free = asyncio.run(run())
+    assert exhausted is False and elapsed < 0.1
+    assert queued is False and free is True
+
+
+def test_sparse_calls_take_one_token_each(monkeypatch):
+    monkeypatch.setattr(rate_limiter_module, "LEASE_TTL_SECONDS", 0.01)
+    limiter = RateLimiter(backend="local")
+    client = FakeClient({"calls_per_hour": 10000})
+
+    async def run():
+        gate = None
+        first = None
+        for _ in range(25):
+            assert await limiter.acquire("sparse", client)
+            gate = limiter._gate("sparse", client)
+            first = first or tuple(gate.local_state[3600])
+            # 리스 만료 + 수요 구간이 끊길 만큼 쉬었다가 다음 호출
+            await asyncio.sleep(0.03)
+        return gate, first
+
+    gate, (first_tokens, first_ts) = asyncio.run(run())
+    tokens, ts = gate.local_state[3600]
+    refill = (ts - first_ts) * 10000 / 3600
+    assert gate.lease_size == 500
+    assert abs(first_tokens - 9999) < 1e-6
+    assert abs(tokens - (first_tokens - 24 + refill)) < 1e-6
+
+
+def test_sustained_calls_lease_in_bulk():
+    limiter = RateLimiter(backend="local")
+    client = FakeClient({"calls_per_hour": 10000})
+
+    async def run():
+        for _ in range(200):
+            assert await limiter.acquire("busy", client)
+        return limiter._gate("busy", client)
+
+    gate = asyncio.run(run())
+    # 같은 구간 안의 연속 호출은 직전까지의 호출 수만큼 리스 -> 버킷 차감이 호출 수보다 훨씬 적게 일어남
+    assert gate.stats["granted"] == 200
+    assert 10000 - gate.local_state[3600][0] < 400
@@ -0,0 +1,122 @@
+"""
+rolling_correlation 종가 스냅샷 테스트
+- 상태 직렬화 후 이어서 갱신해도 종가 링 버퍼가 같은지
+- 주식/코인 혼합 집합: 저장 종가 슬라이스 결과가 DB 조회 경로(load_price_matrix, 스텁 DB)와 같은지
+- 스냅샷이 며칠 지난 경우에도 이후 일봉을 이어 붙여 같은 결과인지
+"""
+from collections import namedtuple
+from datetime import date, datetime, timedelta
+
+import numpy as np
+import pytest
+
+from app.services.cross_asset_analytics import correlation_snapshot, load_price_matrix
+from app.services.rolling_correlation import RollingCorrelationState, RollingMatrices
+
+START = date(2024, 1, 1)
+
+
+def make_closes(days=520, size=5, seed=3):
+    rng = np.random.default_rng(seed)
+    returns = rng.normal(0, 0.02, (days, size)) + rng.normal(0, 0.01, (days, 1))
+    closes = 100 * np.cumprod(1 + returns, axis=0)
+    closes[rng.random((days, size)) < 0.25] = np.nan
+    closes[:200, 0] = np.nan  # 늦게 상장된 자산
+    return closes
+
+
+def advance_all(state, closes, start=START):
+    for offset, row in enumerate(closes):
+        state.advance(start + timedelta(days=offset), row)
+
+
+def test_state_round_trip_continues_identically():
+    closes = make_closes(days=420)
+    full = RollingCorrelationState(range(closes.shape[1]))
+    advance_all(full, closes)
+
+    resumed = RollingCorrelationState(range(closes.shape[1]))
+    advance_all(resumed, closes[:300])
+    resumed.rebuilt_on = resumed.as_of
+    resumed = RollingCorrelationState.from_bytes(resumed.to_bytes())
+    advance_all(resumed, closes[300:], start=START + timedelta(days=300))
+
+    np.testing.assert_array_equal(resumed.recent_closes(), full.recent_closes())
+    np.testing.assert_array_equal(full.recent_closes(), closes[-full.history:])
+
+
+PriceRow = namedtuple("PriceRow", "ord asset_id name type_name timestamp_utc close_price")
+CloseRow = namedtuple("CloseRow", "asset_id day close_price")
+
+
+class PriceMatrixDB:
+    """
+    PRICE_MATRIX_QUERY 흉내: 티커별 start_date 이후 최신 limit개 일봉 (없으면 가격 없는 행 하나)
+    DAILY_CLOSES_QUERY 흉내: asset_ids 의 [start_date, end_date) 일별 종가
+    """
+
+    def __init__(self, closes, assets, start=START):
+        self.closes, self.assets, self.start = closes, assets, start
+        self.daily_queries = 0
+
+    def execute(self, statement, params):
+        if "asset_ids" in params:
+            self.daily_queries += 1
+            return self.daily_closes(params)
+        by_ticker = {a["ticker"]: (i, a) for i, a in enumerate(self.assets)}
+        rows = []
+        for ord_, ticker in enumerate(params["tickers"], start=1):
+            if ticker not in by_ticker:
+                continue
+            column, asset = by_ticker[ticker]
+            priced = [
+                PriceRow(ord_, asset["asset_id"], asset["name"], asset["type"],
+                         datetime.combine(self.start + timedelta(days=offset), datetime.min.time()) + timedelta(hours=23),
+                         float(close))
+                for offset, close in enumerate(self.closes[:, column])
+                if not np.isnan(close) and self.start + timedelta(days=offset) >= params["start_date"]
+            ][::-1][:params["limit"]]
+            rows.extend(priced or [PriceRow(ord_, asset["asset_id"], asset["name"], asset["type"], None, None)])
+        return type("Result", (), {"fetchall": lambda _self: rows})()
+
+    def daily_closes(self, params):
+        column_of = {a["asset_id"]: i for i, a in enumerate(self.assets)}
+        rows = [
+            CloseRow(asset_id, datetime.combine(day, datetime.min.time()), float(self.closes[offset, column_of[asset_id]]))
+            for asset_id in params["asset_ids"]
+            for offset in range(len(self.closes))
+            for day in [self.start + timedelta(days=offset)]
+            if params["start_date"] <= day < params["end_date"] and not np.isnan(self.closes[offset, column_of[asset_id]])
+        ]
+        return type("Result", (), {"fetchall": lambda _self: rows})()
+
+
+@pytest.mark.parametrize("days,stale", [(30, 1), (90, 1), (365, 3), (60, 2)])
+def test_snapshot_prices_match_on_demand_for_mixed_calendars(days, stale):
+    rng = np.random.default_rng(11)
+    closes = 100 * np.cumprod(1 + rng.normal(0, 0.02, (520, 6)) + rng.normal(0, 0.01, (520, 1)), axis=0)
+    closes[rng.random(closes.shape) < 0.05] = np.nan
+    closes[:, :3][(np.arange(520) % 7) >= 5] = np.nan  # 주식 3개: 주말 휴장, 코인 3개: 매일
+    closes[:480, 2] = np.nan  # 최근 상장 주식 -> 짧은 창에서만 포함
+    assets = [{"asset_id": 10 + i, "ticker": t, "name": t, "type": "Stocks" if i < 3 else "Crypto"}
+              for i, t in enumerate(["AAPL", "MSFT", "NEW", "BTC", "ETH", "SOL"])]
+    # 스냅샷은 stale 일 전까지 (잡이 어제까지 적재), DB 에는 진행 중인 당일 일봉까지 있음
+    state = RollingCorrelationState([a["asset_id"] for a in assets])
+    advance_all(state, closes[:-stale])
+    matrices = RollingMatrices.from_bytes(state.result_bytes(), state.as_of, assets)
+    db = PriceMatrixDB(closes, assets)
+
+    # calculate_correlation_matrix 와 같은 조회 구간
+    end_date = START + timedelta(days=len(closes) - 1)
+    start_date = end_date - timedelta(days=days + 30)
+    tickers = sorted(a["ticker"] for a in assets)
+    assert matrices.prices_cover(tickers, start_date) and not matrices.prices_cover(tickers + ["XRP"], start_date)
+
+    sliced = correlation_snapshot(matrices.price_matrix_through(db, tickers, start_date, end_date, days + 20), days)
+    on_demand = correlation_snapshot(load_price_matrix(db, tickers, start_date, days + 20), days)
+    assert db.daily_queries == 1
+
+    assert sliced["excluded"] == on_demand["excluded"]
+    assert sliced["tickers"] == on_demand["tickers"] and {"AAPL", "BTC"} <= set(sliced["tickers"])
+    assert sliced["asset_info"] == on_demand["asset_info"] and sliced["error"] == on_demand["error"]
+    np.testing.assert_allclose(sliced["corr"], on_demand["corr"], rtol=0, atol=1e-12, equal_nan=True)
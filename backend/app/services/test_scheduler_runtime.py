@@ -0,0 +1,84 @@
+"""
+scheduler_runtime 테스트
+- persistent: 루프별 리소스 1회 생성 후 재사용, 여러 스레드의 잡 분산, 예외 전파, 공유 httpx 풀 재사용
+- per_job: 잡마다 리소스 생성 (기존 동작)
+"""
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from app.external_apis.base.http_pool import pool_stats, pooled_client
+from app.services.scheduler_runtime import SchedulerRuntime
+
+
+def make_runtime(mode, pool_size=2):
+    created = []
+
+    def factory():
+        created.append(asyncio.get_running_loop())
+        return {"api_manager": object()}
+
+    return SchedulerRuntime(factory, mode=mode, pool_size=pool_size), created
+
+
+def test_persistent_loops_reuse_resources_across_jobs():
+    runtime, created = make_runtime("persistent")
+
+    async def job(ctx):
+        await asyncio.sleep(0.05)
+        return ctx.loop_index, id(ctx.api_manager), threading.current_thread().name
+
+    try:
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            results = list(pool.map(lambda i: runtime.run(f"job-{i}", job), range(8)))
+        assert {r[0] for r in results} == {0, 1}
+        assert len(created) == 2 and len({r[1] for r in results}) == 2
+        assert all(r[2].startswith("scheduler-loop-") for r in results)
+
+        async def failing(ctx):
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError):
+            runtime.run("failing", failing)
+        assert sum(w["jobs_run"] for w in runtime.stats()["workers"]) == 9
+    finally:
+        runtime.shutdown()
+
+
+def test_shared_http_pool_only_on_runtime_loops():
+    runtime, _ = make_runtime("persistent", pool_size=1)
+
+    async def job(ctx):
+        async with pooled_client(timeout=5) as first:
+            pass
+        async with pooled_client(timeout=5) as second:
+            pass
+        async with pooled_client(timeout=10) as other:
+            pass
+        return first is second, first is other, first.is_closed, pool_stats()
+
+    try:
+        same, shared_across_configs, closed, stats = runtime.run("http", job)
+        assert same and not shared_across_configs and not closed
+        assert stats == {"clients": 2, "requests": 3}
+    finally:
+        runtime.shutdown()
+
+    async def plain():
+        async with pooled_client() as client:
+            pass
+        return client.is_closed
+
+    assert asyncio.run(plain()) is True
+
+
+def test_per_job_mode_builds_resources_each_run():
+    runtime, created = make_runtime("per_job")
+
+    async def job(ctx):
+        return ctx.loop_index
+
+    assert [runtime.run("job", job) for _ in range(3)] == [None, None, None]
+    assert len(created) == 3
@@ -0,0 +1,34 @@
+"""
+ttl_cache 테스트
+- 만료 항목은 미스, None 값 캐시와 미스 구분 (MISSING)
+- 항목 수 / weight 상한 초과 시 가장 오래 사용하지 않은 항목부터 제거 (keep 키는 유지)
+"""
+from app.services.ttl_cache import MISSING, TTLCache
+
+
+def test_expiry_and_cached_none():
+    cache = TTLCache(ttl_seconds=60)
+    cache.set("none", None)
+    cache.set("gone", 1, ttl_seconds=-1)
+
+    assert cache.get("none", MISSING) is None
+    assert cache.get("gone", MISSING) is MISSING and "gone" not in cache
+    found, missing = cache.get_many(["none", "gone", "new"])
+    assert found == {"none": None} and missing == ["gone", "new"]
+
+
+def test_lru_bounds():
+    cache = TTLCache(max_entries=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+    assert cache.keys() == ["a", "c"]
+
+    sized = TTLCache(max_weight=10, weigh=len)
+    sized.set_many({"x": [0] * 4, "y": [0] * 4})
+    grown = sized.get("x")
+    grown.extend([0] * 4)
+    # x를 방금 사용했더라도 keep으로 지정한 y는 남기고 나머지부터 제거
+    assert sized.evict(keep="y") == 1
+    assert sized.keys() == ["y"] and sized.stats()["evictions"] == 1
@@ -0,0 +1,175 @@
+"""
+TTL Cache - 프로세스 내 캐시 공용 TTL + LRU 저장소
+- 만료(ttl_seconds)된 항목은 조회 시 미스로 처리하고 제거, 사용한 항목은 LRU 끝으로 이동
+- 상한: max_entries(항목 수) / max_weight(weigh(value) 합계, 예: 배열 바이트 수) 중 설정된 것을 넘으면
+  가장 오래 사용하지 않은 항목부터 제거 (keep으로 지정한 키는 남김)
+- None 값도 캐시할 수 있도록 미스는 default(기본 None, 필요하면 MISSING)로 구분
+- AnalyticsCache, LatestPriceCache, IndicatorStore, SubscriptionResolver 부정 캐시, rolling_matrices_cache 가 사용
+"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Tuple
+
+# get(key, MISSING): None 값이 캐시된 경우와 미스를 구분할 때 사용
+MISSING = object()
+
+
+class TTLCache:
+    """스레드 안전 TTL/LRU 캐시"""
+
+    def __init__(
+        self,
+        ttl_seconds: Optional[float] = None,
+        max_entries: Optional[int] = None,
+        max_weight: Optional[float] = None,
+        weigh: Optional[Callable[[Any], float]] = None,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.max_weight = max_weight
+        self.weigh = weigh
+        # key -> (만료 시각 monotonic, 값), 만료 없음은 inf
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        """만료되지 않은 항목이 있는지 (통계/LRU 순서는 바꾸지 않음)"""
+        entry = self._entries.get(key)
+        return entry is not None and entry[0] > time.monotonic()
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry[0] > now:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return entry[1]
+                del self._entries[key]
+            self.misses += 1
+            return default
+
+    def get_many(self, keys: Iterable[Hashable]) -> Tuple[Dict[Hashable, Any], List[Hashable]]:
+        """(찾은 {key: 값}, 미스 키 목록) - 잠금 한 번으로 조회"""
+        found: Dict[Hashable, Any] = {}
+        missing: List[Hashable] = []
+        now = time.monotonic()
+        with self._lock:
+            for key in keys:
+                entry = self._entries.get(key)
+                if entry is not None and entry[0] > now:
+                    self._entries.move_to_end(key)
+                    found[key] = entry[1]
+                else:
+                    if entry is not None:
+                        del self._entries[key]
+                    missing.append(key)
+            self.hits += len(found)
+            self.misses += len(missing)
+        return found, missing
+
+    def values(self) -> List[Any]:
+        """만료되지 않은 값 목록 (LRU 순서, 통계 미반영)"""
+        now = time.monotonic()
+        with self._lock:
+            return [value for expires, value in self._entries.values() if expires > now]
+
+    def keys(self) -> List[Hashable]:
+        with self._lock:
+            return list(self._entries)
+
+    # ------------------------------------------------------------------
+    # 갱신
+    # ------------------------------------------------------------------
+    def set(self, key: Hashable, value: Any, ttl_seconds: Optional[float] = None):
+        self.set_many({key: value}, ttl_seconds)
+
+    def set_many(self, items: Dict[Hashable, Any], ttl_seconds: Optional[float] = None, keep: Optional[Hashable] = None):
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        expires = time.monotonic() + ttl if ttl is not None else float("inf")
+        with self._lock:
+            for key, value in items.items():
+                self._entries[key] = (expires, value)
+                self._entries.move_to_end(key)
+            self._evict(keep)
+
+    def touch(self, key: Hashable):
+        """LRU 순서만 갱신 (값을 직접 수정한 뒤 evict와 함께 사용)"""
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+
+    def evict(self, keep: Optional[Hashable] = None) -> int:
+        """상한을 넘는 만큼 오래된 항목 제거 (값의 weight가 바뀐 경우 호출). 반환값: 제거 수"""
+        with self._lock:
+            return self._evict(keep)
+
+    def invalidate(self, keys: Optional[Iterable[Hashable]] = None):
+        """keys가 없으면 전체, 있으면 해당 키만 제거"""
+        with self._lock:
+            if keys is None:
+                self._entries.clear()
+            else:
+                for key in keys:
+                    self._entries.pop(key, None)
+
+    def invalidate_where(self, predicate: Callable[[Hashable], bool]) -> int:
+        """predicate(key)가 참인 항목 제거. 반환값: 제거 수"""
+        with self._lock:
+            doomed = [key for key in self._entries if predicate(key)]
+            for key in doomed:
+                del self._entries[key]
+            return len(doomed)
+
+    def stats(self) -> Dict[str, Any]:
+        total = self.hits + self.misses
+        stats = {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": (self.hits / total) if total else 0.0,
+            "evictions": self.evictions,
+        }
+        if self.weigh is not None:
+            stats["weight"] = self.total_weight()
+        return stats
+
+    def total_weight(self) -> float:
+        with self._lock:
+            return sum(self.weigh(value) for _, value in self._entries.values()) if self.weigh else float(len(self._entries))
+
+    # ------------------------------------------------------------------
+    # 내부 (잠금 보유 상태에서 호출)
+    # ------------------------------------------------------------------
+    def _evict(self, keep: Optional[Hashable]) -> int:
+        evicted = 0
+        if self.max_entries is not None:
+            while len(self._entries) > max(self.max_entries, 1):
+                del self._entries[self._oldest(keep)]
+                evicted += 1
+        if self.max_weight is not None and self.weigh is not None:
+            total = sum(self.weigh(value) for _, value in self._entries.values())
+            while total > self.max_weight and len(self._entries) > 1:
+                key = self._oldest(keep)
+                total -= self.weigh(self._entries.pop(key)[1])
+                evicted += 1
+        self.evictions += evicted
+        return evicted
+
+    def _oldest(self, keep: Optional[Hashable]) -> Hashable:
+        key = next(iter(self._entries))
+        if key == keep:
+            self._entries.move_to_end(key)
+            key = next(iter(self._entries))
+        return key
@@ -1,6 +1,11 @@
 import json
 import asyncio
-from typing import Any, Optional
+import os
+import socket
+import time
+import zlib
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 import redis.asyncio as redis
 
@@ -8,14 +13,66 @@ from app.core.config_manager import ConfigManager
 from app.utils.logger import logger
 
 
+# 배치 큐 백엔드: "stream" (Redis Streams + Consumer Group, 기본) | "list" (기존 RPUSH/BLPOP)
+QUEUE_BACKEND = os.getenv("BATCH_QUEUE_BACKEND", "stream").lower()
+# 이 크기(bytes)를 넘는 페이로드는 zlib 압축
+COMPRESS_THRESHOLD = int(os.getenv("BATCH_QUEUE_COMPRESS_BYTES", "65536"))
+# 이 시간 이상 ACK되지 않은 다른 워커의 항목을 가져옴 (워커 비정상 종료 대비)
+CLAIM_IDLE_MS = int(os.getenv("BATCH_QUEUE_CLAIM_IDLE_MS", "300000"))
+CLAIM_INTERVAL_SECONDS = 30.0
+# 이 횟수 이상 전달되고도 ACK되지 않은 항목은 DLQ로 이동 (워커를 죽이는 태스크 격리)
+MAX_DELIVERIES = int(os.getenv("BATCH_QUEUE_MAX_DELIVERIES", "5"))
+
+
+def encode_task(task_type: str, payload: dict, compress_threshold: int = COMPRESS_THRESHOLD) -> Dict[str, Any]:
+    """배치 태스크 -> 스트림 필드 (큰 페이로드는 zlib 압축)"""
+    data = json.dumps({"type": task_type, "payload": payload}, ensure_ascii=False).encode("utf-8")
+    if len(data) > compress_threshold:
+        return {"type": task_type, "codec": "zlib", "data": zlib.compress(data, 3)}
+    return {"type": task_type, "codec": "json", "data": data}
+
+
+def decode_task(fields: Dict[Any, Any]) -> Tuple[str, dict]:
+    """스트림 필드 -> (원본 JSON 문자열, 태스크 dict)"""
+    def field(name: str):
+        return fields.get(name, fields.get(name.encode()))
+
+    codec = field("codec")
+    data = field("data")
+    if codec in (b"zlib", "zlib"):
+        data = zlib.decompress(data)
+    raw = data.decode("utf-8") if isinstance(data, bytes) else data
+    return raw, json.loads(raw)
+
+
+def _text(value) -> str:
+    return value.decode("utf-8") if isinstance(value, bytes) else value
+
+
+@dataclass
+class QueuedTask:
+    """읽어온 배치 태스크 (message_id가 None이면 기존 LIST에서 꺼낸 항목으로 ACK 불필요)"""
+    message_id: Optional[str]
+    task: dict
+    raw: str
+
+
 class RedisQueueManager:
     """Encapsulates Redis queue/stream operations with a DLQ (dead-letter queue)."""
 
-    def __init__(self, config_manager: ConfigManager):
+    def __init__(self, config_manager: ConfigManager, backend: str = QUEUE_BACKEND):
         self.config_manager = config_manager
         self.redis_client: Optional[redis.Redis] = None
         self.queue_key = "batch_data_queue"
         self.dlq_key = "dead_letter_queue"
+        # Streams 백엔드: 여러 DataProcessor 워커가 같은 그룹을 공유 (컨슈머 이름은 워커별로 고유)
+        self.backend = backend
+        self.stream_key = "batch_data_stream"
+        self.group_name = "batch_processors"
+        self.consumer_name = os.getenv("BATCH_QUEUE_CONSUMER") or f"{socket.gethostname()}-{os.getpid()}"
+        self._group_client = None
+        self._last_claim = 0.0
+        self._own_pending_recovered = False
 
     async def _ensure_client(self) -> redis.Redis:
         """
@@ -65,10 +122,23 @@ class RedisQueueManager:
         return self.redis_client
 
     async def push_batch_task(self, task_type: str, payload: dict) -> None:
+        await self.push_batch_tasks([(task_type, payload)])
+
+    async def push_batch_tasks(self, tasks: Iterable[Tuple[str, dict]]) -> int:
+        """여러 태스크를 파이프라인 한 번으로 적재 (Streams 백엔드는 큰 페이로드 압축)"""
+        tasks = list(tasks)
+        if not tasks:
+            return 0
         client = await self._ensure_client()
-        message = json.dumps({"type": task_type, "payload": payload}, ensure_ascii=False)
-        await client.rpush(self.queue_key, message)
-        logger.debug(f"Enqueued task to {self.queue_key}: {task_type}")
+        pipe = client.pipeline(transaction=False)
+        for task_type, payload in tasks:
+            if self.backend == "stream":
+                pipe.xadd(self.stream_key, encode_task(task_type, payload))
+            else:
+                pipe.rpush(self.queue_key, json.dumps({"type": task_type, "payload": payload}, ensure_ascii=False))
+        await pipe.execute()
+        logger.debug(f"Enqueued {len(tasks)} task(s) to {self.stream_key if self.backend == 'stream' else self.queue_key}")
+        return len(tasks)
 
     async def pop_batch_task(self, timeout_seconds: int = 1) -> Optional[dict]:
         client = await self._ensure_client()
@@ -82,6 +152,136 @@ class RedisQueueManager:
             logger.warning("Failed to decode task JSON; discarding")
             return None
 
+    async def _ensure_group(self, client: redis.Redis) -> None:
+        """Consumer Group 생성 (클라이언트당 1회)"""
+        if self._group_client is client:
+            return
+        try:
+            await client.xgroup_create(name=self.stream_key, groupname=self.group_name, id="0", mkstream=True)
+        except redis.ResponseError as e:
+            if "BUSYGROUP" not in str(e):
+                raise
+        self._group_client = client
+
+    def _decode_entries(self, entries) -> Tuple[List[QueuedTask], List[str]]:
+        """스트림 항목 -> (태스크, 본문이 삭제된 항목 ID)"""
+        tasks, orphans = [], []
+        for message_id, fields in entries:
+            message_id = _text(message_id)
+            if not fields:
+                # PEL에는 남아 있으나 본문이 삭제된 항목 (ACK만 하면 됨)
+                orphans.append(message_id)
+                continue
+            try:
+                raw, task = decode_task(fields)
+            except (ValueError, zlib.error) as e:
+                logger.warning(f"Failed to decode stream task {message_id}: {e}")
+                tasks.append(QueuedTask(message_id, {}, repr(fields)[:2000]))
+                continue
+            tasks.append(QueuedTask(message_id, task, raw))
+        return tasks, orphans
+
+    async def _drop_poisoned(self, client: redis.Redis, tasks: List[QueuedTask]) -> List[QueuedTask]:
+        """재전달된 항목 중 MAX_DELIVERIES를 넘은 것은 DLQ로 옮기고 나머지만 반환"""
+        if not tasks:
+            return tasks
+        # ID 범위 조회는 사이에 낀 다른 미ACK 항목 때문에 일부가 잘릴 수 있으므로 항목별로 정확히 조회 (파이프라인 1회)
+        pipe = client.pipeline(transaction=False)
+        for queued in tasks:
+            pipe.xpending_range(self.stream_key, self.group_name, min=queued.message_id, max=queued.message_id, count=1)
+        deliveries = {}
+        for pending in await pipe.execute():
+            for entry in pending:
+                deliveries[_text(entry["message_id"])] = entry["times_delivered"]
+        alive = []
+        for queued in tasks:
+            if deliveries.get(queued.message_id, 0) > MAX_DELIVERIES:
+                await self.fail_batch_task(queued, f"exceeded {MAX_DELIVERIES} deliveries")
+            else:
+                alive.append(queued)
+        return alive
+
+    async def _claim_stale(self, client: redis.Redis, count: int) -> Tuple[List[QueuedTask], List[str]]:
+        """CLAIM_IDLE_MS 이상 ACK되지 않은 다른 워커의 항목을 이 워커로 가져옴"""
+        now = time.monotonic()
+        if now - self._last_claim < CLAIM_INTERVAL_SECONDS:
+            return [], []
+        self._last_claim = now
+        result = await client.xautoclaim(
+            self.stream_key, self.group_name, self.consumer_name,
+            min_idle_time=CLAIM_IDLE_MS, start_id="0-0", count=count,
+        )
+        claimed, orphans = self._decode_entries(result[1])
+        if claimed:
+            logger.warning(f"♻️ Claimed {len(claimed)} stale batch task(s) from {self.stream_key}")
+        # Redis 7+는 본문이 삭제된 항목 ID를 세 번째 값으로 돌려주며 PEL에서도 제거함
+        return claimed, orphans
+
+    async def read_batch_tasks(self, count: int = 100, block_ms: int = 100) -> List[QueuedTask]:
+        """
+        최대 count개의 태스크를 한 번에 읽음. 처리 후 ack_batch_tasks 필요.
+        순서: 오래 방치된 항목 claim -> (시작 시) 이 컨슈머 이름의 미ACK 항목 -> 신규 항목 (없으면 block_ms 대기)
+        LIST 백엔드이거나 기존 LIST에 남은 항목이 있으면 함께 꺼냄 (ACK 불필요).
+        """
+        client = await self._ensure_client()
+        tasks: List[QueuedTask] = []
+        if self.backend == "stream":
+            await self._ensure_group(client)
+            # 재전달 항목: claim한 항목 + (시작 직후 1회) 같은 이름의 이전 워커가 ACK하지 못한 항목
+            redelivered, orphans = await self._claim_stale(client, count)
+            if not self._own_pending_recovered:
+                self._own_pending_recovered = True
+                result = await client.xreadgroup(
+                    groupname=self.group_name, consumername=self.consumer_name,
+                    streams={self.stream_key: "0"}, count=count,
+                )
+                for _, entries in result or []:
+                    pending, missing = self._decode_entries(entries)
+                    known = {t.message_id for t in redelivered}
+                    redelivered.extend(t for t in pending if t.message_id not in known)
+                    orphans.extend(missing)
+            if orphans:
+                await client.xack(self.stream_key, self.group_name, *orphans)
+            tasks.extend(await self._drop_poisoned(client, redelivered[:count]))
+
+            if len(tasks) < count:
+                result = await client.xreadgroup(
+                    groupname=self.group_name, consumername=self.consumer_name,
+                    streams={self.stream_key: ">"}, count=count - len(tasks),
+                    block=None if tasks else block_ms,
+                )
+                for _, entries in result or []:
+                    tasks.extend(self._decode_entries(entries)[0])
+
+        # 전환 전에 쌓인 LIST 항목 (또는 LIST 백엔드)
+        if len(tasks) < count:
+            raw_items = await client.lpop(self.queue_key, count - len(tasks))
+            if not raw_items and not tasks and self.backend != "stream":
+                item = await client.blpop(self.queue_key, timeout=block_ms / 1000)
+                raw_items = [item[1]] if item else None
+            for raw in raw_items or []:
+                try:
+                    tasks.append(QueuedTask(None, json.loads(raw), _text(raw)))
+                except json.JSONDecodeError:
+                    logger.warning("Failed to decode task JSON; discarding")
+        return tasks
+
+    async def ack_batch_tasks(self, tasks: Iterable[QueuedTask]) -> None:
+        """처리 완료 항목 ACK 후 스트림에서 삭제 (큐 용도이므로 보관하지 않음)"""
+        ids = [t.message_id for t in tasks if t.message_id]
+        if not ids:
+            return
+        client = await self._ensure_client()
+        pipe = client.pipeline(transaction=True)
+        pipe.xack(self.stream_key, self.group_name, *ids)
+        pipe.xdel(self.stream_key, *ids)
+        await pipe.execute()
+
+    async def fail_batch_task(self, task: QueuedTask, error: str) -> None:
+        """실패 항목을 DLQ로 옮기고 ACK"""
+        await self.move_to_dlq(task.raw, error)
+        await self.ack_batch_tasks([task])
+
     async def move_to_dlq(self, task_json: str, error: str) -> None:
         client = await self._ensure_client()
         wrapper = json.dumps({"failed_task": task_json, "error": error}, ensure_ascii=False)
@@ -99,11 +299,11 @@ class RedisQueueManager:
         
         try:
             wrapper = json.loads(raw_wrapper)
-            failed_task_json = wrapper.get("failed_task")
-            await client.rpush(self.queue_key, failed_task_json)
+            failed_task = json.loads(wrapper.get("failed_task"))
+            await self.push_batch_task(failed_task["type"], failed_task["payload"])
             logger.info("Reprocessed one task from DLQ back to the main queue.")
             return True
-        except (json.JSONDecodeError, TypeError) as e:
+        except (json.JSONDecodeError, TypeError, KeyError) as e:
             logger.error(f"Failed to reprocess DLQ item, putting it back: {e}")
             await client.rpush(self.dlq_key, raw_wrapper) # Re-queue on parsing error
             return False
@@ -125,7 +325,11 @@ class RedisQueueManager:
         return processed
 
     async def get_queue_size(self, queue_name: Optional[str] = None) -> int:
+        """대기 + 처리 중(미ACK) 태스크 수 (queue_name 지정 시 해당 LIST 길이)"""
         client = await self._ensure_client()
-        key = queue_name or self.queue_key
-        size = await client.llen(key)
+        if queue_name:
+            return int(await client.llen(queue_name))
+        size = await client.llen(self.queue_key)
+        if self.backend == "stream":
+            size += await client.xlen(self.stream_key)
         return int(size)
@@ -0,0 +1,118 @@
+"""
+redis_queue_manager 테스트 (fakeredis가 있을 때만 실행)
+- encode_task/decode_task 왕복 (큰 페이로드는 zlib 압축)
+- 여러 항목 한 번에 읽기 + ACK 후 스트림에서 삭제
+- 다른 워커가 ACK하지 못하고 방치한 항목 XAUTOCLAIM
+- MAX_DELIVERIES를 넘게 재전달된 항목은 DLQ로 이동
+- 전환 전 LIST에 남은 항목도 함께 꺼냄
+"""
+import asyncio
+import json
+
+import pytest
+
+fakeredis = pytest.importorskip("fakeredis")
+
+from app.utils import redis_queue_manager
+from app.utils.redis_queue_manager import RedisQueueManager, decode_task, encode_task
+
+
+def make_manager(client, consumer: str = "worker-1") -> RedisQueueManager:
+    """이벤트 루프 안에서 호출 (fakeredis 클라이언트를 현재 루프에 연결된 것으로 취급)"""
+    manager = RedisQueueManager(config_manager=None, backend="stream")
+    manager.redis_client = client
+    manager._attached_loop = asyncio.get_running_loop()
+    manager.consumer_name = consumer
+    return manager
+
+
+def test_encode_decode_round_trip():
+    payload = {"items": [{"ticker": "삼성전자", "close": 1.5}] * 50, "metadata": {"asset_id": 1}}
+
+    small = encode_task("ohlcv_day_data", payload, compress_threshold=1 << 20)
+    large = encode_task("ohlcv_day_data", payload, compress_threshold=64)
+    # Redis에서 읽은 필드는 bytes 키/값
+    stored = {k.encode(): v.encode() if isinstance(v, str) else v for k, v in large.items()}
+
+    assert small["codec"] == "json" and large["codec"] == "zlib"
+    assert len(large["data"]) < len(small["data"])
+    for fields in (small, stored):
+        raw, task = decode_task(fields)
+        assert task == {"type": "ohlcv_day_data", "payload": payload}
+        assert json.loads(raw) == task
+
+
+def test_batched_read_and_ack():
+    async def run():
+        client = fakeredis.FakeAsyncRedis()
+        manager = make_manager(client)
+        await manager.push_batch_tasks([("quote", {"n": n}) for n in range(5)])
+        first = await manager.read_batch_tasks(count=3)
+        rest = await manager.read_batch_tasks(count=10)
+        await manager.ack_batch_tasks(first + rest)
+        empty = await manager.read_batch_tasks(count=10, block_ms=1)
+        pending = await client.xpending(manager.stream_key, manager.group_name)
+        return first, rest, empty, pending["pending"], await client.xlen(manager.stream_key)
+
+    first, rest, empty, pending, length = asyncio.run(run())
+    assert [t.task["payload"]["n"] for t in first + rest] == [0, 1, 2, 3, 4]
+    assert empty == [] and pending == 0 and length == 0
+
+
+def test_stale_entries_are_claimed_by_another_worker(monkeypatch):
+    monkeypatch.setattr(redis_queue_manager, "CLAIM_IDLE_MS", 0)
+
+    async def run():
+        client = fakeredis.FakeAsyncRedis()
+        crashed = make_manager(client, "worker-crashed")
+        await crashed.push_batch_tasks([("quote", {"n": 1}), ("quote", {"n": 2})])
+        await crashed.read_batch_tasks(count=10)  # ACK 없이 종료
+
+        survivor = make_manager(client, "worker-2")
+        survivor._last_claim = float("-inf")
+        claimed = await survivor.read_batch_tasks(count=10)
+        await survivor.ack_batch_tasks(claimed)
+        pending = await client.xpending(survivor.stream_key, survivor.group_name)
+        return claimed, pending["pending"]
+
+    claimed, pending = asyncio.run(run())
+    assert sorted(t.task["payload"]["n"] for t in claimed) == [1, 2]
+    assert pending == 0
+
+
+def test_poison_message_moves_to_dlq(monkeypatch):
+    monkeypatch.setattr(redis_queue_manager, "MAX_DELIVERIES", 1)
+
+    async def run():
+        client = fakeredis.FakeAsyncRedis()
+        await make_manager(client).push_batch_tasks([("quote", {"n": 1})])
+        # 같은 컨슈머 이름으로 재시작을 반복 (매번 ACK 전에 죽는 태스크)
+        first = await make_manager(client).read_batch_tasks(count=10)
+        # 정상 항목 하나가 새로 들어온 상태에서 재시작 -> 독성 항목만 격리
+        await make_manager(client).push_batch_tasks([("quote", {"n": 2})])
+        restarted = await make_manager(client).read_batch_tasks(count=10, block_ms=1)
+        dlq = [json.loads(raw) for raw in await client.lrange("dead_letter_queue", 0, -1)]
+        pending = await client.xpending("batch_data_stream", "batch_processors")
+        return first, restarted, dlq, pending["pending"]
+
+    first, restarted, dlq, pending = asyncio.run(run())
+    assert [t.task["payload"]["n"] for t in first] == [1]
+    assert [t.task["payload"]["n"] for t in restarted] == [2]
+    assert len(dlq) == 1 and json.loads(dlq[0]["failed_task"])["payload"] == {"n": 1}
+    # DLQ로 옮긴 항목은 ACK, 정상 항목은 처리 대기
+    assert pending == 1
+
+
+def test_legacy_list_items_are_drained():
+    async def run():
+        client = fakeredis.FakeAsyncRedis()
+        manager = make_manager(client)
+        await client.rpush(manager.queue_key, json.dumps({"type": "quote", "payload": {"n": 0}}), b"not json")
+        await manager.push_batch_tasks([("quote", {"n": 1})])
+        tasks = await manager.read_batch_tasks(count=10)
+        return tasks, await client.llen(manager.queue_key)
+
+    tasks, remaining = asyncio.run(run())
+    # 스트림 항목 먼저, 이어서 LIST 항목 (LIST 항목은 ACK 대상 아님, 깨진 JSON은 버림)
+    assert [(t.message_id is None, t.task["payload"]["n"]) for t in tasks] == [(False, 1), (True, 0)]
+    assert remaining == 0
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+OHLCV 주/월 롤업 백필 스크립트
+- ohlcv_day_data 전체 기간을 ohlcv_rollup_data(1W, 1M)로 집계해 UPSERT
+- 최초 1회(또는 일봉을 스크립트로 직접 고친 뒤) 실행; 이후에는 DataRepository.save_ohlcv_data가 영향 기간만 갱신
+
+사용법:
+  python backfill_ohlcv_rollups.py                        # 모든 자산
+  python backfill_ohlcv_rollups.py --tickers AAPL BTCUSDT # 특정 티커만
+  python backfill_ohlcv_rollups.py --batch-size 50
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import text
+
+from app.core.database import PostgreSQLSessionLocal
+from app.services.ohlcv_rollup import backfill_rollups
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Backfill weekly/monthly OHLCV rollups")
+    parser.add_argument("--tickers", nargs="+", default=None)
+    parser.add_argument("--batch-size", type=int, default=200)
+    args = parser.parse_args()
+
+    db = PostgreSQLSessionLocal()
+    try:
+        asset_ids = None
+        if args.tickers:
+            rows = db.execute(
+                text("SELECT asset_id FROM assets WHERE ticker = ANY(:tickers)"),
+                {"tickers": [t.upper() for t in args.tickers]},
+            ).fetchall()
+            asset_ids = [row[0] for row in rows]
+            if not asset_ids:
+                print(f"❌ 자산을 찾을 수 없음: {args.tickers}")
+                sys.exit(1)
+
+        start = time.perf_counter()
+        total = backfill_rollups(db, asset_ids, args.batch_size)
+        print(f"✅ 롤업 백필 완료: {total}개 기간 ({time.perf_counter() - start:.1f}s)")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
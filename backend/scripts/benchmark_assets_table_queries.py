@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+자산 테이블 보강 단계 쿼리 수 벤치마크
+- AssetsTableService._enrich_with_realtime_data + _enrich_with_sparkline_data 실행 중 발생한 SQL 수를 집계
+- 페이지 크기와 무관하게 고정 상한(MAX_QUERIES) 이하여야 함 (O(1)); 넘으면 실패 코드로 종료
+  (실시간 시세 / 최근 일봉 / 52주 범위 / data_source / 스파크라인 / 스파크라인 OHLCV fallback)
+- 기본은 외부 시세 API 호출 없이 측정 (--with-external 로 공급자 fallback 포함)
+
+사용법:
+  python benchmark_assets_table_queries.py
+  python benchmark_assets_table_queries.py --type Stocks --sizes 10 50 100 --with-external
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import event
+
+from app.core.database import SessionLocal, engine
+from app.services.endpoint import assets_table_service
+from app.services.endpoint.assets_table_service import AssetsTableService
+
+MAX_QUERIES = 6
+
+
+class QueryCounter:
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, conn, cursor, statement, parameters, context, executemany):
+        self.count += 1
+
+
+async def measure(db, type_name, page_size):
+    base = AssetsTableService._get_base_assets_data(db, type_name, 1, page_size, "market_cap", "desc", None)
+    assets = base['assets']
+
+    counter = QueryCounter()
+    event.listen(engine, "before_cursor_execute", counter)
+    start = time.perf_counter()
+    try:
+        enriched = await AssetsTableService._enrich_with_realtime_data(db, assets)
+        await AssetsTableService._enrich_with_sparkline_data(db, enriched)
+    finally:
+        event.remove(engine, "before_cursor_execute", counter)
+    return len(assets), counter.count, time.perf_counter() - start
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Assets table enrichment query-count benchmark")
+    parser.add_argument("--type", default=None, help="asset type name (e.g. Stocks, Crypto)")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 25, 50, 100])
+    parser.add_argument("--with-external", action="store_true", help="include external quote fallbacks")
+    args = parser.parse_args()
+
+    if not args.with_external:
+        assets_table_service.EXTERNAL_QUOTE_BUDGETS = {
+            provider: (0, 1) for provider in assets_table_service.EXTERNAL_QUOTE_BUDGETS
+        }
+
+    db = SessionLocal()
+    try:
+        counts = {}
+        print(f"📊 enrichment queries per page (type={args.type or 'all'}, external={'on' if args.with_external else 'off'})")
+        for size in args.sizes:
+            rows, queries, elapsed = await measure(db, args.type, size)
+            print(f"  page_size={size:4d} rows={rows:4d} queries={queries:3d} time={elapsed * 1000:8.1f} ms")
+            if rows:
+                counts[size] = queries
+    finally:
+        db.close()
+
+    over = {size: queries for size, queries in counts.items() if queries > MAX_QUERIES}
+    if over:
+        print(f"❌ query count exceeds {MAX_QUERIES}: {over}")
+        sys.exit(1)
+    print(f"✅ query count stays within {MAX_QUERIES} for every page size")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
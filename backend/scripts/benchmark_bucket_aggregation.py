@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+RedisBucketManager 틱 집계 벤치마크
+- per-tick: 틱 x 주기마다 aggregate_tick 호출 (기존 StreamConsumer 방식)
+- batch: 배치 단위 aggregate_ticks_batch 호출 (Python 사전 집계 + Lua 1회)
+- 벤치마크 전용 asset_id 범위를 사용하고 종료 시 생성된 키를 정리
+
+사용법:
+  python benchmark_bucket_aggregation.py                      # 20,000 틱, 배치 100
+  python benchmark_bucket_aggregation.py --ticks 100000 --batch-size 500
+  python benchmark_bucket_aggregation.py --redis-url redis://localhost:6379/0
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.processor.redis_bucket_manager import RedisBucketManager, DEFAULT_TICK_INTERVALS, index_key
+
+BENCH_ASSET_BASE = 900000
+
+
+def synthetic_ticks(count: int, assets: int):
+    """assets개 자산에 대해 초당 여러 틱이 들어오는 합성 데이터"""
+    start = datetime.utcnow().replace(second=0, microsecond=0)
+    prices = {BENCH_ASSET_BASE + a: 100.0 + a for a in range(assets)}
+    ticks = []
+    for i in range(count):
+        asset_id = BENCH_ASSET_BASE + (i % assets)
+        prices[asset_id] *= 1 + random.uniform(-0.001, 0.001)
+        ticks.append((asset_id, prices[asset_id], random.uniform(0, 5), start + timedelta(milliseconds=i * 50)))
+    return ticks
+
+
+async def cleanup(manager: RedisBucketManager, intervals):
+    client = manager.redis_client
+    for interval in intervals:
+        keys = [
+            k async for k in client.scan_iter(match=f"realtime:bars:{interval}:*", count=1000)
+            if int(k.decode("utf-8").split(":")[3]) >= BENCH_ASSET_BASE
+        ]
+        if keys:
+            await client.delete(*keys)
+            await client.zrem(index_key(interval), *keys)
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Redis OHLCV tick aggregation benchmark")
+    parser.add_argument("--redis-url", default=os.getenv("REDIS_URL", "redis://localhost:6379/0"))
+    parser.add_argument("--ticks", type=int, default=20000)
+    parser.add_argument("--assets", type=int, default=50)
+    parser.add_argument("--batch-size", type=int, default=100)
+    args = parser.parse_args()
+
+    intervals = DEFAULT_TICK_INTERVALS
+    ticks = synthetic_ticks(args.ticks, args.assets)
+    manager = RedisBucketManager(args.redis_url)
+    await manager.connect()
+
+    try:
+        await cleanup(manager, intervals)
+        start = time.perf_counter()
+        for asset_id, price, volume, ts in ticks:
+            for interval in intervals:
+                await manager.aggregate_tick(asset_id, interval, price, volume, ts)
+        per_tick_elapsed = time.perf_counter() - start
+
+        await cleanup(manager, intervals)
+        start = time.perf_counter()
+        for offset in range(0, len(ticks), args.batch_size):
+            await manager.aggregate_ticks_batch(ticks[offset:offset + args.batch_size])
+        batch_elapsed = time.perf_counter() - start
+
+        print(f"📊 {args.ticks} ticks, {args.assets} assets, intervals={','.join(intervals)}")
+        print(f"  per-tick : {per_tick_elapsed:8.2f}s  {args.ticks / per_tick_elapsed:10.0f} ticks/s")
+        print(f"  batch    : {batch_elapsed:8.2f}s  {args.ticks / batch_elapsed:10.0f} ticks/s (batch={args.batch_size})")
+        print(f"  speedup  : {per_tick_elapsed / batch_elapsed:8.2f}x")
+    finally:
+        await cleanup(manager, intervals)
+        await manager.redis_client.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
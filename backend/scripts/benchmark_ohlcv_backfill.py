@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+OHLCV 백필 적재 경로 벤치마크
+- redis: 기존 경로 (add_bars_batch로 봉마다 Redis 해시 생성 -> get_completed_bars / save_realtime_bars_batch /
+  save_ohlcv_data / ack_completed_bars 로 1m 바구니 비우기)
+- bulk: OHLCVBackfillLoader (청크 COPY + MERGE, Redis 미사용)
+- 2000년 타임스탬프의 1m 봉을 ohlcv_intraday_data에 적재한 뒤 종료 시 삭제
+
+사용법:
+  python benchmark_ohlcv_backfill.py                      # 1,000,000 bars, 두 경로 모두
+  python benchmark_ohlcv_backfill.py --modes bulk --chunk-size 50000
+  python benchmark_ohlcv_backfill.py --rows 200000 --task-size 5000
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import text
+
+from app.core.database import SessionLocal
+from app.services.processor.validator import DataValidator
+from app.services.processor.repository import DataRepository
+from app.services.processor.redis_bucket_manager import RedisBucketManager
+from app.services.processor.ohlcv_backfill_loader import OHLCVBackfillLoader, build_ohlcv_rows
+from app.core.config import GLOBAL_APP_CONFIGS
+
+BENCH_START = datetime(2000, 1, 1)
+
+
+def synthetic_items(asset_ids, count: int, offset_minutes: int = 0):
+    """us_backfill_collector 형식의 1m 봉 (ISO 문자열 시각)"""
+    items = []
+    for i in range(count):
+        price = 100.0 + (i % 100) * 0.1
+        items.append({
+            "asset_id": asset_ids[i % len(asset_ids)],
+            "timestamp_utc": (BENCH_START + timedelta(minutes=offset_minutes + i // len(asset_ids))).isoformat(),
+            "data_interval": "1m",
+            "open": price,
+            "high": price + 0.5,
+            "low": price - 0.5,
+            "close": price + 0.1,
+            "volume": 1.0,
+        })
+    return items
+
+
+def cleanup(asset_ids, minutes: int):
+    end = BENCH_START + timedelta(minutes=minutes + 1)
+    db = SessionLocal()
+    try:
+        for table in ("ohlcv_intraday_data", "realtime_quotes_time_bar", "realtime_quotes_time_delay"):
+            db.execute(text(f"""
+                DELETE FROM {table}
+                WHERE asset_id = ANY(:ids) AND data_interval = '1m'
+                  AND timestamp_utc >= :start AND timestamp_utc < :end
+            """), {"ids": asset_ids, "start": BENCH_START, "end": end})
+        db.commit()
+    finally:
+        db.close()
+
+
+async def run_redis(repo: DataRepository, items, task_size: int) -> float:
+    bucket = RedisBucketManager(f"redis://{GLOBAL_APP_CONFIGS.get('REDIS_HOST', 'redis')}:"
+                                f"{GLOBAL_APP_CONFIGS.get('REDIS_PORT', 6379)}/{GLOBAL_APP_CONFIGS.get('REDIS_DB', 0)}")
+    await bucket.connect()
+    start = time.perf_counter()
+    for offset in range(0, len(items), task_size):
+        chunk = items[offset:offset + task_size]
+        for it in chunk:
+            it['interval'] = it.get('data_interval')
+        await bucket.add_bars_batch(chunk)
+    # _redis_bucket_processing_loop 의 1m 처리와 동일
+    while True:
+        batch = await bucket.get_completed_bars("1m")
+        if not batch:
+            break
+        bars = batch.as_dicts()
+        await repo.save_realtime_bars_batch(bars)
+        await repo.save_ohlcv_data([{
+            'asset_id': b['asset_id'], 'timestamp_utc': b['timestamp_utc'], 'open_price': b['open'],
+            'high_price': b['high'], 'low_price': b['low'], 'close_price': b['close'],
+            'volume': b['volume'], 'interval': '1m',
+        } for b in bars])
+        await bucket.ack_completed_bars(batch)
+    return time.perf_counter() - start
+
+
+async def run_bulk(repo: DataRepository, items, task_size: int, chunk_size: int) -> float:
+    loader = OHLCVBackfillLoader(repo.async_writer, chunk_size=chunk_size)
+    start = time.perf_counter()
+    for offset in range(0, len(items), task_size):
+        await loader.load(items[offset:offset + task_size], {"is_backfill": True, "interval": "1m"})
+    return time.perf_counter() - start
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="OHLCV backfill load benchmark")
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--assets", type=int, default=200)
+    parser.add_argument("--task-size", type=int, default=50000, help="배치 태스크 하나의 항목 수")
+    parser.add_argument("--chunk-size", type=int, default=20000)
+    parser.add_argument("--modes", default="redis,bulk")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        asset_ids = [r[0] for r in db.execute(text("SELECT asset_id FROM assets ORDER BY asset_id LIMIT :n"), {"n": args.assets})]
+    finally:
+        db.close()
+    if not asset_ids:
+        print("❌ assets 테이블이 비어 있습니다.")
+        return
+
+    repo = DataRepository(DataValidator())
+    modes = [m.strip() for m in args.modes.split(",") if m.strip()]
+    span = (args.rows // len(asset_ids) + 1) * len(modes)
+    cleanup(asset_ids, span)
+    try:
+        results = {}
+        for i, mode in enumerate(modes):
+            # 모드마다 다른 시간 구간을 사용해 신규 INSERT 비용을 동일하게 맞춤
+            items = synthetic_items(asset_ids, args.rows, offset_minutes=i * (args.rows // len(asset_ids) + 1))
+            if mode == "redis":
+                results[mode] = await run_redis(repo, items, args.task_size)
+            elif mode == "bulk":
+                results[mode] = await run_bulk(repo, items, args.task_size, args.chunk_size)
+
+        build_start = time.perf_counter()
+        build_ohlcv_rows(synthetic_items(asset_ids, min(args.rows, 200_000)))
+        build_rate = min(args.rows, 200_000) / (time.perf_counter() - build_start)
+
+        print(f"📊 {args.rows:,} bars, assets={len(asset_ids)}, task={args.task_size:,}, chunk={args.chunk_size:,}")
+        for mode, elapsed in results.items():
+            print(f"  {mode:5s}: {elapsed:8.2f}s  {args.rows / elapsed:10,.0f} rows/s")
+        print(f"  row build (CPU only): {build_rate:,.0f} rows/s")
+    finally:
+        cleanup(asset_ids, span)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
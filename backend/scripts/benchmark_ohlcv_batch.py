@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+OHLCV 수집 -> 배치 큐 -> 적재 행 변환 경로 벤치마크 (bars/s)
+- items: 기존 경로 (검증 DataFrame iterrows -> OhlcvDataPoint -> model_dump_json + json.loads -> encode_task(json.dumps)
+  -> decode_task -> build_ohlcv_rows)
+- columns: OHLCVBatch.from_frame -> to_payload -> encode_task -> decode_task -> task_batch -> to_rows
+- 두 경로 모두 같은 큐 envelope(encode_task/decode_task, 큰 페이로드 zlib)을 거치며 Redis/DB 왕복은 제외 (CPU 비용만)
+- --write: 만든 행을 OHLCVBackfillLoader로 실제 적재 (2000년 타임스탬프 1m 봉, 종료 시 삭제)
+
+사용법:
+  python benchmark_ohlcv_batch.py                          # 자산당 5,000봉 x 200 태스크
+  python benchmark_ohlcv_batch.py --bars 1000 --tasks 1000
+  python benchmark_ohlcv_batch.py --write --tasks 20        # DB 적재까지 포함
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.external_apis.base.schemas import OhlcvDataPoint
+from app.services.ohlcv_batch import OHLCVBatch, task_batch
+from app.services.processor.batch_coalescer import task_items
+from app.services.processor.ohlcv_backfill_loader import OHLCVBackfillLoader, build_ohlcv_rows, target_table
+from app.utils.redis_queue_manager import decode_task, encode_task
+
+BENCH_START = datetime(2000, 1, 1)
+TASK_TYPE = "ohlcv_intraday_data"
+
+
+def provider_frame(bars: int, offset_minutes: int = 0) -> pd.DataFrame:
+    """_validate_ohlcv_dataframe 통과 후 형태 (timestamp_utc UTC, open/high/low/close/volume)"""
+    rng = np.random.default_rng(offset_minutes)
+    close = 100 + np.cumsum(rng.normal(0, 0.1, bars))
+    return pd.DataFrame({
+        "timestamp_utc": pd.date_range(BENCH_START + timedelta(minutes=offset_minutes), periods=bars, freq="min", tz="UTC"),
+        "open": close + rng.normal(0, 0.05, bars),
+        "high": close + 0.5,
+        "low": close - 0.5,
+        "close": close,
+        "volume": rng.uniform(0, 1000, bars),
+    })
+
+
+def legacy_points(df: pd.DataFrame, interval: str):
+    """기존 ApiStrategyManager.get_ohlcv_data의 DataFrame -> OhlcvDataPoint 변환"""
+    result = []
+    for _, row in df.reset_index().iterrows():
+        def get_val(r, keys):
+            for k in keys:
+                if k in r and pd.notna(r[k]):
+                    return r[k]
+            return None
+        result.append(OhlcvDataPoint(
+            timestamp_utc=get_val(row, ['timestamp_utc', 'timestamp']),
+            open_price=float(get_val(row, ['open_price', 'open'])),
+            high_price=float(get_val(row, ['high_price', 'high'])),
+            low_price=float(get_val(row, ['low_price', 'low'])),
+            close_price=float(get_val(row, ['close_price', 'close'])),
+            volume=float(get_val(row, ['volume'])),
+            change_percent=float(get_val(row, ['change_percent', 'change'])) if get_val(row, ['change_percent', 'change']) is not None else None,
+            data_interval=interval,
+        ))
+    return result
+
+
+def run_items(df: pd.DataFrame, metadata: dict):
+    items = [json.loads(p.model_dump_json()) for p in legacy_points(df, metadata["interval"])]
+    fields = encode_task(TASK_TYPE, {"items": items, "metadata": metadata})
+    _, task = decode_task(fields)
+    tables, _ = build_ohlcv_rows(task_items(task), task["payload"]["metadata"])
+    return tables, len(fields["data"])
+
+
+def run_columns(df: pd.DataFrame, metadata: dict):
+    batch = OHLCVBatch.from_frame(df.reset_index())
+    fields = encode_task(TASK_TYPE, {"columns": batch.to_payload(), "metadata": metadata})
+    _, task = decode_task(fields)
+    meta = task["payload"]["metadata"]
+    tables = {target_table(meta["interval"]): task_batch(task).to_rows(meta["asset_id"], meta["interval"])}
+    return tables, len(fields["data"])
+
+
+async def write_tables(loader: OHLCVBackfillLoader, tables) -> None:
+    for table, rows in tables.items():
+        for offset in range(0, len(rows), loader.chunk_size):
+            await loader.writer.upsert_ohlcv_bars(table, rows[offset:offset + loader.chunk_size])
+
+
+def cleanup(asset_id: int, minutes: int) -> None:
+    from sqlalchemy import text
+    from app.core.database import SessionLocal
+    db = SessionLocal()
+    try:
+        db.execute(text("""
+            DELETE FROM ohlcv_intraday_data
+            WHERE asset_id = :id AND data_interval = '1m' AND timestamp_utc >= :start AND timestamp_utc < :end
+        """), {"id": asset_id, "start": BENCH_START, "end": BENCH_START + timedelta(minutes=minutes + 1)})
+        db.commit()
+    finally:
+        db.close()
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="OHLCV items vs columnar batch pipeline benchmark")
+    parser.add_argument("--bars", type=int, default=5000, help="태스크(자산 1회 수집) 하나의 봉 수")
+    parser.add_argument("--tasks", type=int, default=200)
+    parser.add_argument("--modes", default="items,columns")
+    parser.add_argument("--write", action="store_true", help="OHLCVBackfillLoader로 DB 적재까지 포함")
+    parser.add_argument("--asset-id", type=int, default=1)
+    args = parser.parse_args()
+
+    modes = [m.strip() for m in args.modes.split(",") if m.strip()]
+    runners = {"items": run_items, "columns": run_columns}
+    loader = None
+    if args.write:
+        from app.services.processor.repository import DataRepository
+        from app.services.processor.validator import DataValidator
+        loader = OHLCVBackfillLoader(DataRepository(DataValidator()).async_writer)
+    span = args.bars * args.tasks * len(modes)
+
+    results = {}
+    try:
+        if loader:
+            cleanup(args.asset_id, span)
+        for m, mode in enumerate(modes):
+            # 모드마다 다른 시간 구간 (DB 적재 시 신규 INSERT 비용을 동일하게)
+            frames = [provider_frame(args.bars, (m * args.tasks + t) * args.bars) for t in range(args.tasks)]
+            metadata = {"asset_id": args.asset_id, "interval": "1m", "data_type": "ohlcv", "is_backfill": True}
+            payload_bytes = 0
+            start = time.perf_counter()
+            for df in frames:
+                tables, size = runners[mode](df, metadata)
+                payload_bytes += size
+                if loader:
+                    await write_tables(loader, tables)
+            results[mode] = (time.perf_counter() - start, payload_bytes)
+    finally:
+        if loader:
+            cleanup(args.asset_id, span)
+
+    total = args.bars * args.tasks
+    print(f"📊 {args.tasks} tasks x {args.bars:,} bars = {total:,} bars{' (DB 적재 포함)' if loader else ''}")
+    for mode, (elapsed, size) in results.items():
+        print(f"  {mode:7s}: {elapsed:8.2f}s  {total / elapsed:12,.0f} bars/s  queue payload {size / total:6.1f} bytes/bar")
+    if "items" in results and "columns" in results:
+        print(f"  speedup: x{results['items'][0] / results['columns'][0]:.1f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
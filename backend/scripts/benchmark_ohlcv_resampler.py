@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+OHLCV 리샘플러 벤치마크
+- legacy: 기존 dict 루프 (app/services/test_ohlcv_resampler.legacy_resample / legacy_aggregate)
+- columnar: app/services/ohlcv_resampler.resample_dicts / aggregate_dicts / Resampled.to_json
+- DB 없이 무작위 봉으로 실행하며, 두 결과가 동일한지도 함께 확인
+
+사용법:
+  python benchmark_ohlcv_resampler.py               # 1분봉 15,000개 -> 15m/1h/4h, 일봉 -> 1W/1M
+  python benchmark_ohlcv_resampler.py --rows 100000 --repeat 5
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.ohlcv_resampler import OHLCVColumns, aggregate_dicts, resample, resample_dicts
+from app.services.test_ohlcv_resampler import legacy_aggregate, legacy_resample, make_rows
+
+
+def best_of(repeat: int, fn):
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def report(name, legacy_fn, columnar_fn, repeat):
+    legacy_elapsed, expected = best_of(repeat, legacy_fn)
+    columnar_elapsed, actual = best_of(repeat, columnar_fn)
+    parity = len(actual) == len(expected) and all(
+        a['timestamp_utc'] == e['timestamp_utc'] and a['close_price'] == e['close_price']
+        for a, e in zip(actual, expected)
+    )
+    print(f"  {name:6s} legacy={legacy_elapsed * 1000:8.1f} ms  columnar={columnar_elapsed * 1000:8.1f} ms  "
+          f"speedup={legacy_elapsed / columnar_elapsed:6.1f}x  parity={'OK' if parity else 'MISMATCH'}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="OHLCV resampler benchmark")
+    parser.add_argument("--rows", type=int, default=15000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    intraday = make_rows(args.rows, 1, seed=1)
+    daily = make_rows(args.rows, 1440, seed=2)
+
+    print(f"📊 {args.rows:,} rows per series")
+    for minutes in (15, 60, 240):
+        label = f"{minutes}m"
+        report(label, lambda: legacy_resample(intraday, minutes, label),
+               lambda: resample_dicts(intraday, minutes, label), args.repeat)
+    for rule in ("1W", "1M"):
+        report(rule, lambda: legacy_aggregate(daily, rule), lambda: aggregate_dicts(daily, rule), args.repeat)
+
+    # dict를 거치지 않는 경로: 컬럼 적재 + 리샘플 + JSON 직렬화
+    cols = OHLCVColumns.from_dicts(intraday)
+    elapsed, payload = best_of(args.repeat, lambda: resample(cols, "15m", anchor_seconds=3600).to_json("15m"))
+    print(f"  15m resample+to_json (preloaded columns): {elapsed * 1000:8.1f} ms ({len(payload):,} bytes)")
+
+
+if __name__ == "__main__":
+    main()
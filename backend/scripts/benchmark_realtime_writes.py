@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+DataRepository 실시간 쓰기 경로 벤치마크
+- sync: 기존 동기 세션 UPSERT (REALTIME_WRITE_MODE=sync)
+- copy: asyncpg binary COPY + 단일 MERGE (REALTIME_WRITE_MODE=copy)
+- rows/s와 함께 이벤트 루프 정지 시간(5ms 하트비트 지연의 최대/합계)을 측정
+- 라이브 시세(realtime_quotes)를 덮어쓰지 않도록 봉 저장 경로(realtime_quotes_time_bar,
+  realtime_quotes_time_delay)만 사용하며, 2000년 타임스탬프와 data_source='benchmark'로
+  적재한 뒤 종료 시 삭제
+
+사용법:
+  python benchmark_realtime_writes.py                  # 50,000 행, 배치 1,000
+  python benchmark_realtime_writes.py --rows 200000 --batch-size 2000
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import text
+
+from app.core.database import SessionLocal
+from app.services.processor.validator import DataValidator
+from app.services.processor.repository import DataRepository
+
+BENCH_SOURCE = "benchmark"
+BENCH_START = datetime(2000, 1, 1)
+
+
+def synthetic_bars(asset_ids, count: int, offset_minutes: int = 0):
+    bars = []
+    for i in range(count):
+        price = 100.0 + (i % 100) * 0.1
+        bars.append({
+            "asset_id": asset_ids[i % len(asset_ids)],
+            "timestamp_utc": BENCH_START + timedelta(minutes=offset_minutes + i // len(asset_ids)),
+            "interval": "1m",
+            "open": price,
+            "high": price + 0.5,
+            "low": price - 0.5,
+            "close": price + 0.1,
+            "volume": 1.0,
+            "data_source": BENCH_SOURCE,
+        })
+    return bars
+
+
+class LoopStallMonitor:
+    """짧은 sleep의 지연으로 이벤트 루프 블로킹 시간을 측정"""
+
+    def __init__(self, interval: float = 0.005):
+        self.interval = interval
+        self.max_stall = 0.0
+        self.total_stall = 0.0
+        self._task = None
+
+    async def _run(self):
+        while True:
+            start = time.perf_counter()
+            await asyncio.sleep(self.interval)
+            stall = time.perf_counter() - start - self.interval
+            if stall > 0.001:
+                self.total_stall += stall
+                self.max_stall = max(self.max_stall, stall)
+
+    def __enter__(self):
+        self._task = asyncio.get_running_loop().create_task(self._run())
+        return self
+
+    def __exit__(self, *exc):
+        self._task.cancel()
+
+
+def cleanup():
+    db = SessionLocal()
+    try:
+        db.execute(text("DELETE FROM realtime_quotes_time_bar WHERE data_source = :s"), {"s": BENCH_SOURCE})
+        db.execute(text("DELETE FROM realtime_quotes_time_delay WHERE data_source = :s"), {"s": BENCH_SOURCE})
+        db.commit()
+    finally:
+        db.close()
+
+
+async def run_mode(repo: DataRepository, mode: str, bars, batch_size: int):
+    repo.realtime_write_mode = mode
+    with LoopStallMonitor() as monitor:
+        start = time.perf_counter()
+        for offset in range(0, len(bars), batch_size):
+            await repo.save_realtime_bars_batch(bars[offset:offset + batch_size])
+        elapsed = time.perf_counter() - start
+    return elapsed, monitor
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Realtime write path benchmark")
+    parser.add_argument("--rows", type=int, default=50000)
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument("--assets", type=int, default=100)
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        asset_ids = [r[0] for r in db.execute(text("SELECT asset_id FROM assets ORDER BY asset_id LIMIT :n"), {"n": args.assets})]
+    finally:
+        db.close()
+    if not asset_ids:
+        print("❌ assets 테이블이 비어 있습니다.")
+        return
+
+    repo = DataRepository(DataValidator())
+    cleanup()
+    try:
+        results = {}
+        for i, mode in enumerate(("sync", "copy")):
+            # 모드마다 다른 시간 구간을 사용해 신규 INSERT 비용을 동일하게 맞춤
+            bars = synthetic_bars(asset_ids, args.rows, offset_minutes=i * args.rows)
+            results[mode] = await run_mode(repo, mode, bars, args.batch_size)
+
+        print(f"📊 {args.rows} rows, batch={args.batch_size}, assets={len(asset_ids)}")
+        for mode, (elapsed, monitor) in results.items():
+            print(
+                f"  {mode:5s}: {elapsed:8.2f}s  {args.rows / elapsed:10.0f} rows/s  "
+                f"loop stall max {monitor.max_stall * 1000:7.1f}ms / total {monitor.total_stall:6.2f}s"
+            )
+    finally:
+        cleanup()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
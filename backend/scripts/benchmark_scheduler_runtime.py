@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+스케줄러 잡 실행 방식 벤치마크
+- per_job: 기존 방식 (잡마다 새 이벤트 루프 + ApiStrategyManager/RedisQueueManager, 호출마다 새 httpx 클라이언트)
+- persistent: SchedulerRuntime 상시 루프 (루프별 리소스 재사용 + 공유 keep-alive httpx 풀)
+- 잡 하나 = 리소스 준비 + pooled_client로 --requests 회 GET (API 클라이언트 구현과 같은 호출 형태)
+- 새 TCP 연결 수는 httpx trace 확장(connection.connect_tcp.complete)으로 집계
+
+사용법:
+  python benchmark_scheduler_runtime.py                                  # binance ping, 잡 20회, 잡당 5회 호출
+  python benchmark_scheduler_runtime.py --url https://financialmodelingprep.com --jobs 50 --requests 10
+  python benchmark_scheduler_runtime.py --bare                            # ApiStrategyManager 생성 제외 (HTTP만)
+"""
+
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core.config_manager import ConfigManager
+from app.external_apis.base.http_pool import pooled_client
+from app.services.api_strategy_manager import ApiStrategyManager
+from app.services.scheduler_runtime import SchedulerRuntime
+from app.utils.redis_queue_manager import RedisQueueManager
+
+
+class ConnectionCounter:
+    def __init__(self):
+        self.connects = 0
+
+    async def trace(self, event_name, info):
+        if event_name == "connection.connect_tcp.complete":
+            self.connects += 1
+
+
+def run_mode(mode: str, args, config_manager) -> dict:
+    counter = ConnectionCounter()
+
+    def factory():
+        if args.bare:
+            return {}
+        return {
+            "api_manager": ApiStrategyManager(config_manager=config_manager),
+            "redis_queue_manager": RedisQueueManager(config_manager=config_manager),
+        }
+
+    async def job(ctx):
+        for _ in range(args.requests):
+            async with pooled_client(timeout=10) as client:
+                response = await client.get(args.url, extensions={"trace": counter.trace})
+                response.raise_for_status()
+
+    runtime = SchedulerRuntime(factory, mode=mode, pool_size=args.pool_size)
+    durations = []
+
+    def timed(i):
+        start = time.perf_counter()
+        runtime.run(f"bench-{i}", job)
+        durations.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    try:
+        with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+            list(pool.map(timed, range(args.jobs)))
+    finally:
+        runtime.shutdown()
+    durations.sort()
+    return {
+        "total": time.perf_counter() - start,
+        "avg": sum(durations) / len(durations),
+        "p95": durations[min(len(durations) - 1, int(len(durations) * 0.95))],
+        "connects": counter.connects,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Scheduler job runtime benchmark")
+    parser.add_argument("--url", default="https://api.binance.com/api/v3/ping")
+    parser.add_argument("--jobs", type=int, default=20)
+    parser.add_argument("--requests", type=int, default=5, help="잡 하나의 HTTP 호출 수")
+    parser.add_argument("--concurrency", type=int, default=1, help="동시에 실행되는 잡 수 (APScheduler 워커 스레드)")
+    parser.add_argument("--pool-size", type=int, default=2)
+    parser.add_argument("--modes", default="per_job,persistent")
+    parser.add_argument("--bare", action="store_true", help="잡 리소스(ApiStrategyManager 등) 생성 제외")
+    args = parser.parse_args()
+
+    config_manager = None if args.bare else ConfigManager()
+    results = {}
+    for mode in [m.strip() for m in args.modes.split(",") if m.strip()]:
+        results[mode] = run_mode(mode, args, config_manager)
+
+    print(f"📊 {args.jobs} jobs x {args.requests} requests -> {args.url} (concurrency={args.concurrency}, pool={args.pool_size})")
+    for mode, r in results.items():
+        print(
+            f"  {mode:10s}: total {r['total']:7.2f}s  job avg {r['avg'] * 1000:8.1f}ms  "
+            f"p95 {r['p95'] * 1000:8.1f}ms  new connections {r['connects']:5d}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+StreamConsumer 처리량 벤치마크
+- 합성 틱 메시지를 벤치마크 전용 스트림에 미리 적재(backlog)한 뒤 소비 속도를 측정
+- legacy: 스트림별 XREADGROUP(block=100ms) + 메시지별 XACK (기존 방식)
+- pipelined: StreamConsumer.process_streams (일괄 XREADGROUP + 스트림별 일괄 XACK)
+- DB 저장은 측정 대상이 아니므로 저장소는 즉시 성공을 반환하는 객체로 대체
+
+사용법:
+  python benchmark_stream_consumer.py                         # 스트림당 5,000건
+  python benchmark_stream_consumer.py --messages 20000         # 스트림당 메시지 수
+  python benchmark_stream_consumer.py --redis-url redis://localhost:6379/0
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import redis.asyncio as redis
+
+from app.services.processor.validator import DataValidator
+from app.services.processor.adapters import AdapterFactory
+from app.services.processor.consumer import StreamConsumer
+
+PROVIDERS = ["finnhub", "alpaca", "binance", "coinbase", "swissquote", "polygon", "twelvedata", "kis"]
+BENCH_PREFIX = "bench"
+
+
+class NullRepository:
+    """DB 저장을 생략하는 벤치마크용 저장소"""
+
+    async def bulk_save_realtime_quotes(self, records):
+        return True
+
+
+def bench_streams():
+    return {f"{BENCH_PREFIX}_{p}:realtime": f"{BENCH_PREFIX}_{p}_group" for p in PROVIDERS}
+
+
+async def seed_backlog(client, streams, messages_per_stream: int):
+    """스트림마다 합성 틱을 적재하고 Consumer Group을 0부터 다시 생성"""
+    now_ms = int(time.time() * 1000)
+    for stream_name, group_name in streams.items():
+        await client.delete(stream_name)
+        pipe = client.pipeline(transaction=False)
+        for i in range(messages_per_stream):
+            pipe.xadd(stream_name, {
+                "symbol": "AAPL",
+                "price": str(100 + (i % 50) * 0.01),
+                "volume": "1",
+                "raw_timestamp": str(now_ms + i),
+            })
+            if len(pipe) >= 1000:
+                await pipe.execute()
+        await pipe.execute()
+        await client.xgroup_create(name=stream_name, groupname=group_name, id="0", mkstream=True)
+
+
+async def run_legacy(client, consumer, streams):
+    """기존 방식: 스트림별 블로킹 읽기 + 메시지별 ACK"""
+    consumed = 0
+    start = time.perf_counter()
+    while True:
+        records, ack_items = [], []
+        for stream_name, group_name in streams.items():
+            data = await client.xreadgroup(
+                groupname=group_name,
+                consumername="processor_worker",
+                streams={stream_name: ">"},
+                count=consumer.batch_size,
+                block=100,
+            )
+            if data:
+                await consumer._process_messages(data, records, ack_items)
+        if not ack_items:
+            break
+        for stream_name, group_name, message_id in ack_items:
+            await client.xack(stream_name, group_name, message_id)
+        consumed += len(records)
+    return consumed, time.perf_counter() - start
+
+
+async def run_pipelined(consumer, streams):
+    """신규 방식: StreamConsumer.process_streams"""
+    consumer.realtime_streams = streams
+    consumer._groups_ready = False
+    consumed = 0
+    start = time.perf_counter()
+    while True:
+        count = await consumer.process_streams()
+        if count == 0:
+            break
+        consumed += count
+    return consumed, time.perf_counter() - start
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="StreamConsumer throughput benchmark")
+    parser.add_argument("--redis-url", default=os.getenv("REDIS_URL", "redis://localhost:6379/0"))
+    parser.add_argument("--messages", type=int, default=5000, help="스트림당 메시지 수")
+    parser.add_argument("--batch-size", type=int, default=100)
+    args = parser.parse_args()
+
+    streams = bench_streams()
+    total = args.messages * len(streams)
+    client = await redis.from_url(args.redis_url, decode_responses=False)
+
+    validator = DataValidator()
+    consumer = StreamConsumer(
+        redis_url=args.redis_url,
+        adapter_factory=AdapterFactory(validator),
+        repository=NullRepository(),
+        batch_size=args.batch_size,
+    )
+    consumer.set_asset_map({"AAPL": {"id": 1, "type": "Crypto"}})
+    consumer.last_lag_check = time.time()
+    await consumer.connect()
+
+    try:
+        await seed_backlog(client, streams, args.messages)
+        legacy_count, legacy_elapsed = await run_legacy(client, consumer, streams)
+
+        await seed_backlog(client, streams, args.messages)
+        pipelined_count, pipelined_elapsed = await run_pipelined(consumer, streams)
+
+        print(f"📊 backlog: {len(streams)} streams x {args.messages} = {total} messages")
+        print(f"  legacy    : {legacy_elapsed:8.2f}s  {legacy_count / legacy_elapsed:10.0f} msg/s ({legacy_count}건)")
+        print(f"  pipelined : {pipelined_elapsed:8.2f}s  {pipelined_count / pipelined_elapsed:10.0f} msg/s ({pipelined_count}건)")
+        print(f"  speedup   : {legacy_elapsed / pipelined_elapsed:8.2f}x")
+    finally:
+        for stream_name in streams:
+            await client.delete(stream_name)
+        await consumer.close()
+        await client.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
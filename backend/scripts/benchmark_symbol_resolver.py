@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+SymbolResolver 조회 마이크로벤치마크
+- legacy: 기존 StreamConsumer의 endswith('USDT') / '-USD' / '-USDT' / '/USD' 분기 체인
+- resolver: SymbolResolver.resolve (사전 계산 인덱스 단일 조회)
+- DB 없이 합성 자산 목록으로 실행
+
+사용법:
+  python benchmark_symbol_resolver.py                       # 1,000,000 조회, 자산 5,000개
+  python benchmark_symbol_resolver.py --lookups 5000000 --assets 20000
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.symbol_resolver import SymbolResolver
+
+PROVIDERS = ["binance", "coinbase", "finnhub", "alpaca", "swissquote", "polygon", "twelvedata", "kis"]
+
+
+def legacy_resolve(ticker_to_asset_id, ticker):
+    """기존 StreamConsumer._process_messages의 해석 체인"""
+    if ticker in ticker_to_asset_id:
+        return ticker_to_asset_id[ticker]
+    elif ticker.endswith('USDT') and len(ticker) > 4:
+        return ticker_to_asset_id.get(ticker[:-4])
+    elif ticker.endswith('-USD') and len(ticker) > 4:
+        return ticker_to_asset_id.get(ticker[:-4])
+    elif ticker.endswith('-USDT') and len(ticker) > 5:
+        return ticker_to_asset_id.get(ticker[:-5])
+    elif '/USD' in ticker:
+        return ticker_to_asset_id.get(ticker.split('/')[0])
+    return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="SymbolResolver microbenchmark")
+    parser.add_argument("--lookups", type=int, default=1_000_000)
+    parser.add_argument("--assets", type=int, default=5000)
+    parser.add_argument("--miss-ratio", type=float, default=0.05)
+    args = parser.parse_args()
+
+    random.seed(42)
+    tickers = [f"T{i:05d}" for i in range(args.assets)]
+    asset_map = {t: {'id': i + 1, 'type': 'Stocks'} for i, t in enumerate(tickers)}
+
+    resolver = SymbolResolver()
+    start = time.perf_counter()
+    resolver.load_mapping(asset_map)
+    build_elapsed = time.perf_counter() - start
+
+    forms = ["{t}", "{t}USDT", "{t}-USD", "{t}-USDT", "{t}/USD"]
+    workload = []
+    for _ in range(args.lookups):
+        provider = random.choice(PROVIDERS)
+        if random.random() < args.miss_ratio:
+            workload.append((provider, f"UNKNOWN{random.randint(0, 999)}"))
+        else:
+            workload.append((provider, random.choice(forms).format(t=random.choice(tickers))))
+
+    start = time.perf_counter()
+    legacy_hits = 0
+    for _, symbol in workload:
+        if legacy_resolve(asset_map, symbol) is not None:
+            legacy_hits += 1
+    legacy_elapsed = time.perf_counter() - start
+
+    resolve = resolver.resolve
+    start = time.perf_counter()
+    resolver_hits = 0
+    for provider, symbol in workload:
+        if resolve(provider, symbol) is not None:
+            resolver_hits += 1
+    resolver_elapsed = time.perf_counter() - start
+
+    print(f"📊 {args.lookups:,} lookups, {args.assets:,} assets, index {resolver.stats()['index_size']:,} entries (build {build_elapsed * 1000:.0f}ms)")
+    print(f"  legacy   : {legacy_elapsed:6.3f}s  {args.lookups / legacy_elapsed / 1e6:6.2f}M lookups/s  hits {legacy_hits:,}")
+    print(f"  resolver : {resolver_elapsed:6.3f}s  {args.lookups / resolver_elapsed / 1e6:6.2f}M lookups/s  hits {resolver_hits:,}")
+    print(f"  speedup  : {legacy_elapsed / resolver_elapsed:6.2f}x  ({resolver.stats()})")
+
+
+if __name__ == "__main__":
+    main()
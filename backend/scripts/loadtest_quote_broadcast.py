@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+실시간 시세 브로드캐스트 부하 테스트
+- legacy: 시세마다 prices_{ticker}, prices_{asset_id} 두 방에 'realtime_quote' emit (변경 전 broadcast_quotes_batch)
+- engine: app/core/quote_broadcast.QuoteBroadcastEngine (클라이언트별 'realtime_quotes' 프레임)
+
+모드
+1) inproc (기본): 네트워크 없이 Socket.IO 서버 매니저에 가상 클라이언트 N명을 등록하고
+   Engine.IO 전송 단계에서 프레임 수/바이트를 집계. 배치당 emit 지연과 시세당 CPU 시간을 비교
+2) live (--url): 실제 서버에 AsyncClient N개를 연결해 구독 후, 발행 클라이언트가 broadcast_quotes_batch를 보내고
+   각 클라이언트가 수신한 프레임의 sent_at 기준 종단 지연을 측정
+
+사용법:
+  python loadtest_quote_broadcast.py --clients 5000 --symbols 500 --per-client 20
+  python loadtest_quote_broadcast.py --url http://localhost:8001 --clients 1000 --duration 30
+"""
+import argparse
+import asyncio
+import inspect
+import os
+import random
+import statistics
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import socketio
+
+from app.core.quote_broadcast import QuoteBroadcastEngine, quote_rooms
+
+
+def make_universe(n_symbols):
+    return [{"asset_id": i + 1, "ticker": f"SYM{i:04d}", "asset_type": "Stocks"} for i in range(n_symbols)]
+
+
+def make_batch(universe, size, rnd):
+    now = time.time()
+    batch = []
+    for asset in rnd.sample(universe, min(size, len(universe))):
+        batch.append({
+            **asset,
+            "timestamp_utc": now,
+            "price": round(rnd.uniform(10, 500), 4),
+            "volume": rnd.randint(1, 1000),
+            "data_source": "loadtest",
+            "sent_at": now,
+        })
+    return batch
+
+
+def pick_subscription(universe, per_client, rnd):
+    """구독 심볼: 절반은 티커, 절반은 asset_id (프론트엔드 두 방식 혼재 재현, 일부는 둘 다)"""
+    rooms = []
+    for asset in rnd.sample(universe, min(per_client, len(universe))):
+        choice = rnd.random()
+        if choice < 0.45:
+            rooms.append(f"prices_{asset['ticker']}")
+        elif choice < 0.9:
+            rooms.append(f"prices_{asset['asset_id']}")
+        else:
+            rooms += [f"prices_{asset['ticker']}", f"prices_{asset['asset_id']}"]
+    return rooms
+
+
+# ----------------------------------------------------------------------
+# inproc
+# ----------------------------------------------------------------------
+class Counter:
+    def __init__(self):
+        self.frames = 0
+        self.bytes = 0
+
+    async def send_packet(self, eio_sid, eio_pkt):
+        self.frames += 1
+        self.bytes += len(eio_pkt.encode())
+
+
+async def build_server(n_clients, universe, per_client, seed):
+    sio = socketio.AsyncServer(async_mode="asgi")
+    counter = Counter()
+    # Engine.IO 전송 단계에서 가로채 프레임 수/바이트 집계 (legacy emit과 엔진 모두 여기를 지남)
+    sio.eio.send_packet = counter.send_packet
+    rnd = random.Random(seed)
+    for i in range(n_clients):
+        sid = sio.manager.connect(f"eio{i}", "/")
+        if inspect.isawaitable(sid):
+            sid = await sid
+        for room in pick_subscription(universe, per_client, rnd):
+            sio.manager.basic_enter_room(sid, "/", room)
+    return sio, counter
+
+
+async def legacy_broadcast(sio, batch):
+    async def one(quote):
+        for room in quote_rooms(quote):
+            await sio.emit("realtime_quote", quote, room=room)
+    await asyncio.gather(*[one(q) for q in batch])
+
+
+async def run_inproc(args):
+    universe = make_universe(args.symbols)
+    results = {}
+    for mode in ("legacy", "engine"):
+        sio, counter = await build_server(args.clients, universe, args.per_client, args.seed)
+        engine = QuoteBroadcastEngine(sio, max_rate_hz=0)
+        rnd = random.Random(args.seed + 1)
+        batches = [make_batch(universe, args.batch, rnd) for _ in range(args.batches)]
+
+        latencies = []
+        cpu_start = time.process_time()
+        for batch in batches:
+            start = time.perf_counter()
+            if mode == "legacy":
+                await legacy_broadcast(sio, batch)
+            else:
+                engine.enqueue(batch)
+                await engine.flush()
+            latencies.append(time.perf_counter() - start)
+        cpu = time.process_time() - cpu_start
+        quotes = args.batch * args.batches
+        results[mode] = {
+            "p50_ms": statistics.median(latencies) * 1000,
+            "p99_ms": sorted(latencies)[int(len(latencies) * 0.99) - 1] * 1000 if len(latencies) > 1 else latencies[0] * 1000,
+            "cpu_us_per_quote": cpu / quotes * 1e6,
+            "frames": counter.frames,
+            "mbytes": counter.bytes / 1e6,
+        }
+        if engine._flush_task:
+            engine._flush_task.cancel()
+
+    print(f"📊 {args.clients:,} clients x {args.per_client} subscriptions, {args.symbols} symbols, "
+          f"{args.batches} batches x {args.batch} quotes")
+    for mode, r in results.items():
+        print(f"  {mode:7}: emit p50 {r['p50_ms']:8.2f} ms  p99 {r['p99_ms']:8.2f} ms  "
+              f"CPU {r['cpu_us_per_quote']:9.1f} us/quote  frames {r['frames']:>9,}  {r['mbytes']:8.2f} MB")
+    legacy, engine = results["legacy"], results["engine"]
+    print(f"  speedup: {legacy['p50_ms'] / engine['p50_ms']:.1f}x latency, "
+          f"{legacy['cpu_us_per_quote'] / engine['cpu_us_per_quote']:.1f}x CPU, "
+          f"{legacy['frames'] / max(engine['frames'], 1):.1f}x fewer frames")
+
+
+# ----------------------------------------------------------------------
+# live
+# ----------------------------------------------------------------------
+async def run_live(args):
+    universe = make_universe(args.symbols)
+    rnd = random.Random(args.seed)
+    latencies = []
+    received = {"frames": 0, "quotes": 0}
+
+    def on_frame(data):
+        now = time.time()
+        quotes = data if isinstance(data, list) else [data]
+        received["frames"] += 1
+        for quote in quotes:
+            received["quotes"] += 1
+            if "sent_at" in quote:
+                latencies.append(now - float(quote["sent_at"]))
+
+    clients = []
+    for i in range(args.clients):
+        client = socketio.AsyncClient(reconnection=False)
+        client.on("realtime_quote", on_frame)
+        client.on("realtime_quotes", on_frame)
+        await client.connect(args.url, transports=["websocket"])
+        symbols = [room[len("prices_"):] for room in pick_subscription(universe, args.per_client, rnd)]
+        await client.emit("subscribe_prices", {"symbols": symbols})
+        clients.append(client)
+        if (i + 1) % 500 == 0:
+            print(f"  connected {i + 1:,} clients")
+
+    publisher = socketio.AsyncClient(reconnection=False)
+    await publisher.connect(args.url, transports=["websocket"])
+    await asyncio.sleep(2)
+
+    deadline = time.time() + args.duration
+    sent = 0
+    while time.time() < deadline:
+        batch = make_batch(universe, args.batch, rnd)
+        await publisher.emit("broadcast_quotes_batch", batch)
+        sent += len(batch)
+        await asyncio.sleep(args.interval)
+    await asyncio.sleep(2)
+
+    for client in clients + [publisher]:
+        await client.disconnect()
+
+    if latencies:
+        latencies.sort()
+        print(f"📊 live: sent {sent:,} quotes, received {received['quotes']:,} quotes in {received['frames']:,} frames")
+        print(f"  latency p50 {latencies[len(latencies) // 2] * 1000:.1f} ms  "
+              f"p99 {latencies[int(len(latencies) * 0.99) - 1] * 1000:.1f} ms")
+    else:
+        print("⚠️ no quotes received")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Realtime quote broadcast load test")
+    parser.add_argument("--clients", type=int, default=5000)
+    parser.add_argument("--symbols", type=int, default=500)
+    parser.add_argument("--per-client", type=int, default=20)
+    parser.add_argument("--batch", type=int, default=200, help="quotes per broadcaster batch")
+    parser.add_argument("--batches", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--url", default=None, help="run against a live server instead of in-process")
+    parser.add_argument("--duration", type=float, default=30.0)
+    parser.add_argument("--interval", type=float, default=0.2, help="seconds between batches (live)")
+    args = parser.parse_args()
+
+    asyncio.run(run_live(args) if args.url else run_inproc(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -489,6 +489,14 @@ export const useRealtimePrices = (assetIdentifier: string, options: { enabled?:
     handleRealtimeQuoteRef.current?.(data)
   }, [])
 
+  // 배치 프레임 ('realtime_quotes'): 구독한 심볼의 시세 목록을 한 번에 수신
+  const handleRealtimeQuotes = useCallback((quotes: any) => {
+    if (!Array.isArray(quotes)) return
+    for (const quote of quotes) {
+      handleRealtimeQuoteRef.current?.(quote)
+    }
+  }, [])
+
   // 연결 상태 체크 및 더미 데이터 모드 감지
   useEffect(() => {
     if (typeof window === 'undefined') return
@@ -520,6 +528,7 @@ export const useRealtimePrices = (assetIdentifier: string, options: { enabled?:
     // 이벤트 리스너 등록 (연결 상태와 무관하게 항상 등록)
     socket.on('subscription_confirmed', handleSubscriptionConfirmed)
     socket.on('realtime_quote', handleRealtimeQuote)
+    socket.on('realtime_quotes', handleRealtimeQuotes)
 
     // 실시간 구독 관리
     // 💡 연결된 경우에만 구독 요청을 보내되, 
@@ -543,6 +552,7 @@ export const useRealtimePrices = (assetIdentifier: string, options: { enabled?:
     return () => {
       socket.off('subscription_confirmed', handleSubscriptionConfirmed)
       socket.off('realtime_quote', handleRealtimeQuote)
+      socket.off('realtime_quotes', handleRealtimeQuotes)
     }
     // eslint-disable-next-line react-hooks/exhaustive-deps
   }, [socket, assetIdentifier, isConnected])